@@ -6,6 +6,9 @@ Streamlit web application for recommending DSA learning paths
 import streamlit as st
 import sys
 import os
+import time
+import uuid
+import pandas as pd
 
 # Add src to path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
@@ -15,16 +18,29 @@ from data.topic_data import (
     get_all_topics, 
     get_topic_description, 
     get_all_categories,
-    get_topics_by_category
+    get_topics_by_category,
+    get_topic_prefix_index
 )
 from data.problem_data import (
-    get_problems_by_topic_and_level,
+    get_problem_page,
     get_available_topics_for_problems,
     get_difficulty_levels,
-    get_problem_count_by_topic
+    get_problem_count_by_topic,
+    get_problem_count,
+    get_unique_problem_count,
+    get_practice_set,
+    get_balanced_practice_set,
+    get_due_reviews,
+    get_daily_mix,
+    filter_problems,
+    recommend_problems,
+    search_problems
 )
-from graph.topic_graph import TopicGraph
+from data.analytics import CohortAnalytics, EVENT_COLUMNS
+from data.reviews import ReviewScheduler
 from graph.topological_sort import TopologicalSort
+from graph.shared import attach_or_publish
+from graph.snapshot import GraphRegistry
 from utils.helpers import (
     format_learning_path,
     create_topic_selector,
@@ -35,11 +51,24 @@ from utils.helpers import (
     validate_topic_selection,
     create_difficulty_selector,
     display_problems,
+    page_cursor,
+    reset_pager,
+    display_page_controls,
+    display_search_results,
+    display_recommendations,
+    display_daily_mix,
+    display_due_reviews,
+    display_cohort_analytics,
+    display_practice_set,
+    display_balanced_set,
     create_problem_stats_chart,
     display_problem_summary
 )
 from utils.gemini_chat import create_gemini_chat_interface, display_chat_interface
 
+# Problems rendered per page on the Problem Suggestions page
+PROBLEMS_PAGE_SIZE = 20
+
 # Page configuration
 st.set_page_config(
     page_title="DSA Topic Recommendation System",
@@ -487,6 +516,16 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+@st.cache_resource
+def get_shared_graph_reader(namespace: str):
+    """Attach this server process to the graph indexes shared by all workers"""
+    return attach_or_publish(TOPIC_DEPENDENCIES, namespace)
+
+@st.cache_resource
+def get_graph_registry():
+    """Process-wide graph registry; reloads swap in a new snapshot without blocking sessions"""
+    return GraphRegistry(TOPIC_DEPENDENCIES)
+
 def main():
     """Main application function"""
     
@@ -498,7 +537,7 @@ def main():
         st.header("🎯 Navigation")
         page = st.selectbox(
             "Choose a page",
-            ["🏠 Home", "📚 Study Plan", "🧩 Problem Suggestions", "💬 Chat", "ℹ️ About"]
+            ["🏠 Home", "📚 Study Plan", "🧩 Problem Suggestions", "📊 Cohort Analytics", "💬 Chat", "ℹ️ About"]
         )
         
         st.markdown("---")
@@ -512,8 +551,15 @@ def main():
     
     # Initialize graph with error handling for deployment
     try:
-        if 'topic_graph' not in st.session_state:
-            st.session_state.topic_graph = TopicGraph(TOPIC_DEPENDENCIES)
+        # Set DSA_SHARED_GRAPH to a namespace to share one graph between server processes
+        shared_namespace = os.environ.get('DSA_SHARED_GRAPH')
+        shared_engine = get_shared_graph_reader(shared_namespace).engine() if shared_namespace else None
+        if shared_engine is not None:
+            st.session_state.topic_graph = shared_engine
+        else:
+            # Nothing published in the shared namespace yet, or none configured: take one local
+            # snapshot per rerun, so a concurrent reload never changes the graph mid-page
+            st.session_state.topic_graph = get_graph_registry().current()
         if 'topological_sort' not in st.session_state:
             st.session_state.topological_sort = TopologicalSort(TOPIC_DEPENDENCIES)
     except Exception as e:
@@ -521,6 +567,17 @@ def main():
         st.info("Please refresh the page to retry initialization.")
         return
     
+    # Learner's solved problems: canonical id -> time solved
+    if 'solved_problems' not in st.session_state:
+        st.session_state.solved_problems = {}
+    # Anonymous learner id, seeding the daily mix
+    if 'learner_id' not in st.session_state:
+        st.session_state.learner_id = uuid.uuid4().hex
+    # The learner's review cards live as long as the session, like its solved problems;
+    # saving them under an id no later session uses would only grow DSA_REVIEW_STATE
+    if 'review_scheduler' not in st.session_state:
+        st.session_state.review_scheduler = ReviewScheduler()
+    
     # Page routing with error handling
     try:
         if page == "🏠 Home":
@@ -529,6 +586,8 @@ def main():
             show_study_plan()
         elif page == "🧩 Problem Suggestions":
             show_problem_suggestions()
+        elif page == "📊 Cohort Analytics":
+            show_cohort_analytics()
         elif page == "💬 Chat":
             show_chat_interface()
         elif page == "ℹ️ About":
@@ -624,7 +683,8 @@ def show_study_plan():
         # Target topic selection
         try:
             all_topics = get_all_topics()
-            target_topic = create_topic_selector(all_topics, "target_topic", "Select topic you want to learn")
+            target_topic = create_topic_selector(all_topics, "target_topic", "Select topic you want to learn",
+                                                 prefix_index=get_topic_prefix_index())
         except Exception as e:
             st.error(f"Error loading topics: {str(e)}")
             return
@@ -632,7 +692,10 @@ def show_study_plan():
     with col2:
         # Known topics selection
         try:
-            known_topics = create_multi_topic_selector(all_topics, "known_topics", "Select topics you already know")
+            known_topics = create_multi_topic_selector(all_topics, "known_topics", "Select topics you already know",
+                                                       prefix_index=get_topic_prefix_index())
+            # Problem recommendations start from these
+            st.session_state.learner_known_topics = known_topics
         except Exception as e:
             st.error(f"Error loading topic selector: {str(e)}")
             known_topics = []
@@ -671,6 +734,45 @@ def show_study_plan():
             st.error(f"Error generating learning path: {str(e)}")
             return
         
+        # One practice set for the whole path
+        if learning_path:
+            st.markdown("---")
+            st.subheader("🧩 Practice Set for This Path")
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                practice_level = create_difficulty_selector("practice_level", "Difficulty")
+            with col2:
+                per_topic_quota = st.number_input("Problems per topic", min_value=1, max_value=50, value=3,
+                                                  key="practice_quota")
+            with col3:
+                practice_page = st.number_input("Page", min_value=1, value=1, key="practice_page")
+            
+            level_mix = None if practice_level == "all" else {practice_level: None}
+            practice = get_practice_set(learning_path, level_mix, int(per_topic_quota), page=int(practice_page))
+            display_practice_set(practice)
+            
+            # Fixed-size set under level and per-topic quotas
+            with st.expander("⚖️ Build a balanced set"):
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    set_size = st.number_input("Problems", min_value=1, max_value=500, value=30, key="balanced_size")
+                with col2:
+                    intermediate_share = st.slider("Intermediate %", 0, 100, 40, key="balanced_intermediate")
+                with col3:
+                    min_per_topic = st.number_input("At least per topic", min_value=0, max_value=20, value=2,
+                                                    key="balanced_min")
+                skip_recent = st.checkbox("Skip problems solved in the last 7 days", value=True, key="balanced_recent")
+                week_ago = time.time() - 7 * 86400
+                recent = [canonical_id for canonical_id, solved_at in st.session_state.solved_problems.items()
+                          if solved_at >= week_ago] if skip_recent else []
+                try:
+                    balanced = get_balanced_practice_set(learning_path, int(set_size),
+                                                         {"intermediate": intermediate_share / 100},
+                                                         int(min_per_topic), exclude=recent)
+                    display_balanced_set(balanced)
+                except ValueError as e:
+                    st.error(str(e))
+        
         # Topic information section
         st.markdown("---")
         st.subheader(f"ℹ️ About {target_topic}")
@@ -800,6 +902,54 @@ def show_problem_suggestions():
     
     st.markdown('<h2 class="sub-header">🧩 Problem Suggestions</h2>', unsafe_allow_html=True)
     
+    # Full-text search across all topics
+    search_query = st.text_input(
+        "🔎 Search problems",
+        key="problem_search",
+        placeholder="e.g. median, rectangle, linked list cycle",
+        help="Searches problem titles and descriptions across every topic"
+    )
+    if search_query.strip():
+        display_search_results(search_problems(search_query, limit=20), search_query.strip())
+        st.markdown("---")
+    
+    # Boolean filter over topics, levels, platforms and tags
+    filter_query = st.text_input(
+        "🧮 Filter problems",
+        key="problem_filter",
+        placeholder="e.g. (Heaps OR Queues) AND advanced AND NOT solved",
+        help="Combine topics, levels, platforms and tags with AND, OR, NOT and parentheses; "
+             "\"solved\" means problems you marked solved"
+    )
+    if filter_query.strip():
+        try:
+            display_search_results(filter_problems(filter_query, st.session_state.solved_problems),
+                                   filter_query.strip())
+        except ValueError as e:
+            st.error(str(e))
+        st.markdown("---")
+    
+    solved = st.session_state.solved_problems
+    
+    # Solved problems coming back for spaced-repetition review
+    due_reviews = get_due_reviews(st.session_state.learner_id, solved, limit=5,
+                                  scheduler=st.session_state.review_scheduler)
+    if due_reviews:
+        st.subheader("🔁 Due for Review")
+        display_due_reviews(due_reviews, st.session_state.learner_id, st.session_state.review_scheduler)
+        st.markdown("---")
+    
+    # Personalized next problems from what the learner knows and has solved
+    st.subheader("⭐ Recommended Next")
+    recommended = recommend_problems(solved, st.session_state.get("learner_known_topics", []), k=5, per_topic=2)
+    display_recommendations(recommended, solved)
+    st.markdown("---")
+    
+    # Randomized mix of unsolved problems, fixed for the day
+    st.subheader("🎲 Today's Mix")
+    display_daily_mix(get_daily_mix(st.session_state.learner_id, solved, k=5), solved)
+    st.markdown("---")
+    
     # User input section
     st.subheader("🎯 What level of problems do you want to practice?")
     
@@ -808,7 +958,8 @@ def show_problem_suggestions():
     with col1:
         # Topic selection
         available_topics = get_available_topics_for_problems()
-        topic = create_topic_selector(available_topics, "problem_topic", "Select topic")
+        topic = create_topic_selector(available_topics, "problem_topic", "Select topic",
+                                      prefix_index=get_topic_prefix_index())
     
     with col2:
         # Difficulty level selection
@@ -818,15 +969,24 @@ def show_problem_suggestions():
     if topic and difficulty_level:
         st.markdown("---")
         
-        # Get problems
-        problems = get_problems_by_topic_and_level(topic, difficulty_level)
+        # Get the current page of problems
+        try:
+            page = get_problem_page(topic, difficulty_level, page_cursor("problem_pages", (topic, difficulty_level)),
+                                    PROBLEMS_PAGE_SIZE)
+        except ValueError:
+            # The list changed shape since the cursor was made; start over
+            reset_pager("problem_pages")
+            page = get_problem_page(topic, difficulty_level, page_cursor("problem_pages", (topic, difficulty_level)),
+                                    PROBLEMS_PAGE_SIZE)
         
-        if problems:
+        if page["problems"]:
             # Display problem summary
-            display_problem_summary(len(problems), topic, difficulty_level)
+            display_problem_summary(page["total"], topic, difficulty_level)
             
-            # Display problems
-            display_problems(problems, topic, difficulty_level)
+            # Display only the current page of problems
+            display_problems(page["problems"], topic, difficulty_level, st.session_state.solved_problems,
+                             page["start"])
+            display_page_controls(page, "problem_pages")
             
             # Show practice tips
             st.markdown("---")
@@ -905,6 +1065,8 @@ def show_problem_suggestions():
             if problem_counts:
                 fig = create_problem_stats_chart(problem_counts)
                 st.plotly_chart(fig, use_container_width=True)
+                st.caption(f"{get_unique_problem_count()} distinct problems "
+                           f"({sum(problem_counts.values())} listings across topics)")
         
         # Related topics
         if topic in TOPIC_DEPENDENCIES:
@@ -915,11 +1077,44 @@ def show_problem_suggestions():
                 st.write("Consider learning these topics before diving deep into the problems:")
                 for dep in dependencies:
                     if dep in available_topics:
-                        dep_count = len(get_problems_by_topic_and_level(dep, "all"))
+                        dep_count = get_problem_count(dep, "all", dedup=True)
                         st.write(f"• **{dep}** ({dep_count} problems available)")
                     else:
                         st.write(f"• **{dep}** (learning path available)")
 
+def show_cohort_analytics():
+    """Display class-wide progress analytics from uploaded progress events"""
+    st.header("📊 Cohort Analytics")
+    st.markdown(f"Upload your class's progress as CSV files with the columns `{'`, `'.join(EVENT_COLUMNS)}` "
+                "(epoch seconds or ISO dates), one row per completed topic. New files are added to the "
+                "dashboard without reloading the earlier ones.")
+    
+    # One cohort per session, rebuilt if the curriculum's levels changed
+    topics_by_level = st.session_state.topic_graph.get_topics_by_level()
+    analytics = st.session_state.get("cohort_analytics")
+    if analytics is None or analytics.topics != [topic for level in sorted(topics_by_level)
+                                                 for topic in topics_by_level[level]]:
+        analytics = st.session_state.cohort_analytics = CohortAnalytics(topics_by_level)
+        st.session_state.cohort_files = set()
+    
+    uploads = st.file_uploader("Progress events", type="csv", accept_multiple_files=True, key="cohort_uploads")
+    for upload in uploads or []:
+        upload_key = (upload.name, upload.size)
+        if upload_key in st.session_state.cohort_files:
+            continue
+        try:
+            applied = analytics.add_events(pd.read_csv(upload))
+        except ValueError as e:
+            st.error(f"{upload.name}: {e}")
+            continue
+        st.session_state.cohort_files.add(upload_key)
+        st.success(f"{upload.name}: {applied} progress events added")
+    
+    if not len(analytics):
+        st.info("No progress events yet.")
+        return
+    display_cohort_analytics(analytics)
+
 def show_chat_interface():
     """Display the chat interface"""
     
@@ -0,0 +1,77 @@
+"""
+Autocomplete Benchmark
+Builds the prefix index over synthetic topics and a large synthetic problem
+catalog's titles and reports build time and completion latency by prefix
+length, next to ranking a linear scan of all names
+
+Usage:
+    python benchmarks/bench_autocomplete.py --problems 1000000 --topics 10000
+"""
+
+import argparse
+import random
+import time
+from typing import Any, Dict, List
+
+from bench_utils import environment_info, print_table, summarize, time_call, write_results
+
+from data.autocomplete import build_index, normalize
+from data.synthetic import generate_problem_catalog, layered_curriculum
+
+def linear_scan(names: List[str], prefix: str, limit: int) -> List[str]:
+    """Baseline: every name with a word starting with the prefix, shortest first"""
+    prefix = normalize(prefix)
+    hits = [name for name in names if any(word.startswith(prefix) for word in name.lower().split())
+            or name.lower().startswith(prefix)]
+    return sorted(hits, key=len)[:limit]
+
+def main():
+    parser = argparse.ArgumentParser(description="Prefix autocomplete benchmark")
+    parser.add_argument("--problems", type=int, default=1_000_000, help="problems in the synthetic catalog")
+    parser.add_argument("--topics", type=int, default=10_000, help="synthetic topics")
+    parser.add_argument("--queries", type=int, default=500, help="lookups per prefix length")
+    parser.add_argument("--limit", type=int, default=10, help="completions per lookup")
+    parser.add_argument("--scan-queries", type=int, default=3, help="lookups for the linear scan baseline")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--output", help="optional path for JSON results")
+    args = parser.parse_args()
+
+    problems_data = generate_problem_catalog(args.problems, num_topics=100, seed=args.seed)
+    titles = [problem["title"] for levels in problems_data.values() for problems in levels.values() for problem in problems]
+    topics = list(layered_curriculum(args.topics, seed=args.seed))
+
+    start = time.perf_counter()
+    index = build_index(topics, {}, titles)
+    build_s = time.perf_counter() - start
+
+    rng = random.Random(args.seed)
+    names = topics + titles
+    rows: List[Dict[str, Any]] = []
+    for length in (1, 2, 3, 4, 6):
+        prefixes = []
+        for _ in range(args.queries):
+            word = rng.choice(rng.choice(names).split())
+            prefixes.append(word[:length])
+        stats = summarize([time_call(lambda: index.complete(prefix, args.limit)) for prefix in prefixes])
+        rows.append({"prefix_len": length, "method": "index", "mean_us": stats["mean_us"],
+                     "p50_us": stats["p50_us"], "p99_us": stats["p99_us"], "max_us": stats["max_us"]})
+        if length in (1, 4):
+            scan = summarize([time_call(lambda: linear_scan(names, prefix, args.limit))
+                              for prefix in prefixes[:args.scan_queries]])
+            rows.append({"prefix_len": length, "method": "scan", "mean_us": scan["mean_us"],
+                         "p50_us": scan["p50_us"], "p99_us": scan["p99_us"], "max_us": scan["max_us"]})
+
+    print(f"index: {len(index)} names, built in {build_s:.1f} s")
+    print_table(rows, ["prefix_len", "method", "mean_us", "p50_us", "p99_us", "max_us"])
+
+    if args.output:
+        write_results(args.output, {
+            "benchmark": "autocomplete",
+            "environment": environment_info(),
+            "parameters": vars(args),
+            "build_s": build_s,
+            "results": rows,
+        })
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Balanced Practice Set Benchmark
+Times building practice sets under level shares and per-topic minimums and
+maximums for learning paths of growing length over a large synthetic
+catalog, with and without a block of recently solved problems excluded,
+and checks every set against its quotas
+
+Usage:
+    python benchmarks/bench_balanced_set.py --problems 1000000 --topics 1000
+"""
+
+import argparse
+import random
+from typing import Any, Dict, List
+
+from bench_utils import environment_info, print_table, summarize, time_call, write_results
+
+from data.catalog import ProblemCatalog
+from data.practice import build_balanced_set
+from data.synthetic import generate_problem_catalog
+
+def check_quotas(result: Dict[str, Any], path: List[str], size: int, min_per_topic: int, max_per_topic: int,
+                 excluded) -> bool:
+    """Whether a set has its size, per-topic bounds and level targets, or reports why not"""
+    problems = result["problems"]
+    ids = [problem.problem_id for problem in problems]
+    if len(set(ids)) != len(ids) or excluded.intersection(ids):
+        return False
+    if result["shortfalls"]:
+        return True
+    counts = result["topic_counts"]
+    return (len(problems) == size
+            and all(min_per_topic <= counts.get(topic, 0) <= max_per_topic for topic in path)
+            and all(result["level_counts"][level] == target for level, target in result["level_targets"].items()))
+
+def main():
+    parser = argparse.ArgumentParser(description="Balanced practice sets under topic and level quotas")
+    parser.add_argument("--problems", type=int, default=1_000_000, help="problems in the synthetic catalog")
+    parser.add_argument("--topics", type=int, default=1000, help="topics in the synthetic catalog")
+    parser.add_argument("--paths", default="20,200,500", help="comma separated path lengths")
+    parser.add_argument("--problems-per-topic", type=float, default=3.0, help="set size per path topic")
+    parser.add_argument("--intermediate", type=float, default=0.4, help="intermediate share of each set")
+    parser.add_argument("--min-per-topic", type=int, default=1, help="fewest problems per path topic")
+    parser.add_argument("--max-per-topic", type=int, default=6, help="most problems per path topic")
+    parser.add_argument("--excluded", type=int, default=20, help="recently solved problems per path topic")
+    parser.add_argument("--repeat", type=int, default=20, help="timed runs per case")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--output", help="optional path for JSON results")
+    args = parser.parse_args()
+
+    catalog = ProblemCatalog(generate_problem_catalog(args.problems, num_topics=args.topics, seed=args.seed))
+    rng = random.Random(args.seed)
+    topics = catalog.topics()
+    shares = {"intermediate": args.intermediate}
+
+    rows: List[Dict[str, Any]] = []
+    for length in (int(n) for n in args.paths.split(",")):
+        path = rng.sample(topics, min(length, len(topics)))
+        size = int(len(path) * args.problems_per_topic)
+        recent = {problem.problem_id for topic in path
+                  for problem in catalog.problems(topic, dedup=True)[:args.excluded]}
+        for excluded in (set(), recent):
+            run = lambda: build_balanced_set(catalog, path, size, shares, args.min_per_topic, args.max_per_topic,
+                                             excluded)
+            result = run()
+            stats = summarize([time_call(run) for _ in range(args.repeat)])
+            rows.append({"path_topics": len(path), "size": size, "excluded": len(excluded),
+                         "levels": "/".join(str(count) for count in result["level_counts"].values()),
+                         "quotas_met": check_quotas(result, path, size, args.min_per_topic, args.max_per_topic,
+                                                    excluded),
+                         "mean_ms": stats["mean_us"] / 1e3, "p99_ms": stats["p99_us"] / 1e3})
+
+    print_table(rows, ["path_topics", "size", "excluded", "levels", "quotas_met", "mean_ms", "p99_ms"])
+
+    if args.output:
+        write_results(args.output, {
+            "benchmark": "balanced_set",
+            "environment": environment_info(),
+            "parameters": vars(args),
+            "results": rows,
+        })
+
+if __name__ == "__main__":
+    main()
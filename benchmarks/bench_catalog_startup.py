@@ -0,0 +1,129 @@
+"""
+Catalog Startup Benchmark
+Measures, in a fresh interpreter per run, the time from start to the first
+topic query and the resident memory afterwards, for the problem data as one
+Python literal module (compiled into the full catalog) versus per-topic
+shards loaded lazily, with the bundled data and a generated catalog scaled
+up from it
+
+Usage:
+    python benchmarks/bench_catalog_startup.py --scale 100 --repeat 5
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List
+
+from bench_utils import environment_info, percentile, print_table, write_results
+
+def _rss_kb() -> int:
+    """Resident set size of this process from /proc (0 where unavailable)"""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+def child(mode: str, source: str):
+    """Start up one way, answer the first topic query and print timings as JSON"""
+    baseline_kb = _rss_kb()
+    start = time.perf_counter()
+    if mode == "module":
+        # Same path as the app without shards: import the literal, compile the catalog
+        from data.catalog import ProblemCatalog
+        sys.path.insert(0, os.path.dirname(source))
+        module = __import__(os.path.splitext(os.path.basename(source))[0])
+        catalog = ProblemCatalog(module.PROBLEMS_DATA)
+        topics = catalog.topics()
+        first = catalog.problems(topics[0], "all")
+    else:
+        from data.shards import ShardedProblemStore
+        store = ShardedProblemStore(source)
+        topics = store.topics()
+        first = store.problems(topics[0], "all")
+    elapsed = time.perf_counter() - start
+    print(json.dumps({"startup_ms": elapsed * 1e3, "rss_kb": _rss_kb(), "rss_delta_kb": _rss_kb() - baseline_kb,
+                      "topics": len(topics), "first_topic_problems": len(first)}))
+
+def run_child(mode: str, source: str) -> Dict[str, Any]:
+    out = subprocess.run([sys.executable, os.path.abspath(__file__), "--child", mode, source],
+                         check=True, capture_output=True, text=True).stdout
+    return json.loads(out)
+
+def write_module(problems_data, path: str):
+    """Write problem data as a Python literal module, like problem_bank.py"""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("PROBLEMS_DATA = ")
+        f.write(repr(problems_data))
+        f.write("\n")
+
+def scaled_catalog(problems_data, scale: int):
+    """Catalog with scale times the topics of the bundled data, each a renamed copy of a bundled topic"""
+    scaled = {}
+    for copy in range(scale):
+        for topic, levels in problems_data.items():
+            name = topic if copy == 0 else f"{topic} {copy}"
+            scaled[name] = {
+                level: [{**problem, "link": f"{problem['link']}?copy={copy}"} if copy and "link" in problem
+                        else dict(problem) for problem in problems]
+                for level, problems in levels.items()
+            }
+    return scaled
+
+def main():
+    parser = argparse.ArgumentParser(description="Problem catalog startup time and memory benchmark")
+    parser.add_argument("--scale", type=int, default=100, help="size of the generated catalog relative to the bundled one")
+    parser.add_argument("--repeat", type=int, default=5, help="fresh-interpreter runs per case")
+    parser.add_argument("--output", help="optional path for JSON results")
+    parser.add_argument("--child", nargs=2, metavar=("MODE", "SOURCE"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(*args.child)
+        return
+
+    from data.problem_bank import PROBLEMS_DATA
+    from data.shards import write_shards
+
+    rows: List[Dict[str, Any]] = []
+    with tempfile.TemporaryDirectory() as workdir:
+        datasets = {"bundled": PROBLEMS_DATA, f"{args.scale}x": scaled_catalog(PROBLEMS_DATA, args.scale)}
+        for name, problems_data in datasets.items():
+            module = os.path.join(workdir, f"problems_{name}.py")
+            shards = os.path.join(workdir, f"shards_{name}")
+            write_module(problems_data, module)
+            write_shards(problems_data, shards)
+            size = sum(len(problems) for levels in problems_data.values() for problems in levels.values())
+            for mode, source in (("module", module), ("shards", shards)):
+                # Untimed first run writes the module's bytecode cache, as a deployed app would have
+                run_child(mode, source)
+                runs = [run_child(mode, source) for _ in range(args.repeat)]
+                rows.append({
+                    "catalog": name,
+                    "problems": size,
+                    "mode": mode,
+                    "startup_ms": percentile([r["startup_ms"] for r in runs], 50),
+                    "rss_mb": percentile([r["rss_kb"] for r in runs], 50) / 1024,
+                    "rss_delta_mb": percentile([r["rss_delta_kb"] for r in runs], 50) / 1024,
+                })
+
+    print_table(rows, ["catalog", "problems", "mode", "startup_ms", "rss_mb", "rss_delta_mb"])
+
+    if args.output:
+        write_results(args.output, {
+            "benchmark": "catalog_startup",
+            "environment": environment_info(),
+            "parameters": vars(args),
+            "results": rows,
+        })
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Closure Crossover Benchmark
+Compares BFS closure queries (dict and CSR engines) with the NumPy bitset
+engine on dense layered curricula, and reports after how many queries the
+bitset build cost pays for itself
+
+Usage:
+    python benchmarks/bench_closure_crossover.py --sizes 500,1000,2000,4000 --density 8
+"""
+
+import argparse
+import random
+from typing import Any, Dict, List
+
+from bench_utils import environment_info, print_table, summarize, time_call, write_results
+
+from data.synthetic import layered_curriculum
+from graph.engine import create_engine
+
+BFS_BACKENDS = ["dict", "csr"]
+
+def bfs_cohort_coverage(engine, cohort: List[List[str]]) -> Dict[str, int]:
+    """Reference cohort coverage computed with one BFS per known topic"""
+    counts = dict.fromkeys(engine.topics(), 0)
+    for known in cohort:
+        covered = set(known)
+        for topic in known:
+            covered.update(engine.get_prerequisites(topic))
+        for topic in covered:
+            counts[topic] += 1
+    return counts
+
+def run_size(nodes: int, density: float, queries: int, cohort_size: int, seed: int) -> List[Dict[str, Any]]:
+    """Benchmark every backend on one curriculum size"""
+    dependencies = layered_curriculum(nodes, seed=seed, layers=max(2, int(nodes ** 0.5) // 2), avg_prereqs=density)
+    topics = list(dependencies)
+    rng = random.Random(seed)
+    query_topics = [rng.choice(topics) for _ in range(queries)]
+    cohort = [rng.sample(topics, 5) for _ in range(cohort_size)]
+    edges = sum(len(p) for p in dependencies.values())
+
+    engines = {}
+    rows = []
+    for backend in BFS_BACKENDS + ["numpy"]:
+        build = time_call(lambda: engines.__setitem__(backend, create_engine(dependencies, backend)))
+        engine = engines[backend]
+        samples = [time_call(lambda: engine.get_prerequisites(topic)) for topic in query_topics]
+        if backend == "numpy":
+            cohort_seconds = time_call(lambda: engine.cohort_coverage(cohort))
+        else:
+            cohort_seconds = time_call(lambda: bfs_cohort_coverage(engine, cohort))
+        stats = summarize(samples)
+        rows.append({"nodes": nodes, "edges": edges, "backend": backend, "build_ms": build * 1e3,
+                     "query_mean_us": stats["mean_us"], "query_p95_us": stats["p95_us"],
+                     "cohort_ms": cohort_seconds * 1e3})
+
+    bitset = rows[-1]
+    for row in rows[:-1]:
+        saved_per_query = row["query_mean_us"] - bitset["query_mean_us"]
+        extra_build_us = (bitset["build_ms"] - row["build_ms"]) * 1e3
+        row["crossover_queries"] = int(extra_build_us / saved_per_query) if saved_per_query > 0 else "never"
+    bitset["matrix_mb"] = engines["numpy"].closure.nbytes() / 1e6
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description="BFS vs NumPy bitset closure crossover benchmark")
+    parser.add_argument("--sizes", default="250,500,1000,2000,4000", help="comma separated topic counts")
+    parser.add_argument("--density", type=float, default=8.0, help="average prerequisites per topic")
+    parser.add_argument("--queries", type=int, default=500, help="closure queries per backend")
+    parser.add_argument("--cohort", type=int, default=1000, help="learners in the cohort coverage query")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--output", help="optional path for JSON results")
+    args = parser.parse_args()
+
+    rows = []
+    for nodes in (int(s) for s in args.sizes.split(",")):
+        rows.extend(run_size(nodes, args.density, args.queries, args.cohort, args.seed))
+
+    print_table(rows, ["nodes", "edges", "backend", "build_ms", "query_mean_us", "query_p95_us",
+                       "cohort_ms", "crossover_queries", "matrix_mb"])
+
+    if args.output:
+        write_results(args.output, {
+            "benchmark": "closure_crossover",
+            "environment": environment_info(),
+            "parameters": vars(args),
+            "results": rows,
+        })
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Cohort Analytics Benchmark
+Times class dashboards over the bundled curriculum for cohorts of growing
+size: loading every progress event into the columnar matrix, refreshing
+after a small batch of new events, and the dashboard queries (funnel,
+completion distribution, share past a topic, median time between two
+topics), next to per-learner Python dictionaries scanned for every query
+and a from-scratch rebuild for every batch
+
+Learners work through the curriculum in topological order with random
+gaps between topics and stop at a random point, so the funnel narrows
+level by level.
+
+Usage:
+    python benchmarks/bench_cohort_analytics.py --learners 1000 10000 100000
+"""
+
+import argparse
+import random
+import statistics
+import time
+from typing import Any, Dict, List
+
+import numpy as np
+import pandas as pd
+
+from bench_utils import environment_info, print_table, summarize, time_call, write_results
+
+from data.analytics import DAY, CohortAnalytics
+from data.topic_data import TOPIC_DEPENDENCIES
+from graph.engine import create_engine
+
+def progress_events(learners: int, order: List[str], rng: random.Random, start: float) -> pd.DataFrame:
+    """Completion events of learners who follow the topological order and drop out at random"""
+    rows = []
+    for i in range(learners):
+        clock = start + rng.random() * 30 * DAY
+        for topic in order[:int(len(order) * rng.random() ** 0.7) + 1]:
+            clock += rng.expovariate(1 / (4 * DAY))
+            rows.append((f"learner-{i}", topic, clock))
+    return pd.DataFrame(rows, columns=["learner", "topic", "completed_at"])
+
+def dictionary_dashboard(progress: Dict[str, Dict[str, float]], levels: Dict[int, List[str]]):
+    """Baseline: every dashboard number from per-learner dictionaries"""
+    ordered = sorted(levels)
+    funnel = [0] * len(ordered)
+    distribution: Dict[int, int] = {}
+    days = []
+    past = 0
+    for topics in progress.values():
+        for i, level in enumerate(ordered):
+            if not all(topic in topics for topic in levels[level]):
+                break
+            funnel[i] += 1
+        distribution[len(topics)] = distribution.get(len(topics), 0) + 1
+        past += "Graphs" in topics
+        if "Recursion" in topics and "Dynamic Programming" in topics:
+            days.append((topics["Dynamic Programming"] - topics["Recursion"]) / DAY)
+    return funnel, distribution, past / len(progress), statistics.median(days) if days else float("nan")
+
+def columnar_dashboard(analytics: CohortAnalytics):
+    return (analytics.funnel(), analytics.completion_distribution(), analytics.share_past("Graphs"),
+            analytics.median_days_between("Recursion", "Dynamic Programming"))
+
+def main():
+    parser = argparse.ArgumentParser(description="Columnar cohort analytics vs per-learner dictionaries")
+    parser.add_argument("--learners", type=int, nargs="+", default=[1000, 10_000, 100_000], help="cohort sizes")
+    parser.add_argument("--batch", type=int, default=200, help="new events per incremental refresh")
+    parser.add_argument("--repeats", type=int, default=10, help="timed runs per case")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--output", help="optional path for JSON results")
+    args = parser.parse_args()
+
+    engine = create_engine(TOPIC_DEPENDENCIES)
+    levels = engine.get_topics_by_level()
+    order = engine.topological_order()
+    rng = random.Random(args.seed)
+
+    rows: List[Dict[str, Any]] = []
+    for learners in args.learners:
+        events = progress_events(learners, order, rng, time.time() - 365 * DAY)
+        batch = events.sample(args.batch, random_state=args.seed).assign(completed_at=time.time())
+
+        start = time.perf_counter()
+        analytics = CohortAnalytics(levels)
+        analytics.add_events(events)
+        load_ms = (time.perf_counter() - start) * 1e3
+        progress: Dict[str, Dict[str, float]] = {}
+        for learner, topic, completed_at in events.itertuples(index=False):
+            progress.setdefault(learner, {})[topic] = completed_at
+
+        funnel, distribution, past, median = dictionary_dashboard(progress, levels)
+        columns = columnar_dashboard(analytics)
+        assert columns[0]["learners"].tolist() == funnel
+        assert abs(columns[2] - past) < 1e-12 and abs(columns[3] - median) < 1e-9
+
+        common = {"learners": learners, "events": len(events)}
+        dashboard = summarize([time_call(lambda: columnar_dashboard(analytics)) for _ in range(args.repeats)])
+        scan = summarize([time_call(lambda: dictionary_dashboard(progress, levels)) for _ in range(args.repeats)])
+        rows.append({**common, "operation": "dashboard queries", "method": "columnar",
+                     "mean_ms": dashboard["mean_us"] / 1e3, "p99_ms": dashboard["p99_us"] / 1e3})
+        rows.append({**common, "operation": "dashboard queries", "method": "per-learner dicts",
+                     "mean_ms": scan["mean_us"] / 1e3, "p99_ms": scan["p99_us"] / 1e3})
+
+        def rebuild():
+            fresh = CohortAnalytics(levels)
+            fresh.add_events(pd.concat([events, batch], ignore_index=True))
+        incremental = summarize([time_call(lambda: analytics.add_events(batch)) for _ in range(args.repeats)])
+        full = summarize([time_call(rebuild) for _ in range(max(2, args.repeats // 5))])
+        rows.append({**common, "operation": f"refresh after {args.batch} events", "method": "incremental",
+                     "mean_ms": incremental["mean_us"] / 1e3, "p99_ms": incremental["p99_us"] / 1e3})
+        rows.append({**common, "operation": f"refresh after {args.batch} events", "method": "rebuild",
+                     "mean_ms": full["mean_us"] / 1e3, "p99_ms": full["p99_us"] / 1e3})
+        rows.append({**common, "operation": "load all events", "method": "columnar",
+                     "mean_ms": load_ms, "p99_ms": float(np.nan)})
+
+    print_table(rows, ["learners", "events", "operation", "method", "mean_ms", "p99_ms"])
+
+    if args.output:
+        write_results(args.output, {
+            "benchmark": "cohort_analytics",
+            "environment": environment_info(),
+            "parameters": vars(args),
+            "results": rows,
+        })
+
+if __name__ == "__main__":
+    main()
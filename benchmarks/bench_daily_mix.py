@@ -0,0 +1,88 @@
+"""
+Daily Mix Benchmark
+Times one learner's daily mix from the warm alias table next to weighted
+reservoir sampling (A-Res) over every problem, across catalog sizes and
+shares of solved problems
+
+A-Res gives every unsolved problem the key u^(1 / weight) and keeps the k
+largest, the one-pass way to draw a weighted sample without replacement;
+it is exact but reads the whole catalog for every learner. The alias
+table is built once per catalog, so its time should stay flat as the
+catalog grows, rising only when most of the catalog is solved and draws
+are rejected.
+
+Usage:
+    python benchmarks/bench_daily_mix.py --sizes 10000 100000 1000000 --topics 200
+"""
+
+import argparse
+import heapq
+import random
+import time
+from typing import Any, Dict, List
+
+from bench_utils import environment_info, print_table, summarize, time_call, write_results
+
+from data.catalog import ProblemCatalog
+from data.daily_mix import DEFAULT_LEVEL_WEIGHTS, DailyMixSampler
+from data.synthetic import generate_problem_catalog
+
+def reservoir_mix(catalog: ProblemCatalog, topic_weights, k: int, rng: random.Random, exclude) -> list:
+    """A-Res over every (topic, level) listing of the catalog"""
+    keyed = []
+    for topic in catalog.topics():
+        topic_weight = topic_weights.get(topic, 1.0)
+        for level, level_weight in DEFAULT_LEVEL_WEIGHTS.items():
+            weight = topic_weight * level_weight
+            for problem in catalog.problems(topic, level, dedup=True):
+                if problem.problem_id not in exclude:
+                    keyed.append((rng.random() ** (1.0 / weight), problem.problem_id))
+    return heapq.nlargest(k, keyed)
+
+def main():
+    parser = argparse.ArgumentParser(description="Alias-table daily mixes vs weighted reservoir sampling")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000],
+                        help="problems in each synthetic catalog")
+    parser.add_argument("--topics", type=int, default=200, help="topics in the synthetic catalogs")
+    parser.add_argument("--solved", type=float, nargs="+", default=[0.0, 0.1, 0.9, 0.999],
+                        help="shares of the catalog a learner has solved")
+    parser.add_argument("--k", type=int, default=10, help="problems per mix")
+    parser.add_argument("--learners", type=int, default=200, help="timed mixes per case")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--output", help="optional path for JSON results")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    rows: List[Dict[str, Any]] = []
+    for size in args.sizes:
+        catalog = ProblemCatalog(generate_problem_catalog(size, num_topics=args.topics, seed=args.seed))
+        topic_weights = {topic: rng.choice((1.0, 2.0, 4.0)) for topic in catalog.topics()}
+        start = time.perf_counter()
+        sampler = DailyMixSampler(catalog, topic_weights)
+        build_ms = (time.perf_counter() - start) * 1e3
+        for share in args.solved:
+            solved = set(rng.sample(range(catalog.unique_count()), int(catalog.unique_count() * share)))
+            mixes = []
+            users = [f"learner-{i}" for i in range(args.learners)]
+            alias = summarize([time_call(lambda: mixes.append(sampler.daily_mix(user, args.k, solved)))
+                               for user in users])
+            assert all(len(mix) == args.k and not any(p.problem_id in solved for p in mix) for mix in mixes)
+            reservoir = summarize([time_call(lambda: reservoir_mix(catalog, topic_weights, args.k, rng, solved))
+                                   for _ in range(max(3, args.learners // 50))])
+            for method, stats in (("alias table", alias), ("A-Res scan", reservoir)):
+                rows.append({"problems": catalog.unique_count(), "solved": share, "method": method,
+                             "build_ms": build_ms if method == "alias table" else 0.0,
+                             "mean_us": stats["mean_us"], "p50_us": stats["p50_us"], "p99_us": stats["p99_us"]})
+
+    print_table(rows, ["problems", "solved", "method", "build_ms", "mean_us", "p50_us", "p99_us"])
+
+    if args.output:
+        write_results(args.output, {
+            "benchmark": "daily_mix",
+            "environment": environment_info(),
+            "parameters": vars(args),
+            "results": rows,
+        })
+
+if __name__ == "__main__":
+    main()
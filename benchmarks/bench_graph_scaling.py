@@ -0,0 +1,211 @@
+"""
+Graph Scaling Benchmark
+Times TopicGraph and TopologicalSort (and optionally the engine backends) on
+synthetic curricula from 10^2 to 10^6 topics and writes JSON results that can
+be compared against a previous run
+
+Every (curriculum, size, engine) case runs in its own process with a wall
+clock limit, so one pathological operation cannot stall the whole suite.
+
+Usage:
+    python benchmarks/bench_graph_scaling.py --max-nodes 100000 --output benchmarks/results/scaling.json
+    python benchmarks/bench_graph_scaling.py --baseline benchmarks/results/scaling.json
+"""
+
+import argparse
+import json
+import multiprocessing as mp
+import queue
+import random
+import sys
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+from bench_utils import environment_info, print_table, summarize, time_call, write_results
+
+from data.synthetic import CURRICULUM_GENERATORS, generate_curriculum
+from graph.engine import create_engine
+from graph.topic_graph import TopicGraph
+from graph.topological_sort import TopologicalSort
+
+LEGACY_ENGINES = ["topic_graph", "topological_sort"]
+
+def _legacy_operations(engine_name: str, dependencies: Dict[str, List[str]]) -> Tuple[Any, Dict[str, Callable]]:
+    """Build a legacy engine and map benchmark operations onto its methods"""
+    if engine_name == "topic_graph":
+        engine = TopicGraph(dependencies)
+        return engine, {
+            "closure_prerequisites": engine.get_prerequisites,
+            "closure_dependents": engine.get_dependent_topics,
+            "learning_path": lambda topic, known: engine.get_learning_path(topic, known),
+            "level": engine.get_topic_level,
+            "sort_subgraph": engine._topological_sort_subgraph,
+        }
+
+    engine = TopologicalSort(dependencies)
+    return engine, {
+        "closure_prerequisites": engine._get_all_prerequisites,
+        "learning_path": lambda topic, known: engine.get_learning_order(topic, known),
+        "level": engine.get_dependency_depth,
+        "levels_all": engine.get_topics_by_depth,
+        "sort_subgraph": engine.sort_subgraph,
+    }
+
+def _engine_operations(backend: str, dependencies: Dict[str, List[str]]) -> Tuple[Any, Dict[str, Callable]]:
+    """Build an engine backend and map benchmark operations onto its methods"""
+    engine = create_engine(dependencies, backend)
+    return engine, {
+        "closure_prerequisites": engine.get_prerequisites,
+        "closure_dependents": engine.get_dependent_topics,
+        "learning_path": lambda topic, known: engine.get_learning_path(topic, known),
+        "level": engine.get_topic_level,
+        "levels_all": engine.get_topics_by_level,
+        "sort_subgraph": engine.sort_subgraph,
+    }
+
+def _operation_args(operation: str, topics: List[str], rng: random.Random) -> tuple:
+    if operation == "levels_all":
+        return ()
+    if operation == "learning_path":
+        return (rng.choice(topics), rng.sample(topics, min(3, len(topics))))
+    if operation == "sort_subgraph":
+        return (rng.sample(topics, min(200, len(topics))),)
+    return (rng.choice(topics),)
+
+def run_case(kind: str, nodes: int, engine_name: str, seed: int, queries: int,
+             op_budget: float, results: "mp.Queue"):
+    """Benchmark one engine on one curriculum; runs in a child process"""
+    sys.setrecursionlimit(10000)
+    dependencies = generate_curriculum(kind, nodes, seed=seed)
+    edges = sum(len(prereqs) for prereqs in dependencies.values())
+    topics = list(dependencies)
+    base = {"kind": kind, "nodes": nodes, "edges": edges, "engine": engine_name}
+
+    built = {}
+
+    def build():
+        builder = _legacy_operations if engine_name in LEGACY_ENGINES else _engine_operations
+        built["engine"], built["operations"] = builder(engine_name, dependencies)
+
+    results.put({**base, "operation": "construction", "status": "ok", **summarize([time_call(build)])})
+
+    for operation, method in built["operations"].items():
+        rng = random.Random(seed)
+        samples = []
+        status = "ok"
+        deadline = time.perf_counter() + op_budget
+        try:
+            for _ in range(1 if operation == "levels_all" else queries):
+                args = _operation_args(operation, topics, rng)
+                samples.append(time_call(lambda: method(*args)))
+                if time.perf_counter() > deadline:
+                    status = "budget"
+                    break
+        except RecursionError:
+            status = "recursion_error"
+        results.put({**base, "operation": operation, "status": status, **summarize(samples)})
+
+def run_suite(kinds: List[str], sizes: List[int], engines: List[str], seed: int,
+              queries: int, op_budget: float, case_timeout: float) -> List[Dict[str, Any]]:
+    """Run every case in a child process, collecting whatever rows finish in time"""
+    rows = []
+    ctx = mp.get_context("spawn" if sys.platform == "win32" else "fork")
+    for kind in kinds:
+        for nodes in sizes:
+            for engine_name in engines:
+                results = ctx.Queue()
+                process = ctx.Process(target=run_case, args=(kind, nodes, engine_name, seed, queries, op_budget, results))
+                process.start()
+                case_rows = []
+                deadline = time.perf_counter() + case_timeout
+                while process.is_alive() or not results.empty():
+                    try:
+                        case_rows.append(results.get(timeout=0.1))
+                    except queue.Empty:
+                        pass
+                    if time.perf_counter() > deadline:
+                        process.terminate()
+                        case_rows.append({"kind": kind, "nodes": nodes, "engine": engine_name,
+                                          "operation": "remaining", "status": "timeout", **summarize([])})
+                        break
+                process.join()
+                if process.exitcode not in (0, None) and not any(r["status"] == "timeout" for r in case_rows):
+                    case_rows.append({"kind": kind, "nodes": nodes, "engine": engine_name,
+                                      "operation": "remaining", "status": f"exit_{process.exitcode}", **summarize([])})
+                rows.extend(case_rows)
+                print(f"{kind:>9} {nodes:>8} {engine_name:<17} {len(case_rows)} rows", file=sys.stderr)
+    return rows
+
+def compare_to_baseline(rows: List[Dict[str, Any]], baseline_path: str, threshold: float) -> List[Dict[str, Any]]:
+    """
+    Compare mean latency with a previous results file
+
+    Args:
+        rows: Current result rows
+        baseline_path: Path to an earlier JSON results file
+        threshold: Ratio above which a case is reported as a regression
+
+    Returns:
+        Rows for cases present in both runs, with the current/baseline ratio
+    """
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+
+    def key(row):
+        return (row["kind"], row["nodes"], row["engine"], row["operation"])
+
+    previous = {key(row): row for row in baseline["results"] if row.get("status") == "ok"}
+    comparison = []
+    for row in rows:
+        old = previous.get(key(row))
+        if row.get("status") != "ok" or old is None or not old["mean_us"]:
+            continue
+        ratio = row["mean_us"] / old["mean_us"]
+        comparison.append({**{k: row[k] for k in ("kind", "nodes", "engine", "operation")},
+                           "baseline_us": old["mean_us"], "current_us": row["mean_us"], "ratio": ratio,
+                           "regression": "yes" if ratio > threshold else ""})
+    return comparison
+
+def main():
+    parser = argparse.ArgumentParser(description="Scaling benchmark for the topic graph engines")
+    parser.add_argument("--kinds", default=",".join(CURRICULUM_GENERATORS), help="comma separated curriculum kinds")
+    parser.add_argument("--sizes", help="comma separated node counts (overrides --max-nodes)")
+    parser.add_argument("--max-nodes", type=int, default=10 ** 4, help="largest power of ten to run, up to 10^6")
+    parser.add_argument("--engines", default=",".join(LEGACY_ENGINES),
+                        help="comma separated engines: topic_graph, topological_sort or engine backends")
+    parser.add_argument("--queries", type=int, default=50, help="queries per operation")
+    parser.add_argument("--op-budget", type=float, default=5.0, help="seconds per operation before sampling stops")
+    parser.add_argument("--case-timeout", type=float, default=300.0, help="seconds per case before it is killed")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--output", help="path for JSON results")
+    parser.add_argument("--baseline", help="previous JSON results to compare against")
+    parser.add_argument("--threshold", type=float, default=1.25, help="slowdown ratio reported as a regression")
+    args = parser.parse_args()
+
+    if args.sizes:
+        sizes = [int(s) for s in args.sizes.split(",")]
+    else:
+        sizes = [10 ** p for p in range(2, 7) if 10 ** p <= args.max_nodes]
+    kinds = [k.strip() for k in args.kinds.split(",") if k.strip()]
+    engines = [e.strip() for e in args.engines.split(",") if e.strip()]
+
+    rows = run_suite(kinds, sizes, engines, args.seed, args.queries, args.op_budget, args.case_timeout)
+    print_table(rows, ["kind", "nodes", "engine", "operation", "status", "count", "mean_us", "p95_us"])
+
+    if args.output:
+        write_results(args.output, {
+            "benchmark": "graph_scaling",
+            "environment": environment_info(),
+            "parameters": vars(args),
+            "results": rows,
+        })
+
+    if args.baseline:
+        comparison = compare_to_baseline(rows, args.baseline, args.threshold)
+        print()
+        print_table(comparison, ["kind", "nodes", "engine", "operation", "baseline_us", "current_us", "ratio", "regression"])
+        if any(row["regression"] for row in comparison):
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
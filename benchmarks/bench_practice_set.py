@@ -0,0 +1,79 @@
+"""
+Practice Set Benchmark
+Times building a de-duplicated practice set for learning paths of growing
+length over a large synthetic catalog, with and without a per-topic quota,
+next to calling get_problems_by_topic_and_level's original dict-copying
+implementation once per path topic
+
+Usage:
+    python benchmarks/bench_practice_set.py --problems 1000000 --topics 1000
+"""
+
+import argparse
+import random
+from typing import Any, Dict, List
+
+from bench_utils import environment_info, print_table, summarize, time_call, write_results
+
+from bench_problem_catalog import legacy_get_problems_by_topic_and_level
+from data.catalog import ProblemCatalog
+from data.practice import build_practice_set
+from data.synthetic import generate_problem_catalog
+
+def legacy_practice_set(problems_data, path: List[str], quota) -> List[Dict]:
+    """Baseline: one dict-copying lookup per topic, de-duplicated by link"""
+    seen = set()
+    result = []
+    for topic in path:
+        taken = 0
+        for problem in legacy_get_problems_by_topic_and_level(problems_data, topic, "all"):
+            if quota is not None and taken >= quota:
+                break
+            if problem["link"] not in seen:
+                seen.add(problem["link"])
+                result.append(problem)
+                taken += 1
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description="Learning-path practice set benchmark")
+    parser.add_argument("--problems", type=int, default=1_000_000, help="problems in the synthetic catalog")
+    parser.add_argument("--topics", type=int, default=1000, help="topics in the synthetic catalog")
+    parser.add_argument("--paths", default="10,100,500", help="comma separated path lengths")
+    parser.add_argument("--quota", type=int, default=5, help="per-topic quota for the quota runs")
+    parser.add_argument("--repeat", type=int, default=20, help="timed runs per case")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--output", help="optional path for JSON results")
+    args = parser.parse_args()
+
+    problems_data = generate_problem_catalog(args.problems, num_topics=args.topics, seed=args.seed)
+    catalog = ProblemCatalog(problems_data)
+    rng = random.Random(args.seed)
+    topics = list(problems_data)
+
+    rows: List[Dict[str, Any]] = []
+    for length in (int(n) for n in args.paths.split(",")):
+        path = rng.sample(topics, min(length, len(topics)))
+        for quota in (args.quota, None):
+            for method in ("catalog", "legacy"):
+                if method == "catalog":
+                    run = lambda: build_practice_set(catalog, path, per_topic_quota=quota, page=2)
+                else:
+                    run = lambda: legacy_practice_set(problems_data, path, quota)
+                stats = summarize([time_call(run) for _ in range(args.repeat)])
+                size = build_practice_set(catalog, path, per_topic_quota=quota)["total"]
+                rows.append({"path_topics": len(path), "quota": quota or "none", "method": method,
+                             "problems": size, "mean_ms": stats["mean_us"] / 1e3, "p99_ms": stats["p99_us"] / 1e3})
+
+    print_table(rows, ["path_topics", "quota", "method", "problems", "mean_ms", "p99_ms"])
+
+    if args.output:
+        write_results(args.output, {
+            "benchmark": "practice_set",
+            "environment": environment_info(),
+            "parameters": vars(args),
+            "results": rows,
+        })
+
+if __name__ == "__main__":
+    main()
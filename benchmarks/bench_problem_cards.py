@@ -0,0 +1,107 @@
+"""
+Problem Card Benchmark
+Times what one rerun of a problem list spends producing its elements:
+formatting every problem's labels and markdown (platform lookup, badge,
+description, rating, link) as display_problems used to, next to looking
+up kept cards and prepending the list number, and the first rerun that
+renders the cards (including setting up the card store)
+
+The elements are built without a browser, as the JSON of the messages
+Streamlit sends for them, like bench_problem_pages.py. Problems come as
+catalog records (platform already known) and as plain dictionaries
+(platform classified from the link every time).
+
+Usage:
+    python benchmarks/bench_problem_cards.py --problems 200000 --topics 200
+"""
+
+import argparse
+import json
+import time
+from typing import Any, Dict, List
+
+from bench_utils import environment_info, print_table, summarize, time_call, write_results
+
+from data.catalog import ProblemCatalog, canonical_link, classify_platform
+from data.render import PLATFORM_MARKERS, ProblemCards, render_card
+from data.synthetic import generate_problem_catalog
+
+def formatted_elements(problems, start: int = 0) -> List[Dict[str, Any]]:
+    """Elements of a list formatted from scratch, the way display_problems did on every rerun"""
+    elements = []
+    for i, problem in enumerate(problems, start + 1):
+        elements.append({"type": "expander", "label": f"{i}. {problem['title']} ({problem.get('level', 'unknown').title()})"})
+        elements.append({"type": "markdown", "body": f"**Description:** {problem['description']}"})
+        if problem.get('rating') is not None:
+            elements.append({"type": "markdown", "body": f"**Rating:** {problem['rating']:g}"})
+        if 'link' in problem:
+            platform = problem.get('platform')
+            if platform is None:
+                platform = classify_platform(canonical_link(problem['link']))
+            if platform in PLATFORM_MARKERS:
+                body = f"{PLATFORM_MARKERS[platform]} **Practice on {platform}:** [Open Problem]({problem['link']})"
+            else:
+                body = f"🔗 **Practice Link:** [Open Problem]({problem['link']})"
+            elements.append({"type": "markdown", "body": body})
+        elements.append({"type": "checkbox", "label": "✅ Solved", "key": f"solved_{problem.get('canonical_id')}"})
+    return elements
+
+def card_elements(cards: ProblemCards, problems, start: int = 0) -> List[Dict[str, Any]]:
+    """Elements of a list from prerendered cards"""
+    elements = []
+    for i, problem in enumerate(problems, start + 1):
+        card = cards.card(problem)
+        elements.append({"type": "expander", "label": f"{i}. {card.label}"})
+        elements.append({"type": "markdown", "body": card.body})
+        elements.append({"type": "checkbox", "label": "✅ Solved", "key": f"solved_{problem.get('canonical_id')}"})
+    return elements
+
+def main():
+    parser = argparse.ArgumentParser(description="Prerendered problem cards vs formatting on every rerun")
+    parser.add_argument("--problems", type=int, default=200_000, help="problems in the synthetic catalog")
+    parser.add_argument("--topics", type=int, default=200, help="topics in the synthetic catalog")
+    parser.add_argument("--page-sizes", type=int, nargs="+", default=[20, 1000], help="problems per rendered list")
+    parser.add_argument("--repeats", type=int, default=200, help="timed reruns per case")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--output", help="optional path for JSON results")
+    args = parser.parse_args()
+
+    catalog = ProblemCatalog(generate_problem_catalog(args.problems, num_topics=args.topics, seed=args.seed))
+    start = time.perf_counter()
+    cards = ProblemCards(catalog)
+    setup_ms = (time.perf_counter() - start) * 1e3
+    topic = max(catalog.topics(), key=catalog.count)
+
+    rows: List[Dict[str, Any]] = []
+    for size in args.page_sizes:
+        records = list(catalog.problems(topic)[:size])
+        dictionaries = [{key: value for key, value in problem.to_dict().items() if key != "platform"}
+                        for problem in records]
+        for kind, problems in (("records", records), ("dictionaries", dictionaries)):
+            # Dictionaries are not catalog records, so they get no prerendered card
+            methods = {"format every rerun": lambda: formatted_elements(problems)}
+            if kind == "records":
+                methods["first rerun (cards rendered)"] = lambda: card_elements(ProblemCards(catalog), problems)
+                methods["kept cards"] = lambda: card_elements(cards, problems)
+            for method, run in methods.items():
+                elements = run()
+                stats = summarize([time_call(run) for _ in range(max(3, args.repeats * 20 // size))])
+                rows.append({"problems": size, "input": kind, "method": method, "elements": len(elements),
+                             "payload_kb": len(json.dumps(elements, ensure_ascii=False).encode()) / 1024,
+                             "mean_us": stats["mean_us"], "p99_us": stats["p99_us"]})
+        assert all(render_card(problem) == cards.card(problem) for problem in records)
+
+    print(f"card store for {len(catalog)} records set up in {setup_ms:.1f} ms")
+    print_table(rows, ["problems", "input", "method", "elements", "payload_kb", "mean_us", "p99_us"])
+
+    if args.output:
+        write_results(args.output, {
+            "benchmark": "problem_cards",
+            "environment": environment_info(),
+            "parameters": vars(args),
+            "setup_ms": setup_ms,
+            "results": rows,
+        })
+
+if __name__ == "__main__":
+    main()
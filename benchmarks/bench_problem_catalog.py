@@ -0,0 +1,112 @@
+"""
+Problem Catalog Benchmark
+Compares the original dict-copying get_problems_by_topic_and_level with
+views over the compiled ProblemCatalog on a large synthetic catalog
+
+For each access path it reports latency per call, memory blocks still
+allocated while the result is held (sys.getallocatedblocks) and peak bytes
+allocated during the call (tracemalloc).
+
+Usage:
+    python benchmarks/bench_problem_catalog.py --problems 1000000 --topics 200
+"""
+
+import argparse
+import random
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, List
+
+from bench_utils import environment_info, print_table, summarize, time_call, write_results
+
+from data.catalog import ProblemCatalog
+from data.synthetic import generate_problem_catalog
+
+def legacy_get_problems_by_topic_and_level(problems_data, topic: str, level: str = "all"):
+    """The original implementation: copies every problem dict and adds a level key"""
+    if topic not in problems_data:
+        return []
+    topic_problems = problems_data[topic]
+    if level == "all":
+        all_problems = []
+        for diff_level in ["beginner", "intermediate", "advanced"]:
+            if diff_level in topic_problems:
+                problems_with_level = []
+                for problem in topic_problems[diff_level]:
+                    problem_copy = problem.copy()
+                    problem_copy["level"] = diff_level
+                    problems_with_level.append(problem_copy)
+                all_problems.extend(problems_with_level)
+        return all_problems
+    if level in topic_problems:
+        problems_with_level = []
+        for problem in topic_problems[level]:
+            problem_copy = problem.copy()
+            problem_copy["level"] = level
+            problems_with_level.append(problem_copy)
+        return problems_with_level
+    return []
+
+def allocations(func) -> Dict[str, float]:
+    """Blocks retained by the result and peak bytes allocated by one call"""
+    blocks_before = sys.getallocatedblocks()
+    result = func()
+    blocks = sys.getallocatedblocks() - blocks_before
+    del result
+
+    tracemalloc.start()
+    result = func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return {"blocks": blocks, "peak_kb": peak / 1024}
+
+def main():
+    parser = argparse.ArgumentParser(description="Dict-copying vs compiled catalog problem lookups")
+    parser.add_argument("--problems", type=int, default=1_000_000, help="problems in the synthetic catalog")
+    parser.add_argument("--topics", type=int, default=200, help="topics in the synthetic catalog")
+    parser.add_argument("--queries", type=int, default=200, help="timed lookups per access path and level")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--output", help="optional path for JSON results")
+    args = parser.parse_args()
+
+    problems_data = generate_problem_catalog(args.problems, num_topics=args.topics, seed=args.seed)
+    start = time.perf_counter()
+    catalog = ProblemCatalog(problems_data)
+    build_ms = (time.perf_counter() - start) * 1e3
+
+    rng = random.Random(args.seed)
+    topics = list(problems_data)
+    query_topics = [rng.choice(topics) for _ in range(args.queries)]
+    paths = {
+        "legacy": lambda topic, level: legacy_get_problems_by_topic_and_level(problems_data, topic, level),
+        "catalog": lambda topic, level: catalog.problems(topic, level),
+    }
+
+    rows: List[Dict[str, Any]] = []
+    for level in ("beginner", "all"):
+        for name, lookup in paths.items():
+            samples = [time_call(lambda: lookup(topic, level)) for topic in query_topics]
+            # Iterate the result as a page would, touching every title
+            render = [time_call(lambda: sum(len(p["title"]) for p in lookup(topic, level))) for topic in query_topics[:20]]
+            stats = summarize(samples)
+            rows.append({"level": level, "path": name, "results": len(lookup(query_topics[0], level)),
+                         "mean_us": stats["mean_us"], "p99_us": stats["p99_us"],
+                         "iterate_mean_us": summarize(render)["mean_us"],
+                         **allocations(lambda: lookup(query_topics[0], level))})
+
+    print(f"catalog: {len(catalog)} problems, {args.topics} topics, compiled in {build_ms:.0f} ms")
+    print_table(rows, ["level", "path", "results", "mean_us", "p99_us", "iterate_mean_us", "blocks", "peak_kb"])
+
+    if args.output:
+        write_results(args.output, {
+            "benchmark": "problem_catalog",
+            "environment": environment_info(),
+            "parameters": vars(args),
+            "build_ms": build_ms,
+            "results": rows,
+        })
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Problem Database Benchmark
+Compares the SQLite problem store with the in-memory problem dict (the
+original dict-copying lookup) and the compiled ProblemCatalog on a
+synthetic catalog: per-topic lookups with and without dedup, counts, and
+text search (FTS5 next to the in-memory BM25 index)
+
+Also times the first query of a new thread, which is what a Streamlit
+rerun pays: it borrows an already open connection from the store's pool,
+next to opening a new connection and preparing the query on it.
+
+Usage:
+    python benchmarks/bench_problem_database.py --problems 100000 --topics 200
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List
+
+from bench_utils import environment_info, print_table, summarize, time_call, write_results
+
+from bench_problem_catalog import legacy_get_problems_by_topic_and_level
+from data.catalog import ProblemCatalog
+from data.database import SQLiteProblemStore, write_database
+from data.search import ProblemSearchIndex
+from data.synthetic import generate_problem_catalog
+
+def main():
+    parser = argparse.ArgumentParser(description="SQLite vs in-memory problem catalog")
+    parser.add_argument("--problems", type=int, default=100_000, help="problems in the synthetic catalog")
+    parser.add_argument("--topics", type=int, default=200, help="topics in the synthetic catalog")
+    parser.add_argument("--queries", type=int, default=200, help="timed queries per case")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--output", help="optional path for JSON results")
+    args = parser.parse_args()
+
+    problems_data = generate_problem_catalog(args.problems, num_topics=args.topics, seed=args.seed)
+    catalog = ProblemCatalog(problems_data)
+    search_index = ProblemSearchIndex(catalog)
+    rng = random.Random(args.seed)
+    topics = list(problems_data)
+    query_topics = [rng.choice(topics) for _ in range(args.queries)]
+    # Search for title words of random problems, the last one cut to a prefix
+    queries = []
+    for _ in range(args.queries):
+        words = rng.choice(catalog).title.lower().split()[:2]
+        words[-1] = words[-1][:max(3, len(words[-1]) - 2)]
+        queries.append(" ".join(words))
+
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, "problems.db")
+        start = time.perf_counter()
+        store = write_database(problems_data, path)
+        build_ms = (time.perf_counter() - start) * 1e3
+        size_mb = sum(os.path.getsize(path + suffix) for suffix in ("", "-wal") if os.path.exists(path + suffix)) / 2**20
+
+        cases = {
+            "beginner": {
+                "dict": lambda topic: legacy_get_problems_by_topic_and_level(problems_data, topic, "beginner"),
+                "catalog": lambda topic: catalog.problems(topic, "beginner"),
+                "sqlite": lambda topic: store.problems(topic, "beginner"),
+            },
+            "all": {
+                "dict": lambda topic: legacy_get_problems_by_topic_and_level(problems_data, topic, "all"),
+                "catalog": lambda topic: catalog.problems(topic, "all"),
+                "sqlite": lambda topic: store.problems(topic, "all"),
+            },
+            "all dedup": {
+                "catalog": lambda topic: catalog.problems(topic, "all", dedup=True),
+                "sqlite": lambda topic: store.problems(topic, "all", dedup=True),
+            },
+            "count": {
+                "dict": lambda topic: sum(len(problems) for problems in problems_data[topic].values()),
+                "catalog": lambda topic: catalog.count(topic),
+                "sqlite": lambda topic: store.count(topic),
+            },
+            "counts by topic": {
+                "dict": lambda topic: {t: sum(len(p) for p in levels.values()) for t, levels in problems_data.items()},
+                "catalog": lambda topic: catalog.counts_by_topic(),
+                "sqlite": lambda topic: store.counts_by_topic(),
+            },
+        }
+
+        rows: List[Dict[str, Any]] = []
+        for case, backends in cases.items():
+            for backend, lookup in backends.items():
+                stats = summarize([time_call(lambda: lookup(topic)) for topic in query_topics])
+                rows.append({"query": case, "backend": backend,
+                             "mean_us": stats["mean_us"], "p50_us": stats["p50_us"], "p99_us": stats["p99_us"]})
+
+        search_backends = {"bm25 index": lambda q: search_index.search(q, 10)}
+        if store.has_fts:
+            search_backends["sqlite fts5"] = lambda q: store.search(q, 10)
+        for backend, search in search_backends.items():
+            stats = summarize([time_call(lambda: search(q)) for q in queries])
+            rows.append({"query": "search", "backend": backend,
+                         "mean_us": stats["mean_us"], "p50_us": stats["p50_us"], "p99_us": stats["p99_us"]})
+
+        # Every rerun runs on a new thread; its first query takes a pooled connection with warm statements
+        connection_samples: Dict[str, List[float]] = {"new thread, pooled connection": [],
+                                                      "new connection (open + first query)": []}
+        def fresh_thread(topic):
+            connection_samples["new thread, pooled connection"].append(
+                time_call(lambda: store.problems(topic, "beginner")))
+        for topic in query_topics[:50]:
+            thread = threading.Thread(target=fresh_thread, args=(topic,))
+            thread.start()
+            thread.join()
+            opened = []
+            connection_samples["new connection (open + first query)"].append(
+                time_call(lambda: opened.append(SQLiteProblemStore(path)) or opened[0].problems(topic, "beginner")))
+            opened[0].close()
+        for name, samples in connection_samples.items():
+            stats = summarize(samples)
+            rows.append({"query": name, "backend": "sqlite",
+                         "mean_us": stats["mean_us"], "p50_us": stats["p50_us"], "p99_us": stats["p99_us"]})
+        store.close()
+
+    print(f"catalog: {len(catalog)} problems, {args.topics} topics; database built in {build_ms:.0f} ms, {size_mb:.1f} MB")
+    print_table(rows, ["query", "backend", "mean_us", "p50_us", "p99_us"])
+
+    if args.output:
+        write_results(args.output, {
+            "benchmark": "problem_database",
+            "environment": environment_info(),
+            "parameters": vars(args),
+            "build_ms": build_ms,
+            "size_mb": size_mb,
+            "results": rows,
+        })
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Problem Import Benchmark
+Streams synthetic JSONL and CSV problem dumps through the import pipeline
+(read, validate, normalize, classify, dedupe, write JSONL) and reports
+records per second and peak traced memory for growing dump sizes
+
+Dumps mix in duplicate listings, links in other spellings, easy/medium/hard
+levels and a small share of invalid rows, like scraped problem lists
+(including JSON records with a list for the topic).
+
+Usage:
+    python benchmarks/bench_problem_import.py --records 100000,1000000
+"""
+
+import argparse
+import csv
+import json
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Dict, List
+
+from bench_utils import environment_info, print_table, write_results
+
+from data.importer import ProblemImporter, read_records, write_jsonl
+from data.synthetic import generate_problem_catalog
+from data.topic_data import TOPIC_ALIASES, TOPIC_DEPENDENCIES
+
+def write_dump(path: str, num_records: int, seed: int, fmt: str):
+    """Write a synthetic dump, streaming it out topic by topic"""
+    rng = random.Random(seed)
+    level_names = {"beginner": "Easy", "intermediate": "medium", "advanced": "HARD"}
+    problems_data = generate_problem_catalog(num_records, num_topics=100, seed=seed)
+    fields = ["title", "description", "link", "topic", "level"]
+    with open(path, "w", encoding="utf-8", newline="") as out:
+        writer = csv.DictWriter(out, fields) if fmt == "csv" else None
+        if writer:
+            writer.writeheader()
+        for topic, levels in problems_data.items():
+            for level, problems in levels.items():
+                for problem in problems:
+                    record = {**problem, "topic": topic,
+                              "level": level_names[level] if rng.random() < 0.3 else level}
+                    roll = rng.random()
+                    if roll < 0.01:
+                        record["level"] = "expert"
+                    elif roll < 0.02:
+                        record["link"] = "not a link"
+                    elif roll < 0.03:
+                        record["title"] = ""
+                    elif roll < 0.035 and not writer:
+                        # JSON dumps can hold a list where a string belongs
+                        record["topic"] = [topic]
+                    if writer:
+                        writer.writerow(record)
+                    else:
+                        out.write(json.dumps(record))
+                        out.write("\n")
+
+def run_import(path: str, output: str, trace: bool) -> Dict[str, Any]:
+    importer = ProblemImporter(TOPIC_DEPENDENCIES, TOPIC_ALIASES)
+    if trace:
+        tracemalloc.start()
+    start = time.perf_counter()
+    with open(output, "w", encoding="utf-8") as out:
+        write_jsonl(importer.process(read_records(path)), out)
+    elapsed = time.perf_counter() - start
+    peak = 0
+    if trace:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    summary = importer.summary()
+    return {"read": summary["read"], "imported": summary["imported"], "duplicates": summary["duplicates"],
+            "rejected": sum(summary["rejected"].values()), "seconds": elapsed,
+            "records_per_s": summary["read"] / elapsed, "peak_mb": peak / 2**20}
+
+def main():
+    parser = argparse.ArgumentParser(description="Streaming problem import throughput")
+    parser.add_argument("--records", default="100000,1000000", help="comma separated dump sizes")
+    parser.add_argument("--formats", default="jsonl,csv", help="comma separated input formats")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--output", help="optional path for JSON results")
+    args = parser.parse_args()
+
+    rows: List[Dict[str, Any]] = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in (int(n) for n in args.records.split(",")):
+            for fmt in args.formats.split(","):
+                dump = os.path.join(workdir, f"dump.{fmt}")
+                write_dump(dump, size, args.seed, fmt)
+                imported = os.path.join(workdir, "imported.jsonl")
+                # Throughput untraced; tracemalloc slows allocation-heavy code several times over
+                timed = run_import(dump, imported, trace=False)
+                traced = run_import(dump, imported, trace=True)
+                rows.append({"format": fmt, "dump_mb": os.path.getsize(dump) / 2**20, **timed,
+                             "peak_mb": traced["peak_mb"]})
+
+    print_table(rows, ["format", "read", "dump_mb", "imported", "duplicates", "rejected",
+                       "seconds", "records_per_s", "peak_mb"])
+
+    if args.output:
+        write_results(args.output, {
+            "benchmark": "problem_import",
+            "environment": environment_info(),
+            "parameters": vars(args),
+            "results": rows,
+        })
+
+if __name__ == "__main__":
+    main()
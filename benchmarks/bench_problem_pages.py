@@ -0,0 +1,149 @@
+"""
+Problem Page Benchmark
+Times fetching one page of a large topic with opaque cursors (binary search
+in memory, keyset seek in SQLite) next to loading the whole topic, and
+estimates what one rerun of the Problem Suggestions page sends when it
+renders the whole topic versus one page
+
+The rendered payload is estimated without a browser: each problem becomes
+the elements display_problems creates for it (an expander label, the
+description, the practice link markdown and the solved checkbox), encoded
+as JSON, which tracks the size of the element messages Streamlit sends.
+Rerun time is the time to fetch the problems and build those elements.
+It first checks that SQLite keyset pages walk the same problems as the
+full listing for a topic with several levels outside the standard three.
+
+Usage:
+    python benchmarks/bench_problem_pages.py --topic-size 10000 --page-size 20
+"""
+
+import argparse
+import json
+import os
+import tempfile
+from typing import Any, Dict, List
+
+from bench_utils import environment_info, print_table, summarize, time_call, write_results
+
+from data.catalog import ProblemCatalog
+from data.database import write_database
+from data.pagination import decode_cursor, page_result, paginate
+from data.synthetic import generate_problem_catalog
+
+def render_elements(problems, start: int = 0) -> List[Dict[str, Any]]:
+    """The elements display_problems creates for some problems"""
+    elements = []
+    for i, problem in enumerate(problems, start + 1):
+        elements.append({"type": "expander", "label": f"{i}. {problem.title} ({problem.level.title()})"})
+        elements.append({"type": "markdown", "body": f"**Description:** {problem.description}"})
+        elements.append({"type": "markdown", "body": f"🔗 **Practice Link:** [Open Problem]({problem.link})"})
+        elements.append({"type": "checkbox", "label": "✅ Solved", "key": f"solved_{problem.canonical_id}"})
+    return elements
+
+def payload_bytes(elements) -> int:
+    return len(json.dumps(elements, ensure_ascii=False).encode())
+
+def check_keyset_pages(directory: str):
+    """Paging through a topic with repeats and several non-standard levels returns its full listing"""
+    def problem(i: int) -> Dict[str, str]:
+        return {"title": f"Problem {i}", "description": "", "link": f"https://leetcode.com/problems/problem-{i}/"}
+
+    # "zeta" comes before "alpha" in the data; the database orders such levels by name
+    problems_data = {"Topic": {"beginner": [problem(i) for i in range(5)],
+                               "zeta": [problem(i) for i in range(3, 15)],
+                               "alpha": [problem(i) for i in range(10, 25)],
+                               "mid": [problem(i) for i in range(20, 30)]}}
+    database = write_database(problems_data, os.path.join(directory, "levels.db"))
+    for level in ("all", "zeta", "alpha"):
+        for dedup in (False, True):
+            expected = [p.index for p in database.problems("Topic", level, dedup)]
+            for page_size in (1, 3, 7):
+                seen, cursor = [], None
+                while True:
+                    after, start = decode_cursor(cursor, "Topic", level, dedup) if cursor else ((-1, -1), 0)
+                    window = database.problems_after("Topic", level, after, page_size + 1, dedup)
+                    page = page_result(window, "Topic", level, dedup, start, page_size)
+                    seen += [p.index for p in page["problems"]]
+                    cursor = page["next_cursor"]
+                    if cursor is None:
+                        break
+                assert seen == expected, (level, dedup, page_size)
+    database.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="Cursor pages vs whole-topic listings")
+    parser.add_argument("--topic-size", type=int, default=10_000, help="problems in the large topic")
+    parser.add_argument("--topics", type=int, default=20, help="topics in the synthetic catalog")
+    parser.add_argument("--page-size", type=int, default=20, help="problems per page")
+    parser.add_argument("--repeats", type=int, default=50, help="timed fetches per case")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--output", help="optional path for JSON results")
+    args = parser.parse_args()
+
+    problems_data = generate_problem_catalog(args.topic_size * args.topics, num_topics=args.topics,
+                                             seed=args.seed, duplicate_rate=0.0)
+    catalog = ProblemCatalog(problems_data)
+    topic = max(catalog.topics(), key=catalog.count)
+    directory = tempfile.mkdtemp()
+    check_keyset_pages(directory)
+    database = write_database(problems_data, os.path.join(directory, "problems.db"))
+    total = catalog.count(topic)
+
+    # Cursors to the first, middle and last pages, made by paging through once
+    cursors = {}
+    cursor, page_number = None, 0
+    last_page = (total - 1) // args.page_size
+    while True:
+        if page_number in (0, last_page // 2, last_page):
+            cursors[page_number] = cursor
+        page = paginate(catalog.problems(topic), topic, "all", False, cursor, args.page_size)
+        cursor, page_number = page["next_cursor"], page_number + 1
+        if cursor is None:
+            break
+
+    def database_page(cursor):
+        after, start = decode_cursor(cursor, topic, "all", False) if cursor else ((-1, -1), 0)
+        window = database.problems_after(topic, "all", after, args.page_size + 1)
+        return page_result(window, topic, "all", False, start, args.page_size)
+
+    rows: List[Dict[str, Any]] = []
+    for number, cursor in cursors.items():
+        fetchers = {
+            "catalog cursor": lambda: paginate(catalog.problems(topic), topic, "all", False, cursor,
+                                               args.page_size)["problems"],
+            "sqlite keyset": lambda: database_page(cursor)["problems"],
+            "sqlite whole topic": lambda: database.problems(topic),
+        }
+        for method, fetch in fetchers.items():
+            stats = summarize([time_call(fetch) for _ in range(args.repeats)])
+            rows.append({"page": number + 1, "method": method, "problems": len(fetch()),
+                         "mean_us": stats["mean_us"], "p99_us": stats["p99_us"]})
+
+    whole = catalog.problems(topic)
+    first_page = paginate(whole, topic, "all", False, None, args.page_size)
+    render_rows = []
+    for name, fetch in (("whole topic", lambda: render_elements(list(catalog.problems(topic)))),
+                        ("one page", lambda: render_elements(
+                            paginate(catalog.problems(topic), topic, "all", False, None, args.page_size)["problems"]))):
+        elements = fetch()
+        stats = summarize([time_call(fetch) for _ in range(max(3, args.repeats // 10))])
+        render_rows.append({"render": name, "elements": len(elements), "payload_kb": payload_bytes(elements) / 1024,
+                            "rerun_ms": stats["mean_us"] / 1e3})
+
+    print(f"topic '{topic}': {total} problems, pages of {args.page_size} "
+          f"(first page {len(first_page['problems'])} problems, cursor {first_page['next_cursor']})")
+    print_table(rows, ["page", "method", "problems", "mean_us", "p99_us"])
+    print()
+    print_table(render_rows, ["render", "elements", "payload_kb", "rerun_ms"])
+
+    if args.output:
+        write_results(args.output, {
+            "benchmark": "problem_pages",
+            "environment": environment_info(),
+            "parameters": vars(args),
+            "fetch": rows,
+            "render": render_rows,
+        })
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Problem Search Benchmark
+Builds the BM25 inverted index over a large synthetic problem catalog and
+reports build time, index size and top-k query latency for single-term,
+multi-term and prefix queries, next to a linear substring scan
+
+Usage:
+    python benchmarks/bench_problem_search.py --problems 1000000 --k 10
+"""
+
+import argparse
+import random
+import time
+from typing import Any, Dict, List
+
+from bench_utils import environment_info, print_table, summarize, time_call, write_results
+
+from data.catalog import ProblemCatalog
+from data.search import ProblemSearchIndex, tokenize
+from data.synthetic import generate_problem_catalog
+
+def linear_scan(catalog: ProblemCatalog, query: str, k: int) -> List[Any]:
+    """Baseline: first k problems whose title or description contains every query word"""
+    words = tokenize(query)
+    hits = []
+    for problem in catalog:
+        text = f"{problem.title} {problem.description}".lower()
+        if all(word in text for word in words):
+            hits.append(problem)
+            if len(hits) == k:
+                break
+    return hits
+
+def query_sets(index: ProblemSearchIndex, catalog: ProblemCatalog, count: int, seed: int) -> Dict[str, List[str]]:
+    rng = random.Random(seed)
+    titles = [catalog[rng.randrange(len(catalog))].title for _ in range(count * 2)]
+    words = [tokenize(title) for title in titles]
+    return {
+        "single": [rng.choice(w) for w in words[:count]],
+        "multi": [" ".join(rng.sample(w, min(3, len(w)))) for w in words[count:]],
+        "prefix": [rng.choice(w)[:3] for w in words[:count]],
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Inverted index search benchmark")
+    parser.add_argument("--problems", type=int, default=1_000_000, help="problems in the synthetic catalog")
+    parser.add_argument("--topics", type=int, default=200, help="topics in the synthetic catalog")
+    parser.add_argument("--queries", type=int, default=300, help="queries per query kind")
+    parser.add_argument("--k", type=int, default=10, help="results per query")
+    parser.add_argument("--scan-queries", type=int, default=5, help="queries for the linear scan baseline")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--output", help="optional path for JSON results")
+    args = parser.parse_args()
+
+    catalog = ProblemCatalog(generate_problem_catalog(args.problems, num_topics=args.topics, seed=args.seed))
+    start = time.perf_counter()
+    index = ProblemSearchIndex(catalog)
+    build_s = time.perf_counter() - start
+    index_mb = sum(a.nbytes for a in (index._docs, index._impacts, index._by_impact, index._df, index._offsets)) / 1e6
+
+    rows = []
+    for kind, queries in query_sets(index, catalog, args.queries, args.seed).items():
+        stats = summarize([time_call(lambda: index.search(query, args.k)) for query in queries])
+        rows.append({"method": "index", "kind": kind, "queries": len(queries), "mean_us": stats["mean_us"],
+                     "p50_us": stats["p50_us"], "p99_us": stats["p99_us"], "max_us": stats["max_us"]})
+        if kind != "prefix":
+            scan = summarize([time_call(lambda: linear_scan(catalog, query, args.k)) for query in queries[:args.scan_queries]])
+            rows.append({"method": "scan", "kind": kind, "queries": scan["count"], "mean_us": scan["mean_us"],
+                         "p50_us": scan["p50_us"], "p99_us": scan["p99_us"], "max_us": scan["max_us"]})
+
+    print(f"index: {len(catalog)} problems, {index.vocabulary_size()} terms, "
+          f"built in {build_s:.1f} s, postings {index_mb:.0f} MB")
+    print_table(rows, ["method", "kind", "queries", "mean_us", "p50_us", "p99_us", "max_us"])
+
+    if args.output:
+        write_results(args.output, {
+            "benchmark": "problem_search",
+            "environment": environment_info(),
+            "parameters": vars(args),
+            "build_s": build_s,
+            "index_mb": index_mb,
+            "results": rows,
+        })
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Rating Index Benchmark
+Times rating range queries ("problems rated 1400-1600 in a topic") and
+closest-to-rating queries on the sorted rating index, next to filtering
+and sorting the topic's problem list per query
+
+Ratings are drawn within each problem's level band, so levels and the
+default cutoffs agree.
+
+Usage:
+    python benchmarks/bench_rating_index.py --problems 1000000 --topics 200
+"""
+
+import argparse
+import random
+import time
+from typing import Any, Dict, List
+
+from bench_utils import environment_info, print_table, summarize, time_call, write_results
+
+from data.catalog import ProblemCatalog
+from data.ratings import RatingIndex
+from data.synthetic import generate_problem_catalog
+
+# Rating band of each level, matching the default cutoffs
+BANDS = {"beginner": (800, 1199), "intermediate": (1200, 1799), "advanced": (1800, 3500)}
+
+def add_ratings(problems_data, rng: random.Random, rated_share: float):
+    for levels in problems_data.values():
+        for level, problems in levels.items():
+            low, high = BANDS[level]
+            for problem in problems:
+                if rng.random() < rated_share:
+                    problem["rating"] = rng.randint(low, high) // 10 * 10
+
+def main():
+    parser = argparse.ArgumentParser(description="Sorted rating index vs list filtering")
+    parser.add_argument("--problems", type=int, default=1_000_000, help="problems in the synthetic catalog")
+    parser.add_argument("--topics", type=int, default=200, help="topics in the synthetic catalog")
+    parser.add_argument("--rated", type=float, default=0.9, help="share of problems with a rating")
+    parser.add_argument("--width", type=int, default=200, help="width of range queries")
+    parser.add_argument("--k", type=int, default=10, help="problems per closest-rating query")
+    parser.add_argument("--queries", type=int, default=200, help="timed queries per case")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--output", help="optional path for JSON results")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    problems_data = generate_problem_catalog(args.problems, num_topics=args.topics, seed=args.seed)
+    add_ratings(problems_data, rng, args.rated)
+    catalog = ProblemCatalog(problems_data)
+    start = time.perf_counter()
+    index = RatingIndex(catalog)
+    build_ms = (time.perf_counter() - start) * 1e3
+
+    topics = catalog.topics()
+    queries = [(rng.choice(topics), rng.randrange(800, 3500 - args.width)) for _ in range(args.queries)]
+
+    def filter_range(topic, low):
+        matches = [p for p in catalog.problems(topic, dedup=True)
+                   if p.rating is not None and low <= p.rating <= low + args.width]
+        return sorted(matches, key=lambda p: p.rating)
+
+    def sort_closest(topic, rating):
+        rated = [p for p in catalog.problems(topic, dedup=True) if p.rating is not None]
+        return sorted(rated, key=lambda p: (abs(p.rating - rating), p.rating))[:args.k]
+
+    for topic, low in queries[:20]:
+        assert list(index.in_range(topic, low, low + args.width)) == filter_range(topic, low)
+        assert index.closest(topic, low, args.k) == sort_closest(topic, low)
+
+    cases = {
+        "range": {
+            "rating index": lambda topic, low: index.in_range(topic, low, low + args.width),
+            "filter + sort": filter_range,
+        },
+        "closest": {
+            "rating index": lambda topic, rating: index.closest(topic, rating, args.k),
+            "sort by distance": sort_closest,
+        },
+        "level": {
+            "rating index": lambda topic, _: index.problems(topic, "intermediate"),
+            "filter + sort": lambda topic, _: sorted(
+                (p for p in catalog.problems(topic, dedup=True) if p.rating is not None and 1200 <= p.rating < 1800),
+                key=lambda p: p.rating),
+        },
+    }
+    rows: List[Dict[str, Any]] = []
+    for case, methods in cases.items():
+        for method, query in methods.items():
+            results = []
+            stats = summarize([time_call(lambda: results.append(len(query(topic, value)))) for topic, value in queries])
+            rows.append({"query": case, "method": method, "mean_results": sum(results) / len(results),
+                         "mean_us": stats["mean_us"], "p50_us": stats["p50_us"], "p99_us": stats["p99_us"]})
+
+    print(f"catalog: {len(catalog)} problems, {args.topics} topics, {args.rated:.0%} rated; "
+          f"index built in {build_ms:.0f} ms")
+    print_table(rows, ["query", "method", "mean_results", "mean_us", "p50_us", "p99_us"])
+
+    if args.output:
+        write_results(args.output, {
+            "benchmark": "rating_index",
+            "environment": environment_info(),
+            "parameters": vars(args),
+            "build_ms": build_ms,
+            "results": rows,
+        })
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Recommender Benchmark
+Times top-k recommendations on a large synthetic catalog and layered
+curriculum for learners with growing numbers of solved problems, next to
+scoring every candidate problem of the eligible topics and taking the top k
+
+Learners know the first curriculum layer and have solved problems spread
+over topics they mastered and topics they are working on, with solve times
+over the last few months.
+
+Usage:
+    python benchmarks/bench_recommender.py --problems 1000000 --topics 1000
+"""
+
+import argparse
+import heapq
+import random
+import time
+from typing import Any, Dict, List
+
+from bench_utils import environment_info, print_table, summarize, time_call, write_results
+
+from data.catalog import LEVELS, ProblemCatalog
+from data.recommend import LEVEL_FIT, LearnerProfile, ProblemRecommender
+from data.synthetic import generate_problem_catalog, layered_curriculum
+
+def score_all(recommender: ProblemRecommender, profile: LearnerProfile, k: int, now: float):
+    """Baseline: score every unsolved candidate of every eligible topic, then take the top k"""
+    scored = []
+    for topic, topic_score in recommender.topic_scores(profile, now).items():
+        target = profile.target_level(topic)
+        for rank, level in enumerate(LEVELS):
+            fit = LEVEL_FIT.get(rank - target, 0.0)
+            if not fit:
+                continue
+            base = topic_score + recommender.level_weight * fit
+            for position, problem in enumerate(recommender.catalog.problems(topic, level, dedup=True)):
+                if problem.problem_id not in profile.solved:
+                    scored.append((base - recommender.position_decay * position, problem.index, problem))
+    best = heapq.nlargest(k * 4, scored, key=lambda item: (item[0], -item[1]))
+    seen, results = set(), []
+    for score, _, problem in best:
+        if problem.problem_id not in seen:
+            seen.add(problem.problem_id)
+            results.append((problem, score))
+    return results[:k]
+
+def make_learner(catalog: ProblemCatalog, dependencies, solved: int, rng: random.Random, now: float) -> LearnerProfile:
+    roots = [topic for topic, prereqs in dependencies.items() if not prereqs]
+    profile = LearnerProfile(catalog, known_topics=roots)
+    # Work outward from the roots, the way a learner moves through the curriculum
+    order = [topic for topic in dependencies if dependencies[topic]]
+    active = order[:max(1, solved // 150)]
+    for _ in range(solved):
+        topic = rng.choice(active)
+        problems = catalog.problems(topic, rng.choice(LEVELS), dedup=True)
+        if problems:
+            # Learners mostly solve from the top of each list
+            position = min(len(problems) - 1, int(rng.expovariate(1 / 40)))
+            profile.record_solve(problems[position].problem_id, now - rng.uniform(0, 90) * 86400)
+    return profile
+
+def main():
+    parser = argparse.ArgumentParser(description="Personalized top-k recommendation latency")
+    parser.add_argument("--problems", type=int, default=1_000_000, help="problems in the synthetic catalog")
+    parser.add_argument("--topics", type=int, default=1000, help="topics in the synthetic curriculum")
+    parser.add_argument("--solved", default="100,1000,5000", help="comma separated solved counts per learner")
+    parser.add_argument("--learners", type=int, default=20, help="learners per solved count")
+    parser.add_argument("--k", type=int, default=10, help="recommendations per query")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--output", help="optional path for JSON results")
+    args = parser.parse_args()
+
+    dependencies = layered_curriculum(args.topics, seed=args.seed)
+    catalog = ProblemCatalog(generate_problem_catalog(args.problems, num_topics=args.topics, seed=args.seed))
+    start = time.perf_counter()
+    recommender = ProblemRecommender(catalog, dependencies)
+    build_ms = (time.perf_counter() - start) * 1e3
+    rng = random.Random(args.seed)
+    now = time.time()
+
+    rows: List[Dict[str, Any]] = []
+    for solved in (int(n) for n in args.solved.split(",")):
+        profile_samples, heap_samples, scan_samples = [], [], []
+        for _ in range(args.learners):
+            started = time.perf_counter()
+            profile = make_learner(catalog, dependencies, solved, rng, now)
+            profile_samples.append(time.perf_counter() - started)
+            heap_samples += [time_call(lambda: recommender.recommend(profile, args.k, now)) for _ in range(5)]
+            scan_samples.append(time_call(lambda: score_all(recommender, profile, args.k, now)))
+            heap_top = [p.problem_id for p, _ in recommender.recommend(profile, args.k, now)]
+            scan_top = [p.problem_id for p, _ in score_all(recommender, profile, args.k, now)]
+            assert heap_top == scan_top, "heap merge and full scan disagree"
+        for method, samples in (("heap merge", heap_samples), ("score all", scan_samples)):
+            stats = summarize(samples)
+            rows.append({"solved": solved, "method": method, "mean_ms": stats["mean_us"] / 1e3,
+                         "p50_ms": stats["p50_us"] / 1e3, "p99_ms": stats["p99_us"] / 1e3})
+        rows.append({"solved": solved, "method": "profile build", "mean_ms": summarize(profile_samples)["mean_us"] / 1e3})
+
+    print(f"catalog: {len(catalog)} problems, {args.topics} topics; recommender built in {build_ms:.0f} ms")
+    print_table(rows, ["solved", "method", "mean_ms", "p50_ms", "p99_ms"])
+
+    if args.output:
+        write_results(args.output, {
+            "benchmark": "recommender",
+            "environment": environment_info(),
+            "parameters": vars(args),
+            "build_ms": build_ms,
+            "results": rows,
+        })
+
+if __name__ == "__main__":
+    main()
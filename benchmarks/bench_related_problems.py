@@ -0,0 +1,127 @@
+"""
+Related Problems Benchmark
+Times "related problems for X" on the MinHash/LSH index next to exact
+Jaccard similarity against every problem, and reports how well the bucket
+lookup matches the exact answer, on the bundled and a synthetic catalog
+
+Synthetic problems are random word sequences and hardly resemble each
+other, so a share of them get rewritten variants (a title word and some
+description words replaced, listed under another topic), the way
+collections carry near-copies of classic problems.
+
+Quality per query, against the exact top k above the same minimum
+similarity:
+- precision: share of returned problems that belong in the exact top k
+  (a problem tying the exact k-th score counts)
+- recall: share of the exact top k that was returned
+
+Usage:
+    python benchmarks/bench_related_problems.py --problems 200000 --topics 200
+"""
+
+import argparse
+import random
+import time
+from typing import Any, Dict, List
+
+import numpy as np
+
+from bench_utils import environment_info, print_table, summarize, time_call, write_results
+
+from data.catalog import ProblemCatalog
+from data.problem_bank import PROBLEMS_DATA
+from data.related import RelatedProblemIndex
+from data.synthetic import generate_problem_catalog
+
+def add_variants(problems_data, rng: random.Random, share: float):
+    """Append rewritten copies of a share of the problems under random topics"""
+    listings = [(topic, level, problem) for topic, levels in problems_data.items()
+                for level, problems in levels.items() for problem in problems]
+    topics = list(problems_data)
+    words = [word for _, _, problem in listings[:1000] for word in problem["description"].split()]
+    for i, (_, level, problem) in enumerate(rng.sample(listings, int(len(listings) * share))):
+        title = problem["title"].split()
+        title[rng.randrange(len(title))] = rng.choice(words).capitalize()
+        description = [rng.choice(words) if rng.random() < 0.2 else word for word in problem["description"].split()]
+        problems_data[rng.choice(topics)][level].append({
+            "title": " ".join(title),
+            "description": " ".join(description),
+            "link": f"https://example.com/variants/{i}",
+        })
+
+def exact_related(index: RelatedProblemIndex, problem_id: int, k: int, min_similarity: float):
+    """Ids and scores of the k most similar problems by comparing against all of them"""
+    others = np.arange(len(index), dtype=np.int32)
+    others = others[others != problem_id]
+    scores = index.similarities(problem_id, others)
+    top = np.argsort(-scores, kind="stable")[:k]
+    top = top[scores[top] >= min_similarity]
+    return others[top], scores[top]
+
+def evaluate(name: str, catalog: ProblemCatalog, args, rng: random.Random) -> List[Dict[str, Any]]:
+    start = time.perf_counter()
+    index = RelatedProblemIndex(catalog, bands=args.bands, rows=args.rows)
+    build_s = time.perf_counter() - start
+    queries = rng.sample(range(len(index)), min(args.queries, len(index)))
+
+    precision, recall, candidates = [], [], []
+    for problem_id in queries:
+        found = index.related(problem_id, args.k, args.min_similarity)
+        exact_ids, exact_scores = exact_related(index, problem_id, args.k, args.min_similarity)
+        candidates.append(len(index.candidates(problem_id)))
+        if found:
+            cutoff = exact_scores[-1] if len(exact_scores) == args.k else args.min_similarity
+            precision.append(sum(score >= cutoff - 1e-12 for _, score in found) / len(found))
+        if len(exact_ids):
+            found_ids = {catalog.problem_id(problem.canonical_id) for problem, _ in found}
+            recall.append(sum(int(i) in found_ids for i in exact_ids) / len(exact_ids))
+
+    lsh = summarize([time_call(lambda: index.related(q, args.k, args.min_similarity)) for q in queries])
+    exact = summarize([time_call(lambda: exact_related(index, q, args.k, args.min_similarity))
+                       for q in queries[:max(5, len(queries) // 10)]])
+    common = {"catalog": name, "problems": len(index), "build_s": build_s}
+    return [
+        {**common, "method": "lsh buckets", "mean_candidates": float(np.mean(candidates)),
+         "precision": float(np.mean(precision)) if precision else float("nan"),
+         "recall": float(np.mean(recall)) if recall else float("nan"),
+         "mean_ms": lsh["mean_us"] / 1e3, "p99_ms": lsh["p99_us"] / 1e3},
+        {**common, "method": "all pairs", "mean_candidates": float(len(index) - 1),
+         "precision": 1.0, "recall": 1.0,
+         "mean_ms": exact["mean_us"] / 1e3, "p99_ms": exact["p99_us"] / 1e3},
+    ]
+
+def main():
+    parser = argparse.ArgumentParser(description="MinHash/LSH related problems vs exact all-pairs similarity")
+    parser.add_argument("--problems", type=int, default=200_000, help="problems in the synthetic catalog")
+    parser.add_argument("--topics", type=int, default=200, help="topics in the synthetic catalog")
+    parser.add_argument("--variants", type=float, default=0.2, help="share of synthetic problems given a rewritten variant")
+    parser.add_argument("--bands", type=int, default=16, help="LSH bands")
+    parser.add_argument("--rows", type=int, default=2, help="signature values per band")
+    parser.add_argument("--k", type=int, default=5, help="related problems per query")
+    parser.add_argument("--min-similarity", type=float, default=0.3, help="lowest Jaccard similarity returned")
+    parser.add_argument("--queries", type=int, default=200, help="queries per catalog")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--output", help="optional path for JSON results")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    problems_data = generate_problem_catalog(args.problems, num_topics=args.topics, seed=args.seed)
+    add_variants(problems_data, rng, args.variants)
+    rows = evaluate("bundled", ProblemCatalog(PROBLEMS_DATA), args, rng)
+    rows += evaluate("synthetic", ProblemCatalog(problems_data), args, rng)
+
+    print(f"bands={args.bands} rows={args.rows}: pairs become candidates around Jaccard "
+          f"{(1 / args.bands) ** (1 / args.rows):.2f}; k={args.k}, min similarity {args.min_similarity}")
+    print_table(rows, ["catalog", "problems", "build_s", "method", "mean_candidates", "precision", "recall",
+                       "mean_ms", "p99_ms"])
+
+    if args.output:
+        write_results(args.output, {
+            "benchmark": "related_problems",
+            "environment": environment_info(),
+            "parameters": vars(args),
+            "results": rows,
+        })
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Review Scheduler Benchmark
+Times the review scheduler for many learners: rescheduling one card in a
+learner's heap, and the batch "who has reviews due" pass through the
+bucketed timer queue next to a scan over every learner's history, and
+compares the size of the saved state with the same cards as JSON
+
+Learners solve a random number of problems at random times over the past
+year and review some of them, so due times spread over past and future
+like in a running deployment. The batch pass runs once per simulated hour
+over a day; each hour only learners whose next review fell in that hour
+come due.
+
+Usage:
+    python benchmarks/bench_review_scheduler.py --learners 10000 --cards 200
+"""
+
+import argparse
+import io
+import json
+import random
+import time
+from typing import Any, Dict, List
+
+from bench_utils import environment_info, print_table, summarize, time_call, write_results
+
+from data.reviews import DAY, ReviewScheduler
+
+def scan_due(histories: Dict[str, Dict[str, Any]], now: float) -> Dict[str, List[str]]:
+    """Baseline: every card of every learner checked against the clock"""
+    due = {}
+    for learner, cards in histories.items():
+        found = [key for key, card in cards.items() if card.due <= now]
+        if found:
+            due[learner] = found
+    return due
+
+def main():
+    parser = argparse.ArgumentParser(description="Heap and bucketed review scheduling vs history scans")
+    parser.add_argument("--learners", type=int, default=10_000, help="learners with review state")
+    parser.add_argument("--cards", type=int, default=200, help="mean solved problems per learner")
+    parser.add_argument("--problems", type=int, default=50_000, help="distinct problems learners solve")
+    parser.add_argument("--digest", type=int, default=10, help="due cards listed per learner in a batch pass")
+    parser.add_argument("--hours", type=int, default=24, help="hourly batch passes timed")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--output", help="optional path for JSON results")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    now = time.time()
+    scheduler = ReviewScheduler()
+    start = time.perf_counter()
+    for i in range(args.learners):
+        learner = f"learner-{i}"
+        for problem in rng.sample(range(args.problems), rng.randint(1, 2 * args.cards)):
+            key = f"problem-{problem}"
+            solved_at = now - rng.random() * 365 * DAY
+            scheduler.add(learner, key, solved_at)
+            reviewed = solved_at
+            for _ in range(rng.randrange(4)):
+                reviewed = min(now, reviewed + rng.random() * 20 * DAY)
+                scheduler.review(learner, key, rng.choice((2, 3, 4, 5)), reviewed)
+    build_s = time.perf_counter() - start
+    cards = scheduler.card_count()
+    histories = {learner: scheduler.cards(learner) for learner in scheduler.learners()}
+
+    # Catch up on everything already due, as a deployment does once
+    backlog = scheduler.pop_due(now, args.digest)
+
+    rows: List[Dict[str, Any]] = []
+    learners = scheduler.learners()
+    picks = [(learner, rng.choice(list(histories[learner])))
+             for learner in (rng.choice(learners) for _ in range(2000))]
+    stats = summarize([time_call(lambda: scheduler.review(learner, key, rng.choice((2, 4, 5)), now))
+                       for learner, key in picks])
+    rows.append({"operation": "reschedule one card", "method": "learner heap",
+                 "mean_us": stats["mean_us"], "p99_us": stats["p99_us"], "learners_due": ""})
+
+    bucketed, scanned, fired = [], [], []
+    for hour in range(1, args.hours + 1):
+        clock = now + hour * 3600
+        bucketed.append(time_call(lambda: fired.append(scheduler.pop_due(clock, args.digest))))
+        scanned.append(time_call(lambda: scan_due(histories, clock)))
+    mean_fired = sum(len(batch) for batch in fired) / len(fired)
+    for method, timings in (("bucketed queue", bucketed), ("scan all histories", scanned)):
+        stats = summarize(timings)
+        rows.append({"operation": "hourly due pass", "method": method, "mean_us": stats["mean_us"],
+                     "p99_us": stats["p99_us"],
+                     "learners_due": f"{mean_fired:.0f} new" if method == "bucketed queue" else "all overdue"})
+
+    stream = io.BytesIO()
+    saved = scheduler.dump(stream)
+    as_json = len(json.dumps({str(learner): {key: card._asdict() for key, card in learner_cards.items()}
+                              for learner, learner_cards in histories.items()}).encode())
+
+    print(f"{len(learners)} learners, {cards} cards, built in {build_s:.1f} s; "
+          f"{len(backlog)} learners had reviews due at the start")
+    print_table(rows, ["operation", "method", "learners_due", "mean_us", "p99_us"])
+    print(f"\nsaved state: {saved / 1e6:.1f} MB ({saved / cards:.1f} bytes per card), "
+          f"JSON {as_json / 1e6:.1f} MB ({as_json / cards:.1f} bytes per card)")
+
+    if args.output:
+        write_results(args.output, {
+            "benchmark": "review_scheduler",
+            "environment": environment_info(),
+            "parameters": vars(args),
+            "results": rows,
+            "state_bytes": saved,
+            "json_bytes": as_json,
+        })
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Shared Graph Memory Benchmark
+Starts several worker processes that either build their own graph engine or
+attach to indexes published in shared memory, and reports RSS and PSS per
+worker while they are all alive
+
+PSS (proportional set size) splits shared pages between the processes that
+map them, so it is the fairer per-worker figure; it is read from
+/proc/self/smaps_rollup and only available on Linux.
+
+Usage:
+    python benchmarks/bench_shared_memory.py --topics 8000 --workers 4
+"""
+
+import argparse
+import multiprocessing as mp
+import os
+import resource
+import time
+from typing import Any, Dict, List
+
+import numpy as np
+
+from bench_utils import environment_info, print_table, write_results
+
+from data.synthetic import layered_curriculum
+from graph.engine import create_engine
+from graph.shared import SharedGraphReader, attach_or_publish, unlink_namespace
+
+def memory_usage() -> Dict[str, float]:
+    """Resident and proportional memory of this process in MB"""
+    usage = {"rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, "pss_mb": None}
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    usage["rss_mb"] = int(line.split()[1]) / 1024
+        with open("/proc/self/smaps_rollup") as f:
+            for line in f:
+                if line.startswith("Pss:"):
+                    usage["pss_mb"] = int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return usage
+
+def worker(mode: str, topics: int, seed: int, namespace: str, results: "mp.Queue", done: "mp.Event"):
+    """Load the graph one way or the other, touch every index page, then report memory"""
+    baseline = memory_usage()
+    start = time.perf_counter()
+    if mode == "private":
+        engine = create_engine(layered_curriculum(topics, seed=seed, avg_prereqs=6), "numpy")
+    else:
+        engine = SharedGraphReader(namespace).engine()
+    load_seconds = time.perf_counter() - start
+
+    # Touch every page of the closure matrices and run a few queries
+    checksum = int(np.bitwise_xor.reduce(engine.closure.ancestors, axis=None)
+                   ^ np.bitwise_xor.reduce(engine.closure.descendants, axis=None)) & 0xFFFF
+    for topic in engine.topics()[::max(1, topics // 50)]:
+        engine.get_learning_path(topic)
+
+    usage = memory_usage()
+    results.put({"mode": mode, "pid": os.getpid(), "load_ms": load_seconds * 1e3,
+                 "rss_mb": usage["rss_mb"], "pss_mb": usage["pss_mb"],
+                 "rss_growth_mb": usage["rss_mb"] - baseline["rss_mb"], "checksum": checksum})
+    # Stay alive until every worker has measured, so shared pages are split fairly
+    done.wait(60)
+
+def run_mode(mode: str, args) -> List[Dict[str, Any]]:
+    ctx = mp.get_context("spawn")
+    results, done = ctx.Queue(), ctx.Event()
+    processes = [ctx.Process(target=worker, args=(mode, args.topics, args.seed, args.namespace, results, done))
+                 for _ in range(args.workers)]
+    for process in processes:
+        process.start()
+    rows = [results.get(timeout=600) for _ in processes]
+    done.set()
+    for process in processes:
+        process.join()
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description="RSS per worker with private vs shared graph indexes")
+    parser.add_argument("--topics", type=int, default=8000, help="topics in the generated curriculum")
+    parser.add_argument("--workers", type=int, default=4, help="worker processes per mode")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--namespace", default=f"dsa_bench_{os.getpid()}", help="shared memory namespace")
+    parser.add_argument("--output", help="optional path for JSON results")
+    args = parser.parse_args()
+
+    rows = run_mode("private", args)
+    publish_start = time.perf_counter()
+    attach_or_publish(layered_curriculum(args.topics, seed=args.seed, avg_prereqs=6), args.namespace)
+    publish_ms = (time.perf_counter() - publish_start) * 1e3
+    try:
+        rows += run_mode("shared", args)
+    finally:
+        unlink_namespace(args.namespace)
+
+    print_table(rows, ["mode", "pid", "load_ms", "rss_mb", "pss_mb", "rss_growth_mb"])
+    for mode in ("private", "shared"):
+        mode_rows = [r for r in rows if r["mode"] == mode]
+        pss = [r["pss_mb"] for r in mode_rows if r["pss_mb"] is not None]
+        print(f"{mode:>8}: mean RSS {sum(r['rss_mb'] for r in mode_rows) / len(mode_rows):.1f} MB"
+              + (f", mean PSS {sum(pss) / len(pss):.1f} MB" if pss else ""))
+    print(f"publish (once): {publish_ms:.0f} ms")
+
+    if args.output:
+        write_results(args.output, {
+            "benchmark": "shared_memory",
+            "environment": environment_info(),
+            "parameters": vars(args),
+            "publish_ms": publish_ms,
+            "results": rows,
+        })
+
+if __name__ == "__main__":
+    main()
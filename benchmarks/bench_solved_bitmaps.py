@@ -0,0 +1,143 @@
+"""
+Solved Bitmap Benchmark
+Answers "how many <level> <topic> problems has each learner not solved"
+for a large learner population from per-learner solved bitmaps and
+precomputed (topic, level) masks, next to scanning per-learner lists of
+solved problem dictionaries (the shape progress is tracked in today)
+
+Also reports memory per learner and the size and speed of the compact
+serialized form, next to JSON lists of canonical ids.
+
+Usage:
+    python benchmarks/bench_solved_bitmaps.py --learners 100000 --problems 10000
+"""
+
+import argparse
+import io
+import json
+import random
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, List
+
+from bench_utils import environment_info, print_table, write_results
+
+from data.catalog import LEVELS, ProblemCatalog
+from data.solved import SolvedIndex
+from data.synthetic import generate_problem_catalog
+
+def solved_problem_ids(rng: random.Random, catalog: ProblemCatalog, topics: List[str], mean_solved: int) -> List[int]:
+    """A learner's solved problems: mostly early problems of a few topics, like a real learner"""
+    count = min(catalog.unique_count(), int(rng.expovariate(1 / mean_solved)) + 1)
+    focus = rng.sample(topics, min(len(topics), 1 + count // 40))
+    solved = set()
+    while len(solved) < count:
+        problems = catalog.problems(rng.choice(focus), rng.choice(LEVELS), dedup=True)
+        if problems:
+            solved.add(problems[min(len(problems) - 1, int(rng.expovariate(1 / 30)))].problem_id)
+        elif len(focus) < len(topics):
+            focus.append(rng.choice(topics))
+    return list(solved)
+
+def timed(build):
+    start = time.perf_counter()
+    result = build()
+    return result, time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description="Solved bitmaps vs lists of solved problems")
+    parser.add_argument("--learners", type=int, default=100_000, help="learners in the index")
+    parser.add_argument("--baseline-learners", type=int, default=10_000, help="learners for the list baseline")
+    parser.add_argument("--problems", type=int, default=10_000, help="problems in the synthetic catalog")
+    parser.add_argument("--topics", type=int, default=100, help="topics in the synthetic catalog")
+    parser.add_argument("--mean-solved", type=int, default=60, help="mean solved problems per learner")
+    parser.add_argument("--queries", type=int, default=10, help="(topic, level) queries")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--output", help="optional path for JSON results")
+    args = parser.parse_args()
+
+    # No problem listed twice, so the list baseline (one topic per solved problem) counts the same problems
+    catalog = ProblemCatalog(generate_problem_catalog(args.problems, num_topics=args.topics, seed=args.seed,
+                                                      duplicate_rate=0.0))
+    rng = random.Random(args.seed)
+    topics = catalog.topics()
+    unique = catalog.unique_problems()
+    solved = [solved_problem_ids(rng, catalog, topics, args.mean_solved) for _ in range(args.learners)]
+
+    # Bitmaps for every learner; lists of problem dictionaries for the baseline subset
+    def build_index():
+        index = SolvedIndex(catalog)
+        for learner, problem_ids in enumerate(solved):
+            index.add_solved(learner, problem_ids)
+        return index
+    def build_lists():
+        return [[{"title": unique[i].title, "topic": unique[i].topic, "level": unique[i].level, "link": unique[i].link}
+                 for i in problem_ids] for problem_ids in solved[:baseline_learners]]
+    index, index_s = timed(build_index)
+    index_bytes = sum(sys.getsizeof(index.bitmap(learner)) for learner in range(args.learners))
+    baseline_learners = min(args.learners, args.baseline_learners)
+    lists, lists_s = timed(build_lists)
+    # Allocations of a second build; tracemalloc slows allocation several times over, so builds are timed untraced
+    tracemalloc.start()
+    kept = build_lists()
+    lists_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+
+    queries = [(rng.choice(topics), rng.choice((*LEVELS, "all"))) for _ in range(args.queries)]
+    bitmap_s = list_s = 0.0
+    for topic, level in queries:
+        start = time.perf_counter()
+        counts = index.unsolved_counts(topic, level)
+        bitmap_s += time.perf_counter() - start
+        total = catalog.count(topic, level, dedup=True)
+        start = time.perf_counter()
+        list_counts = [total - sum(1 for p in problems if p["topic"] == topic and (level == "all" or p["level"] == level))
+                       for problems in lists]
+        list_s += time.perf_counter() - start
+        assert list_counts == [counts[learner] for learner in range(baseline_learners)]
+
+    buffer = io.BytesIO()
+    start = time.perf_counter()
+    dumped = index.dump(buffer)
+    dump_s = time.perf_counter() - start
+    buffer.seek(0)
+    start = time.perf_counter()
+    loaded = SolvedIndex.load(catalog, buffer, index.masks)
+    load_s = time.perf_counter() - start
+    assert all(loaded.bitmap(str(learner)) == index.bitmap(learner) for learner in range(0, args.learners, 97))
+    json_bytes = sum(len(json.dumps([unique[i].canonical_id for i in problem_ids])) for problem_ids in solved)
+
+    rows: List[Dict[str, Any]] = [
+        {"method": "bitmaps", "learners": args.learners, "build_s": index_s,
+         "memory_per_learner_b": index_bytes / args.learners,
+         "query_ms": bitmap_s / len(queries) * 1e3, "per_learner_us": bitmap_s / len(queries) / args.learners * 1e6},
+        {"method": "lists of dicts", "learners": baseline_learners, "build_s": lists_s,
+         "memory_per_learner_b": lists_bytes / baseline_learners,
+         "query_ms": list_s / len(queries) * 1e3, "per_learner_us": list_s / len(queries) / baseline_learners * 1e6},
+    ]
+    storage = [
+        {"format": "encoded bitmaps", "bytes_per_learner": dumped / args.learners,
+         "write_s": dump_s, "read_s": load_s},
+        {"format": "json canonical ids", "bytes_per_learner": json_bytes / args.learners},
+    ]
+
+    mean = sum(len(problem_ids) for problem_ids in solved) / args.learners
+    print(f"catalog: {catalog.unique_count()} problems, {args.topics} topics; "
+          f"{args.learners} learners, {mean:.0f} solved on average")
+    print_table(rows, ["method", "learners", "build_s", "memory_per_learner_b", "query_ms", "per_learner_us"])
+    print()
+    print_table(storage, ["format", "bytes_per_learner", "write_s", "read_s"])
+
+    if args.output:
+        write_results(args.output, {
+            "benchmark": "solved_bitmaps",
+            "environment": environment_info(),
+            "parameters": vars(args),
+            "results": rows,
+            "storage": storage,
+        })
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+Tag Query Benchmark
+Evaluates boolean problem queries over topics, levels and tags, such as
+"(tag OR tag) AND advanced AND NOT solved", with compressed bitmap algebra,
+next to filtering the problem list with the same predicate
+
+Synthetic problems get one to three technique tags from a vocabulary with
+Zipf popularity, so a few tags cover much of the catalog and most are rare.
+Also reports bitmap storage next to uncompressed bitmaps of the same terms,
+and first checks topic-and-level queries on the bundled catalog against
+the topic/level listing API, and that NOT on a topic excludes problems
+listed under several topics.
+
+Usage:
+    python benchmarks/bench_tag_queries.py --problems 1000000 --topics 200 --tags 300
+"""
+
+import argparse
+import itertools
+import random
+import time
+from typing import Any, Dict, List
+
+from bench_utils import environment_info, print_table, summarize, time_call, write_results
+
+from data.bitmaps import RoaringBitmap
+from data.catalog import LEVELS, ProblemCatalog
+from data.problem_data import get_problem_catalog, get_problems_by_topic_and_level
+from data.synthetic import generate_problem_catalog
+from data.tags import TagIndex
+
+def add_tags(problems_data, rng: random.Random, tags: List[str]):
+    cum_weights = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(tags))))
+    for levels in problems_data.values():
+        for problems in levels.values():
+            for problem in problems:
+                problem["tags"] = sorted(set(rng.choices(tags, cum_weights=cum_weights, k=rng.randint(1, 3))))
+
+def check_topic_levels(catalog: ProblemCatalog):
+    """Every "topic AND level" query on the bundled catalog returns exactly the topic's problems at that level"""
+    index = TagIndex(catalog)
+    for topic in catalog.topics():
+        for level in LEVELS:
+            expected = list(get_problems_by_topic_and_level(topic, level, dedup=True))
+            assert index.problems(f'"{topic}" AND {level}') == expected, (topic, level)
+            assert index.count(f'"{topic}" AND {level}') == len(expected), (topic, level)
+
+def check_negation(catalog: ProblemCatalog):
+    """NOT on a topic drops a problem listed under it from every other topic too"""
+    index = TagIndex(catalog)
+    pairs = set()
+    for problem in catalog.unique_problems():
+        topics = list(dict.fromkeys(topic for topic, _ in catalog.placements(problem.problem_id)))
+        pairs.update((first, second) for first in topics for second in topics if first != second)
+    assert pairs, "bundled catalog lists no problem under two topics"
+    for first, second in sorted(pairs):
+        excluded = {problem.canonical_id for problem in catalog.problems(second)}
+        matches = {problem.canonical_id for problem in index.problems(f'"{first}" AND NOT "{second}"')}
+        assert matches and matches.isdisjoint(excluded), (first, second)
+    for topic in catalog.topics():
+        assert index.count(f'NOT "{topic}"') == catalog.unique_count() - index.count(f'"{topic}"'), topic
+
+def main():
+    parser = argparse.ArgumentParser(description="Compressed bitmap queries vs list filtering")
+    parser.add_argument("--problems", type=int, default=1_000_000, help="problems in the synthetic catalog")
+    parser.add_argument("--topics", type=int, default=200, help="topics in the synthetic catalog")
+    parser.add_argument("--tags", type=int, default=300, help="distinct technique tags")
+    parser.add_argument("--solved", type=int, default=2000, help="solved problems of the querying learner")
+    parser.add_argument("--queries", type=int, default=20, help="timed queries per template")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--output", help="optional path for JSON results")
+    args = parser.parse_args()
+
+    check_topic_levels(get_problem_catalog())
+    check_negation(get_problem_catalog())
+
+    rng = random.Random(args.seed)
+    tag_names = [f"technique {i}" for i in range(args.tags)]
+    problems_data = generate_problem_catalog(args.problems, num_topics=args.topics, seed=args.seed)
+    add_tags(problems_data, rng, tag_names)
+    catalog = ProblemCatalog(problems_data)
+    start = time.perf_counter()
+    index = TagIndex(catalog)
+    build_s = time.perf_counter() - start
+
+    # Baseline data: every listing's problem id and terms as a set, like filtering problem dictionaries,
+    # and each problem's topics and tags over all its listings, which a NOT excludes
+    listing_terms = [(problem.problem_id, {problem.topic.lower(), problem.level, *problem.tags})
+                     for problem in catalog]
+    problem_terms: Dict[int, set] = {}
+    for problem in catalog:
+        problem_terms.setdefault(problem.problem_id, set()).update((problem.topic.lower(), *problem.tags))
+    solved_ids = set(rng.sample(range(catalog.unique_count()), args.solved))
+    solved = RoaringBitmap.from_ids(problem.index for pid in solved_ids for problem in catalog.listings(pid))
+
+    topics = [topic.lower() for topic in catalog.topics()]
+    popular, rare = tag_names[:10], tag_names[10:]
+    templates = {
+        "(tag OR tag) AND level AND NOT solved": lambda: (
+            lambda a, b, level: (
+                f'("{a}" OR "{b}") AND {level} AND NOT solved',
+                lambda pid, t: (a in t or b in t) and level in t and pid not in solved_ids))(
+            rng.choice(popular), rng.choice(rare), rng.choice(LEVELS)),
+        "topic AND tag": lambda: (
+            lambda topic, a: (f'"{topic}" AND "{a}"', lambda pid, t: topic in t and a in t))(
+            rng.choice(topics), rng.choice(popular)),
+        "tag AND tag AND NOT level": lambda: (
+            lambda a, b, level: (f'"{a}" AND "{b}" AND NOT {level}',
+                                 lambda pid, t: a in t and b in t and level not in t))(
+            rng.choice(popular), rng.choice(popular), rng.choice(LEVELS)),
+        "NOT (tag OR level)": lambda: (
+            lambda a, level: (f'NOT ("{a}" OR {level})', lambda pid, t: not (a in problem_terms[pid] or level in t)))(
+            rng.choice(popular), rng.choice(LEVELS)),
+    }
+
+    rows: List[Dict[str, Any]] = []
+    for name, make in templates.items():
+        queries = [make() for _ in range(args.queries)]
+        for expression, predicate in queries[:3]:
+            expected = [i for i, (pid, terms) in enumerate(listing_terms) if predicate(pid, terms)]
+            assert list(index.query(expression, solved)) == expected, expression
+            assert index.count(expression, solved) == len({listing_terms[i][0] for i in expected}), expression
+        matches = []
+        bitmap_samples = [time_call(lambda: matches.append(len(index.query(q, solved)))) for q, _ in queries]
+        list_samples = [time_call(lambda: [i for i, (pid, terms) in enumerate(listing_terms) if p(pid, terms)])
+                        for _, p in queries[:max(3, args.queries // 5)]]
+        for method, samples in (("bitmaps", bitmap_samples), ("list filter", list_samples)):
+            stats = summarize(samples)
+            rows.append({"query": name, "method": method, "mean_matches": sum(matches) / len(matches),
+                         "mean_ms": stats["mean_us"] / 1e3, "p50_ms": stats["p50_us"] / 1e3,
+                         "p99_ms": stats["p99_us"] / 1e3})
+
+    bitmaps = [index.bitmap(term) for term in index.terms()]
+    compressed = sum(bitmap.nbytes() for bitmap in bitmaps)
+    uncompressed = len(bitmaps) * len(catalog) / 8
+
+    print(f"catalog: {len(catalog)} listings of {catalog.unique_count()} problems, {args.topics} topics, "
+          f"{args.tags} tags; "
+          f"index built in {build_s:.1f} s")
+    print(f"bitmaps: {len(bitmaps)} terms, {compressed / 2**20:.1f} MB compressed, "
+          f"{uncompressed / 2**20:.1f} MB as plain bitmaps")
+    print_table(rows, ["query", "method", "mean_matches", "mean_ms", "p50_ms", "p99_ms"])
+
+    if args.output:
+        write_results(args.output, {
+            "benchmark": "tag_queries",
+            "environment": environment_info(),
+            "parameters": vars(args),
+            "build_s": build_s,
+            "compressed_bytes": compressed,
+            "uncompressed_bytes": uncompressed,
+            "results": rows,
+        })
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark Utilities
+Shared timing, summarizing and reporting helpers for the benchmark scripts
+"""
+
+import json
+import os
+import platform
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+# Make the src packages importable the same way app/main.py does
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+def time_call(func: Callable[[], Any]) -> float:
+    """Run a callable once and return the elapsed time in seconds"""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of samples"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[rank]
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """
+    Summarize timing samples
+
+    Args:
+        samples: Elapsed times in seconds
+
+    Returns:
+        Dictionary with count and mean/p50/p95/p99/max latency in microseconds
+    """
+    if not samples:
+        return {"count": 0, "mean_us": 0.0, "p50_us": 0.0, "p95_us": 0.0, "p99_us": 0.0, "max_us": 0.0}
+    return {
+        "count": len(samples),
+        "mean_us": sum(samples) / len(samples) * 1e6,
+        "p50_us": percentile(samples, 50) * 1e6,
+        "p95_us": percentile(samples, 95) * 1e6,
+        "p99_us": percentile(samples, 99) * 1e6,
+        "max_us": max(samples) * 1e6,
+    }
+
+def environment_info() -> Dict[str, str]:
+    """Describe the interpreter and machine the benchmark ran on"""
+    return {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+def write_results(path: str, payload: Dict[str, Any]):
+    """Write benchmark results as JSON, creating parent directories as needed"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(payload, f, indent=2, sort_keys=True)
+
+def print_table(rows: List[Dict[str, Any]], columns: List[str]):
+    """Print rows of results as an aligned plain-text table"""
+    widths = {c: max(len(c), *(len(_format_cell(r.get(c))) for r in rows)) for c in columns} if rows else {}
+    print("  ".join(c.ljust(widths.get(c, len(c))) for c in columns))
+    for row in rows:
+        print("  ".join(_format_cell(row.get(c)).ljust(widths[c]) for c in columns))
+
+def _format_cell(value: Any) -> str:
+    if isinstance(value, float):
+        return f"{value:.1f}"
+    return "" if value is None else str(value)
@@ -0,0 +1,158 @@
+"""
+Graph Engine Differential Harness
+Runs identical randomized workloads against every graph engine backend,
+checks that all backends agree and reports per-operation latency
+
+Usage:
+    python benchmarks/compare_engines.py --topics 500 --ops 2000 --seed 7
+"""
+
+import argparse
+import random
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+
+from bench_utils import environment_info, print_table, summarize, time_call, write_results
+
+from data.topic_data import TOPIC_DEPENDENCIES
+from graph.engine import ENGINE_BACKENDS, create_engine
+
+def random_dependencies(num_topics: int, avg_prereqs: float, seed: int, cycle_edges: int = 0) -> Dict[str, List[str]]:
+    """
+    Build a random dependency dictionary
+
+    Args:
+        num_topics: Number of topics to create
+        avg_prereqs: Average number of prerequisites per topic
+        seed: Random seed
+        cycle_edges: Number of backward edges to add, creating cycles
+
+    Returns:
+        Dictionary mapping topics to their prerequisites
+    """
+    rng = random.Random(seed)
+    names = [f"T{i}" for i in range(num_topics)]
+    # Shuffle dictionary order so it differs from the generation order
+    positions = list(range(num_topics))
+    rng.shuffle(positions)
+
+    dependencies = {names[i]: [] for i in positions}
+    for i in range(1, num_topics):
+        count = min(i, int(rng.expovariate(1 / avg_prereqs)) if avg_prereqs > 0 else 0)
+        dependencies[names[i]] = [names[j] for j in rng.sample(range(i), count)]
+
+    # Close a two-topic cycle by making a prerequisite depend on its dependent
+    with_prereqs = [name for name in names if dependencies[name]]
+    for _ in range(cycle_edges if with_prereqs else 0):
+        topic = rng.choice(with_prereqs)
+        dependencies[rng.choice(dependencies[topic])].append(topic)
+
+    # A dangling prerequisite, which every backend must ignore
+    if num_topics:
+        dependencies[names[0]].append("Unknown Topic")
+    return dependencies
+
+def build_workload(topics: List[str], num_ops: int, seed: int) -> List[Tuple[str, tuple]]:
+    """Create a reproducible list of (operation, arguments) pairs"""
+    rng = random.Random(seed)
+    pool = topics + ["Unknown Topic"]
+    workload = []
+    for _ in range(num_ops):
+        op = rng.choice(["get_prerequisites", "get_dependent_topics", "get_learning_path",
+                         "sort_subgraph", "get_topic_level"])
+        if op == "get_learning_path":
+            known = rng.sample(topics, min(len(topics), rng.randint(0, 4)))
+            args = (rng.choice(pool), known)
+        elif op == "sort_subgraph":
+            args = (rng.sample(pool, min(len(pool), rng.randint(1, 30))),)
+        else:
+            args = (rng.choice(pool),)
+        workload.append((op, args))
+    return workload
+
+def run_backend(backend: str, dependencies: Dict[str, List[str]],
+                workload: List[Tuple[str, tuple]]) -> Tuple[List[Any], Dict[str, List[float]], float]:
+    """Run a workload on one backend, returning results, per-operation timings and build time"""
+    engine = None
+
+    def build():
+        nonlocal engine
+        engine = create_engine(dependencies, backend)
+
+    build_seconds = time_call(build)
+    results = [("topological_order", engine.topological_order()),
+               ("get_topics_by_level", engine.get_topics_by_level())]
+    timings: Dict[str, List[float]] = {}
+    for op, args in workload:
+        method: Callable = getattr(engine, op)
+        box = []
+        timings.setdefault(op, []).append(time_call(lambda: box.append(method(*args))))
+        results.append((op, box[0]))
+    return results, timings, build_seconds
+
+def compare(dependencies: Dict[str, List[str]], workload: List[Tuple[str, tuple]],
+            backends: List[str], label: str) -> Tuple[List[Dict[str, Any]], int]:
+    """Run all backends on a workload and check they agree with the first one"""
+    rows = []
+    mismatches = 0
+    reference = None
+    for backend in backends:
+        results, timings, build_seconds = run_backend(backend, dependencies, workload)
+        if reference is None:
+            reference = (backend, results)
+        else:
+            for i, (expected, actual) in enumerate(zip(reference[1], results)):
+                if expected != actual:
+                    mismatches += 1
+                    if mismatches <= 5:
+                        print(f"[{label}] {backend} disagrees with {reference[0]} on {actual[0]} "
+                              f"(step {i}): {expected[1]!r} != {actual[1]!r}", file=sys.stderr)
+
+        rows.append({"workload": label, "backend": backend, "operation": "build",
+                     **summarize([build_seconds])})
+        for op, samples in sorted(timings.items()):
+            rows.append({"workload": label, "backend": backend, "operation": op, **summarize(samples)})
+    return rows, mismatches
+
+def main():
+    parser = argparse.ArgumentParser(description="Differential test and benchmark for graph engine backends")
+    parser.add_argument("--topics", type=int, default=300, help="topics in each random graph")
+    parser.add_argument("--avg-prereqs", type=float, default=2.5, help="average prerequisites per topic")
+    parser.add_argument("--ops", type=int, default=1000, help="operations per workload")
+    parser.add_argument("--graphs", type=int, default=3, help="number of random graphs")
+    parser.add_argument("--seed", type=int, default=0, help="base random seed")
+    parser.add_argument("--backends", default=",".join(ENGINE_BACKENDS), help="comma separated backends")
+    parser.add_argument("--output", help="optional path for JSON results")
+    args = parser.parse_args()
+
+    backends = [b.strip() for b in args.backends.split(",") if b.strip()]
+    workloads = [("bundled", TOPIC_DEPENDENCIES)]
+    for g in range(args.graphs):
+        seed = args.seed + g
+        workloads.append((f"random-{seed}", random_dependencies(args.topics, args.avg_prereqs, seed)))
+        workloads.append((f"cyclic-{seed}", random_dependencies(args.topics, args.avg_prereqs, seed, cycle_edges=3)))
+
+    all_rows = []
+    total_mismatches = 0
+    for label, dependencies in workloads:
+        workload = build_workload(list(dependencies), args.ops, args.seed)
+        rows, mismatches = compare(dependencies, workload, backends, label)
+        all_rows.extend(rows)
+        total_mismatches += mismatches
+
+    print_table(all_rows, ["workload", "backend", "operation", "count", "mean_us", "p50_us", "p95_us", "max_us"])
+    print(f"\n{'All backends agree' if total_mismatches == 0 else f'{total_mismatches} mismatches found'}")
+
+    if args.output:
+        write_results(args.output, {
+            "benchmark": "compare_engines",
+            "environment": environment_info(),
+            "parameters": vars(args),
+            "mismatches": total_mismatches,
+            "results": all_rows,
+        })
+
+    sys.exit(1 if total_mismatches else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""
+Graph Hot-Reload Stress Test
+Many reader threads query the shared graph while a writer keeps reloading it.
+Checks that every reader sees a consistent snapshot and reports reader tail
+latency overall and while a reload is in progress
+
+Two publication models are compared:
+
+- swap: GraphRegistry, readers take the current snapshot without locking
+- lock: a single lock around the graph, held by the writer while it rebuilds
+
+All threads share one interpreter, so under the swap model the writer's
+rebuild still competes with readers for the GIL; what disappears is readers
+queueing behind the whole rebuild.
+
+Usage:
+    python benchmarks/stress_graph_reload.py --readers 32 --seconds 5 --topics 2000
+"""
+
+import argparse
+import random
+import sys
+import threading
+import time
+from typing import Any, Dict, List
+
+from bench_utils import environment_info, percentile, print_table, summarize, write_results
+
+from data.synthetic import layered_curriculum
+from graph.engine import create_engine
+from graph.snapshot import GraphRegistry
+
+class LockedGraph:
+    """Baseline: one engine behind a lock that the writer holds while rebuilding"""
+
+    def __init__(self, topic_dependencies, backend):
+        self.backend = backend
+        self._lock = threading.Lock()
+        self._engine = create_engine(topic_dependencies, backend)
+        self.version = 1
+
+    def query(self, func):
+        with self._lock:
+            return func(self._engine, self.version)
+
+    def reload(self, topic_dependencies):
+        with self._lock:
+            self._engine = create_engine(topic_dependencies, self.backend)
+            self.version += 1
+
+def curricula(topics: int, seed: int) -> List[Dict[str, List[str]]]:
+    """Two alternating curricula whose topic sets differ, so stale reads are detectable"""
+    first = layered_curriculum(topics, seed=seed)
+    second = {f"{topic} v2": [f"{p} v2" for p in prereqs] for topic, prereqs in layered_curriculum(topics, seed=seed + 1).items()}
+    return [first, second]
+
+def run(model: str, args) -> Dict[str, Any]:
+    versions = curricula(args.topics, args.seed)
+    # Topic names per version, so readers can verify they never mix versions
+    version_topics = [set(v) for v in versions]
+
+    if model == "swap":
+        graph = GraphRegistry(versions[0], backend=args.backend)
+
+        def read(func):
+            snapshot = graph.current()
+            return func(snapshot, snapshot.version)
+    else:
+        graph = LockedGraph(versions[0], args.backend)
+        read = graph.query
+
+    stop = threading.Event()
+    reload_windows = []
+    errors = []
+    samples: List[List[tuple]] = [[] for _ in range(args.readers)]
+
+    def writer():
+        i = 1
+        while not stop.is_set():
+            start = time.perf_counter()
+            graph.reload(versions[i % 2])
+            reload_windows.append((start, time.perf_counter()))
+            i += 1
+            stop.wait(args.reload_interval)
+
+    def reader(slot: int):
+        rng = random.Random(args.seed + slot)
+        out = samples[slot]
+        last_version = 0
+
+        def query(engine, version):
+            topics = engine.topics()
+            target = topics[rng.randrange(len(topics))]
+            path = engine.get_learning_path(target, [topics[rng.randrange(len(topics))]])
+            return version, topics[0], path
+
+        while not stop.is_set():
+            start = time.perf_counter()
+            version, first_topic, path = read(query)
+            end = time.perf_counter()
+            out.append((start, end))
+            expected = version_topics[0] if first_topic in version_topics[0] else version_topics[1]
+            if version < last_version:
+                errors.append(f"reader {slot} went back from version {last_version} to {version}")
+            if any(topic not in expected for topic in path):
+                errors.append(f"reader {slot} saw a path mixing curriculum versions")
+            last_version = version
+
+    threads = [threading.Thread(target=reader, args=(i,)) for i in range(args.readers)]
+    threads.append(threading.Thread(target=writer))
+    for thread in threads:
+        thread.start()
+    time.sleep(args.seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    latencies = [end - start for out in samples for start, end in out]
+    during_reload = [
+        end - start for out in samples for start, end in out
+        if any(start < w_end and end > w_start for w_start, w_end in reload_windows)
+    ]
+    overall = summarize(latencies)
+    reloading = summarize(during_reload)
+    return {
+        "model": model,
+        "reads": overall["count"],
+        "reloads": len(reload_windows),
+        "errors": len(errors),
+        "p50_us": overall["p50_us"],
+        "p99_us": overall["p99_us"],
+        "p999_us": percentile(latencies, 99.9) * 1e6,
+        "max_us": overall["max_us"],
+        "reload_reads": reloading["count"],
+        "reload_p99_us": reloading["p99_us"],
+        "reload_p999_us": percentile(during_reload, 99.9) * 1e6,
+        "reload_max_us": reloading["max_us"],
+        "first_error": errors[0] if errors else "",
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent readers during graph hot reloads")
+    parser.add_argument("--readers", type=int, default=32, help="reader threads")
+    parser.add_argument("--seconds", type=float, default=5.0, help="duration per model")
+    parser.add_argument("--topics", type=int, default=2000, help="topics per curriculum")
+    parser.add_argument("--backend", default="dict", help="engine backend")
+    parser.add_argument("--reload-interval", type=float, default=0.05, help="pause between reloads in seconds")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--output", help="optional path for JSON results")
+    args = parser.parse_args()
+
+    rows = [run("swap", args), run("lock", args)]
+    print_table(rows, ["model", "reads", "reloads", "errors", "p50_us", "p99_us", "p999_us", "max_us",
+                       "reload_reads", "reload_p99_us", "reload_p999_us", "reload_max_us"])
+    for row in rows:
+        if row["first_error"]:
+            print(f"{row['model']}: {row['first_error']}", file=sys.stderr)
+
+    if args.output:
+        write_results(args.output, {
+            "benchmark": "stress_graph_reload",
+            "environment": environment_info(),
+            "parameters": vars(args),
+            "results": rows,
+        })
+
+    sys.exit(1 if any(row["errors"] for row in rows) else 0)
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@ setup(
     install_requires=[
         "streamlit>=1.28.0,<2.0.0",
         "networkx>=3.0,<4.0",
+        "numpy>=1.23.0,<3.0.0",
         "pandas>=2.0.0,<3.0.0",
         "matplotlib>=3.7.0,<4.0.0",
         "plotly>=5.15.0,<6.0.0",
@@ -0,0 +1,266 @@
+"""
+Cohort Analytics
+Class-wide progress through the curriculum: funnels along the topic
+levels, completion distributions and time between topics
+
+A cohort's progress is one float64 matrix of completion times (epoch
+seconds, NaN while not completed), a row per learner and a column per
+topic, with topics grouped by their level in the dependency graph. Every
+dashboard number is a vectorized operation over its columns:
+
+- share past a topic: completed cells of the topic's column
+- funnel: learners who completed every topic of levels 0 .. k, per k
+- completion distribution: learners per number of completed topics
+- time between two topics: the difference of two columns
+
+Events arrive as (learner, topic, completed_at) rows, e.g. an export of
+the class's progress. add_events applies a batch to the matrix and then
+refreshes only what the batch touched: the per-topic counts get the newly
+completed cells, and the funnel and distribution histograms swap out the
+old contributions of the batch's learners for their new ones, so a small
+batch costs time in proportion to its learners, not to the cohort.
+"""
+
+from typing import Hashable, Iterable, List, Mapping, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .catalog import ProblemCatalog
+
+DAY = 86400.0
+
+# Columns of a progress event frame
+EVENT_COLUMNS = ("learner", "topic", "completed_at")
+
+def event_frame(events) -> pd.DataFrame:
+    """
+    Progress events as a frame with numeric completion times
+
+    Args:
+        events: DataFrame or iterable of (learner, topic, completed_at) rows;
+            completed_at may be epoch seconds, datetimes or ISO 8601 date strings
+    """
+    frame = events if isinstance(events, pd.DataFrame) else pd.DataFrame(list(events), columns=EVENT_COLUMNS)
+    missing = [column for column in EVENT_COLUMNS if column not in frame.columns]
+    if missing:
+        raise ValueError(f"Progress events need the columns {', '.join(missing)}")
+    completed_at = frame["completed_at"]
+    if not pd.api.types.is_numeric_dtype(completed_at):
+        completed_at = pd.to_datetime(completed_at, utc=True, format="ISO8601")
+        completed_at = (completed_at - pd.Timestamp(0, tz="UTC")).dt.total_seconds()
+    return pd.DataFrame({"learner": frame["learner"].to_numpy(), "topic": frame["topic"].to_numpy(),
+                         "completed_at": completed_at.to_numpy(dtype=np.float64)})
+
+def topic_completions(solves, catalog: ProblemCatalog, mastery: int = 3) -> pd.DataFrame:
+    """
+    Progress events from solved problems: a topic counts as completed at a learner's mastery-th solve in it
+
+    Args:
+        solves: DataFrame or iterable of (learner, canonical_id, solved_at) rows
+        catalog: Compiled problem catalog the canonical ids belong to
+        mastery: Solved problems that complete a topic
+
+    Returns:
+        Event frame with learner, topic and completed_at
+    """
+    if not isinstance(solves, pd.DataFrame):
+        solves = pd.DataFrame(list(solves), columns=("learner", "canonical_id", "solved_at"))
+    # A problem listed under several topics counts for each of them
+    placements = pd.DataFrame([(problem.canonical_id, problem.topic) for problem in catalog],
+                              columns=("canonical_id", "topic")).drop_duplicates()
+    solved = (solves.drop_duplicates(["learner", "canonical_id"])
+              .merge(placements, on="canonical_id")
+              .sort_values("solved_at", kind="stable"))
+    nth = solved.groupby(["learner", "topic"], sort=False).cumcount() == mastery - 1
+    completed = solved[nth]
+    return pd.DataFrame({"learner": completed["learner"].to_numpy(), "topic": completed["topic"].to_numpy(),
+                         "completed_at": completed["solved_at"].to_numpy(dtype=np.float64)})
+
+class CohortAnalytics:
+    """Completion times of one cohort's learners, with incrementally maintained aggregates"""
+
+    def __init__(self, topics_by_level: Mapping[int, Sequence[str]]):
+        """
+        Args:
+            topics_by_level: Topics grouped by level in the dependency graph, e.g. the graph
+                engine's get_topics_by_level()
+        """
+        self.levels: List[int] = sorted(topics_by_level)
+        self.topics: List[str] = [topic for level in self.levels for topic in topics_by_level[level]]
+        self._topic_index = {topic: i for i, topic in enumerate(self.topics)}
+        # Position of each topic's level in self.levels, and a topics x levels indicator to count per level
+        self._topic_level = np.repeat(np.arange(len(self.levels)),
+                                      [len(topics_by_level[level]) for level in self.levels])
+        self._level_members = np.zeros((len(self.topics), len(self.levels)), dtype=np.int32)
+        self._level_members[np.arange(len(self.topics)), self._topic_level] = 1
+        self._level_sizes = self._level_members.sum(axis=0)
+
+        self._learners: List[Hashable] = []
+        self._learner_index: dict = {}
+        self._times = np.full((0, len(self.topics)), np.nan)
+        # Per learner: completed topics and leading levels fully completed
+        self._completed = np.zeros(0, dtype=np.int32)
+        self._reached = np.zeros(0, dtype=np.int32)
+        # Learners per completed-topic count, per reached level count, and per topic
+        self._completed_histogram = np.zeros(len(self.topics) + 1, dtype=np.int64)
+        self._reached_histogram = np.zeros(len(self.levels) + 1, dtype=np.int64)
+        self._topic_counts = np.zeros(len(self.topics), dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self._learners)
+
+    def learners(self) -> List[Hashable]:
+        """Learners in the cohort, in order of their first event"""
+        return list(self._learners)
+
+    def add_events(self, events) -> int:
+        """
+        Apply a batch of progress events and refresh the aggregates it touched
+
+        A topic's earliest completion time wins; events for topics outside
+        the curriculum are skipped.
+
+        Args:
+            events: DataFrame or iterable of (learner, topic, completed_at) rows (see event_frame)
+
+        Returns:
+            Number of events applied
+        """
+        frame = event_frame(events)
+        columns = frame["topic"].map(self._topic_index)
+        known = columns.notna().to_numpy() & ~np.isnan(frame["completed_at"].to_numpy())
+        if not known.any():
+            return 0
+        frame = frame[known]
+        columns = columns[known].to_numpy(dtype=np.int64)
+        # Map the batch's distinct learners, not the whole index, to rows
+        codes, distinct = pd.factorize(frame["learner"])
+        self._add_learners(distinct)
+        index = self._learner_index
+        rows = np.array([index[learner] for learner in distinct], dtype=np.int64)[codes]
+        times = frame["completed_at"].to_numpy()
+
+        # Earliest time per (learner, topic) cell of the batch
+        keys = rows * len(self.topics) + columns
+        order = np.argsort(keys, kind="stable")
+        keys = keys[order]
+        starts = np.flatnonzero(np.concatenate([[True], keys[1:] != keys[:-1]]))
+        cells = keys[starts]
+        earliest = np.fmin.reduceat(times[order], starts)
+
+        touched = np.unique(cells // len(self.topics))
+        completed_before = self._completed[touched]
+        reached_before = self._reached[touched]
+        current = self._times.flat[cells]
+        open_before = np.isnan(current)
+        self._times.flat[cells] = np.fmin(current, earliest)
+
+        # Newly completed cells, per topic
+        newly = cells[open_before]
+        self._topic_counts += np.bincount(newly % len(self.topics), minlength=len(self.topics))
+
+        # Swap the touched learners' old histogram contributions for their new ones
+        done = ~np.isnan(self._times[touched])
+        completed = done.sum(axis=1, dtype=np.int32)
+        full_levels = (done.astype(np.int32) @ self._level_members) == self._level_sizes
+        reached = np.where(full_levels.all(axis=1), len(self.levels), np.argmin(full_levels, axis=1)).astype(np.int32)
+        self._completed[touched] = completed
+        self._reached[touched] = reached
+        for histogram, before, after in ((self._completed_histogram, completed_before, completed),
+                                         (self._reached_histogram, reached_before, reached)):
+            histogram -= np.bincount(before, minlength=len(histogram))
+            histogram += np.bincount(after, minlength=len(histogram))
+        return len(frame)
+
+    def _add_learners(self, learners: Iterable[Hashable]):
+        new = [learner for learner in learners if learner not in self._learner_index]
+        if not new:
+            return
+        start = len(self._learners)
+        for i, learner in enumerate(new, start):
+            self._learner_index[learner] = i
+        self._learners.extend(new)
+        size = len(self._learners)
+        if size > len(self._times):
+            # Grow by doubling so a stream of small batches copies the matrix O(log n) times
+            capacity = max(size, 2 * len(self._times), 64)
+            self._times = np.vstack([self._times, np.full((capacity - len(self._times), len(self.topics)), np.nan)])
+            self._completed = np.concatenate([self._completed, np.zeros(capacity - len(self._completed), np.int32)])
+            self._reached = np.concatenate([self._reached, np.zeros(capacity - len(self._reached), np.int32)])
+        # New learners start with nothing completed
+        self._completed_histogram[0] += len(new)
+        self._reached_histogram[0] += len(new)
+
+    def completion_times(self) -> pd.DataFrame:
+        """Learners x topics frame of completion times (epoch seconds, NaN while not completed)"""
+        return pd.DataFrame(self._times[:len(self._learners)], index=self._learners, columns=self.topics)
+
+    def share_past(self, topic: str) -> float:
+        """Share of the cohort that completed a topic"""
+        if not self._learners:
+            return 0.0
+        return float(self._topic_counts[self._topic_index[topic]]) / len(self._learners)
+
+    def topic_completion(self) -> pd.DataFrame:
+        """Per topic, in level order: its level, learners who completed it and their share of the cohort"""
+        return pd.DataFrame({
+            "topic": self.topics,
+            "level": np.asarray(self.levels)[self._topic_level],
+            "learners": self._topic_counts,
+            "share": self._topic_counts / max(1, len(self._learners)),
+        })
+
+    def funnel(self) -> pd.DataFrame:
+        """
+        Learners through each level of the curriculum
+
+        Returns:
+            Frame with one row per level: level, topics, learners who completed every
+            topic of this and all earlier levels, their share of the cohort, and the
+            share of the previous stage that made it through this one
+        """
+        # Learners whose leading completed levels reach past level k: suffix sums of the histogram
+        through = np.cumsum(self._reached_histogram[::-1])[::-1][1:]
+        previous = np.concatenate([[len(self._learners)], through[:-1]])
+        return pd.DataFrame({
+            "level": self.levels,
+            "topics": self._level_sizes,
+            "learners": through,
+            "share": through / max(1, len(self._learners)),
+            "step_share": np.divide(through, previous, out=np.zeros(len(through)), where=previous > 0),
+        })
+
+    def completion_distribution(self) -> pd.DataFrame:
+        """Learners per number of completed topics, with the share and cumulative share of the cohort"""
+        learners = self._completed_histogram
+        share = learners / max(1, len(self._learners))
+        return pd.DataFrame({
+            "topics_completed": np.arange(len(learners)),
+            "learners": learners,
+            "share": share,
+            "cumulative_share": np.cumsum(share),
+        })
+
+    def completion_quantiles(self, quantiles: Sequence[float] = (0.25, 0.5, 0.75)) -> pd.Series:
+        """Completed-topic counts at quantiles of the cohort, read off the distribution"""
+        cumulative = np.cumsum(self._completed_histogram)
+        targets = np.asarray(quantiles) * max(0, len(self._learners) - 1)
+        return pd.Series(np.searchsorted(cumulative, targets, side="right"), index=list(quantiles))
+
+    def time_between(self, start_topic: str, end_topic: str) -> pd.Series:
+        """
+        Days from completing one topic to completing another, per learner who completed both
+
+        Negative values mean the learner completed end_topic first.
+        """
+        start = self._times[:len(self._learners), self._topic_index[start_topic]]
+        end = self._times[:len(self._learners), self._topic_index[end_topic]]
+        both = ~np.isnan(start) & ~np.isnan(end)
+        return pd.Series((end[both] - start[both]) / DAY, index=np.asarray(self._learners, dtype=object)[both],
+                         name=f"{start_topic} -> {end_topic}")
+
+    def median_days_between(self, start_topic: str, end_topic: str) -> float:
+        """Median days from completing one topic to completing another (NaN if nobody completed both)"""
+        days = self.time_between(start_topic, end_topic)
+        return float(days.median()) if len(days) else float("nan")
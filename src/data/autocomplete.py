@@ -0,0 +1,171 @@
+"""
+Prefix Autocomplete
+Sorted-array prefix index over topic names, aliases and problem titles for
+type-ahead selectors
+
+Every word start of every name is stored as one lowercase key
+("binary search trees", "search trees", "trees"), so typing any word of a
+name finds it. Keys are kept in one sorted list; the matches of a prefix
+are the contiguous range found with two bisects. Results are ranked topics
+first, then aliases, then problem titles, preferring matches at the start
+of a name and shorter names.
+
+Short prefixes such as "s" match a large part of a big catalog, so the
+ranked completions of every prefix whose range exceeds ``heavy_range``
+keys are computed at build time. Any other prefix ranks at most
+``heavy_range`` keys per lookup.
+"""
+
+import bisect
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+
+import numpy as np
+
+KIND_ORDER = {"topic": 0, "alias": 1, "problem": 2}
+
+class Completion(NamedTuple):
+    text: str   # Name as it should be shown
+    value: str  # What choosing it selects (the topic an alias stands for)
+    kind: str   # "topic", "alias" or "problem"
+
+def normalize(text: str) -> str:
+    """Lowercase with single spaces"""
+    return " ".join(text.lower().split())
+
+class PrefixIndex:
+    """Ranked prefix completions over a fixed set of names"""
+
+    def __init__(self, entries: Iterable[Tuple[str, str, str]], max_results: int = 32, heavy_range: int = 256):
+        """
+        Build the index
+
+        Args:
+            entries: (text, value, kind) triples; kind is one of KIND_ORDER
+            max_results: Most completions one lookup can return
+            heavy_range: Prefixes matching more keys than this get precomputed results
+        """
+        self.max_results = max_results
+        self.heavy_range = max(heavy_range, max_results)
+        self._entries: List[Completion] = []
+        keyed = []
+        for text, value, kind in entries:
+            entry = len(self._entries)
+            self._entries.append(Completion(text, value, kind))
+            name = normalize(text)
+            start = 0
+            while start >= 0:
+                # (key, rank tuple, entry)
+                keyed.append((name[start:], (KIND_ORDER[kind], start > 0, len(name), entry), entry))
+                start = name.find(" ", start)
+                start = start + 1 if start >= 0 else -1
+
+        # Rank of each key among all keys, so ranking a range is an integer selection
+        by_rank = sorted(range(len(keyed)), key=lambda i: keyed[i][1])
+        ranks = np.empty(len(keyed), dtype=np.int32)
+        ranks[by_rank] = np.arange(len(keyed), dtype=np.int32)
+
+        order = sorted(range(len(keyed)), key=lambda i: keyed[i][0])
+        self._keys = [keyed[i][0] for i in order]
+        self._key_entries = np.array([keyed[i][2] for i in order], dtype=np.int32)
+        self._ranks = ranks[order] if len(order) else ranks
+
+        self._heavy: Dict[str, List[Completion]] = {}
+        self._precompute(0, len(self._keys), 0)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _range(self, prefix: str, lo: int = 0, hi: int = -1) -> Tuple[int, int]:
+        hi = len(self._keys) if hi < 0 else hi
+        lo = bisect.bisect_left(self._keys, prefix, lo, hi)
+        return lo, bisect.bisect_left(self._keys, prefix + "\uffff", lo, hi)
+
+    def _precompute(self, lo: int, hi: int, depth: int):
+        """Store results for every heavy prefix one character longer than depth within keys[lo:hi]"""
+        i = lo
+        while i < hi:
+            if len(self._keys[i]) <= depth:
+                i += 1
+                continue
+            prefix = self._keys[i][:depth + 1]
+            start, stop = self._range(prefix, i, hi)
+            if stop - start > self.heavy_range:
+                self._heavy[prefix] = self._ranked(start, stop, self.max_results)
+                self._precompute(start, stop, depth + 1)
+            i = stop
+
+    def _ranked(self, lo: int, hi: int, limit: int) -> List[Completion]:
+        """Best distinct completions among keys[lo:hi]"""
+        ranks = self._ranks[lo:hi]
+        # A name can match at several word starts, so select extra before de-duplicating
+        want = min(len(ranks), limit * 4)
+        while True:
+            if want < len(ranks):
+                best = np.argpartition(ranks, want - 1)[:want]
+                best = best[np.argsort(ranks[best])]
+            else:
+                best = np.argsort(ranks)
+            results = []
+            seen = set()
+            for entry in self._key_entries[lo + best]:
+                completion = self._entries[entry]
+                if (completion.value, completion.kind) not in seen:
+                    seen.add((completion.value, completion.kind))
+                    results.append(completion)
+                    if len(results) == limit:
+                        return results
+            if want >= len(ranks):
+                return results
+            want = min(len(ranks), want * 4)
+
+    def complete(self, prefix: str, limit: int = 10) -> List[Completion]:
+        """
+        Ranked completions for a typed prefix
+
+        Args:
+            prefix: What the user typed so far (case and extra spaces are ignored)
+            limit: Maximum number of completions (at most max_results)
+
+        Returns:
+            Completions, best first
+        """
+        prefix = normalize(prefix)
+        limit = min(limit, self.max_results)
+        if not prefix or limit <= 0:
+            return []
+        cached = self._heavy.get(prefix)
+        if cached is not None:
+            return cached[:limit]
+        lo, hi = self._range(prefix)
+        if hi - lo <= limit:
+            return self._small(lo, hi, limit)
+        return self._ranked(lo, hi, limit)
+
+    def _small(self, lo: int, hi: int, limit: int) -> List[Completion]:
+        results = []
+        seen = set()
+        for i in sorted(range(lo, hi), key=self._ranks.__getitem__):
+            completion = self._entries[self._key_entries[i]]
+            if (completion.value, completion.kind) not in seen:
+                seen.add((completion.value, completion.kind))
+                results.append(completion)
+        return results[:limit]
+
+def build_index(topics: Iterable[str], aliases: Dict[str, str] = None, problem_titles: Iterable[str] = (),
+                **kwargs) -> PrefixIndex:
+    """
+    Prefix index over topics, their aliases and problem titles
+
+    Args:
+        topics: Topic names
+        aliases: Dictionary mapping alias -> topic name
+        problem_titles: Problem titles (duplicates are fine)
+        **kwargs: Passed on to PrefixIndex
+
+    Returns:
+        The built index
+    """
+    entries = [(topic, topic, "topic") for topic in topics]
+    entries += [(alias, topic, "alias") for alias, topic in (aliases or {}).items()]
+    entries += [(title, title, "problem") for title in dict.fromkeys(problem_titles)]
+    return PrefixIndex(entries, **kwargs)
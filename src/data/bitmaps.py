@@ -0,0 +1,255 @@
+"""
+Compressed Bitmaps
+Roaring-style compressed sets of problem ids with set algebra
+
+Ids are split into chunks of 2^16 by their high bits. Each non-empty chunk
+is stored as either a sorted array of its low 16 bits (up to 4096 ids, two
+bytes per id) or a 65536-bit bitmap (8 KB, as a Python int), whichever is
+smaller, so a sparse tag costs two bytes per problem and a dense one an
+eighth of a byte. AND, OR and AND NOT work chunk by chunk and skip chunks
+the other side does not have: sorted arrays go through C set operations,
+bitmaps through int bitwise operators, mixed pairs look array entries up
+in the bitmap's bytes.
+"""
+
+import re
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from typing import Iterable, Iterator, List, Optional, Union
+
+CHUNK_BITS = 16
+CHUNK_SIZE = 1 << CHUNK_BITS
+# Most ids an array container holds; at 4096 two-byte ids it is as large as a bitmap container
+ARRAY_LIMIT = 4096
+_BITMAP_BYTES = CHUNK_SIZE // 8
+
+_NONZERO_BYTE = re.compile(b"[^\x00]")
+
+# Set bit positions of every byte value
+_BYTE_BITS = tuple(tuple(bit for bit in range(8) if value >> bit & 1) for value in range(256))
+
+# A container: sorted array('H') of low bits, or an int bitmap of the chunk
+Container = Union[array, int]
+
+# int.bit_count needs Python 3.10; older interpreters count the digits of bin()
+if hasattr(int, "bit_count"):
+    bit_count = int.bit_count
+else:
+    def bit_count(bits: int) -> int:
+        """Number of set bits of a non-negative int"""
+        return bin(bits).count("1")
+
+def bit_positions(bits: int) -> List[int]:
+    """Positions of the set bits of a non-negative int, ascending"""
+    data = bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+    # Skip runs of zero bytes in C; sparse bitmaps are mostly zeros
+    return [offset * 8 + bit
+            for offset in (match.start() for match in _NONZERO_BYTE.finditer(data))
+            for bit in _BYTE_BITS[data[offset]]]
+
+def _to_bitmap(values: array) -> int:
+    buffer = bytearray(_BITMAP_BYTES)
+    for value in values:
+        buffer[value >> 3] |= 1 << (value & 7)
+    return int.from_bytes(buffer, "little")
+
+def _normalize(bits: int) -> Optional[Container]:
+    """Smallest container for a chunk bitmap (None if empty)"""
+    if not bits:
+        return None
+    if bit_count(bits) <= ARRAY_LIMIT:
+        return array("H", bit_positions(bits))
+    return bits
+
+def _from_set(values: set) -> Optional[Container]:
+    if not values:
+        return None
+    ordered = array("H", sorted(values))
+    return ordered if len(ordered) <= ARRAY_LIMIT else _to_bitmap(ordered)
+
+def _select(values: array, bits: int, keep: bool) -> Optional[Container]:
+    """Array entries whose bit is set (keep=True) or clear (keep=False) in a chunk bitmap"""
+    data = bits.to_bytes(_BITMAP_BYTES, "little")
+    selected = array("H", [value for value in values if (data[value >> 3] >> (value & 7) & 1) == keep])
+    return selected or None
+
+def _and(a: Container, b: Container) -> Optional[Container]:
+    if isinstance(a, int):
+        return _normalize(a & b) if isinstance(b, int) else _select(b, a, True)
+    if isinstance(b, int):
+        return _select(a, b, True)
+    return _from_set(set(a).intersection(b))
+
+def _or(a: Container, b: Container) -> Container:
+    if isinstance(a, int):
+        return a | (b if isinstance(b, int) else _to_bitmap(b))
+    if isinstance(b, int):
+        return b | _to_bitmap(a)
+    return _from_set(set(a).union(b))
+
+def _andnot(a: Container, b: Container) -> Optional[Container]:
+    if isinstance(a, int):
+        return _normalize(a & ~(b if isinstance(b, int) else _to_bitmap(b)))
+    if isinstance(b, int):
+        return _select(a, b, False)
+    return _from_set(set(a).difference(b))
+
+def _count(container: Container) -> int:
+    return bit_count(container) if isinstance(container, int) else len(container)
+
+class RoaringBitmap:
+    """Immutable compressed set of non-negative ids"""
+
+    __slots__ = ("_chunks",)
+
+    def __init__(self, chunks: Optional[dict] = None):
+        # chunk key (id >> 16) -> container, keys ascending
+        self._chunks = chunks or {}
+
+    @classmethod
+    def from_ids(cls, ids: Iterable[int]) -> "RoaringBitmap":
+        """Bitmap of some ids, in any order, repeats allowed"""
+        grouped = {}
+        for value in ids:
+            grouped.setdefault(value >> CHUNK_BITS, set()).add(value & (CHUNK_SIZE - 1))
+        return cls({key: _from_set(grouped[key]) for key in sorted(grouped)})
+
+    @classmethod
+    def from_range(cls, stop: int) -> "RoaringBitmap":
+        """Bitmap of ids 0 .. stop - 1"""
+        chunks = {}
+        for key in range((stop + CHUNK_SIZE - 1) >> CHUNK_BITS):
+            size = min(CHUNK_SIZE, stop - (key << CHUNK_BITS))
+            chunks[key] = array("H", range(size)) if size <= ARRAY_LIMIT else (1 << size) - 1
+        return cls(chunks)
+
+    @classmethod
+    def from_int(cls, bits: int) -> "RoaringBitmap":
+        """Bitmap of the set bits of an int, e.g. a SolvedIndex bitmap"""
+        data = bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+        chunks = {}
+        for key, start in enumerate(range(0, len(data), _BITMAP_BYTES)):
+            container = _normalize(int.from_bytes(data[start:start + _BITMAP_BYTES], "little"))
+            if container is not None:
+                chunks[key] = container
+        return cls(chunks)
+
+    def to_int(self) -> int:
+        """The set as an int bitmap"""
+        buffer = bytearray((max(self._chunks) + 1) * _BITMAP_BYTES if self._chunks else 0)
+        for key, container in self._chunks.items():
+            bits = container if isinstance(container, int) else _to_bitmap(container)
+            buffer[key * _BITMAP_BYTES:(key + 1) * _BITMAP_BYTES] = bits.to_bytes(_BITMAP_BYTES, "little")
+        return int.from_bytes(buffer, "little")
+
+    def __and__(self, other: "RoaringBitmap") -> "RoaringBitmap":
+        small, large = (self._chunks, other._chunks) if len(self._chunks) <= len(other._chunks) else (other._chunks, self._chunks)
+        chunks = {}
+        for key, container in small.items():
+            if key in large:
+                result = _and(container, large[key])
+                if result is not None:
+                    chunks[key] = result
+        return RoaringBitmap(chunks)
+
+    def __or__(self, other: "RoaringBitmap") -> "RoaringBitmap":
+        chunks = dict(self._chunks)
+        for key, container in other._chunks.items():
+            chunks[key] = _or(chunks[key], container) if key in chunks else container
+        return RoaringBitmap(dict(sorted(chunks.items())))
+
+    def __sub__(self, other: "RoaringBitmap") -> "RoaringBitmap":
+        chunks = {}
+        for key, container in self._chunks.items():
+            if key in other._chunks:
+                container = _andnot(container, other._chunks[key])
+                if container is None:
+                    continue
+            chunks[key] = container
+        return RoaringBitmap(chunks)
+
+    def __len__(self) -> int:
+        return sum(_count(container) for container in self._chunks.values())
+
+    def __bool__(self) -> bool:
+        return bool(self._chunks)
+
+    def __iter__(self) -> Iterator[int]:
+        for key, container in self._chunks.items():
+            base = key << CHUNK_BITS
+            values = bit_positions(container) if isinstance(container, int) else container
+            for value in values:
+                yield base + value
+
+    def __contains__(self, value: int) -> bool:
+        container = self._chunks.get(value >> CHUNK_BITS)
+        if container is None:
+            return False
+        low = value & (CHUNK_SIZE - 1)
+        if isinstance(container, int):
+            return bool(container >> low & 1)
+        position = bisect_left(container, low)
+        return position < len(container) and container[position] == low
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, RoaringBitmap):
+            return NotImplemented
+        # Containers are always the smaller kind for their size, so equal sets have equal containers
+        return self._chunks == other._chunks
+
+    def __repr__(self):
+        return f"RoaringBitmap({len(self)} ids in {len(self._chunks)} chunks)"
+
+    def first(self, n: int) -> List[int]:
+        """Smallest n ids"""
+        result = []
+        for value in self:
+            if len(result) == n:
+                break
+            result.append(value)
+        return result
+
+    def nbytes(self) -> int:
+        """Bytes of container payload (two per array entry, 8 KB per bitmap chunk)"""
+        return sum(_BITMAP_BYTES if isinstance(c, int) else 2 * len(c) for c in self._chunks.values())
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialized form: chunk count, then per chunk its key, kind and size,
+        then the payload (array entries little-endian, or the 8 KB bitmap)
+        """
+        out = bytearray(struct.pack("<I", len(self._chunks)))
+        for key, container in self._chunks.items():
+            if isinstance(container, int):
+                out += struct.pack("<IBI", key, 1, _BITMAP_BYTES)
+                out += container.to_bytes(_BITMAP_BYTES, "little")
+            else:
+                if sys.byteorder != "little":
+                    container = array("H", container)
+                    container.byteswap()
+                out += struct.pack("<IBI", key, 0, len(container))
+                out += container.tobytes()
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "RoaringBitmap":
+        """Bitmap from to_bytes"""
+        (count,) = struct.unpack_from("<I", data)
+        offset = 4
+        chunks = {}
+        for _ in range(count):
+            key, kind, size = struct.unpack_from("<IBI", data, offset)
+            offset += struct.calcsize("<IBI")
+            if kind == 1:
+                chunks[key] = int.from_bytes(data[offset:offset + size], "little")
+                offset += size
+            else:
+                values = array("H")
+                values.frombytes(data[offset:offset + 2 * size])
+                if sys.byteorder != "little":
+                    values.byteswap()
+                chunks[key] = values
+                offset += 2 * size
+        return cls(chunks)
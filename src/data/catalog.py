@@ -0,0 +1,325 @@
+"""
+Compiled Problem Catalog
+Immutable, flat problem records compiled once from the nested
+``PROBLEMS_DATA`` layout
+
+Records are stored in one tuple ordered by topic (in catalog order) and
+then by difficulty level, so every (topic, level) pair and every topic as
+a whole occupies one contiguous range. Queries return precomputed
+read-only views over those ranges: nothing is copied or allocated per call.
+
+The same problem is often listed under several topics or levels. Each
+record carries a canonical id derived from its normalized link (and a
+dense ``problem_id`` number for that id), and the catalog keeps a reverse
+index from every problem to all of its listings. The practice platform a
+link points to is classified once, when the record is built. Counts and views can be
+asked for in dedup mode, where each problem counts once per range at its
+first listing; those are precomputed as well.
+
+A problem may also carry a numeric difficulty ``rating`` (ratings.py
+indexes them for range queries) and technique ``tags`` beyond its topic
+(tags.py indexes them for boolean queries).
+"""
+
+import zlib
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, overload
+
+LEVELS = ("beginner", "intermediate", "advanced")
+FIELDS = ("title", "description", "link", "topic", "level", "index", "canonical_id", "problem_id", "platform",
+          "rating", "tags")
+
+# Fields a record may lack; they read as missing when None, like keys absent from a problem dictionary
+OPTIONAL_FIELDS = ("link", "rating", "tags")
+
+# Path prefixes that identify a problem; anything after them (/description/, /solutions/) is a sub-page
+PROBLEM_PATHS = {"leetcode.com": 2, "hackerrank.com": 2}
+
+# Practice sites by host, including their subdomains
+PLATFORMS = {
+    "leetcode.com": "LeetCode",
+    "geeksforgeeks.org": "GeeksforGeeks",
+    "hackerrank.com": "HackerRank",
+    "codeforces.com": "Codeforces",
+    "codechef.com": "CodeChef",
+    "interviewbit.com": "InterviewBit",
+    "takeuforward.org": "takeUforward",
+}
+
+def canonical_link(link: str) -> str:
+    """
+    Normalize a problem link so that every way of writing it compares equal
+
+    The scheme, "www.", query string, fragment, letter case of the host and
+    trailing slashes are dropped, and known sites' problem sub-pages are
+    cut back to the problem itself.
+
+    Args:
+        link: Problem URL
+
+    Returns:
+        Canonical form, e.g. "leetcode.com/problems/two-sum"
+    """
+    # Plain string operations; this runs for every record at load time
+    rest = link.strip()
+    scheme_end = rest.find("//")
+    if scheme_end >= 0:
+        rest = rest[scheme_end + 2:]
+    rest = rest.split("#", 1)[0].split("?", 1)[0]
+    host, _, path = rest.partition("/")
+    host = host.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    if host.endswith(":80") or host.endswith(":443"):
+        host = host.rsplit(":", 1)[0]
+    segments = [segment for segment in path.split("/") if segment]
+    if host in PROBLEM_PATHS:
+        segments = segments[:PROBLEM_PATHS[host]]
+    return "/".join([host, *segments])
+
+def canonical_problem_id(title: str, link: Optional[str]) -> str:
+    """Canonical id of a problem: its canonical link, or its normalized title when it has no link"""
+    if link:
+        return canonical_link(link)
+    return "title:" + " ".join(title.lower().split())
+
+def classify_platform(canonical_id: str) -> str:
+    """Practice site a canonical id belongs to, e.g. "LeetCode" ("" for other sites and links)"""
+    host = canonical_id.split("/", 1)[0]
+    while host:
+        platform = PLATFORMS.get(host)
+        if platform is not None:
+            return platform
+        host = host.partition(".")[2]
+    return ""
+
+class Problem:
+    """
+    One problem record
+
+    Behaves like the read-only problem dictionaries it replaces
+    (``problem['title']``, ``problem.get('level')``, ``'link' in problem``)
+    so existing display code keeps working.
+    """
+
+    __slots__ = FIELDS
+
+    def __init__(self, title: str, description: str, link: Optional[str], topic: str, level: str, index: int,
+                 canonical_id: str, problem_id: int, platform: str = "", rating: Optional[float] = None,
+                 tags: Optional[Tuple[str, ...]] = None):
+        object.__setattr__(self, "title", title)
+        object.__setattr__(self, "description", description)
+        object.__setattr__(self, "link", link)
+        object.__setattr__(self, "topic", topic)
+        object.__setattr__(self, "level", level)
+        object.__setattr__(self, "index", index)
+        object.__setattr__(self, "canonical_id", canonical_id)
+        object.__setattr__(self, "problem_id", problem_id)
+        object.__setattr__(self, "platform", platform)
+        object.__setattr__(self, "rating", rating)
+        object.__setattr__(self, "tags", tags)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Problem records are immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Problem records are immutable")
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in FIELDS or (key in OPTIONAL_FIELDS and getattr(self, key) is None):
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key: str) -> bool:
+        return key in FIELDS and (key not in OPTIONAL_FIELDS or getattr(self, key) is not None)
+
+    def keys(self) -> List[str]:
+        return [key for key in FIELDS if key in self]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dictionary copy, e.g. for JSON export"""
+        return {key: getattr(self, key) for key in self.keys()}
+
+    def __repr__(self):
+        return f"Problem({self.title!r}, topic={self.topic!r}, level={self.level!r})"
+
+class ProblemView(Sequence):
+    """Read-only window over a contiguous range of catalog records"""
+
+    __slots__ = ("_records", "_start", "_stop")
+
+    def __init__(self, records: Tuple[Problem, ...], start: int, stop: int):
+        self._records = records
+        self._start = start
+        self._stop = stop
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    @overload
+    def __getitem__(self, i: int) -> Problem: ...
+
+    @overload
+    def __getitem__(self, i: slice) -> "ProblemView": ...
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            start, stop, step = i.indices(len(self))
+            if step != 1:
+                return [self[j] for j in range(start, stop, step)]
+            return ProblemView(self._records, self._start + start, self._start + max(start, stop))
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("problem view index out of range")
+        return self._records[self._start + i]
+
+    def __iter__(self) -> Iterator[Problem]:
+        records = self._records
+        for i in range(self._start, self._stop):
+            yield records[i]
+
+    def __repr__(self):
+        return f"ProblemView({len(self)} problems)"
+
+class ProblemCatalog:
+    """All problems as immutable records with per-(topic, level) index ranges"""
+
+    def __init__(self, problems_data: Dict[str, Dict[str, List[Dict[str, str]]]]):
+        """
+        Compile the nested problem data
+
+        Args:
+            problems_data: Dictionary mapping topic -> level -> list of problem dictionaries
+        """
+        records = []
+        ranges: Dict[Tuple[str, str], Tuple[int, int]] = {}
+        problem_ids: Dict[str, int] = {}
+        listings: List[List[int]] = []
+        for topic, levels in problems_data.items():
+            topic_start = len(records)
+            # Known levels first in difficulty order, then any others in data order
+            ordered = [level for level in LEVELS if level in levels]
+            ordered += [level for level in levels if level not in LEVELS]
+            for level in ordered:
+                start = len(records)
+                for problem in levels[level]:
+                    link = problem.get("link")
+                    canonical_id = canonical_problem_id(problem["title"], link)
+                    problem_id = problem_ids.setdefault(canonical_id, len(problem_ids))
+                    if problem_id == len(listings):
+                        listings.append([])
+                    listings[problem_id].append(len(records))
+                    records.append(Problem(problem["title"], problem.get("description", ""), link,
+                                           topic, level, len(records), canonical_id, problem_id,
+                                           classify_platform(canonical_id), problem.get("rating"),
+                                           tuple(problem["tags"]) if problem.get("tags") else None))
+                ranges[(topic, level)] = (start, len(records))
+            ranges[(topic, "all")] = (topic_start, len(records))
+
+        self._records = tuple(records)
+        self._topics = list(problems_data)
+        self._views = {key: ProblemView(self._records, start, stop) for key, (start, stop) in ranges.items()}
+        self._empty = ProblemView(self._records, 0, 0)
+
+        # Reverse index: problem id -> record indexes of all its listings, and canonical id -> problem id
+        self._problem_ids = problem_ids
+        self._listings = tuple(tuple(indexes) for indexes in listings)
+        # Dedup mode: first listing of each problem within every range
+        self._unique_views = {key: self._first_listings(view) for key, view in self._views.items()}
+        self._unique_records = tuple(self._records[indexes[0]] for indexes in self._listings)
+        self._revisions: Dict[str, int] = {}
+
+    @staticmethod
+    def _first_listings(view: ProblemView) -> Tuple[Problem, ...]:
+        seen = set()
+        unique = []
+        for problem in view:
+            if problem.problem_id not in seen:
+                seen.add(problem.problem_id)
+                unique.append(problem)
+        # Share the view's records when nothing repeats
+        return view if len(unique) == len(view) else tuple(unique)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __iter__(self) -> Iterator[Problem]:
+        return iter(self._records)
+
+    def __getitem__(self, index: int) -> Problem:
+        return self._records[index]
+
+    def topics(self) -> List[str]:
+        """Topics that have problems, in catalog order"""
+        return list(self._topics)
+
+    def problems(self, topic: str, level: str = "all", dedup: bool = False) -> Sequence[Problem]:
+        """
+        Problems of a topic at one level, or all levels
+
+        Args:
+            topic: DSA topic name
+            level: Difficulty level (beginner, intermediate, advanced, all)
+            dedup: List each problem once, at its first listing in the range
+
+        Returns:
+            Precomputed read-only sequence (empty if there is no such topic or level)
+        """
+        if dedup:
+            return self._unique_views.get((topic, level), self._empty)
+        return self._views.get((topic, level), self._empty)
+
+    def revision(self, topic: str) -> int:
+        """
+        Checksum of a topic's records and their positions, computed on first use
+
+        Record indexes shift when problems are added or removed before them, so
+        anything keyed on them (page cursors) is only valid for the same revision.
+        """
+        revision = self._revisions.get(topic)
+        if revision is None:
+            view = self._views.get((topic, "all"), self._empty)
+            start = view[0].index if len(view) else -1
+            revision = zlib.crc32("\x1e".join(f"{problem.level}\x1f{problem.canonical_id}" for problem in view)
+                                  .encode("utf-8"), start & 0xFFFFFFFF)
+            self._revisions[topic] = revision
+        return revision
+
+    def count(self, topic: str, level: str = "all", dedup: bool = False) -> int:
+        """Number of problems of a topic at one level, or all levels"""
+        return len(self.problems(topic, level, dedup))
+
+    def counts_by_topic(self, dedup: bool = False) -> Dict[str, int]:
+        """Number of problems per topic"""
+        views = self._unique_views if dedup else self._views
+        return {topic: len(views[(topic, "all")]) for topic in self._topics}
+
+    def unique_count(self) -> int:
+        """Number of distinct problems across all topics"""
+        return len(self._listings)
+
+    def unique_problems(self) -> Tuple[Problem, ...]:
+        """First listing of every distinct problem, in problem id order"""
+        return self._unique_records
+
+    def problem_id(self, canonical_id: str) -> int:
+        """Dense number of a canonical id (-1 if unknown)"""
+        return self._problem_ids.get(canonical_id, -1)
+
+    def problem_id_for_link(self, link: str) -> int:
+        """Dense number of the problem a link points to (-1 if unknown)"""
+        return self._problem_ids.get(canonical_link(link), -1)
+
+    def listings(self, problem_id: int) -> Tuple[Problem, ...]:
+        """Every record of a problem, in catalog order"""
+        return tuple(self._records[i] for i in self._listings[problem_id])
+
+    def placements(self, problem_id: int) -> List[Tuple[str, str]]:
+        """(topic, level) pairs a problem is listed under"""
+        return [(self._records[i].topic, self._records[i].level) for i in self._listings[problem_id]]
@@ -0,0 +1,203 @@
+"""
+Daily Mix
+A randomized daily problem mix per learner, weighted by topic importance
+and level
+
+Every (topic, level) cell of the catalog's dedup views is weighted by
+topic weight x level weight x its problem count, and a Walker/Vose alias
+table over the cells is built once per catalog. A draw picks a cell in
+O(1) from the table and a problem uniformly within the cell, so each
+problem is drawn with probability proportional to its topic and level
+weights, and the cost of a mix depends on its size, not on the catalog.
+
+Solved problems and problems already in the mix are rejected and drawn
+again, which keeps the same proportions over the remaining problems
+(successive sampling without replacement). A learner who has solved most
+of the catalog would make rejection slow, so after a bounded number of
+rejections the mix falls back to weighting cells by their remaining
+problems, listing a cell only when it is drawn.
+
+The random generator is seeded from the learner id and the date, so a
+learner gets the same mix all day and a new one tomorrow.
+"""
+
+import datetime
+import hashlib
+import random
+from typing import Collection, Dict, List, Mapping, Optional, Sequence, Set
+
+from .catalog import LEVELS, Problem, ProblemCatalog
+
+# Intermediate problems show up a little more often than the easiest and hardest ones
+DEFAULT_LEVEL_WEIGHTS = {"beginner": 1.0, "intermediate": 1.5, "advanced": 1.0}
+
+# Rejected draws allowed per requested problem before falling back to exact cell weights
+REJECTIONS_PER_PROBLEM = 32
+
+def topic_importance(topic_dependencies: Mapping[str, Sequence[str]]) -> Dict[str, float]:
+    """Topic weight 1 + the number of topics that list it as a prerequisite"""
+    weights = {topic: 1.0 for topic in topic_dependencies}
+    for prerequisites in topic_dependencies.values():
+        for prerequisite in prerequisites:
+            weights[prerequisite] = weights.get(prerequisite, 1.0) + 1.0
+    return weights
+
+def daily_seed(user: str, day: datetime.date) -> int:
+    """Stable 64-bit seed of a learner and a date, the same in every process"""
+    digest = hashlib.blake2b(f"{user}|{day.isoformat()}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+class AliasTable:
+    """Walker/Vose alias table: O(n) build, O(1) weighted draws"""
+
+    __slots__ = ("probability", "alias")
+
+    def __init__(self, weights: Sequence[float]):
+        """
+        Args:
+            weights: Non-negative weights, at least one positive
+        """
+        count = len(weights)
+        total = float(sum(weights))
+        if count == 0 or total <= 0:
+            raise ValueError("Alias table needs a positive weight")
+        scaled = [weight * count / total for weight in weights]
+        self.probability = [1.0] * count
+        self.alias = list(range(count))
+        small = [i for i, weight in enumerate(scaled) if weight < 1.0]
+        large = [i for i, weight in enumerate(scaled) if weight >= 1.0]
+        while small and large:
+            low, high = small.pop(), large.pop()
+            self.probability[low] = scaled[low]
+            self.alias[low] = high
+            scaled[high] -= 1.0 - scaled[low]
+            (small if scaled[high] < 1.0 else large).append(high)
+        # Whatever is left is 1 up to rounding
+
+    def __len__(self) -> int:
+        return len(self.probability)
+
+    def sample(self, rng: random.Random) -> int:
+        """Index drawn with probability proportional to its weight"""
+        i = int(rng.random() * len(self.probability))
+        return i if rng.random() < self.probability[i] else self.alias[i]
+
+class DailyMixSampler:
+    """Weighted random problem mixes over a catalog's (topic, level) cells"""
+
+    def __init__(self, catalog: ProblemCatalog, topic_weights: Optional[Mapping[str, float]] = None,
+                 level_weights: Optional[Mapping[str, float]] = None):
+        """
+        Args:
+            catalog: Compiled problem catalog
+            topic_weights: Weight per topic (default 1); topics with weight 0 are left out
+            level_weights: Weight per level (default DEFAULT_LEVEL_WEIGHTS)
+        """
+        self.catalog = catalog
+        topic_weights = topic_weights or {}
+        level_weights = DEFAULT_LEVEL_WEIGHTS if level_weights is None else level_weights
+        self._cells: List[Sequence[Problem]] = []
+        self._weights: List[float] = []
+        for topic in catalog.topics():
+            for level in LEVELS:
+                problems = catalog.problems(topic, level, dedup=True)
+                # Weight per problem of the cell
+                weight = topic_weights.get(topic, 1.0) * level_weights.get(level, 0.0)
+                if problems and weight > 0:
+                    self._cells.append(problems)
+                    self._weights.append(weight)
+        self._table = AliasTable([w * len(c) for w, c in zip(self._weights, self._cells)]) if self._cells else None
+
+    def sample(self, k: int, rng: random.Random, exclude: Collection[int] = ()) -> List[Problem]:
+        """
+        Draw k distinct problems
+
+        Args:
+            k: Number of problems
+            rng: Random generator
+            exclude: Problem ids to leave out, e.g. solved problems
+
+        Returns:
+            Up to k problems in draw order (fewer if not enough problems remain)
+        """
+        picked: List[Problem] = []
+        if self._table is None or k <= 0:
+            return picked
+        taken: Set[int] = set()
+        rejections = 0
+        while len(picked) < k and rejections < REJECTIONS_PER_PROBLEM * k:
+            cell = self._cells[self._table.sample(rng)]
+            problem = cell[int(rng.random() * len(cell))]
+            if problem.problem_id in exclude or problem.problem_id in taken:
+                rejections += 1
+                continue
+            taken.add(problem.problem_id)
+            picked.append(problem)
+        if len(picked) < k:
+            picked.extend(self._sample_remaining(k - len(picked), rng, exclude, taken))
+        return picked
+
+    def _sample_remaining(self, k: int, rng: random.Random, exclude: Collection[int],
+                          taken: Set[int]) -> List[Problem]:
+        """
+        Exact fallback for learners who solved much of the catalog
+
+        A cell that has rejected a draw is listed once and weighted by its
+        remaining problems; other cells still propose from their full list.
+        Every round thus proposes each remaining problem with probability
+        proportional to its weight.
+        """
+        remaining: Dict[int, List[Problem]] = {}
+        weights = [weight * len(cell) for weight, cell in zip(self._weights, self._cells)]
+        picked = []
+        while len(picked) < k:
+            total = sum(weights)
+            if total <= 0:
+                break
+            index = _choose(weights, total, rng)
+            problems = remaining.get(index)
+            if problems is None:
+                cell = self._cells[index]
+                problem = cell[int(rng.random() * len(cell))]
+                if problem.problem_id in exclude or problem.problem_id in taken:
+                    problems = remaining[index] = [p for p in cell
+                                                   if p.problem_id not in exclude and p.problem_id not in taken]
+                    weights[index] = self._weights[index] * len(problems)
+                    continue
+            else:
+                if not problems:
+                    continue
+                # Swap-remove a random remaining problem
+                position = int(rng.random() * len(problems))
+                problem = problems[position]
+                problems[position] = problems[-1]
+                problems.pop()
+                weights[index] = self._weights[index] * len(problems)
+                if problem.problem_id in taken:
+                    # Listed under another topic as well and drawn there after this cell was listed
+                    continue
+            taken.add(problem.problem_id)
+            picked.append(problem)
+        return picked
+
+    def daily_mix(self, user: str, k: int = 5, exclude: Collection[int] = (),
+                  day: Optional[datetime.date] = None) -> List[Problem]:
+        """
+        A learner's mix for a day, the same for every call with the same arguments
+
+        Args:
+            user: Learner id
+            k: Number of problems
+            exclude: Problem ids to leave out, e.g. solved problems
+            day: Date of the mix (default today)
+        """
+        day = day or datetime.date.today()
+        return self.sample(k, random.Random(daily_seed(user, day)), exclude)
+
+def _choose(weights: List[float], total: float, rng: random.Random) -> int:
+    target = rng.random() * total
+    for index, weight in enumerate(weights):
+        target -= weight
+        if target < 0 and weight > 0:
+            return index
+    return max(i for i, weight in enumerate(weights) if weight > 0)
@@ -0,0 +1,457 @@
+"""
+SQLite Problem Catalog
+Editable on-disk problem catalog on the standard-library ``sqlite3``
+
+Problems are rows of one table whose ids follow catalog order (topic, then
+level, then insertion), so every query returns problems in the same order
+as ProblemCatalog. Two covering indexes answer the common queries without
+touching the table: (topic, level) with every listed column for topic
+pages, and (canonical_id, topic, level) for placements. Counts, plain and
+de-duplicated, live in a small table that triggers keep current, so a
+count is one primary-key lookup. An FTS5 table, also kept in sync by
+triggers, serves text search where SQLite was built with FTS5.
+
+Reads borrow a read-only connection from a small pool and hand it back
+after the query, so connections outlive the threads that used them:
+Streamlit runs every rerun on a new script thread, and a per-thread
+connection would be opened and dropped again on every rerun. The pool is
+last-in first-out, so the busiest connections stay warm. Queries are
+constant SQL strings, so sqlite3's per-connection statement cache
+prepares each one once per pooled connection. Writes go through a single connection behind
+a lock; the database runs in WAL mode so they never block readers.
+
+Build a database from the bundled data with:
+
+    cd src && python -m data.database build ../problems.db
+"""
+
+import os
+import sqlite3
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .catalog import LEVELS, Problem, canonical_problem_id, classify_platform
+from .search import tokenize
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS topics (
+    name TEXT PRIMARY KEY,
+    position INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS canonical_ids (
+    problem_id INTEGER PRIMARY KEY,
+    canonical_id TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS problems (
+    id INTEGER PRIMARY KEY,
+    topic TEXT NOT NULL,
+    level_rank INTEGER NOT NULL,
+    level TEXT NOT NULL,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL,
+    link TEXT,
+    canonical_id TEXT NOT NULL,
+    problem_id INTEGER NOT NULL,
+    platform TEXT NOT NULL,
+    rating REAL,
+    tags TEXT
+);
+-- Listings and distinct problems per (topic, level); level 'all' is the
+-- whole topic and topic '' all topics
+CREATE TABLE IF NOT EXISTS problem_counts (
+    topic TEXT NOT NULL,
+    level TEXT NOT NULL,
+    listings INTEGER NOT NULL,
+    distinct_problems INTEGER NOT NULL,
+    PRIMARY KEY (topic, level)
+) WITHOUT ROWID;
+"""
+
+# Created after the bulk load, which is faster than maintaining them row by row
+INDEXES = """
+CREATE INDEX IF NOT EXISTS problems_topic_level
+    ON problems (topic, level_rank, level, id, title, description, link, canonical_id, problem_id, platform, rating, tags);
+CREATE INDEX IF NOT EXISTS problems_link
+    ON problems (canonical_id, topic, level);
+"""
+
+# Keep problem_counts current; a listing changes a distinct count only if
+# it is the problem's only listing in that scope
+COUNT_TRIGGERS = """
+CREATE TRIGGER IF NOT EXISTS problem_counts_insert AFTER INSERT ON problems BEGIN
+    INSERT INTO problem_counts (topic, level, listings, distinct_problems) VALUES
+        (new.topic, new.level, 1, NOT EXISTS (SELECT 1 FROM problems WHERE canonical_id = new.canonical_id
+            AND topic = new.topic AND level = new.level AND id != new.id)),
+        (new.topic, 'all', 1, NOT EXISTS (SELECT 1 FROM problems WHERE canonical_id = new.canonical_id
+            AND topic = new.topic AND id != new.id)),
+        ('', new.level, 1, NOT EXISTS (SELECT 1 FROM problems WHERE canonical_id = new.canonical_id
+            AND level = new.level AND id != new.id)),
+        ('', 'all', 1, NOT EXISTS (SELECT 1 FROM problems WHERE canonical_id = new.canonical_id AND id != new.id))
+    ON CONFLICT (topic, level) DO UPDATE SET listings = listings + 1,
+        distinct_problems = distinct_problems + excluded.distinct_problems;
+END;
+CREATE TRIGGER IF NOT EXISTS problem_counts_delete AFTER DELETE ON problems BEGIN
+    UPDATE problem_counts SET listings = listings - 1, distinct_problems = distinct_problems -
+        NOT EXISTS (SELECT 1 FROM problems WHERE canonical_id = old.canonical_id AND topic = old.topic AND level = old.level)
+        WHERE topic = old.topic AND level = old.level;
+    UPDATE problem_counts SET listings = listings - 1, distinct_problems = distinct_problems -
+        NOT EXISTS (SELECT 1 FROM problems WHERE canonical_id = old.canonical_id AND topic = old.topic)
+        WHERE topic = old.topic AND level = 'all';
+    UPDATE problem_counts SET listings = listings - 1, distinct_problems = distinct_problems -
+        NOT EXISTS (SELECT 1 FROM problems WHERE canonical_id = old.canonical_id AND level = old.level)
+        WHERE topic = '' AND level = old.level;
+    UPDATE problem_counts SET listings = listings - 1, distinct_problems = distinct_problems -
+        NOT EXISTS (SELECT 1 FROM problems WHERE canonical_id = old.canonical_id)
+        WHERE topic = '' AND level = 'all';
+END;
+"""
+
+_INITIAL_COUNTS = """
+INSERT INTO problem_counts (topic, level, listings, distinct_problems)
+    SELECT topic, level, COUNT(*), COUNT(DISTINCT problem_id) FROM problems GROUP BY topic, level
+    UNION ALL SELECT topic, 'all', COUNT(*), COUNT(DISTINCT problem_id) FROM problems GROUP BY topic
+    UNION ALL SELECT '', level, COUNT(*), COUNT(DISTINCT problem_id) FROM problems GROUP BY level
+    UNION ALL SELECT '', 'all', COUNT(*), COUNT(DISTINCT problem_id) FROM problems
+"""
+
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS problems_fts
+    USING fts5(title, description, content='problems', content_rowid='id');
+"""
+
+FTS_TRIGGERS = """
+CREATE TRIGGER IF NOT EXISTS problems_fts_insert AFTER INSERT ON problems BEGIN
+    INSERT INTO problems_fts (rowid, title, description) VALUES (new.id, new.title, new.description);
+END;
+CREATE TRIGGER IF NOT EXISTS problems_fts_delete AFTER DELETE ON problems BEGIN
+    INSERT INTO problems_fts (problems_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+END;
+"""
+
+_COLUMNS = "id, topic, level, title, description, link, canonical_id, problem_id, platform, rating, tags"
+_INSERT = ("INSERT INTO problems (topic, level_rank, level, title, description, link, canonical_id, problem_id, "
+           "platform, rating, tags) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)")
+
+# Tags are stored as one text column, joined by the ASCII unit separator
+TAG_SEPARATOR = "\x1f"
+
+# Constant query strings, prepared once per connection by the statement cache
+_SELECT_LEVEL = f"""SELECT {_COLUMNS} FROM problems INDEXED BY problems_topic_level
+    WHERE topic = ? AND level_rank = ? AND level = ? ORDER BY level_rank, level, id"""
+_SELECT_TOPIC = f"""SELECT {_COLUMNS} FROM problems INDEXED BY problems_topic_level
+    WHERE topic = ? ORDER BY level_rank, level, id"""
+# Keyset pages, each a seek on problems_topic_level: the rows of one level after an id, the rows of the
+# levels after a rank, and (for levels outside LEVELS, which share a rank) the rows after (level, id);
+# optionally only each problem's first listing in the range
+_PAGE_LEVEL = f"""SELECT {_COLUMNS} FROM problems INDEXED BY problems_topic_level
+    WHERE topic = ? AND level_rank = ? AND level = ? AND id > ? {{}}ORDER BY level_rank, level, id LIMIT ?"""
+_PAGE_LATER_LEVELS = f"""SELECT {_COLUMNS} FROM problems INDEXED BY problems_topic_level
+    WHERE topic = ? AND level_rank > ? {{}}ORDER BY level_rank, level, id LIMIT ?"""
+_PAGE_OTHER_LEVELS = f"""SELECT {_COLUMNS} FROM problems INDEXED BY problems_topic_level
+    WHERE topic = ? AND level_rank = ? AND (level, id) > (?, ?) {{}}ORDER BY level_rank, level, id LIMIT ?"""
+_SELECT_ROW_LEVEL = "SELECT level FROM problems WHERE id = ?"
+_FIRST_LISTING = """AND NOT EXISTS (SELECT 1 FROM problems AS earlier INDEXED BY problems_link
+        WHERE earlier.canonical_id = problems.canonical_id AND earlier.topic = problems.topic {}
+        AND (earlier.level_rank, earlier.level, earlier.id) < (problems.level_rank, problems.level, problems.id)) """
+_IN_TOPIC = _FIRST_LISTING.format("")
+_IN_LEVEL = _FIRST_LISTING.format("AND earlier.level = problems.level")
+# (plain, first listings within the level, first listings within the topic)
+_SELECT_LEVEL_PAGE = tuple(_PAGE_LEVEL.format(clause) for clause in ("", _IN_LEVEL, _IN_TOPIC))
+_SELECT_LATER_LEVELS_PAGE = tuple(_PAGE_LATER_LEVELS.format(clause) for clause in ("", _IN_TOPIC, _IN_TOPIC))
+_SELECT_OTHER_LEVELS_PAGE = tuple(_PAGE_OTHER_LEVELS.format(clause) for clause in ("", _IN_TOPIC, _IN_TOPIC))
+_COUNT = "SELECT listings, distinct_problems FROM problem_counts WHERE topic = ? AND level = ?"
+_COUNTS_BY_TOPIC = """SELECT t.name, COALESCE(c.listings, 0), COALESCE(c.distinct_problems, 0)
+    FROM topics t LEFT JOIN problem_counts c ON c.topic = t.name AND c.level = 'all' ORDER BY t.position"""
+_SELECT_TOPICS = "SELECT name FROM topics ORDER BY position"
+_SELECT_PLACEMENTS = "SELECT topic, level FROM problems INDEXED BY problems_link WHERE canonical_id = ? ORDER BY id"
+_SEARCH = f"""SELECT {", ".join("p." + c for c in _COLUMNS.split(", "))} FROM problems_fts
+    JOIN problems p ON p.id = problems_fts.rowid
+    WHERE problems_fts MATCH ? ORDER BY bm25(problems_fts, ?, 1.0) LIMIT ?"""
+
+def _level_rank(level: str) -> int:
+    """Sort position of a level: known levels in difficulty order, any others after them"""
+    return LEVELS.index(level) if level in LEVELS else len(LEVELS)
+
+def _problem(row) -> Problem:
+    problem_row_id, topic, level, title, description, link, canonical_id, problem_id, platform, rating, tags = row
+    return Problem(title, description, link, topic, level, problem_row_id - 1, canonical_id, problem_id, platform,
+                   rating, tuple(tags.split(TAG_SEPARATOR)) if tags else None)
+
+def _row_values(topic: str, level: str, problem: Dict[str, str], canonical_id: str, problem_id: int):
+    return (topic, _level_rank(level), level, problem["title"], problem.get("description", ""),
+            problem.get("link"), canonical_id, problem_id, classify_platform(canonical_id), problem.get("rating"),
+            TAG_SEPARATOR.join(problem["tags"]) if problem.get("tags") else None)
+
+class SQLiteProblemStore:
+    """Problem catalog stored in a SQLite database"""
+
+    def __init__(self, path: str, cached_statements: int = 64, pool_size: int = 8):
+        """
+        Open an existing database; read connections are opened lazily and pooled
+
+        Args:
+            path: Database file written by write_database
+            cached_statements: Prepared statements kept per connection
+            pool_size: Most idle read connections kept open
+        """
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"No problem database at '{path}'")
+        if pool_size < 1:
+            raise ValueError("Connection pool size must be at least 1")
+        self.path = path
+        self.cached_statements = cached_statements
+        self.pool_size = pool_size
+        # Idle read connections, most recently returned last
+        self._readers: List[sqlite3.Connection] = []
+        self._pool_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._writer: Optional[sqlite3.Connection] = None
+        self.has_fts = bool(self._query("SELECT 1 FROM sqlite_master WHERE name = 'problems_fts'"))
+
+    def _query(self, sql: str, parameters: tuple = ()) -> List[tuple]:
+        """Rows of one read query, on a pooled read-only connection"""
+        with self._pool_lock:
+            connection = self._readers.pop() if self._readers else None
+        if connection is None:
+            uri = "file:" + os.path.abspath(self.path) + "?mode=ro"
+            # Pooled connections move between threads, but only one thread uses a connection at a time
+            connection = sqlite3.connect(uri, uri=True, cached_statements=self.cached_statements,
+                                         check_same_thread=False)
+        try:
+            return connection.execute(sql, parameters).fetchall()
+        finally:
+            with self._pool_lock:
+                keep = len(self._readers) < self.pool_size
+                if keep:
+                    self._readers.append(connection)
+            if not keep:
+                connection.close()
+
+    def topics(self) -> List[str]:
+        """Topics in catalog order"""
+        return [name for (name,) in self._query(_SELECT_TOPICS)]
+
+    def problems(self, topic: str, level: str = "all", dedup: bool = False) -> Sequence[Problem]:
+        """
+        Problems of a topic at one level, or all levels
+
+        Args:
+            topic: DSA topic name
+            level: Difficulty level (beginner, intermediate, advanced, all)
+            dedup: List each problem once, at its first listing in the range
+
+        Returns:
+            Tuple of problem records in catalog order (empty if there is no such topic or level)
+        """
+        if level == "all":
+            rows = self._query(_SELECT_TOPIC, (topic,))
+        else:
+            rows = self._query(_SELECT_LEVEL, (topic, _level_rank(level), level))
+        problems = tuple(_problem(row) for row in rows)
+        if dedup:
+            # Rows come in catalog order, so the first row of each problem is its first listing
+            seen = set()
+            problems = tuple(p for p in problems if p.problem_id not in seen and not seen.add(p.problem_id))
+        return problems
+
+    def problems_after(self, topic: str, level: str = "all", after: Tuple[int, int] = (-1, -1), limit: int = 20,
+                       dedup: bool = False) -> Tuple[Problem, ...]:
+        """
+        Keyset page: the problems of a topic that follow a position, without reading the ones before it
+
+        Args:
+            topic: DSA topic name
+            level: Difficulty level (beginner, intermediate, advanced, all)
+            after: (level rank, record index) of the last problem already shown
+            limit: Most problems to return
+            dedup: List each problem once, at its first listing in the range
+
+        Returns:
+            Tuple of problem records in catalog order
+
+        Raises:
+            ValueError: If after is a problem of a level outside LEVELS that was removed since
+        """
+        # Record indexes are row ids - 1
+        rank, after_id = after[0], after[1] + 1
+        if level != "all":
+            variant = 1 if dedup else 0
+            if (rank, after_id) < (_level_rank(level), 0):
+                after_id = 0
+            elif rank > _level_rank(level):
+                return ()
+            rows = self._query(_SELECT_LEVEL_PAGE[variant], (topic, _level_rank(level), level, after_id, limit))
+            return tuple(_problem(row) for row in rows)
+
+        variant = 2 if dedup else 0
+        rows = []
+        if rank >= len(LEVELS):
+            # Levels outside LEVELS are ordered by name, and the cursor only has the row: look up its level
+            level_rows = self._query(_SELECT_ROW_LEVEL, (after_id,))
+            if not level_rows:
+                raise ValueError("Page cursor points at a problem that was removed")
+            rows = self._query(_SELECT_OTHER_LEVELS_PAGE[variant], (topic, rank, level_rows[0][0], after_id, limit))
+        else:
+            if rank >= 0:
+                rows = self._query(_SELECT_LEVEL_PAGE[variant], (topic, rank, LEVELS[rank], after_id, limit))
+            if len(rows) < limit:
+                rows += self._query(_SELECT_LATER_LEVELS_PAGE[variant], (topic, rank, limit - len(rows)))
+        return tuple(_problem(row) for row in rows)
+
+    def count(self, topic: Optional[str] = None, level: str = "all", dedup: bool = False) -> int:
+        """Number of problems of a topic and/or level, or overall, from the maintained counts"""
+        rows = self._query(_COUNT, (topic or "", level or "all"))
+        if not rows:
+            return 0
+        return rows[0][1] if dedup else rows[0][0]
+
+    def counts_by_topic(self, dedup: bool = False) -> Dict[str, int]:
+        """Number of problems per topic, in catalog order"""
+        return {topic: unique if dedup else listings
+                for topic, listings, unique in self._query(_COUNTS_BY_TOPIC)}
+
+    def unique_count(self) -> int:
+        """Number of distinct problems across all topics"""
+        return self.count(dedup=True)
+
+    def placements(self, link: str) -> List[Tuple[str, str]]:
+        """(topic, level) pairs the problem behind a link is listed under"""
+        canonical_id = canonical_problem_id("", link)
+        return [tuple(row) for row in self._query(_SELECT_PLACEMENTS, (canonical_id,))]
+
+    def search(self, query: str, limit: int = 10, title_weight: float = 2.0) -> List[Problem]:
+        """
+        Full-text search over titles and descriptions, best BM25 match first
+
+        Every word must match; the last one also matches as a prefix.
+
+        Raises:
+            RuntimeError: If the database has no FTS5 table
+        """
+        if not self.has_fts:
+            raise RuntimeError("This problem database was built without FTS5")
+        terms = tokenize(query)
+        if not terms:
+            return []
+        match = " ".join(f'"{term}"' for term in terms) + "*"
+        rows = self._query(_SEARCH, (match, title_weight, limit))
+        return [_problem(row) for row in rows]
+
+    def load_all(self) -> Dict[str, Dict[str, List[Dict[str, str]]]]:
+        """Read every problem back into the nested PROBLEMS_DATA layout"""
+        problems_data: Dict[str, Dict[str, List[Dict[str, str]]]] = {topic: {} for topic in self.topics()}
+        for topic in problems_data:
+            for problem in self.problems(topic):
+                record = {"title": problem.title, "description": problem.description}
+                if problem.link is not None:
+                    record["link"] = problem.link
+                if problem.rating is not None:
+                    record["rating"] = problem.rating
+                if problem.tags:
+                    record["tags"] = list(problem.tags)
+                problems_data[topic].setdefault(problem.level, []).append(record)
+        return problems_data
+
+    def _write(self) -> sqlite3.Connection:
+        if self._writer is None:
+            self._writer = sqlite3.connect(self.path, check_same_thread=False)
+        return self._writer
+
+    def add_problem(self, topic: str, level: str, problem: Dict[str, str]):
+        """Append a problem to a topic and level"""
+        canonical_id = canonical_problem_id(problem["title"], problem.get("link"))
+        with self._write_lock:
+            connection = self._write()
+            with connection:
+                connection.execute("INSERT OR IGNORE INTO topics (name, position) "
+                                   "VALUES (?, (SELECT COUNT(*) FROM topics))", (topic,))
+                connection.execute("INSERT OR IGNORE INTO canonical_ids (problem_id, canonical_id) "
+                                   "VALUES ((SELECT COUNT(*) FROM canonical_ids), ?)", (canonical_id,))
+                (problem_id,) = connection.execute("SELECT problem_id FROM canonical_ids WHERE canonical_id = ?",
+                                                   (canonical_id,)).fetchone()
+                connection.execute(_INSERT, _row_values(topic, level, problem, canonical_id, problem_id))
+
+    def remove_problem(self, topic: str, level: str, title: str) -> bool:
+        """Remove the first problem with a title from a topic and level; True if one was removed"""
+        with self._write_lock:
+            connection = self._write()
+            with connection:
+                cursor = connection.execute(
+                    "DELETE FROM problems WHERE id = (SELECT MIN(id) FROM problems "
+                    "WHERE topic = ? AND level_rank = ? AND level = ? AND title = ?)",
+                    (topic, _level_rank(level), level, title))
+        return cursor.rowcount > 0
+
+    def close(self):
+        """Close the writer and the idle pooled readers"""
+        with self._pool_lock:
+            readers, self._readers = self._readers, []
+        for connection in readers:
+            connection.close()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+def write_database(problems_data: Dict[str, Dict[str, List[Dict[str, str]]]], path: str,
+                   fts: bool = True) -> SQLiteProblemStore:
+    """
+    Create a problem database from nested problem data, replacing any existing file
+
+    Args:
+        problems_data: Dictionary mapping topic -> level -> list of problem dictionaries
+        path: Database file
+        fts: Also build the FTS5 text index (skipped if SQLite lacks FTS5)
+
+    Returns:
+        Store opened on the new database
+    """
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+    connection = sqlite3.connect(path)
+    try:
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.executescript(SCHEMA)
+        problem_ids: Dict[str, int] = {}
+        rows = []
+        for topic, levels in problems_data.items():
+            # Same order as ProblemCatalog: known levels by difficulty, then the rest
+            for level in sorted(levels, key=_level_rank):
+                for problem in levels[level]:
+                    canonical_id = canonical_problem_id(problem["title"], problem.get("link"))
+                    problem_id = problem_ids.setdefault(canonical_id, len(problem_ids))
+                    rows.append(_row_values(topic, level, problem, canonical_id, problem_id))
+        with connection:
+            connection.executemany("INSERT INTO topics (name, position) VALUES (?, ?)",
+                                   ((topic, position) for position, topic in enumerate(problems_data)))
+            connection.executemany("INSERT INTO canonical_ids (problem_id, canonical_id) VALUES (?, ?)",
+                                   ((problem_id, canonical_id) for canonical_id, problem_id in problem_ids.items()))
+            connection.executemany(_INSERT, rows)
+            connection.execute(_INITIAL_COUNTS)
+        # executescript commits on its own; the file is not in use until this returns
+        connection.executescript(INDEXES + COUNT_TRIGGERS)
+        if fts:
+            try:
+                connection.executescript(FTS_SCHEMA)
+            except sqlite3.OperationalError:
+                pass
+            else:
+                connection.execute("INSERT INTO problems_fts (problems_fts) VALUES ('rebuild')")
+                connection.executescript(FTS_TRIGGERS)
+        connection.execute("ANALYZE")
+    finally:
+        connection.close()
+    return SQLiteProblemStore(path)
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build the SQLite problem database")
+    parser.add_argument("command", choices=["build"])
+    parser.add_argument("path", help="database file")
+    args = parser.parse_args()
+
+    from .problem_bank import PROBLEMS_DATA
+    store = write_database(PROBLEMS_DATA, args.path)
+    print(f"Wrote {store.count()} problems in {len(store.topics())} topics to {args.path}")
@@ -0,0 +1,380 @@
+"""
+Problem Import
+Streaming import of problem dumps (JSONL or CSV) into the catalog format
+
+Records are read one at a time, validated, normalized and passed on, so
+memory stays flat however large the dump is; the only state that grows is
+one 16-byte digest per kept record for de-duplication. Each record:
+
+- needs a title, a topic and a level; levels also accept easy / medium /
+  hard, and topics are matched case-insensitively against known topics and
+  aliases
+- may have a numeric difficulty rating; a rated record without a level
+  gets the level its rating falls in (see ratings.py)
+- may have technique tags, as a list or a string separated by commas,
+  semicolons or pipes (CSV)
+- gets its link normalized (https, lowercase host, no fragment, known
+  sites cut back to the problem page) and checked for a host
+- gets its canonical id and practice platform computed once, here
+- is dropped as a duplicate if its canonical problem was already kept for
+  the same topic and level (or anywhere, with scope="problem")
+
+Rejected records are counted by reason, with the first few kept as
+examples. Import a dump with:
+
+    cd src && python -m data.importer problems.jsonl --output catalog.jsonl
+"""
+
+import csv
+import hashlib
+import json
+import math
+import re
+import time
+from typing import IO, Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+from .catalog import LEVELS, PROBLEM_PATHS, canonical_problem_id, classify_platform
+from .ratings import LEVEL_CUTOFFS, level_for_rating
+
+# Fields of an imported record, in output order
+IMPORT_FIELDS = ("title", "description", "link", "topic", "level", "canonical_id", "platform", "rating", "tags")
+
+LEVEL_ALIASES = {"easy": "beginner", "medium": "intermediate", "hard": "advanced"}
+
+def normalize_link(link: str) -> Optional[Tuple[str, str]]:
+    """
+    Normalized display form and canonical id of a problem link, in one pass
+
+    Args:
+        link: Problem URL, with or without a scheme
+
+    Returns:
+        (https link, canonical id), or None if the link has no usable host;
+        the canonical id equals canonical_link(link)
+    """
+    rest = link.strip()
+    scheme_end = rest.find("//")
+    if scheme_end >= 0:
+        if rest[:scheme_end].lower() not in ("http:", "https:", ""):
+            return None
+        rest = rest[scheme_end + 2:]
+    rest = rest.split("#", 1)[0]
+    host, slash, path = rest.partition("/")
+    host = host.lower()
+    if host.endswith(":80") or host.endswith(":443"):
+        host = host.rsplit(":", 1)[0]
+    if "." not in host or " " in rest or host[0] == "." or host[-1] == ".":
+        return None
+    site = host[4:] if host.startswith("www.") else host
+    segments = [segment for segment in path.split("?", 1)[0].split("/") if segment]
+    if site in PROBLEM_PATHS:
+        # Cut back to the problem page, in the sites' own trailing-slash style
+        canonical_id = "/".join([site, *segments[:PROBLEM_PATHS[site]]])
+        return "https://" + canonical_id + "/", canonical_id
+    return "https://" + host + slash + path, "/".join([site, *segments])
+
+def parse_rating(value: Any) -> Optional[float]:
+    """
+    Numeric rating of a record field
+
+    Returns:
+        The rating (an int when whole), None if the field is empty
+
+    Raises:
+        ValueError: If the value is not a finite number
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+        raise ValueError(f"Invalid rating {value!r}")
+    rating = float(value)
+    if not math.isfinite(rating):
+        raise ValueError(f"Invalid rating {value!r}")
+    return int(rating) if rating.is_integer() else rating
+
+def parse_tags(value: Any) -> Optional[List[str]]:
+    """
+    Tags of a record field, whitespace-collapsed, first spelling of each kept
+
+    Returns:
+        The tags, None if the field is empty
+
+    Raises:
+        ValueError: If the value is neither a string nor a list of strings
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, str):
+        value = re.split(r"[,;|]", value)
+    elif not isinstance(value, list) or not all(isinstance(tag, str) for tag in value):
+        raise ValueError(f"Invalid tags {value!r}")
+    tags, seen = [], set()
+    for tag in value:
+        tag = " ".join(tag.split())
+        if tag and tag.lower() not in seen:
+            seen.add(tag.lower())
+            tags.append(tag)
+    return tags or None
+
+def read_jsonl(stream: IO[str]) -> Iterator[Tuple[int, Optional[Dict[str, Any]]]]:
+    """Yield (line number, record) per non-blank line; record is None if the line is not a JSON object"""
+    loads = json.loads
+    for number, line in enumerate(stream, 1):
+        try:
+            record = loads(line)
+        except ValueError:
+            # Checked only on failure; blank lines are rare
+            if not line.strip():
+                continue
+            record = None
+        yield number, record if type(record) is dict else None
+
+def read_csv(stream: IO[str]) -> Iterator[Tuple[int, Optional[Dict[str, Any]]]]:
+    """Yield (line number, record) per CSV row, using the header row as field names"""
+    reader = csv.DictReader(stream)
+    for record in reader:
+        # Rows with more cells than headers are malformed
+        yield reader.line_num, None if None in record else record
+
+def read_records(source: Union[str, IO[str]], fmt: Optional[str] = None) -> Iterator[Tuple[int, Optional[Dict[str, Any]]]]:
+    """
+    Stream records from a JSONL or CSV file
+
+    Args:
+        source: File path or open text stream
+        fmt: "jsonl" or "csv"; defaults to the file extension (JSONL if unknown)
+    """
+    if fmt is None:
+        name = source if isinstance(source, str) else getattr(source, "name", "")
+        fmt = "csv" if str(name).lower().endswith(".csv") else "jsonl"
+    reader = read_csv if fmt == "csv" else read_jsonl
+    if isinstance(source, str):
+        with open(source, encoding="utf-8", newline="" if fmt == "csv" else None) as stream:
+            yield from reader(stream)
+    else:
+        yield from reader(source)
+
+class ProblemImporter:
+    """Validates, normalizes and de-duplicates a stream of problem records"""
+
+    def __init__(self, topics: Iterable[str] = (), aliases: Optional[Mapping[str, str]] = None,
+                 strict_topics: bool = False, scope: str = "listing", max_examples: int = 10,
+                 cutoffs: Sequence[float] = LEVEL_CUTOFFS):
+        """
+        Args:
+            topics: Known topic names; matching topics take their spelling
+            aliases: Alternative topic names mapped to known topics
+            strict_topics: Reject topics that are neither known nor aliases
+            scope: "listing" drops a problem repeated under the same topic and
+                level; "problem" keeps only its first listing anywhere
+            max_examples: Rejected records to keep as examples
+            cutoffs: Rating cutoffs that give rated records without a level their level
+        """
+        if scope not in ("listing", "problem"):
+            raise ValueError(f"Unknown dedup scope '{scope}'. Choose from: listing, problem")
+        self._topics = {" ".join(topic.lower().split()): topic for topic in topics}
+        for alias, topic in (aliases or {}).items():
+            self._topics.setdefault(" ".join(alias.lower().split()), topic)
+        self.strict_topics = strict_topics
+        self.scope = scope
+        self.max_examples = max_examples
+        self.cutoffs = tuple(cutoffs)
+        self._seen = set()
+        self.read = 0
+        self.imported = 0
+        self.duplicates = 0
+        self.rejected: Dict[str, int] = {}
+        self.examples: List[Tuple[int, str]] = []
+        self.elapsed = 0.0
+
+    def _reject(self, line: int, reason: str):
+        self.rejected[reason] = self.rejected.get(reason, 0) + 1
+        if len(self.examples) < self.max_examples:
+            self.examples.append((line, reason))
+
+    def _topic(self, value: Any) -> Optional[str]:
+        if not isinstance(value, str):
+            return None
+        name = " ".join(value.split())
+        if not name:
+            return None
+        known = self._topics.get(name.lower())
+        if known is None and self.strict_topics:
+            return None
+        return known or name
+
+    def process(self, records: Iterable[Tuple[int, Optional[Dict[str, Any]]]]) -> Iterator[Dict[str, Any]]:
+        """
+        Yield each valid, new record in the import format (see IMPORT_FIELDS)
+
+        Args:
+            records: (line number, record) pairs, e.g. from read_records
+        """
+        # Dumps spell topics and levels a handful of ways; resolve each spelling once.
+        # Only strings are cached: a list or object in these fields is unhashable
+        topics: Dict[str, Optional[str]] = {}
+        levels: Dict[str, Optional[str]] = {}
+        level_names = {level: level for level in LEVELS}
+        level_names.update(LEVEL_ALIASES)
+        seen = self._seen
+        listing_scope = self.scope == "listing"
+        read = imported = duplicates = 0
+        started = time.perf_counter()
+        try:
+            for line, record in records:
+                read += 1
+                if record is None:
+                    self._reject(line, "malformed record")
+                    continue
+                title = record.get("title")
+                if not isinstance(title, str) or not title.strip():
+                    self._reject(line, "missing title")
+                    continue
+                title = " ".join(title.split())
+                raw = record.get("topic")
+                if not isinstance(raw, str):
+                    topic = None
+                else:
+                    topic = topics[raw] if raw in topics else topics.setdefault(raw, self._topic(raw))
+                if topic is None:
+                    self._reject(line, "missing or unknown topic")
+                    continue
+                try:
+                    rating = parse_rating(record.get("rating"))
+                except ValueError:
+                    self._reject(line, "invalid rating")
+                    continue
+                try:
+                    tags = parse_tags(record.get("tags"))
+                except ValueError:
+                    self._reject(line, "invalid tags")
+                    continue
+                raw = record.get("level")
+                if not isinstance(raw, str):
+                    level = None
+                elif raw in levels:
+                    level = levels[raw]
+                else:
+                    level = levels[raw] = level_names.get(raw.strip().lower())
+                if level is None and rating is not None and not raw:
+                    level = level_for_rating(rating, self.cutoffs)
+                if level is None:
+                    self._reject(line, "unknown level")
+                    continue
+                link = record.get("link") or None
+                if link is not None:
+                    normalized = normalize_link(link) if isinstance(link, str) else None
+                    if normalized is None:
+                        self._reject(line, "invalid link")
+                        continue
+                    link, canonical_id = normalized
+                else:
+                    canonical_id = canonical_problem_id(title, None)
+                description = record.get("description") or ""
+                if not isinstance(description, str):
+                    self._reject(line, "invalid description")
+                    continue
+
+                # A 128-bit digest stays small and is the same in every run (hash() of str is
+                # seeded per process); two distinct records collide with odds ~n^2 / 2^129
+                key = _dedup_key(canonical_id, topic, level) if listing_scope else _dedup_key(canonical_id)
+                if key in seen:
+                    duplicates += 1
+                    continue
+                seen.add(key)
+                imported += 1
+                yield {"title": title, "description": description.strip(), "link": link, "topic": topic,
+                       "level": level, "canonical_id": canonical_id, "platform": classify_platform(canonical_id),
+                       "rating": rating, "tags": tags}
+        finally:
+            self.read += read
+            self.imported += imported
+            self.duplicates += duplicates
+            self.elapsed += time.perf_counter() - started
+
+    def summary(self) -> Dict[str, Any]:
+        """Counts of the import so far, with records per second"""
+        return {
+            "read": self.read,
+            "imported": self.imported,
+            "duplicates": self.duplicates,
+            "rejected": dict(self.rejected),
+            "examples": list(self.examples),
+            "seconds": self.elapsed,
+            "records_per_second": self.read / self.elapsed if self.elapsed else 0.0,
+        }
+
+def _dedup_key(*parts: str) -> bytes:
+    return hashlib.blake2b("\0".join(parts).encode("utf-8"), digest_size=16).digest()
+
+def write_jsonl(problems: Iterable[Dict[str, Any]], stream: IO[str]) -> int:
+    """Write imported records one JSON object per line; returns how many were written"""
+    dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+    written = 0
+    batch = []
+    for problem in problems:
+        batch.append(dumps(problem))
+        if len(batch) == 1024:
+            # One write per batch instead of two per record
+            batch.append("")
+            stream.write("\n".join(batch))
+            written += len(batch) - 1
+            batch = []
+    if batch:
+        batch.append("")
+        stream.write("\n".join(batch))
+        written += len(batch) - 1
+    return written
+
+def to_problems_data(problems: Iterable[Dict[str, Any]]) -> Dict[str, Dict[str, List[Dict[str, str]]]]:
+    """
+    Group imported records into the nested topic -> level -> problems layout
+
+    The result holds every problem, so unlike the streaming steps it grows
+    with the import; use it to build a catalog, shards or a database.
+    """
+    problems_data: Dict[str, Dict[str, List[Dict[str, str]]]] = {}
+    for problem in problems:
+        record = {"title": problem["title"], "description": problem["description"]}
+        if problem["link"] is not None:
+            record["link"] = problem["link"]
+        if problem.get("rating") is not None:
+            record["rating"] = problem["rating"]
+        if problem.get("tags"):
+            record["tags"] = problem["tags"]
+        problems_data.setdefault(problem["topic"], {}).setdefault(problem["level"], []).append(record)
+    return problems_data
+
+if __name__ == "__main__":
+    import argparse
+
+    from .topic_data import TOPIC_ALIASES, TOPIC_DEPENDENCIES
+
+    parser = argparse.ArgumentParser(description="Import a JSONL or CSV problem dump")
+    parser.add_argument("input", help="problem dump (.jsonl or .csv)")
+    parser.add_argument("--format", choices=["jsonl", "csv"], help="input format (default: from the extension)")
+    parser.add_argument("--output", help="write imported records as JSONL (streaming)")
+    parser.add_argument("--shards", help="write a shard directory (see shards.py)")
+    parser.add_argument("--database", help="write a SQLite database (see database.py)")
+    parser.add_argument("--scope", choices=["listing", "problem"], default="listing", help="dedup scope")
+    parser.add_argument("--strict-topics", action="store_true", help="reject topics not in the curriculum")
+    args = parser.parse_args()
+
+    importer = ProblemImporter(TOPIC_DEPENDENCIES, TOPIC_ALIASES, args.strict_topics, args.scope)
+    imported = importer.process(read_records(args.input, args.format))
+    if args.shards or args.database:
+        problems_data = to_problems_data(imported)
+        if args.shards:
+            from .shards import write_shards
+            write_shards(problems_data, args.shards)
+        if args.database:
+            from .database import write_database
+            write_database(problems_data, args.database).close()
+    elif args.output:
+        with open(args.output, "w", encoding="utf-8") as out:
+            write_jsonl(imported, out)
+    else:
+        # Validate only
+        for _ in imported:
+            pass
+    print(json.dumps(importer.summary(), indent=2))
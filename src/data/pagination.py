@@ -0,0 +1,115 @@
+"""
+Problem Pagination
+Cursor-based pages of a topic's problem list
+
+Problem lists are ordered by level (known levels in difficulty order) and
+then by record position, the order every backend already returns. A page
+is the next page_size problems after a key (level rank, record index), so
+fetching page n never reads pages 1 .. n-1: in-memory views find the key
+by binary search, and the SQLite store seeks to it through its
+(topic, level_rank, level, id) index.
+
+Cursors are opaque URL-safe strings. They also carry a checksum of the
+listing they were made for (topic, level, dedup and a revision) and the
+position of the first problem they point at, for numbering; a cursor of
+another listing is rejected. SQLite row ids never change, so database
+cursors stay valid while problems are added or removed (except a cursor
+after a removed problem of a level outside LEVELS, whose level it needs). In-memory record
+indexes shift when a problem is added or removed before them, so those
+cursors carry the catalog's revision of the topic and are rejected once
+it changes; callers start over at the first page.
+"""
+
+import base64
+import binascii
+import struct
+import zlib
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from .catalog import LEVELS, Problem
+
+CURSOR_VERSION = 1
+# version, listing checksum, level rank, record index, position of the next problem
+_CURSOR = struct.Struct("<BIBqI")
+
+# Sort key of a problem within a topic's list: (level rank, record index)
+PageKey = Tuple[int, int]
+
+def level_rank(level: str) -> int:
+    """Sort position of a level: known levels in difficulty order, any others after them"""
+    return LEVELS.index(level) if level in LEVELS else len(LEVELS)
+
+def page_key(problem: Problem) -> PageKey:
+    """Position of a problem in its topic's list"""
+    return level_rank(problem.level), problem.index
+
+def _listing(topic: str, level: str, dedup: bool, revision: int) -> int:
+    return zlib.crc32(f"{topic}\x1f{level}\x1f{int(dedup)}\x1f{revision}".encode())
+
+def encode_cursor(topic: str, level: str, dedup: bool, after: PageKey, position: int, revision: int = 0) -> str:
+    """Opaque cursor for the problems after a key of a listing (revision: see ProblemCatalog.revision)"""
+    payload = _CURSOR.pack(CURSOR_VERSION, _listing(topic, level, dedup, revision), after[0], after[1], position)
+    return base64.urlsafe_b64encode(payload).rstrip(b"=").decode()
+
+def decode_cursor(cursor: str, topic: str, level: str, dedup: bool, revision: int = 0) -> Tuple[PageKey, int]:
+    """
+    Key and position a cursor points after
+
+    Raises:
+        ValueError: If the cursor is malformed, belongs to another listing or
+            was made for another revision of it
+    """
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        version, listing, rank, index, position = _CURSOR.unpack(payload)
+    except (binascii.Error, struct.error, ValueError):
+        raise ValueError("Invalid page cursor") from None
+    if version != CURSOR_VERSION or listing != _listing(topic, level, dedup, revision):
+        raise ValueError("Page cursor belongs to another problem listing or an older version of it")
+    return (rank, index), position
+
+def page_start(problems: Sequence[Problem], after: PageKey) -> int:
+    """Index of the first problem whose key is greater than after (binary search over the sorted list)"""
+    low, high = 0, len(problems)
+    while low < high:
+        middle = (low + high) // 2
+        if page_key(problems[middle]) <= after:
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+def paginate(problems: Sequence[Problem], topic: str, level: str = "all", dedup: bool = False,
+             cursor: Optional[str] = None, page_size: int = 20, revision: int = 0) -> Dict[str, Any]:
+    """
+    One page of an in-memory problem list in catalog order
+
+    Args:
+        problems: The listing's problems, sorted by page_key (catalog, shard and database lists are)
+        topic: Topic of the listing
+        level: Level of the listing
+        dedup: Whether the listing is de-duplicated
+        cursor: next_cursor of the previous page (None for the first page)
+        page_size: Problems per page
+        revision: Revision of the listing's records, e.g. ProblemCatalog.revision(topic)
+
+    Returns:
+        Dictionary with the page's problems, start (0-based position of
+        the first one) and next_cursor (None on the last page)
+    """
+    page_size = max(1, page_size)
+    start = 0
+    if cursor is not None:
+        after, _ = decode_cursor(cursor, topic, level, dedup, revision)
+        start = page_start(problems, after)
+    window = list(problems[start:start + page_size + 1])
+    return page_result(window, topic, level, dedup, start, page_size, revision)
+
+def page_result(window: Sequence[Problem], topic: str, level: str, dedup: bool, start: int,
+                page_size: int, revision: int = 0) -> Dict[str, Any]:
+    """Page dictionary from up to page_size + 1 problems starting at a position"""
+    page = list(window[:page_size])
+    next_cursor = None
+    if len(window) > page_size:
+        next_cursor = encode_cursor(topic, level, dedup, page_key(page[-1]), start + len(page), revision)
+    return {"problems": page, "start": start, "next_cursor": next_cursor}
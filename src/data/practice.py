@@ -0,0 +1,294 @@
+"""
+Practice Sets
+One de-duplicated, ordered problem set for a whole learning path
+
+Problems are taken topic by topic in path order, and within a topic level
+by level, from the catalog's precomputed dedup views. A problem listed
+under several path topics is placed at the first one, which is usually the
+prerequisite. Nothing is copied until a problem is selected, so the cost
+is proportional to the problems returned plus those skipped as repeats.
+
+Balanced sets ("30 problems over my path, 40% intermediate, at least 2 per
+topic, nothing from last week") are built greedily with a repair pass, on
+the same dedup views:
+
+1. Coverage: every path topic gets its minimum, each pick at the level
+   furthest below its target.
+2. Fill: levels below target take the topic with the fewest picks so far
+   (a heap per level); remaining slots go to levels without a target,
+   then, if targets cannot be met, to any level.
+3. Repair: coverage picks at a level over its target are swapped, within
+   their topic, for problems of a level under target or without one.
+
+Each step reads the next unused problem of a (topic, level) view, so the
+cost grows with the set size and the number of path topics, not with the
+catalog.
+"""
+
+import heapq
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Set
+
+from .catalog import LEVELS, Problem, ProblemCatalog
+
+def iter_practice_set(catalog: ProblemCatalog, path: Iterable[str],
+                      level_mix: Optional[Mapping[str, Optional[int]]] = None,
+                      per_topic_quota: Optional[int] = None,
+                      exclude: Iterable[int] = ()) -> Iterator[Problem]:
+    """
+    Lazily yield the practice set of a learning path
+
+    Args:
+        catalog: Compiled problem catalog
+        path: Topics in learning order
+        level_mix: Levels to include, in order, mapped to how many problems of
+            that level each topic contributes (None for all); defaults to all
+            problems of every level, easiest first
+        per_topic_quota: Most problems any one topic contributes
+        exclude: Problem ids to leave out, e.g. problems already solved
+
+    Yields:
+        Problem records in practice order, each distinct problem once
+    """
+    if level_mix is None:
+        level_mix = dict.fromkeys(LEVELS)
+    seen = set(exclude)
+    for topic in dict.fromkeys(path):
+        taken = 0
+        for level, level_quota in level_mix.items():
+            taken_at_level = 0
+            for problem in catalog.problems(topic, level, dedup=True):
+                if per_topic_quota is not None and taken >= per_topic_quota:
+                    break
+                if level_quota is not None and taken_at_level >= level_quota:
+                    break
+                if problem.problem_id in seen:
+                    continue
+                seen.add(problem.problem_id)
+                taken += 1
+                taken_at_level += 1
+                yield problem
+            if per_topic_quota is not None and taken >= per_topic_quota:
+                break
+
+def build_practice_set(catalog: ProblemCatalog, path: Iterable[str],
+                       level_mix: Optional[Mapping[str, Optional[int]]] = None,
+                       per_topic_quota: Optional[int] = None,
+                       exclude: Iterable[int] = (),
+                       page: int = 1, page_size: int = 20) -> Dict[str, Any]:
+    """
+    One page of a learning path's practice set
+
+    Args:
+        catalog: Compiled problem catalog
+        path: Topics in learning order
+        level_mix: Levels to include mapped to a per-topic count (see iter_practice_set)
+        per_topic_quota: Most problems any one topic contributes
+        exclude: Problem ids to leave out
+        page: 1-based page number
+        page_size: Problems per page
+
+    Returns:
+        Dictionary with the page's problems, page, page_size, total and pages
+    """
+    page = max(1, page)
+    page_size = max(1, page_size)
+    problems: List[Problem] = list(iter_practice_set(catalog, path, level_mix, per_topic_quota, exclude))
+    start = (page - 1) * page_size
+    return {
+        "problems": problems[start:start + page_size],
+        "page": page,
+        "page_size": page_size,
+        "total": len(problems),
+        "pages": max(1, -(-len(problems) // page_size)),
+    }
+
+class _Supply:
+    """Unused problems of one (topic, level) dedup view, in curated order"""
+
+    __slots__ = ("problems", "position", "used")
+
+    def __init__(self, problems: Sequence[Problem], used: Set[int]):
+        self.problems = problems
+        self.position = 0
+        # Shared across all views: excluded and already picked problem ids
+        self.used = used
+
+    def peek(self) -> Optional[Problem]:
+        while self.position < len(self.problems):
+            problem = self.problems[self.position]
+            if problem.problem_id not in self.used:
+                return problem
+            self.position += 1
+        return None
+
+    def take(self) -> Problem:
+        problem = self.peek()
+        self.used.add(problem.problem_id)
+        self.position += 1
+        return problem
+
+def level_targets(size: int, level_shares: Mapping[str, float]) -> Dict[str, int]:
+    """
+    Problems per level from shares of the set size, rounded by largest remainder
+
+    Raises:
+        ValueError: If a level is unknown, a share is negative or the shares add up to more than 1
+    """
+    for level, share in level_shares.items():
+        if level not in LEVELS:
+            raise ValueError(f"Unknown level '{level}'. Choose from: {', '.join(LEVELS)}")
+        if share < 0:
+            raise ValueError(f"Negative share for level '{level}'")
+    if sum(level_shares.values()) > 1 + 1e-9:
+        raise ValueError("Level shares add up to more than 100%")
+    exact = {level: share * size for level, share in level_shares.items()}
+    targets = {level: int(value) for level, value in exact.items()}
+    # Hand out the remaining problems by largest fractional part, easier levels first on ties
+    remaining = round(sum(exact.values())) - sum(targets.values())
+    by_remainder = sorted(exact, key=lambda level: (-(exact[level] - targets[level]), LEVELS.index(level)))
+    for level in by_remainder[:remaining]:
+        targets[level] += 1
+    return targets
+
+def build_balanced_set(catalog: ProblemCatalog, path: Iterable[str], size: int,
+                       level_shares: Optional[Mapping[str, float]] = None, min_per_topic: int = 0,
+                       max_per_topic: Optional[int] = None, exclude: Iterable[int] = ()) -> Dict[str, Any]:
+    """
+    A practice set of a given size under topic and level quotas
+
+    Args:
+        catalog: Compiled problem catalog
+        path: Topics in learning order
+        size: Number of problems
+        level_shares: Share of the set per level, e.g. {"intermediate": 0.4}; levels
+            left out fill whatever the shares leave (None: no level quotas)
+        min_per_topic: Fewest problems per path topic
+        max_per_topic: Most problems per path topic
+        exclude: Problem ids to leave out, e.g. problems done last week
+
+    Returns:
+        Dictionary with the problems (in path order, then level), level_targets,
+        level_counts, topic_counts and shortfalls (messages for quotas that
+        could not be met with the available problems)
+
+    Raises:
+        ValueError: If the quotas contradict each other
+    """
+    path = list(dict.fromkeys(path))
+    if min_per_topic * len(path) > size:
+        raise ValueError(f"At least {min_per_topic} problems for each of {len(path)} topics "
+                         f"do not fit in {size} problems")
+    if max_per_topic is not None and max_per_topic < min_per_topic:
+        raise ValueError("The per-topic maximum is below the per-topic minimum")
+    cap = max_per_topic if max_per_topic is not None else size
+    targets = level_targets(size, level_shares or {})
+    free_levels = [level for level in LEVELS if level not in targets]
+
+    used: Set[int] = set(exclude)
+    supply = {(topic, level): _Supply(catalog.problems(topic, level, dedup=True), used)
+              for topic in path for level in LEVELS}
+    position = {topic: i for i, topic in enumerate(path)}
+    picks: Dict[str, List[Problem]] = {topic: [] for topic in path}
+    level_counts = dict.fromkeys(LEVELS, 0)
+    shortfalls: List[str] = []
+    total = 0
+
+    def take(topic: str, level: str):
+        nonlocal total
+        picks[topic].append(supply[(topic, level)].take())
+        level_counts[level] += 1
+        total += 1
+
+    def deficit(level: str) -> int:
+        return targets[level] - level_counts[level] if level in targets else 0
+
+    def behind(level: str, limit: Mapping[str, int]) -> float:
+        # Share of the level's quota still missing, so picks follow the mix rather than the biggest quota
+        return (limit[level] - level_counts[level]) / limit[level] if limit.get(level) else 0.0
+
+    # 1. Coverage: each topic's minimum, at the levels furthest below target
+    for topic in path:
+        while len(picks[topic]) < min_per_topic:
+            available = [level for level in LEVELS if supply[(topic, level)].peek() is not None]
+            if not available:
+                shortfalls.append(f"{topic}: only {len(picks[topic])} of {min_per_topic} problems available")
+                break
+            take(topic, max(available, key=lambda level: (behind(level, targets), -LEVELS.index(level))))
+
+    # 2. Fill: the topic with the fewest picks for each level below target, then free levels, then any level
+    def fill(levels: List[str], limit: Dict[str, int]):
+        heaps = {level: [(len(picks[t]), position[t], t) for t in path] for level in levels}
+        for heap in heaps.values():
+            heapq.heapify(heap)
+        while total < size and heaps:
+            level = max(heaps, key=lambda l: (behind(l, limit), -LEVELS.index(l)))
+            if limit[level] - level_counts[level] <= 0:
+                break
+            heap = heaps[level]
+            while heap:
+                count, _, topic = heap[0]
+                if count != len(picks[topic]):
+                    # Stale entry: the topic got a pick at another level since
+                    heapq.heapreplace(heap, (len(picks[topic]), position[topic], topic))
+                elif count >= cap or supply[(topic, level)].peek() is None:
+                    heapq.heappop(heap)
+                else:
+                    break
+            if not heap:
+                del heaps[level]
+                continue
+            topic = heap[0][2]
+            take(topic, level)
+            heapq.heapreplace(heap, (len(picks[topic]), position[topic], topic))
+
+    fill([level for level in targets if deficit(level) > 0], targets)
+    unlimited = dict.fromkeys(LEVELS, size)
+    if free_levels:
+        fill(free_levels, unlimited)
+    if total < size:
+        fill(list(LEVELS), unlimited)
+
+    # 3. Repair: swap picks over target for same-topic problems of levels under target, else of free levels
+    for topic in path:
+        for i, problem in enumerate(picks[topic]):
+            if problem.level not in targets or deficit(problem.level) >= 0:
+                continue
+            under = sorted((level for level in targets if deficit(level) > 0), key=deficit, reverse=True)
+            for level in under + free_levels:
+                if supply[(topic, level)].peek() is not None:
+                    picks[topic][i] = supply[(topic, level)].take()
+                    level_counts[problem.level] -= 1
+                    level_counts[level] += 1
+                    break
+
+    def capped(levels: Iterable[str]) -> bool:
+        # Whether problems are left at these levels, but only in topics already at max_per_topic
+        return any(len(picks[topic]) >= cap and supply[(topic, level)].peek() is not None
+                   for topic in path for level in levels)
+
+    for level in targets:
+        if deficit(level) > 0:
+            if capped([level]):
+                shortfalls.append(f"{level}: {level_counts[level]} of {targets[level]} problems within "
+                                  f"{max_per_topic} per topic")
+            else:
+                shortfalls.append(f"{level}: {level_counts[level]} of {targets[level]} problems available")
+        elif deficit(level) < 0:
+            shortfalls.append(f"{level}: {level_counts[level]} problems instead of {targets[level]}, "
+                              f"the only ones left for some topics' minimum")
+    if total < size:
+        if capped(LEVELS):
+            shortfalls.append(f"only {total} of {size} problems fit {max_per_topic} per topic")
+        else:
+            shortfalls.append(f"only {total} of {size} problems available")
+
+    level_rank = {level: i for i, level in enumerate(LEVELS)}
+    problems = [problem for topic in path
+                for problem in sorted(picks[topic], key=lambda p: (level_rank[p.level], p.index))]
+    return {
+        "problems": problems,
+        "level_targets": targets,
+        "level_counts": level_counts,
+        "topic_counts": {topic: len(picks[topic]) for topic in path},
+        "shortfalls": shortfalls,
+    }
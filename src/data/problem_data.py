@@ -1,1045 +1,695 @@
 """
 DSA Problem Data with Links
-Contains problems organized by topics and difficulty levels
-Based on comprehensive LeetCode problem collection and Striver's A2Z DSA Course
+Access to the problem collection, organized by topics and difficulty levels
+
+The bundled collection lives in problem_bank.py and is only imported on
+first use. With DSA_PROBLEM_SHARDS pointing at a shard directory (see
+shards.py), topic lists, counts and per-topic problem lists are served from
+lazily loaded per-topic shards instead, so startup reads only the manifest.
+Features that need every problem (search, practice sets, placements) load
+all shards once into the full catalog.
+
+With DSA_PROBLEM_DB pointing at a SQLite database (see database.py), the
+database is the editable source of truth: per-topic lists, counts, search
+and add/remove_problem all go through prepared queries on it.
+
+Recommendations (see recommend.py) rank problems for one learner from the
+problems they solved, over the full catalog; daily mixes (see daily_mix.py)
+sample it by topic and level weights. Rating queries (see ratings.py),
+boolean tag queries (see tags.py) and related problems (see related.py) use
+indexes over the full catalog as well.
+
+Spaced-repetition reviews of solved problems (see reviews.py) are keyed by
+canonical id, so catalog changes leave them alone. Callers with a stable
+learner id use one process-wide scheduler; with DSA_REVIEW_STATE naming a
+file, it is loaded from it on first use and saved to it at most every
+REVIEW_SAVE_INTERVAL seconds after a review. Anonymous learners (the app's
+sessions) pass a scheduler of their own, which is never saved.
 """
 
-# Problem data structure with single links (preferring LeetCode)
-PROBLEMS_DATA = {
-    "Arrays": {
-        "beginner": [
-            {
-                "title": "Two Sum",
-                "description": "Find two numbers that add up to a target sum",
-                "link": "https://leetcode.com/problems/two-sum/"
-            },
-            {
-                "title": "Remove Element",
-                "description": "Remove all instances of a value from array",
-                "link": "https://leetcode.com/problems/remove-element/"
-            },
-            {
-                "title": "Maximum Score After Splitting a String",
-                "description": "Split string to maximize score of zeros and ones",
-                "link": "https://leetcode.com/problems/maximum-score-after-splitting-a-string/"
-            },
-            {
-                "title": "Plus One",
-                "description": "Add one to a number represented as array of digits",
-                "link": "https://leetcode.com/problems/plus-one/"
-            },
-            {
-                "title": "Move Zeroes",
-                "description": "Move all zeros to the end while maintaining relative order",
-                "link": "https://leetcode.com/problems/move-zeroes/"
-            },
-            {
-                "title": "Valid Mountain Array",
-                "description": "Check if array is a valid mountain",
-                "link": "https://leetcode.com/problems/valid-mountain-array/"
-            },
-            {
-                "title": "Find Numbers with Even Number of Digits",
-                "description": "Count numbers with even number of digits",
-                "link": "https://leetcode.com/problems/find-numbers-with-even-number-of-digits/"
-            },
-            {
-                "title": "Squares of a Sorted Array",
-                "description": "Return squares of sorted array in sorted order",
-                "link": "https://leetcode.com/problems/squares-of-a-sorted-array/"
-            }
-        ],
-        "intermediate": [
-            {
-                "title": "3Sum",
-                "description": "Find three numbers that add up to zero",
-                "link": "https://leetcode.com/problems/3sum/"
-            },
-            {
-                "title": "Container With Most Water",
-                "description": "Find container that can hold the most water",
-                "link": "https://leetcode.com/problems/container-with-most-water/"
-            },
-            {
-                "title": "Set Matrix Zeroes",
-                "description": "Set entire row and column to zero if element is zero",
-                "link": "https://leetcode.com/problems/set-matrix-zeroes/"
-            },
-            {
-                "title": "Spiral Matrix",
-                "description": "Return elements of matrix in spiral order",
-                "link": "https://leetcode.com/problems/spiral-matrix/"
-            },
-            {
-                "title": "Rotate Image",
-                "description": "Rotate matrix 90 degrees clockwise in-place",
-                "link": "https://leetcode.com/problems/rotate-image/"
-            },
-            {
-                "title": "Search a 2D Matrix II",
-                "description": "Search for target in sorted 2D matrix",
-                "link": "https://leetcode.com/problems/search-a-2d-matrix-ii/"
-            },
-            {
-                "title": "Product of Array Except Self",
-                "description": "Return array where each element is product of all others",
-                "link": "https://leetcode.com/problems/product-of-array-except-self/"
-            },
-            {
-                "title": "Rotate Array",
-                "description": "Rotate array to the right by k steps",
-                "link": "https://leetcode.com/problems/rotate-array/"
-            },
-            {
-                "title": "Next Permutation",
-                "description": "Find next lexicographically greater permutation",
-                "link": "https://leetcode.com/problems/next-permutation/"
-            },
-            {
-                "title": "Maximum Subarray",
-                "description": "Find contiguous subarray with largest sum (Kadane's Algorithm)",
-                "link": "https://leetcode.com/problems/maximum-subarray/"
-            },
-            {
-                "title": "Best Time to Buy and Sell Stock",
-                "description": "Find maximum profit from stock transactions",
-                "link": "https://leetcode.com/problems/best-time-to-buy-and-sell-stock/"
-            },
-            {
-                "title": "Rearrange Array Elements by Sign",
-                "description": "Rearrange array alternating positive and negative",
-                "link": "https://leetcode.com/problems/rearrange-array-elements-by-sign/"
-            }
-        ],
-        "advanced": [
-            {
-                "title": "Median of Two Sorted Arrays",
-                "description": "Find median of two sorted arrays in logarithmic time",
-                "link": "https://leetcode.com/problems/median-of-two-sorted-arrays/"
-            },
-            {
-                "title": "Trapping Rain Water",
-                "description": "Calculate how much rain water can be trapped",
-                "link": "https://leetcode.com/problems/trapping-rain-water/"
-            },
-            {
-                "title": "First Missing Positive",
-                "description": "Find smallest missing positive integer",
-                "link": "https://leetcode.com/problems/first-missing-positive/"
-            },
-            {
-                "title": "Max Sum of Rectangle No Larger Than K",
-                "description": "Find maximum sum rectangle with sum no larger than k",
-                "link": "https://leetcode.com/problems/max-sum-of-rectangle-no-larger-than-k/"
-            },
-            {
-                "title": "4Sum",
-                "description": "Find four numbers that add up to target",
-                "link": "https://leetcode.com/problems/4sum/"
-            },
-            {
-                "title": "Largest Rectangle in Histogram",
-                "description": "Find largest rectangle area in histogram",
-                "link": "https://leetcode.com/problems/largest-rectangle-in-histogram/"
-            }
-        ]
-    },
-    "Strings": {
-        "beginner": [
-            {
-                "title": "Valid Palindrome",
-                "description": "Check if a string is a palindrome",
-                "link": "https://leetcode.com/problems/valid-palindrome/"
-            },
-            {
-                "title": "Valid Anagram",
-                "description": "Check if two strings are anagrams",
-                "link": "https://leetcode.com/problems/valid-anagram/"
-            },
-            {
-                "title": "Implement strStr()",
-                "description": "Find first occurrence of needle in haystack",
-                "link": "https://leetcode.com/problems/implement-strstr/"
-            },
-            {
-                "title": "Length of Last Word",
-                "description": "Return length of last word in string",
-                "link": "https://leetcode.com/problems/length-of-last-word/"
-            },
-            {
-                "title": "Reverse String",
-                "description": "Reverse a string in-place",
-                "link": "https://leetcode.com/problems/reverse-string/"
-            },
-            {
-                "title": "First Unique Character in a String",
-                "description": "Find first non-repeating character",
-                "link": "https://leetcode.com/problems/first-unique-character-in-a-string/"
-            }
-        ],
-        "intermediate": [
-            {
-                "title": "Longest Palindromic Substring",
-                "description": "Find the longest palindromic substring",
-                "link": "https://leetcode.com/problems/longest-palindromic-substring/"
-            },
-            {
-                "title": "Group Anagrams",
-                "description": "Group strings that are anagrams together",
-                "link": "https://leetcode.com/problems/group-anagrams/"
-            },
-            {
-                "title": "Longest Substring Without Repeating Characters",
-                "description": "Find length of longest substring without repeating characters",
-                "link": "https://leetcode.com/problems/longest-substring-without-repeating-characters/"
-            },
-            {
-                "title": "String to Integer (atoi)",
-                "description": "Convert string to integer with validation",
-                "link": "https://leetcode.com/problems/string-to-integer-atoi/"
-            },
-            {
-                "title": "Longest Common Prefix",
-                "description": "Find longest common prefix among strings",
-                "link": "https://leetcode.com/problems/longest-common-prefix/"
-            },
-            {
-                "title": "Count and Say",
-                "description": "Generate nth term of count-and-say sequence",
-                "link": "https://leetcode.com/problems/count-and-say/"
-            },
-            {
-                "title": "Sort Characters By Frequency",
-                "description": "Sort characters by frequency in descending order",
-                "link": "https://leetcode.com/problems/sort-characters-by-frequency/"
-            }
-        ],
-        "advanced": [
-            {
-                "title": "Minimum Window Substring",
-                "description": "Find minimum window substring containing all characters",
-                "link": "https://leetcode.com/problems/minimum-window-substring/"
-            },
-            {
-                "title": "Edit Distance",
-                "description": "Minimum operations to convert one string to another",
-                "link": "https://leetcode.com/problems/edit-distance/"
-            },
-            {
-                "title": "Regular Expression Matching",
-                "description": "Implement regular expression matching",
-                "link": "https://leetcode.com/problems/regular-expression-matching/"
-            },
-            {
-                "title": "Wildcard Matching",
-                "description": "Implement wildcard pattern matching",
-                "link": "https://leetcode.com/problems/wildcard-matching/"
-            },
-            {
-                "title": "Palindromic Substrings",
-                "description": "Count number of palindromic substrings",
-                "link": "https://leetcode.com/problems/palindromic-substrings/"
-            }
-        ]
-    },
-    "Linked Lists": {
-        "beginner": [
-            {
-                "title": "Reverse Linked List",
-                "description": "Reverse a singly linked list",
-                "link": "https://leetcode.com/problems/reverse-linked-list/"
-            },
-            {
-                "title": "Merge Two Sorted Lists",
-                "description": "Merge two sorted linked lists",
-                "link": "https://leetcode.com/problems/merge-two-sorted-lists/"
-            },
-            {
-                "title": "Remove Duplicates from Sorted List",
-                "description": "Remove duplicates from sorted linked list",
-                "link": "https://leetcode.com/problems/remove-duplicates-from-sorted-list/"
-            },
-            {
-                "title": "Linked List Cycle",
-                "description": "Detect if a linked list has a cycle",
-                "link": "https://leetcode.com/problems/linked-list-cycle/"
-            },
-            {
-                "title": "Intersection of Two Linked Lists",
-                "description": "Find intersection point of two linked lists",
-                "link": "https://leetcode.com/problems/intersection-of-two-linked-lists/"
-            },
-            {
-                "title": "Palindrome Linked List",
-                "description": "Check if linked list is palindrome",
-                "link": "https://leetcode.com/problems/palindrome-linked-list/"
-            },
-            {
-                "title": "Middle of the Linked List",
-                "description": "Find middle node of linked list",
-                "link": "https://leetcode.com/problems/middle-of-the-linked-list/"
-            },
-            {
-                "title": "Delete Node in a Linked List",
-                "description": "Delete a node without access to head",
-                "link": "https://leetcode.com/problems/delete-node-in-a-linked-list/"
-            }
-        ],
-        "intermediate": [
-            {
-                "title": "Add Two Numbers",
-                "description": "Add two numbers represented as linked lists",
-                "link": "https://leetcode.com/problems/add-two-numbers/"
-            },
-            {
-                "title": "Remove Nth Node From End of List",
-                "description": "Remove nth node from end of linked list",
-                "link": "https://leetcode.com/problems/remove-nth-node-from-end-of-list/"
-            },
-            {
-                "title": "Swap Nodes in Pairs",
-                "description": "Swap every two adjacent nodes",
-                "link": "https://leetcode.com/problems/swap-nodes-in-pairs/"
-            },
-            {
-                "title": "Rotate List",
-                "description": "Rotate linked list to the right by k places",
-                "link": "https://leetcode.com/problems/rotate-list/"
-            },
-            {
-                "title": "Remove Duplicates from Sorted List II",
-                "description": "Remove all duplicates from sorted linked list",
-                "link": "https://leetcode.com/problems/remove-duplicates-from-sorted-list-ii/"
-            },
-            {
-                "title": "Partition List",
-                "description": "Partition list around value x",
-                "link": "https://leetcode.com/problems/partition-list/"
-            },
-            {
-                "title": "Reverse Linked List II",
-                "description": "Reverse linked list from position m to n",
-                "link": "https://leetcode.com/problems/reverse-linked-list-ii/"
-            },
-            {
-                "title": "Copy List with Random Pointer",
-                "description": "Deep copy linked list with random pointers",
-                "link": "https://leetcode.com/problems/copy-list-with-random-pointer/"
-            },
-            {
-                "title": "Reverse Nodes in k-Group",
-                "description": "Reverse nodes in groups of k",
-                "link": "https://leetcode.com/problems/reverse-nodes-in-k-group/"
-            },
-            {
-                "title": "Odd Even Linked List",
-                "description": "Group odd and even positioned nodes together",
-                "link": "https://leetcode.com/problems/odd-even-linked-list/"
-            }
-        ],
-        "advanced": [
-            {
-                "title": "Merge k Sorted Lists",
-                "description": "Merge k sorted linked lists",
-                "link": "https://leetcode.com/problems/merge-k-sorted-lists/"
-            },
-            {
-                "title": "Linked List Cycle II",
-                "description": "Find where cycle begins in linked list",
-                "link": "https://leetcode.com/problems/linked-list-cycle-ii/"
-            },
-            {
-                "title": "LRU Cache",
-                "description": "Design and implement LRU cache",
-                "link": "https://leetcode.com/problems/lru-cache/"
-            },
-            {
-                "title": "Sort List",
-                "description": "Sort linked list using O(n log n) time",
-                "link": "https://leetcode.com/problems/sort-list/"
-            },
-            {
-                "title": "Flatten a Multilevel Doubly Linked List",
-                "description": "Flatten multilevel doubly linked list",
-                "link": "https://leetcode.com/problems/flatten-a-multilevel-doubly-linked-list/"
-            }
-        ]
-    },
-    "Binary Trees": {
-        "beginner": [
-            {
-                "title": "Maximum Depth of Binary Tree",
-                "description": "Find the maximum depth of a binary tree",
-                "link": "https://leetcode.com/problems/maximum-depth-of-binary-tree/"
-            },
-            {
-                "title": "Same Tree",
-                "description": "Check if two binary trees are the same",
-                "link": "https://leetcode.com/problems/same-tree/"
-            },
-            {
-                "title": "Invert Binary Tree",
-                "description": "Invert a binary tree",
-                "link": "https://leetcode.com/problems/invert-binary-tree/"
-            },
-            {
-                "title": "Symmetric Tree",
-                "description": "Check if tree is mirror of itself",
-                "link": "https://leetcode.com/problems/symmetric-tree/"
-            },
-            {
-                "title": "Path Sum",
-                "description": "Check if tree has root-to-leaf path with sum",
-                "link": "https://leetcode.com/problems/path-sum/"
-            },
-            {
-                "title": "Minimum Depth of Binary Tree",
-                "description": "Find minimum depth of binary tree",
-                "link": "https://leetcode.com/problems/minimum-depth-of-binary-tree/"
-            },
-            {
-                "title": "Balanced Binary Tree",
-                "description": "Check if binary tree is height-balanced",
-                "link": "https://leetcode.com/problems/balanced-binary-tree/"
-            },
-            {
-                "title": "Diameter of Binary Tree",
-                "description": "Find diameter of binary tree",
-                "link": "https://leetcode.com/problems/diameter-of-binary-tree/"
-            }
-        ],
-        "intermediate": [
-            {
-                "title": "Binary Tree Inorder Traversal",
-                "description": "Perform inorder traversal of binary tree",
-                "link": "https://leetcode.com/problems/binary-tree-inorder-traversal/"
-            },
-            {
-                "title": "Binary Tree Preorder Traversal",
-                "description": "Perform preorder traversal of binary tree",
-                "link": "https://leetcode.com/problems/binary-tree-preorder-traversal/"
-            },
-            {
-                "title": "Binary Tree Postorder Traversal",
-                "description": "Perform postorder traversal of binary tree",
-                "link": "https://leetcode.com/problems/binary-tree-postorder-traversal/"
-            },
-            {
-                "title": "Binary Tree Level Order Traversal",
-                "description": "Level order traversal of binary tree",
-                "link": "https://leetcode.com/problems/binary-tree-level-order-traversal/"
-            },
-            {
-                "title": "Validate Binary Search Tree",
-                "description": "Check if a binary tree is a valid BST",
-                "link": "https://leetcode.com/problems/validate-binary-search-tree/"
-            },
-            {
-                "title": "Convert Sorted Array to Binary Search Tree",
-                "description": "Convert sorted array to height-balanced BST",
-                "link": "https://leetcode.com/problems/convert-sorted-array-to-binary-search-tree/"
-            },
-            {
-                "title": "Path Sum II",
-                "description": "Find all root-to-leaf paths with given sum",
-                "link": "https://leetcode.com/problems/path-sum-ii/"
-            },
-            {
-                "title": "Binary Tree Zigzag Level Order Traversal",
-                "description": "Zigzag level order traversal",
-                "link": "https://leetcode.com/problems/binary-tree-zigzag-level-order-traversal/"
-            },
-            {
-                "title": "Lowest Common Ancestor of a Binary Tree",
-                "description": "Find LCA of two nodes in binary tree",
-                "link": "https://leetcode.com/problems/lowest-common-ancestor-of-a-binary-tree/"
-            }
-        ],
-        "advanced": [
-            {
-                "title": "Binary Tree Maximum Path Sum",
-                "description": "Find the maximum path sum in a binary tree",
-                "link": "https://leetcode.com/problems/binary-tree-maximum-path-sum/"
-            },
-            {
-                "title": "Construct Binary Tree from Preorder and Inorder Traversal",
-                "description": "Build tree from preorder and inorder traversals",
-                "link": "https://leetcode.com/problems/construct-binary-tree-from-preorder-and-inorder-traversal/"
-            },
-            {
-                "title": "Serialize and Deserialize Binary Tree",
-                "description": "Serialize and deserialize binary tree",
-                "link": "https://leetcode.com/problems/serialize-and-deserialize-binary-tree/"
-            },
-            {
-                "title": "Binary Tree Right Side View",
-                "description": "Return right side view of binary tree",
-                "link": "https://leetcode.com/problems/binary-tree-right-side-view/"
-            },
-            {
-                "title": "Flatten Binary Tree to Linked List",
-                "description": "Flatten binary tree to linked list in-place",
-                "link": "https://leetcode.com/problems/flatten-binary-tree-to-linked-list/"
-            },
-            {
-                "title": "Morris Inorder Traversal",
-                "description": "Inorder traversal with O(1) space complexity",
-                "link": "https://leetcode.com/problems/binary-tree-inorder-traversal/"
-            }
-        ]
-    },
-    "Dynamic Programming": {
-        "beginner": [
-            {
-                "title": "Climbing Stairs",
-                "description": "Count ways to climb stairs",
-                "link": "https://leetcode.com/problems/climbing-stairs/"
-            },
-            {
-                "title": "Fibonacci Number",
-                "description": "Calculate the nth Fibonacci number",
-                "link": "https://leetcode.com/problems/fibonacci-number/"
-            },
-            {
-                "title": "House Robber",
-                "description": "Maximum money that can be robbed",
-                "link": "https://leetcode.com/problems/house-robber/"
-            },
-            {
-                "title": "Maximum Subarray",
-                "description": "Find the contiguous subarray with the largest sum",
-                "link": "https://leetcode.com/problems/maximum-subarray/"
-            },
-            {
-                "title": "Min Cost Climbing Stairs",
-                "description": "Find minimum cost to reach top of stairs",
-                "link": "https://leetcode.com/problems/min-cost-climbing-stairs/"
-            },
-            {
-                "title": "Pascal's Triangle",
-                "description": "Generate Pascal's triangle",
-                "link": "https://leetcode.com/problems/pascals-triangle/"
-            }
-        ],
-        "intermediate": [
-            {
-                "title": "Coin Change",
-                "description": "Find minimum coins needed for amount",
-                "link": "https://leetcode.com/problems/coin-change/"
-            },
-            {
-                "title": "Longest Increasing Subsequence",
-                "description": "Find length of longest increasing subsequence",
-                "link": "https://leetcode.com/problems/longest-increasing-subsequence/"
-            },
-            {
-                "title": "House Robber II",
-                "description": "House robber with circular arrangement",
-                "link": "https://leetcode.com/problems/house-robber-ii/"
-            },
-            {
-                "title": "Decode Ways",
-                "description": "Count ways to decode numeric string",
-                "link": "https://leetcode.com/problems/decode-ways/"
-            },
-            {
-                "title": "Unique Paths",
-                "description": "Count unique paths in grid",
-                "link": "https://leetcode.com/problems/unique-paths/"
-            },
-            {
-                "title": "Minimum Path Sum",
-                "description": "Find minimum sum path in grid",
-                "link": "https://leetcode.com/problems/minimum-path-sum/"
-            },
-            {
-                "title": "Palindromic Substrings",
-                "description": "Count palindromic substrings",
-                "link": "https://leetcode.com/problems/palindromic-substrings/"
-            },
-            {
-                "title": "0-1 Knapsack Problem",
-                "description": "Classic 0-1 knapsack dynamic programming",
-                "link": "https://www.geeksforgeeks.org/0-1-knapsack-problem-dp-10/"
-            },
-            {
-                "title": "Subset Sum Problem",
-                "description": "Check if subset with given sum exists",
-                "link": "https://www.geeksforgeeks.org/subset-sum-problem-dp-25/"
-            }
-        ],
-        "advanced": [
-            {
-                "title": "Edit Distance",
-                "description": "Minimum operations to convert one string to another",
-                "link": "https://leetcode.com/problems/edit-distance/"
-            },
-            {
-                "title": "Longest Common Subsequence",
-                "description": "Find length of longest common subsequence",
-                "link": "https://leetcode.com/problems/longest-common-subsequence/"
-            },
-            {
-                "title": "Regular Expression Matching",
-                "description": "Implement regular expression matching",
-                "link": "https://leetcode.com/problems/regular-expression-matching/"
-            },
-            {
-                "title": "Best Time to Buy and Sell Stock IV",
-                "description": "Maximum profit with at most k transactions",
-                "link": "https://leetcode.com/problems/best-time-to-buy-and-sell-stock-iv/"
-            },
-            {
-                "title": "Burst Balloons",
-                "description": "Maximum coins from bursting balloons",
-                "link": "https://leetcode.com/problems/burst-balloons/"
-            },
-            {
-                "title": "Longest Palindromic Subsequence",
-                "description": "Find longest palindromic subsequence",
-                "link": "https://leetcode.com/problems/longest-palindromic-subsequence/"
-            }
-        ]
-    },
-    "Graphs": {
-        "beginner": [
-            {
-                "title": "Number of Islands",
-                "description": "Count number of islands in a 2D grid",
-                "link": "https://leetcode.com/problems/number-of-islands/"
-            },
-            {
-                "title": "Flood Fill",
-                "description": "Perform flood fill on 2D image",
-                "link": "https://leetcode.com/problems/flood-fill/"
-            },
-            {
-                "title": "Find Center of Star Graph",
-                "description": "Find center node of star graph",
-                "link": "https://leetcode.com/problems/find-center-of-star-graph/"
-            },
-            {
-                "title": "Find if Path Exists in Graph",
-                "description": "Check if path exists between two nodes",
-                "link": "https://leetcode.com/problems/find-if-path-exists-in-graph/"
-            }
-        ],
-        "intermediate": [
-            {
-                "title": "Course Schedule",
-                "description": "Check if all courses can be finished",
-                "link": "https://leetcode.com/problems/course-schedule/"
-            },
-            {
-                "title": "Clone Graph",
-                "description": "Clone an undirected graph",
-                "link": "https://leetcode.com/problems/clone-graph/"
-            },
-            {
-                "title": "Pacific Atlantic Water Flow",
-                "description": "Find cells where water can flow to both oceans",
-                "link": "https://leetcode.com/problems/pacific-atlantic-water-flow/"
-            },
-            {
-                "title": "Course Schedule II",
-                "description": "Find order to finish all courses",
-                "link": "https://leetcode.com/problems/course-schedule-ii/"
-            },
-            {
-                "title": "Surrounded Regions",
-                "description": "Capture surrounded regions on board",
-                "link": "https://leetcode.com/problems/surrounded-regions/"
-            },
-            {
-                "title": "Rotting Oranges",
-                "description": "Time for all oranges to rot",
-                "link": "https://leetcode.com/problems/rotting-oranges/"
-            },
-            {
-                "title": "Detect Cycle in Undirected Graph",
-                "description": "Detect cycle in undirected graph using DFS/BFS",
-                "link": "https://www.geeksforgeeks.org/detect-cycle-undirected-graph/"
-            }
-        ],
-        "advanced": [
-            {
-                "title": "Word Ladder",
-                "description": "Find shortest transformation sequence",
-                "link": "https://leetcode.com/problems/word-ladder/"
-            },
-            {
-                "title": "Alien Dictionary",
-                "description": "Find order of characters in alien language",
-                "link": "https://leetcode.com/problems/alien-dictionary/"
-            },
-            {
-                "title": "Network Delay Time",
-                "description": "Find time for signal to reach all nodes",
-                "link": "https://leetcode.com/problems/network-delay-time/"
-            },
-            {
-                "title": "Critical Connections in a Network",
-                "description": "Find bridges in graph",
-                "link": "https://leetcode.com/problems/critical-connections-in-a-network/"
-            },
-            {
-                "title": "Shortest Path in Binary Matrix",
-                "description": "Find shortest path in binary matrix",
-                "link": "https://leetcode.com/problems/shortest-path-in-binary-matrix/"
-            }
-        ]
-    },
-    "Binary Search": {
-        "beginner": [
-            {
-                "title": "Binary Search",
-                "description": "Implement binary search algorithm",
-                "link": "https://leetcode.com/problems/binary-search/"
-            },
-            {
-                "title": "Search Insert Position",
-                "description": "Find position to insert target in sorted array",
-                "link": "https://leetcode.com/problems/search-insert-position/"
-            },
-            {
-                "title": "First Bad Version",
-                "description": "Find first bad version using API",
-                "link": "https://leetcode.com/problems/first-bad-version/"
-            },
-            {
-                "title": "Sqrt(x)",
-                "description": "Compute square root of x",
-                "link": "https://leetcode.com/problems/sqrtx/"
-            },
-            {
-                "title": "Guess Number Higher or Lower",
-                "description": "Guess number using binary search",
-                "link": "https://leetcode.com/problems/guess-number-higher-or-lower/"
-            }
-        ],
-        "intermediate": [
-            {
-                "title": "Search in Rotated Sorted Array",
-                "description": "Search element in rotated sorted array",
-                "link": "https://leetcode.com/problems/search-in-rotated-sorted-array/"
-            },
-            {
-                "title": "Find Peak Element",
-                "description": "Find peak element in array",
-                "link": "https://leetcode.com/problems/find-peak-element/"
-            },
-            {
-                "title": "Search a 2D Matrix",
-                "description": "Search target in 2D matrix",
-                "link": "https://leetcode.com/problems/search-a-2d-matrix/"
-            },
-            {
-                "title": "Find First and Last Position of Element",
-                "description": "Find first and last position in sorted array",
-                "link": "https://leetcode.com/problems/find-first-and-last-position-of-element-in-sorted-array/"
-            },
-            {
-                "title": "Search in Rotated Sorted Array II",
-                "description": "Search in rotated array with duplicates",
-                "link": "https://leetcode.com/problems/search-in-rotated-sorted-array-ii/"
-            }
-        ],
-        "advanced": [
-            {
-                "title": "Find Minimum in Rotated Sorted Array",
-                "description": "Find minimum element in rotated sorted array",
-                "link": "https://leetcode.com/problems/find-minimum-in-rotated-sorted-array/"
-            },
-            {
-                "title": "Median of Two Sorted Arrays",
-                "description": "Find median of two sorted arrays",
-                "link": "https://leetcode.com/problems/median-of-two-sorted-arrays/"
-            },
-            {
-                "title": "Kth Smallest Element in a Sorted Matrix",
-                "description": "Find kth smallest element in sorted matrix",
-                "link": "https://leetcode.com/problems/kth-smallest-element-in-a-sorted-matrix/"
-            },
-            {
-                "title": "Aggressive Cows",
-                "description": "Place cows with maximum minimum distance",
-                "link": "https://www.geeksforgeeks.org/aggressive-cows-problem/"
-            },
-            {
-                "title": "Allocate Minimum Number of Pages",
-                "description": "Allocate books to minimize maximum pages",
-                "link": "https://www.geeksforgeeks.org/allocate-minimum-number-pages/"
-            }
-        ]
-    },
-    "Backtracking": {
-        "beginner": [
-            {
-                "title": "Generate Parentheses",
-                "description": "Generate all combinations of well-formed parentheses",
-                "link": "https://leetcode.com/problems/generate-parentheses/"
-            },
-            {
-                "title": "Letter Combinations of a Phone Number",
-                "description": "Generate letter combinations from phone number",
-                "link": "https://leetcode.com/problems/letter-combinations-of-a-phone-number/"
-            },
-            {
-                "title": "Binary Watch",
-                "description": "Find all possible times on binary watch",
-                "link": "https://leetcode.com/problems/binary-watch/"
-            }
-        ],
-        "intermediate": [
-            {
-                "title": "Permutations",
-                "description": "Generate all permutations of array",
-                "link": "https://leetcode.com/problems/permutations/"
-            },
-            {
-                "title": "Subsets",
-                "description": "Generate all possible subsets",
-                "link": "https://leetcode.com/problems/subsets/"
-            },
-            {
-                "title": "Combination Sum",
-                "description": "Find combinations that sum to target",
-                "link": "https://leetcode.com/problems/combination-sum/"
-            },
-            {
-                "title": "Word Search",
-                "description": "Search for word in 2D board",
-                "link": "https://leetcode.com/problems/word-search/"
-            },
-            {
-                "title": "Palindrome Partitioning",
-                "description": "Partition string into palindromes",
-                "link": "https://leetcode.com/problems/palindrome-partitioning/"
-            },
-            {
-                "title": "Combination Sum II",
-                "description": "Find unique combinations that sum to target",
-                "link": "https://leetcode.com/problems/combination-sum-ii/"
-            }
-        ],
-        "advanced": [
-            {
-                "title": "N-Queens",
-                "description": "Solve the N-Queens puzzle",
-                "link": "https://leetcode.com/problems/n-queens/"
-            },
-            {
-                "title": "Sudoku Solver",
-                "description": "Solve sudoku puzzle",
-                "link": "https://leetcode.com/problems/sudoku-solver/"
-            },
-            {
-                "title": "Word Search II",
-                "description": "Find all words from dictionary in board",
-                "link": "https://leetcode.com/problems/word-search-ii/"
-            },
-            {
-                "title": "Rat in a Maze",
-                "description": "Find path for rat to reach destination",
-                "link": "https://www.geeksforgeeks.org/rat-in-a-maze-backtracking-2/"
-            },
-            {
-                "title": "M-Coloring Problem",
-                "description": "Color graph with m colors",
-                "link": "https://www.geeksforgeeks.org/m-coloring-problem-backtracking-5/"
-            }
-        ]
-    },
-    "Stacks": {
-        "beginner": [
-            {
-                "title": "Valid Parentheses",
-                "description": "Check if parentheses are valid",
-                "link": "https://leetcode.com/problems/valid-parentheses/"
-            },
-            {
-                "title": "Implement Queue using Stacks",
-                "description": "Implement queue using stack operations",
-                "link": "https://leetcode.com/problems/implement-queue-using-stacks/"
-            },
-            {
-                "title": "Remove All Adjacent Duplicates In String",
-                "description": "Remove adjacent duplicates using stack",
-                "link": "https://leetcode.com/problems/remove-all-adjacent-duplicates-in-string/"
-            },
-            {
-                "title": "Baseball Game",
-                "description": "Calculate baseball game score using stack",
-                "link": "https://leetcode.com/problems/baseball-game/"
-            }
-        ],
-        "intermediate": [
-            {
-                "title": "Min Stack",
-                "description": "Design stack with min operation",
-                "link": "https://leetcode.com/problems/min-stack/"
-            },
-            {
-                "title": "Evaluate Reverse Polish Notation",
-                "description": "Evaluate expression in reverse polish notation",
-                "link": "https://leetcode.com/problems/evaluate-reverse-polish-notation/"
-            },
-            {
-                "title": "Daily Temperatures",
-                "description": "Find next warmer temperature for each day",
-                "link": "https://leetcode.com/problems/daily-temperatures/"
-            },
-            {
-                "title": "Next Greater Element I",
-                "description": "Find next greater element using stack",
-                "link": "https://leetcode.com/problems/next-greater-element-i/"
-            },
-            {
-                "title": "Next Greater Element II",
-                "description": "Next greater in circular array",
-                "link": "https://leetcode.com/problems/next-greater-element-ii/"
-            },
-            {
-                "title": "Asteroid Collision",
-                "description": "Simulate asteroid collisions",
-                "link": "https://leetcode.com/problems/asteroid-collision/"
-            }
-        ],
-        "advanced": [
-            {
-                "title": "Largest Rectangle in Histogram",
-                "description": "Find largest rectangle area in histogram",
-                "link": "https://leetcode.com/problems/largest-rectangle-in-histogram/"
-            },
-            {
-                "title": "Trapping Rain Water",
-                "description": "Calculate trapped rain water",
-                "link": "https://leetcode.com/problems/trapping-rain-water/"
-            },
-            {
-                "title": "Maximal Rectangle",
-                "description": "Find largest rectangle in binary matrix",
-                "link": "https://leetcode.com/problems/maximal-rectangle/"
-            },
-            {
-                "title": "Sum of Subarray Minimums",
-                "description": "Sum of minimum of all subarrays",
-                "link": "https://leetcode.com/problems/sum-of-subarray-minimums/"
-            }
-        ]
-    },
-    "Heaps": {
-        "beginner": [
-            {
-                "title": "Kth Largest Element in an Array",
-                "description": "Find kth largest element using heap",
-                "link": "https://leetcode.com/problems/kth-largest-element-in-an-array/"
-            },
-            {
-                "title": "Last Stone Weight",
-                "description": "Simulate stone smashing game",
-                "link": "https://leetcode.com/problems/last-stone-weight/"
-            },
-            {
-                "title": "K Closest Points to Origin",
-                "description": "Find k closest points using heap",
-                "link": "https://leetcode.com/problems/k-closest-points-to-origin/"
-            }
-        ],
-        "intermediate": [
-            {
-                "title": "Top K Frequent Elements",
-                "description": "Find k most frequent elements",
-                "link": "https://leetcode.com/problems/top-k-frequent-elements/"
-            },
-            {
-                "title": "Merge k Sorted Lists",
-                "description": "Merge k sorted linked lists using heap",
-                "link": "https://leetcode.com/problems/merge-k-sorted-lists/"
-            },
-            {
-                "title": "Find Median from Data Stream",
-                "description": "Find median using two heaps",
-                "link": "https://leetcode.com/problems/find-median-from-data-stream/"
-            },
-            {
-                "title": "Kth Smallest Element in a Sorted Matrix",
-                "description": "Find kth smallest using heap",
-                "link": "https://leetcode.com/problems/kth-smallest-element-in-a-sorted-matrix/"
-            }
-        ],
-        "advanced": [
-            {
-                "title": "Sliding Window Maximum",
-                "description": "Maximum in sliding window using heap",
-                "link": "https://leetcode.com/problems/sliding-window-maximum/"
-            },
-            {
-                "title": "IPO",
-                "description": "Maximize capital using heaps",
-                "link": "https://leetcode.com/problems/ipo/"
-            },
-            {
-                "title": "Smallest Range Covering Elements from K Lists",
-                "description": "Find smallest range using heap",
-                "link": "https://leetcode.com/problems/smallest-range-covering-elements-from-k-lists/"
-            }
-        ]
-    }
-}
+import atexit
+import datetime
+import os
+import tempfile
+import threading
+import time
+from typing import Iterable, Mapping, Optional
+
+from .autocomplete import PrefixIndex, build_index
+from .catalog import ProblemCatalog, canonical_problem_id
+from .daily_mix import DailyMixSampler, topic_importance
+from .database import SQLiteProblemStore
+from .importer import LEVEL_ALIASES
+from .pagination import decode_cursor, page_result, paginate
+from .practice import build_balanced_set, build_practice_set
+from .ratings import RatingIndex
+from .recommend import LearnerProfile, ProblemRecommender
+from .reviews import ReviewScheduler
+from .related import RelatedProblemIndex
+from .render import ProblemCards, render_card
+from .search import ProblemSearchIndex
+from .shards import ShardedProblemStore
+from .stats import ProblemStats
+from .tags import TagIndex
+from .topic_data import TOPIC_ALIASES, TOPIC_DEPENDENCIES
+
+# SQLite database, shard directory and how many topic shards stay in memory
+PROBLEM_DB_ENV = "DSA_PROBLEM_DB"
+PROBLEM_SHARDS_ENV = "DSA_PROBLEM_SHARDS"
+RESIDENT_SHARDS_ENV = "DSA_RESIDENT_SHARDS"
+# File the review scheduler is saved to, and the least seconds between two saves
+REVIEW_STATE_ENV = "DSA_REVIEW_STATE"
+REVIEW_SAVE_INTERVAL = 30.0
+
+_problems_data = None
+_database = None
+_shard_store = None
+_modified = False
+_catalog = None
+_search_index = None
+_autocomplete_index = None
+_stats = None
+_recommender = None
+_rating_index = None
+_tag_index = None
+_related_index = None
+_daily_mix_sampler = None
+_review_scheduler = None
+# Serializes loading the scheduler and writing its state file across sessions
+_review_lock = threading.Lock()
+# When the state file was last written, and the timer of a save put off until the interval ends
+_review_saved_at = float("-inf")
+_review_save_timer = None
+_problem_cards = None
+
+def get_problem_database():
+    """
+    SQLite problem database named by DSA_PROBLEM_DB, opened on first use
+    
+    Returns:
+        SQLiteProblemStore, or None when no database is configured
+    """
+    global _database
+    path = os.environ.get(PROBLEM_DB_ENV)
+    if not path:
+        return None
+    if _database is None:
+        _database = SQLiteProblemStore(path)
+    return _database
+
+def get_shard_store():
+    """
+    Shard store named by DSA_PROBLEM_SHARDS, opened on first use
+    
+    Returns:
+        ShardedProblemStore, or None when shards are not configured or the
+        problems were changed in this process
+    """
+    global _shard_store
+    directory = os.environ.get(PROBLEM_SHARDS_ENV)
+    if not directory or _modified or get_problem_database() is not None:
+        return None
+    if _shard_store is None:
+        _shard_store = ShardedProblemStore(directory, int(os.environ.get(RESIDENT_SHARDS_ENV, "8")))
+    return _shard_store
+
+def get_problems_data():
+    """Nested topic -> level -> problems data, loaded on first use"""
+    global _problems_data
+    if _problems_data is None:
+        database = get_problem_database()
+        store = get_shard_store()
+        if database is not None:
+            _problems_data = database.load_all()
+        elif store is not None:
+            _problems_data = store.load_all()
+        else:
+            from .problem_bank import PROBLEMS_DATA
+            _problems_data = PROBLEMS_DATA
+    return _problems_data
+
+def __getattr__(name):
+    # PROBLEMS_DATA stays importable from here without loading it at import time
+    if name == "PROBLEMS_DATA":
+        return get_problems_data()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def get_problem_catalog() -> ProblemCatalog:
+    """Compiled catalog of all problems, built on first use"""
+    global _catalog
+    if _catalog is None:
+        _catalog = ProblemCatalog(get_problems_data())
+    return _catalog
+
+def get_problem_stats() -> ProblemStats:
+    """Problem counts, computed once and then kept up to date by add_problem/remove_problem"""
+    global _stats
+    if _stats is None:
+        _stats = ProblemStats.from_catalog(get_problem_catalog())
+    return _stats
+
+def _invalidate_indexes():
+    """Drop compiled indexes after the problems changed; they are rebuilt on next use"""
+    global _modified, _catalog, _search_index, _autocomplete_index, _recommender, _rating_index, _tag_index, \
+        _related_index, _daily_mix_sampler, _problem_cards
+    # Shards no longer match the data, so all queries go through the catalog
+    _modified = True
+    _catalog = None
+    _search_index = None
+    _autocomplete_index = None
+    _recommender = None
+    _rating_index = None
+    _tag_index = None
+    _related_index = None
+    _daily_mix_sampler = None
+    _problem_cards = None
+
+def _reload_from_database():
+    """Drop every in-memory copy after the database changed; each reloads from it on next use"""
+    global _problems_data, _stats
+    _problems_data = None
+    _stats = None
+    _invalidate_indexes()
+
+def add_problem(topic: str, level: str, problem: dict):
+    """
+    Add a problem to a topic and level
+    
+    Args:
+        topic: DSA topic name
+        level: Difficulty level (beginner, intermediate, advanced)
+        problem: Problem dictionary with title, description and link
+    """
+    database = get_problem_database()
+    if database is not None:
+        database.add_problem(topic, level, problem)
+        _reload_from_database()
+        return
+    stats = get_problem_stats()
+    get_problems_data().setdefault(topic, {}).setdefault(level, []).append(problem)
+    stats.add(topic, level, canonical_problem_id(problem["title"], problem.get("link")))
+    _invalidate_indexes()
+
+def remove_problem(topic: str, level: str, title: str) -> bool:
+    """
+    Remove a problem from a topic and level by title
+    
+    Args:
+        topic: DSA topic name
+        level: Difficulty level
+        title: Problem title
+    
+    Returns:
+        True if a problem was removed
+    """
+    database = get_problem_database()
+    if database is not None:
+        removed = database.remove_problem(topic, level, title)
+        if removed:
+            _reload_from_database()
+        return removed
+    problems = get_problems_data().get(topic, {}).get(level, [])
+    for i, problem in enumerate(problems):
+        if problem["title"] == title:
+            stats = get_problem_stats()
+            del problems[i]
+            stats.remove(topic, level, canonical_problem_id(problem["title"], problem.get("link")))
+            _invalidate_indexes()
+            return True
+    return False
+
+def get_problem_cards() -> ProblemCards:
+    """Display fragments of the catalog's records, each kept after its first use until the catalog changes"""
+    global _problem_cards
+    if _problem_cards is None:
+        _problem_cards = ProblemCards(get_problem_catalog())
+    return _problem_cards
+
+def get_problem_card(problem):
+    """
+    Get a problem's display fragments: expander labels and markdown body
+    
+    Args:
+        problem: Problem record or dictionary
+    
+    Returns:
+        ProblemCard, kept for records of the compiled catalog and rendered on the spot otherwise
+    """
+    if _catalog is None:
+        # Shard and database pages must not pull in the full catalog just to be displayed
+        return render_card(problem)
+    return get_problem_cards().card(problem)
+
+def get_problem_search_index() -> ProblemSearchIndex:
+    """Full-text index over the compiled catalog, built once on first use"""
+    global _search_index
+    if _search_index is None:
+        _search_index = ProblemSearchIndex(get_problem_catalog())
+    return _search_index
+
+def get_autocomplete_index() -> PrefixIndex:
+    """Type-ahead index over topics, aliases and problem titles, built once on first use"""
+    global _autocomplete_index
+    if _autocomplete_index is None:
+        titles = (problem.title for problem in get_problem_catalog())
+        _autocomplete_index = build_index(TOPIC_DEPENDENCIES, TOPIC_ALIASES, titles)
+    return _autocomplete_index
+
+def get_problem_recommender() -> ProblemRecommender:
+    """Recommender over the compiled catalog and the curriculum, built once on first use"""
+    global _recommender
+    if _recommender is None:
+        _recommender = ProblemRecommender(get_problem_catalog(), TOPIC_DEPENDENCIES)
+    return _recommender
+
+def recommend_problems(solved: Mapping[str, float], known_topics: Iterable[str] = (), k: int = 10,
+                       topics: Optional[Iterable[str]] = None, per_topic: Optional[int] = None):
+    """
+    Get personalized next problems for a learner
+    
+    Args:
+        solved: Canonical ids of solved problems mapped to when they were solved (epoch seconds)
+        known_topics: Topics the learner already knows
+        k: Number of problems
+        topics: Only recommend from these topics, e.g. a learning path
+        per_topic: Most problems any one topic contributes
+    
+    Returns:
+        Recommended problems, best first, each distinct problem once
+    """
+    recommender = get_problem_recommender()
+    profile = LearnerProfile.from_solved(recommender.catalog, solved, known_topics)
+    return [problem for problem, _ in recommender.recommend(profile, k, topics=topics, per_topic=per_topic)]
+
+def get_daily_mix_sampler() -> DailyMixSampler:
+    """Alias table over (topic, level) cells weighted by curriculum importance, built once on first use"""
+    global _daily_mix_sampler
+    if _daily_mix_sampler is None:
+        _daily_mix_sampler = DailyMixSampler(get_problem_catalog(), topic_importance(TOPIC_DEPENDENCIES))
+    return _daily_mix_sampler
+
+def get_daily_mix(user: str, solved: Iterable[str] = (), k: int = 5, day: datetime.date = None):
+    """
+    Get a learner's randomized problem mix for a day
+    
+    Args:
+        user: Learner id; the same learner gets the same mix all day
+        solved: Canonical ids of solved problems, left out of the mix
+        k: Number of problems
+        day: Date of the mix (default today)
+    
+    Returns:
+        Up to k distinct problems, weighted towards prerequisite-heavy topics and intermediate level
+    """
+    sampler = get_daily_mix_sampler()
+    problem_ids = (sampler.catalog.problem_id(canonical_id) for canonical_id in solved)
+    return sampler.daily_mix(user, k, {problem_id for problem_id in problem_ids if problem_id >= 0}, day)
+
+def get_review_scheduler() -> ReviewScheduler:
+    """Process-wide review scheduler, loaded from DSA_REVIEW_STATE on first use if the file exists"""
+    global _review_scheduler
+    if _review_scheduler is None:
+        with _review_lock:
+            if _review_scheduler is None:
+                path = os.environ.get(REVIEW_STATE_ENV)
+                if path and os.path.exists(path):
+                    with open(path, "rb") as stream:
+                        _review_scheduler = ReviewScheduler.load(stream)
+                else:
+                    _review_scheduler = ReviewScheduler()
+                if path:
+                    # Write reviews still waiting for their save when the process exits
+                    atexit.register(_flush_review_state)
+    return _review_scheduler
+
+def save_review_state(force: bool = False):
+    """
+    Write the review scheduler to DSA_REVIEW_STATE, if set, replacing the file atomically
+
+    Saves are at least REVIEW_SAVE_INTERVAL seconds apart: one asked for sooner
+    is put off until the interval ends and then writes every review since.
+
+    Args:
+        force: Write now, regardless of the interval
+    """
+    global _review_saved_at, _review_save_timer
+    path = os.environ.get(REVIEW_STATE_ENV)
+    if not path or _review_scheduler is None:
+        return
+    # One save at a time, so an older state never replaces a newer one; each save
+    # still writes its own temporary file next to the target
+    with _review_lock:
+        wait = _review_saved_at + REVIEW_SAVE_INTERVAL - time.monotonic()
+        if not force and wait > 0:
+            if _review_save_timer is None:
+                _review_save_timer = threading.Timer(wait, save_review_state, kwargs={"force": True})
+                _review_save_timer.daemon = True
+                _review_save_timer.start()
+            return
+        if _review_save_timer is not None:
+            _review_save_timer.cancel()
+            _review_save_timer = None
+        descriptor, temporary = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.",
+                                                 dir=os.path.dirname(os.path.abspath(path)))
+        try:
+            with os.fdopen(descriptor, "wb") as stream:
+                _review_scheduler.dump(stream)
+            os.replace(temporary, path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+        _review_saved_at = time.monotonic()
+
+def _flush_review_state():
+    if _review_save_timer is not None:
+        save_review_state(force=True)
+
+def get_due_reviews(learner: str, solved: Mapping[str, float] = None, now: float = None, limit: int = 10,
+                    scheduler: Optional[ReviewScheduler] = None):
+    """
+    Get a learner's solved problems that are due for review
+    
+    Args:
+        learner: Learner id
+        solved: Canonical ids of solved problems mapped to when they were solved; problems
+            not scheduled yet get their first review a day after the solve
+        now: Current time (epoch seconds, default now)
+        limit: Most problems
+        scheduler: Scheduler of an anonymous learner (default the process-wide one)
+    
+    Returns:
+        List of (problem, card) tuples, most overdue first; problems no longer in the catalog are skipped
+    """
+    if scheduler is None:
+        scheduler = get_review_scheduler()
+    for canonical_id, solved_at in (solved or {}).items():
+        scheduler.add(learner, canonical_id, solved_at)
+    catalog = get_problem_catalog()
+    problems = catalog.unique_problems()
+    due = []
+    for canonical_id, card in scheduler.due(learner, time.time() if now is None else now):
+        problem_id = catalog.problem_id(canonical_id)
+        if problem_id >= 0:
+            due.append((problems[problem_id], card))
+            if len(due) == limit:
+                break
+    return due
+
+def record_review(learner: str, canonical_id: str, quality: int, now: float = None,
+                  scheduler: Optional[ReviewScheduler] = None):
+    """
+    Grade a review of a solved problem and schedule the next one
+    
+    Args:
+        learner: Learner id
+        canonical_id: Canonical id of the problem
+        quality: Grade 0-5 (below 3 means it was not recalled)
+        now: Review time (epoch seconds, default now)
+        scheduler: Scheduler of an anonymous learner, which is not saved (default the process-wide one)
+    
+    Returns:
+        The problem's rescheduled card
+    """
+    if scheduler is not None:
+        return scheduler.review(learner, canonical_id, quality, time.time() if now is None else now)
+    card = get_review_scheduler().review(learner, canonical_id, quality, time.time() if now is None else now)
+    save_review_state()
+    return card
+
+def remove_review(learner: str, canonical_id: str, scheduler: Optional[ReviewScheduler] = None) -> bool:
+    """Stop reviewing a problem, e.g. after it was marked unsolved; returns whether it was scheduled"""
+    if scheduler is not None:
+        return scheduler.remove(learner, canonical_id)
+    removed = get_review_scheduler().remove(learner, canonical_id)
+    if removed:
+        save_review_state()
+    return removed
+
+def get_rating_index() -> RatingIndex:
+    """Rated problems sorted by rating per topic, built once on first use"""
+    global _rating_index
+    if _rating_index is None:
+        _rating_index = RatingIndex(get_problem_catalog())
+    return _rating_index
+
+def get_problems_by_rating(topic: str = None, low: float = float("-inf"), high: float = float("inf"),
+                           limit: int = None):
+    """
+    Get problems rated within a range
+    
+    Args:
+        topic: DSA topic name (None for all topics)
+        low: Lowest rating
+        high: Highest rating
+        limit: Maximum number of problems
+    
+    Returns:
+        Rated problems with low <= rating <= high, easiest first, each distinct problem once
+    """
+    return get_rating_index().in_range(topic, low, high, limit)
+
+def get_problems_near_rating(topic: str, rating: float, k: int = 10):
+    """
+    Get the problems rated closest to a rating
+    
+    Args:
+        topic: DSA topic name (None for all topics)
+        rating: Target rating
+        k: Number of problems
+    
+    Returns:
+        Up to k rated problems, closest first
+    """
+    return get_rating_index().closest(topic, rating, k)
+
+def get_tag_index() -> TagIndex:
+    """Compressed bitmaps per topic, level, platform and tag, built once on first use"""
+    global _tag_index
+    if _tag_index is None:
+        _tag_index = TagIndex(get_problem_catalog(), TOPIC_DEPENDENCIES, {**TOPIC_ALIASES, **LEVEL_ALIASES})
+    return _tag_index
+
+def filter_problems(expression: str, solved: Iterable[str] = (), limit: int = 50):
+    """
+    Get problems matching a boolean query over topics, levels, platforms and tags
+    
+    Args:
+        expression: e.g. "(Heaps OR Queues) AND advanced AND NOT solved"
+        solved: Canonical ids of the learner's solved problems, for the "solved" term
+        limit: Maximum number of problems
+    
+    Returns:
+        Matching problems in catalog order, each distinct problem once
+    
+    Raises:
+        ValueError: If the query is malformed or names an unknown term
+    """
+    index = get_tag_index()
+    return index.problems(expression, index.solved_bitmap(solved), limit)
+
+def get_related_index() -> RelatedProblemIndex:
+    """MinHash/LSH buckets of similar problems, built once on first use"""
+    global _related_index
+    if _related_index is None:
+        _related_index = RelatedProblemIndex(get_problem_catalog())
+    return _related_index
+
+def get_related_problems(link: str, title: str = "", k: int = 5, min_similarity: float = 0.2):
+    """
+    Get the problems most similar to one problem
+    
+    Args:
+        link: Practice link of the problem
+        title: Problem title, identifying problems without a link
+        k: Number of problems
+        min_similarity: Lowest Jaccard similarity of title, description, tag and topic features
+    
+    Returns:
+        Up to k (problem, similarity) pairs, most similar first
+    """
+    return get_related_index().related_to(canonical_problem_id(title, link), k, min_similarity)
 
-def get_problems_by_topic_and_level(topic: str, level: str = "all"):
+def get_practice_set(path, level_mix=None, per_topic_quota=None, exclude=(), page: int = 1, page_size: int = 20):
+    """
+    Get one page of a de-duplicated practice set spanning a whole learning path
+    
+    Args:
+        path: Topics in learning order
+        level_mix: Levels to include mapped to problems per topic (None for all), e.g. {"beginner": 2, "intermediate": 1}
+        per_topic_quota: Most problems any one topic contributes
+        exclude: Problem ids to leave out
+        page: 1-based page number
+        page_size: Problems per page
+    
+    Returns:
+        Dictionary with the page's problems, page, page_size, total and pages
+    """
+    return build_practice_set(get_problem_catalog(), path, level_mix, per_topic_quota, exclude, page, page_size)
+
+def get_balanced_practice_set(path, size: int, level_shares=None, min_per_topic: int = 0, max_per_topic: int = None,
+                              exclude: Iterable[str] = ()):
+    """
+    Get a practice set of a given size over a learning path under topic and level quotas
+    
+    Args:
+        path: Topics in learning order
+        size: Number of problems
+        level_shares: Share of the set per level, e.g. {"intermediate": 0.4}
+        min_per_topic: Fewest problems per path topic
+        max_per_topic: Most problems per path topic
+        exclude: Canonical ids of problems to leave out, e.g. those solved last week
+    
+    Returns:
+        Dictionary with the problems, level_targets, level_counts, topic_counts and shortfalls
+    
+    Raises:
+        ValueError: If the quotas contradict each other
+    """
+    catalog = get_problem_catalog()
+    problem_ids = (catalog.problem_id(canonical_id) for canonical_id in exclude)
+    return build_balanced_set(catalog, path, size, level_shares, min_per_topic, max_per_topic,
+                              [problem_id for problem_id in problem_ids if problem_id >= 0])
+
+def search_problems(query: str, limit: int = 10):
+    """
+    Search problem titles and descriptions
+    
+    Args:
+        query: Free text; the last word also matches as a prefix
+        limit: Maximum number of results
+    
+    Returns:
+        Best matching problems, most relevant first, each distinct problem once
+    """
+    # Fetch extra hits, since listings of one problem under several topics score alike
+    database = get_problem_database()
+    if database is not None and database.has_fts:
+        hits = database.search(query, limit * 2)
+    else:
+        hits = [problem for problem, _ in get_problem_search_index().search(query, limit * 2)]
+    problems = []
+    seen = set()
+    for problem in hits:
+        if problem.problem_id not in seen:
+            seen.add(problem.problem_id)
+            problems.append(problem)
+    return problems[:limit]
+
+def get_problems_by_topic_and_level(topic: str, level: str = "all", dedup: bool = False):
     """
     Get problems filtered by topic and difficulty level
     
+    Levels are the stored ones, also for rated problems; get_rating_index().problems(topic, level)
+    lists a topic's rated problems by the level their rating falls in.
+    
     Args:
         topic: DSA topic name
         level: Difficulty level (beginner, intermediate, advanced, all)
+        dedup: List a problem only once even if it appears under several levels
     
     Returns:
-        List of problems matching the criteria
+        Read-only sequence of problem records matching the criteria
     """
-    if topic not in PROBLEMS_DATA:
-        return []
-    
-    topic_problems = PROBLEMS_DATA[topic]
+    database = get_problem_database()
+    if database is not None:
+        return database.problems(topic, level, dedup)
+    store = get_shard_store()
+    if store is not None:
+        return store.problems(topic, level, dedup)
+    return get_problem_catalog().problems(topic, level, dedup)
+
+def get_problem_page(topic: str, level: str = "all", cursor: str = None, page_size: int = 20,
+                     dedup: bool = False):
+    """
+    Get one page of a topic's problems
     
-    if level == "all":
-        all_problems = []
-        for diff_level in ["beginner", "intermediate", "advanced"]:
-            if diff_level in topic_problems:
-                problems_with_level = []
-                for problem in topic_problems[diff_level]:
-                    problem_copy = problem.copy()
-                    problem_copy["level"] = diff_level
-                    problems_with_level.append(problem_copy)
-                all_problems.extend(problems_with_level)
-        return all_problems
+    Args:
+        topic: DSA topic name
+        level: Difficulty level (beginner, intermediate, advanced, all)
+        cursor: Opaque next_cursor of the previous page (None for the first page)
+        page_size: Problems per page
+        dedup: List a problem only once even if it appears under several levels
     
-    if level in topic_problems:
-        problems_with_level = []
-        for problem in topic_problems[level]:
-            problem_copy = problem.copy()
-            problem_copy["level"] = level
-            problems_with_level.append(problem_copy)
-        return problems_with_level
+    Returns:
+        Dictionary with the page's problems, start (0-based position of the
+        first one), total and next_cursor (None on the last page)
     
-    return []
+    Raises:
+        ValueError: If the cursor is malformed, belongs to another listing or
+            was made before problems were added or removed (in-memory data)
+    """
+    page_size = max(1, page_size)
+    database = get_problem_database()
+    if database is not None:
+        # Seek to the cursor in SQL instead of loading the whole topic
+        after, start = decode_cursor(cursor, topic, level, dedup) if cursor is not None else ((-1, -1), 0)
+        window = database.problems_after(topic, level, after, page_size + 1, dedup)
+        page = page_result(window, topic, level, dedup, start, page_size)
+    else:
+        # Shards never change; catalog record indexes shift with edits, so its cursors carry a revision
+        revision = 0 if get_shard_store() is not None else get_problem_catalog().revision(topic)
+        page = paginate(get_problems_by_topic_and_level(topic, level, dedup), topic, level, dedup, cursor, page_size,
+                        revision)
+    page["total"] = get_problem_count(topic, level, dedup)
+    return page
 
 def get_available_topics_for_problems():
     """Get all topics that have problems available"""
-    return list(PROBLEMS_DATA.keys())
+    database = get_problem_database()
+    if database is not None:
+        return database.topics()
+    store = get_shard_store()
+    if store is not None:
+        return store.topics()
+    return list(get_problems_data().keys())
 
 def get_difficulty_levels():
     """Get all available difficulty levels"""
     return ["beginner", "intermediate", "advanced", "all"]
 
-def get_problem_count_by_topic():
-    """Get count of problems for each topic"""
-    counts = {}
-    for topic, levels in PROBLEMS_DATA.items():
-        total_count = 0
-        for level, problems in levels.items():
-            total_count += len(problems)
-        counts[topic] = total_count
-    return counts 
\ No newline at end of file
+def get_problem_count_by_topic(dedup: bool = False):
+    """Get count of problems for each topic (distinct problems if dedup), as a read-only mapping"""
+    database = get_problem_database()
+    if database is not None:
+        return database.counts_by_topic(dedup)
+    store = get_shard_store()
+    if store is not None:
+        return store.counts_by_topic(dedup)
+    return get_problem_stats().counts_by_topic(dedup)
+
+def get_problem_count(topic: str = None, level: str = "all", dedup: bool = False):
+    """Get the number of problems of a topic and/or level without listing them"""
+    database = get_problem_database()
+    if database is not None:
+        return database.count(topic, level, dedup)
+    store = get_shard_store()
+    if store is not None and topic is not None:
+        return store.count(topic, level, dedup)
+    return get_problem_stats().count(topic, level, dedup)
+
+def get_unique_problem_count():
+    """Get the number of distinct problems across all topics"""
+    database = get_problem_database()
+    if database is not None:
+        return database.unique_count()
+    store = get_shard_store()
+    if store is not None:
+        return store.unique_count()
+    return get_problem_stats().count(dedup=True)
+
+def get_problem_placements(link: str):
+    """
+    Get every topic and level a problem is listed under
+    
+    Args:
+        link: Any form of the problem's link
+    
+    Returns:
+        List of (topic, level) pairs, empty if the problem is unknown
+    """
+    database = get_problem_database()
+    if database is not None:
+        return database.placements(link)
+    catalog = get_problem_catalog()
+    problem_id = catalog.problem_id_for_link(link)
+    return catalog.placements(problem_id) if problem_id >= 0 else []
@@ -0,0 +1,131 @@
+"""
+Difficulty Ratings
+Range and nearest-rating queries over problems' optional numeric ratings
+
+Ratings are on a contest-style scale (e.g. 800 to 3500). The index keeps,
+per topic and for all topics together, the rated problems sorted by
+rating next to a parallel list of their ratings, so "problems rated
+1400-1600 in Dynamic Programming" is two bisects and a slice, O(log n + k),
+and the problems closest to a rating are found by walking outwards from one
+bisect. Each distinct problem appears once per topic, at its first listing.
+
+Levels map onto ratings through cutoffs: a level is a rating range, so
+problems of a level are a slice of the same sorted lists rather than a
+second copy of them (RatingIndex.problems). level_for_rating gives the
+level of a rating, e.g. for imported problems that come with a rating but
+no level.
+
+The stored level stays authoritative everywhere else: per-topic lists,
+counts, page cursors and problem edits key on it in every backend, and
+the bundled problems have no ratings. A rated problem whose stored level
+disagrees with its rating keeps the stored one in the level API
+(get_problems_by_topic_and_level); RatingIndex.problems and level_of
+give the level its rating falls in.
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .catalog import LEVELS, Problem, ProblemCatalog
+
+# Lowest rating of each level above beginner
+LEVEL_CUTOFFS = (1200.0, 1800.0)
+
+def level_for_rating(rating: float, cutoffs: Sequence[float] = LEVEL_CUTOFFS) -> str:
+    """Difficulty level a rating falls in"""
+    return LEVELS[bisect_right(cutoffs, rating)]
+
+def rating_bounds(level: str, cutoffs: Sequence[float] = LEVEL_CUTOFFS) -> Tuple[float, float]:
+    """Rating range [low, high) of a level ("all" for every rating)"""
+    if level == "all":
+        return float("-inf"), float("inf")
+    if level not in LEVELS:
+        raise ValueError(f"Unknown level '{level}'. Choose from: {', '.join(LEVELS)}, all")
+    rank = LEVELS.index(level)
+    low = cutoffs[rank - 1] if rank > 0 else float("-inf")
+    high = cutoffs[rank] if rank < len(cutoffs) else float("inf")
+    return low, high
+
+class RatingIndex:
+    """Rated problems sorted by rating, per topic and across all topics"""
+
+    def __init__(self, catalog: ProblemCatalog, cutoffs: Sequence[float] = LEVEL_CUTOFFS):
+        """
+        Args:
+            catalog: Compiled problem catalog
+            cutoffs: Lowest rating of each level above beginner, ascending
+        """
+        if len(cutoffs) != len(LEVELS) - 1 or list(cutoffs) != sorted(cutoffs):
+            raise ValueError(f"Expected {len(LEVELS) - 1} ascending level cutoffs")
+        self.catalog = catalog
+        self.cutoffs = tuple(cutoffs)
+        # topic (None for all topics) -> (ratings ascending, problems in the same order)
+        self._sorted: Dict[Optional[str], Tuple[List[float], Tuple[Problem, ...]]] = {}
+        for topic in catalog.topics():
+            self._sorted[topic] = self._sort(catalog.problems(topic, dedup=True))
+        self._sorted[None] = self._sort(catalog.unique_problems())
+
+    @staticmethod
+    def _sort(problems: Sequence[Problem]) -> Tuple[List[float], Tuple[Problem, ...]]:
+        # Stable sort, so equal ratings keep catalog order
+        rated = sorted((problem for problem in problems if problem.rating is not None), key=lambda p: p.rating)
+        return [problem.rating for problem in rated], tuple(rated)
+
+    def count(self, topic: Optional[str] = None, low: float = float("-inf"), high: float = float("inf")) -> int:
+        """Rated problems of a topic (None for all topics) with low <= rating <= high"""
+        ratings, _ = self._sorted.get(topic, ([], ()))
+        return max(0, bisect_right(ratings, high) - bisect_left(ratings, low))
+
+    def in_range(self, topic: Optional[str], low: float = float("-inf"), high: float = float("inf"),
+                 limit: Optional[int] = None) -> Tuple[Problem, ...]:
+        """
+        Problems rated low <= rating <= high, easiest first
+
+        Args:
+            topic: DSA topic name (None for all topics)
+            low: Lowest rating
+            high: Highest rating
+            limit: Return at most this many
+
+        Returns:
+            Problems in rating order, each distinct problem once
+        """
+        ratings, problems = self._sorted.get(topic, ([], ()))
+        start = bisect_left(ratings, low)
+        stop = bisect_right(ratings, high)
+        if limit is not None:
+            stop = min(stop, start + limit)
+        return problems[start:stop] if start < stop else ()
+
+    def closest(self, topic: Optional[str], rating: float, k: int = 1) -> List[Problem]:
+        """
+        The k problems rated closest to a rating, closest first
+
+        Ties go to the easier problem, then to catalog order.
+        """
+        ratings, problems = self._sorted.get(topic, ([], ()))
+        right = bisect_left(ratings, rating)
+        left = right - 1
+        result = []
+        while len(result) < k and (left >= 0 or right < len(ratings)):
+            if right >= len(ratings) or (left >= 0 and rating - ratings[left] <= ratings[right] - rating):
+                # Equal ratings sit together; take the whole run below in catalog order
+                start = bisect_left(ratings, ratings[left], 0, left + 1)
+                result.extend(problems[start:left + 1])
+                left = start - 1
+            else:
+                result.append(problems[right])
+                right += 1
+        return result[:k]
+
+    def problems(self, topic: Optional[str], level: str = "all") -> Tuple[Problem, ...]:
+        """Rated problems of a topic whose rating falls in a level's range, easiest first"""
+        low, high = rating_bounds(level, self.cutoffs)
+        ratings, problems = self._sorted.get(topic, ([], ()))
+        start = bisect_left(ratings, low)
+        stop = bisect_left(ratings, high)
+        return problems[start:stop]
+
+    def level_of(self, problem: Problem) -> Optional[str]:
+        """Level a problem's rating falls in (None if it has no rating)"""
+        return None if problem.rating is None else level_for_rating(problem.rating, self.cutoffs)
@@ -0,0 +1,211 @@
+"""
+Problem Recommendations
+Personalized next problems for a learner, ranked by topic, difficulty and
+recency
+
+A LearnerProfile keeps what a learner has solved, counted per topic and
+level and updated one solve at a time. The recommender scores topics the
+learner can work on now: frontier topics, whose prerequisites are all
+mastered, and topics already started, boosted by how recently the learner
+worked on them. Each level of such a topic scores by how well it fits the
+topic's next difficulty step.
+
+Candidates are the catalog's precomputed dedup views per (topic, level),
+already in curated order. Within one list the score only falls with
+position, so the top k across all lists come out of a heap merge that
+looks at one head per list plus the problems it skips, never at whole
+topics.
+"""
+
+import heapq
+import time
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+from .catalog import LEVELS, Problem, ProblemCatalog
+
+DAY = 86400.0
+
+# Score of a level by its distance from the topic's target level (one easier, one harder)
+LEVEL_FIT = {0: 1.0, 1: 0.5, -1: 0.25}
+
+class LearnerProfile:
+    """Problems one learner has solved, with per-topic and per-level counts"""
+
+    def __init__(self, catalog: ProblemCatalog, known_topics: Iterable[str] = (),
+                 level_goal: int = 3, mastery: int = 3):
+        """
+        Args:
+            catalog: Compiled problem catalog the problem ids refer to
+            known_topics: Topics the learner already knows
+            level_goal: Solved problems at a level before the next level becomes the target
+            mastery: Solved problems above beginner level that make a topic mastered
+        """
+        self.catalog = catalog
+        self.known_topics: Set[str] = set(known_topics)
+        self.level_goal = level_goal
+        self.mastery = mastery
+        # problem id -> time of its last solve
+        self.solved: Dict[int, float] = {}
+        # topic -> level -> distinct problems solved there
+        self.level_counts: Dict[str, Dict[str, int]] = {}
+        # topic -> time of the latest solve in it
+        self.last_active: Dict[str, float] = {}
+        # Topics mastered through solving, updated as solves come in
+        self._mastered: Set[str] = set()
+
+    @classmethod
+    def from_solved(cls, catalog: ProblemCatalog, solved: Mapping[str, float], known_topics: Iterable[str] = (),
+                    **kwargs) -> "LearnerProfile":
+        """Profile from canonical id -> solve time; problems missing from the catalog are skipped"""
+        profile = cls(catalog, known_topics, **kwargs)
+        for canonical_id, when in solved.items():
+            problem_id = catalog.problem_id(canonical_id)
+            if problem_id >= 0:
+                profile.record_solve(problem_id, when)
+        return profile
+
+    def record_solve(self, problem_id: int, when: Optional[float] = None):
+        """Mark a problem solved at a time (default now); solving it again only refreshes the time"""
+        when = time.time() if when is None else when
+        first = problem_id not in self.solved
+        self.solved[problem_id] = max(when, self.solved.get(problem_id, when))
+        counted = set()
+        for topic, level in self.catalog.placements(problem_id):
+            if first and (topic, level) not in counted:
+                counted.add((topic, level))
+                levels = self.level_counts.setdefault(topic, {})
+                levels[level] = levels.get(level, 0) + 1
+            if when > self.last_active.get(topic, float("-inf")):
+                self.last_active[topic] = when
+        for topic, _ in counted:
+            if topic not in self._mastered and self._reached_mastery(topic):
+                self._mastered.add(topic)
+
+    def _reached_mastery(self, topic: str) -> bool:
+        levels = self.level_counts[topic]
+        above_beginner = sum(count for level, count in levels.items() if level != "beginner")
+        return above_beginner >= self.mastery or sum(levels.values()) >= self.catalog.count(topic, dedup=True)
+
+    def solved_count(self, topic: str, level: Optional[str] = None) -> int:
+        """Distinct problems solved in a topic, at one level or all"""
+        levels = self.level_counts.get(topic, {})
+        return levels.get(level, 0) if level else sum(levels.values())
+
+    def is_mastered(self, topic: str) -> bool:
+        """Known, or enough problems above beginner level solved (or every problem of the topic)"""
+        return topic in self.known_topics or topic in self._mastered
+
+    def target_level(self, topic: str) -> int:
+        """Index in LEVELS of the first level the learner has not yet practiced enough"""
+        levels = self.level_counts.get(topic, {})
+        for rank, level in enumerate(LEVELS):
+            if levels.get(level, 0) < self.level_goal:
+                return rank
+        return len(LEVELS) - 1
+
+class ProblemRecommender:
+    """Top-k unsolved problems for a learner"""
+
+    def __init__(self, catalog: ProblemCatalog, topic_dependencies: Dict[str, List[str]],
+                 frontier_weight: float = 1.0, progress_weight: float = 0.6, recency_weight: float = 0.8,
+                 level_weight: float = 1.0, half_life_days: float = 7.0, position_decay: float = 1e-4):
+        """
+        Args:
+            catalog: Compiled problem catalog
+            topic_dependencies: Dictionary mapping topics to their prerequisites
+            frontier_weight: Bonus for a topic whose prerequisites are all mastered
+            progress_weight: Bonus for a topic the learner has started
+            recency_weight: Bonus for recent work in a topic, halving every half_life_days
+            level_weight: Weight of the difficulty fit (see LEVEL_FIT)
+            half_life_days: Days after which the recency bonus halves
+            position_decay: Score lost per position in a candidate list, so curated order breaks ties
+        """
+        self.catalog = catalog
+        self.prerequisites = {topic: tuple(prereqs) for topic, prereqs in topic_dependencies.items()}
+        self.frontier_weight = frontier_weight
+        self.progress_weight = progress_weight
+        self.recency_weight = recency_weight
+        self.level_weight = level_weight
+        self.half_life = half_life_days * DAY
+        self.position_decay = position_decay
+        # Candidate lists: the catalog's dedup views of every topic and level that has problems
+        self._candidates: Dict[Tuple[str, str], Sequence[Problem]] = {}
+        for topic in catalog.topics():
+            for level in LEVELS:
+                problems = catalog.problems(topic, level, dedup=True)
+                if problems:
+                    self._candidates[(topic, level)] = problems
+
+    def frontier(self, profile: LearnerProfile) -> List[str]:
+        """Topics not yet mastered whose prerequisites all are"""
+        return [topic for topic, prereqs in self.prerequisites.items()
+                if not profile.is_mastered(topic) and all(profile.is_mastered(p) for p in prereqs)]
+
+    def topic_scores(self, profile: LearnerProfile, now: Optional[float] = None) -> Dict[str, float]:
+        """Score of every topic the learner can work on now"""
+        now = time.time() if now is None else now
+        scores = {topic: self.frontier_weight for topic in self.frontier(profile)}
+        for topic, last in profile.last_active.items():
+            if profile.is_mastered(topic):
+                continue
+            recency = 0.5 ** (max(0.0, now - last) / self.half_life)
+            scores[topic] = scores.get(topic, 0.0) + self.progress_weight + self.recency_weight * recency
+        return scores
+
+    def recommend(self, profile: LearnerProfile, k: int = 10, now: Optional[float] = None,
+                  topics: Optional[Iterable[str]] = None, per_topic: Optional[int] = None
+                  ) -> List[Tuple[Problem, float]]:
+        """
+        Best k unsolved problems for a learner
+
+        Args:
+            profile: The learner's profile
+            k: Number of problems
+            now: Time the recency bonus is measured from (default now)
+            topics: Only recommend from these topics, e.g. a learning path
+            per_topic: Most problems any one topic contributes
+
+        Returns:
+            (problem, score) pairs, best first, each distinct problem once
+        """
+        scores = self.topic_scores(profile, now)
+        if topics is not None:
+            allowed = set(topics)
+            scores = {topic: score for topic, score in scores.items() if topic in allowed}
+
+        # One heap entry per candidate list: (-score of its next problem, list number, position)
+        lists: List[Tuple[Sequence[Problem], float, str]] = []
+        heap = []
+        for topic, topic_score in scores.items():
+            target = profile.target_level(topic)
+            for rank, level in enumerate(LEVELS):
+                fit = LEVEL_FIT.get(rank - target, 0.0)
+                problems = self._candidates.get((topic, level))
+                if fit and problems:
+                    base = topic_score + self.level_weight * fit
+                    heap.append((-base, len(lists), 0))
+                    lists.append((problems, base, topic))
+        heapq.heapify(heap)
+
+        solved = profile.solved
+        picked: Set[int] = set()
+        taken: Dict[str, int] = {}
+        results: List[Tuple[Problem, float]] = []
+        decay = self.position_decay
+        while heap and len(results) < k:
+            negative_score, number, position = heap[0]
+            problems, base, topic = lists[number]
+            if per_topic is not None and taken.get(topic, 0) >= per_topic:
+                heapq.heappop(heap)
+                continue
+            if position + 1 < len(problems):
+                heapq.heapreplace(heap, (-(base - decay * (position + 1)), number, position + 1))
+            else:
+                heapq.heappop(heap)
+            problem = problems[position]
+            if problem.problem_id in solved or problem.problem_id in picked:
+                continue
+            picked.add(problem.problem_id)
+            taken[topic] = taken.get(topic, 0) + 1
+            results.append((problem, -negative_score))
+        return results
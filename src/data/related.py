@@ -0,0 +1,207 @@
+"""
+Related Problems
+Similar-problem lookup through MinHash signatures and locality-sensitive
+hashing (LSH) buckets
+
+Each distinct problem is reduced to a set of features: the normalized
+tokens of its title and description (lowercase, stopwords dropped, as for
+search), its tags and the topics it is listed under. Similarity is the
+Jaccard index of two feature sets. Comparing every pair is quadratic, so
+the index is built once per catalog instead:
+
+- A MinHash signature of ``bands * rows`` values per problem, where value i
+  is the smallest of a random hash function i over the problem's features.
+  Two signatures agree at a position with probability equal to the
+  problems' Jaccard similarity.
+- The signature is cut into bands of ``rows`` values, and each band is
+  hashed into a bucket. Problems sharing a bucket in any band are
+  candidates; a pair with similarity s becomes one with probability
+  1 - (1 - s^rows)^bands, an S-curve that is steep around
+  (1 / bands)^(1 / rows).
+
+"Related problems for X" then reads X's bucket in each band and scores only
+those candidates by exact Jaccard over their feature ids. Signatures are
+only needed while building; the index keeps the features and, per band,
+the problems sorted by bucket.
+
+Features carried by a large share of the catalog (words like "array" in a
+big collection) are left out of the signatures: a hash function that
+happens to rank such a feature low would otherwise put most problems in
+one bucket. They still count in the exact similarity of candidates.
+"""
+
+import zlib
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .catalog import Problem, ProblemCatalog
+from .search import tokenize
+
+# Largest prime below 2^32, the modulus of the MinHash functions (a * x + b) mod p; with a, b, x < p the
+# product and sum stay below 2^64
+_PRIME = np.uint64(4294967291)
+# Signature rows hashed per chunk while building, bounding the temporary (features x hash functions) matrix
+_CHUNK_FEATURES = 1 << 18
+# Features of fewer problems always take part in signatures; scoring a bucket this large takes well under 1 ms
+MIN_FREQUENT = 1000
+
+def problem_features(problem: Problem, topics: Iterable[str] = ()) -> List[str]:
+    """Distinct features of a problem: title/description tokens, then "#tag" and "@topic" entries"""
+    features = dict.fromkeys(tokenize(f"{problem.title} {problem.description}"))
+    for tag in problem.tags or ():
+        features["#" + tag.lower()] = None
+    for topic in topics:
+        features["@" + topic.lower()] = None
+    return list(features)
+
+class RelatedProblemIndex:
+    """MinHash/LSH index of distinct problems for similar-problem queries"""
+
+    def __init__(self, catalog: ProblemCatalog, bands: int = 16, rows: int = 2, max_share: float = 0.05,
+                 seed: int = 0):
+        """
+        Build the index
+
+        Args:
+            catalog: Compiled problem catalog; problems are indexed by problem id
+            bands: LSH bands; more bands find less similar pairs
+            rows: Signature values per band; more rows make buckets stricter
+            max_share: Leave features of more than this share of problems (and over MIN_FREQUENT) out of the signatures
+            seed: Seed of the MinHash functions
+        """
+        self.catalog = catalog
+        self.bands = bands
+        self.rows = rows
+        unique = catalog.unique_problems()
+        feature_ids: Dict[str, int] = {}
+        offsets = np.zeros(len(unique) + 1, dtype=np.int64)
+        features: List[int] = []
+        for problem_id, problem in enumerate(unique):
+            topics = dict.fromkeys(listing.topic for listing in catalog.listings(problem_id))
+            ids = {feature_ids.setdefault(feature, len(feature_ids)) for feature in problem_features(problem, topics)}
+            features.extend(sorted(ids))
+            offsets[problem_id + 1] = len(features)
+        # Feature ids of problem i are the sorted slice features[offsets[i]:offsets[i + 1]]
+        self._features = np.asarray(features, dtype=np.int32)
+        self._offsets = offsets
+
+        # Frequent features never become a signature minimum
+        frequency = np.bincount(self._features, minlength=len(feature_ids))
+        frequent = frequency > max(max_share * len(unique), MIN_FREQUENT)
+        signatures = self._signatures(list(feature_ids), frequent, seed)
+        # Per band: problems ordered by bucket key, and where each problem's bucket starts and ends in that order
+        self._members: List[np.ndarray] = []
+        self._bucket_bounds: List[Tuple[np.ndarray, np.ndarray]] = []
+        has_features = (signatures != np.iinfo(np.uint64).max).any(axis=1)
+        for band in range(bands):
+            keys = self._band_keys(signatures[:, band * rows:(band + 1) * rows])
+            # Problems without signature features share no bucket with anything
+            keys[~has_features] = np.arange(int((~has_features).sum()), dtype=np.uint64) | np.uint64(1 << 63)
+            order = np.argsort(keys, kind="stable").astype(np.int32)
+            ordered = keys[order]
+            starts = np.searchsorted(ordered, keys, side="left").astype(np.int32)
+            stops = np.searchsorted(ordered, keys, side="right").astype(np.int32)
+            self._members.append(order)
+            self._bucket_bounds.append((starts, stops))
+
+    def _signatures(self, vocabulary: List[str], frequent: np.ndarray, seed: int) -> np.ndarray:
+        """MinHash signature of every problem, one row per problem"""
+        rng = np.random.default_rng(seed)
+        width = self.bands * self.rows
+        a = rng.integers(1, _PRIME, size=width, dtype=np.uint64)
+        b = rng.integers(0, _PRIME, size=width, dtype=np.uint64)
+        # Stable 32-bit hashes, so signatures do not depend on PYTHONHASHSEED
+        hashes = np.fromiter((zlib.crc32(feature.encode()) for feature in vocabulary), dtype=np.uint64,
+                             count=len(vocabulary)) % _PRIME
+        count = len(self._offsets) - 1
+        signatures = np.full((count, width), np.iinfo(np.uint64).max, dtype=np.uint64)
+        lengths = np.diff(self._offsets)
+        start = 0
+        while start < count:
+            # Whole problems whose features fit in one chunk (at least one problem)
+            stop = int(np.searchsorted(self._offsets, self._offsets[start] + _CHUNK_FEATURES, side="right")) - 1
+            stop = min(max(stop, start + 1), count)
+            rows = np.flatnonzero(lengths[start:stop]) + start
+            if len(rows):
+                chunk = self._features[self._offsets[start]:self._offsets[stop]]
+                values = (hashes[chunk][:, None] * a + b) % _PRIME
+                values[frequent[chunk]] = np.iinfo(np.uint64).max
+                signatures[rows] = np.minimum.reduceat(values, self._offsets[rows] - self._offsets[start], axis=0)
+            start = stop
+        return signatures
+
+    @staticmethod
+    def _band_keys(band: np.ndarray) -> np.ndarray:
+        """One 63-bit bucket key per problem from a band of signature values"""
+        keys = np.zeros(len(band), dtype=np.uint64)
+        for column in band.T:
+            # Polynomial combination; wrap-around is intended, colliding bands only add candidates
+            keys = keys * np.uint64(0x100000001B3) ^ column
+        return keys & np.uint64((1 << 63) - 1)
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def features(self, problem_id: int) -> np.ndarray:
+        """Sorted feature ids of a problem"""
+        return self._features[self._offsets[problem_id]:self._offsets[problem_id + 1]]
+
+    def candidates(self, problem_id: int) -> np.ndarray:
+        """Problem ids sharing a bucket with a problem in any band (without the problem itself)"""
+        slices = []
+        for members, (starts, stops) in zip(self._members, self._bucket_bounds):
+            start, stop = starts[problem_id], stops[problem_id]
+            if stop - start > 1:
+                slices.append(members[start:stop])
+        if not slices:
+            return np.empty(0, dtype=np.int32)
+        found = np.unique(np.concatenate(slices))
+        return found[found != problem_id]
+
+    def similarities(self, problem_id: int, others: np.ndarray) -> np.ndarray:
+        """Exact Jaccard similarity of a problem to each of some problems"""
+        if not len(others):
+            return np.empty(0, dtype=np.float64)
+        own = self.features(problem_id)
+        starts = self._offsets[others]
+        lengths = self._offsets[others + 1] - starts
+        # Feature ids of all others back to back, then shared features per other
+        positions = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())
+        shared = np.isin(self._features[positions], own)
+        owners = np.repeat(np.arange(len(others)), lengths)
+        intersection = np.bincount(owners, weights=shared, minlength=len(others))
+        union = len(own) + lengths - intersection
+        return np.where(union > 0, intersection / np.maximum(union, 1), 0.0)
+
+    def related(self, problem_id: int, k: int = 5, min_similarity: float = 0.2) -> List[Tuple[Problem, float]]:
+        """
+        Problems most similar to one problem
+
+        Args:
+            problem_id: Catalog problem id
+            k: Number of problems
+            min_similarity: Lowest Jaccard similarity to include
+
+        Returns:
+            (problem, similarity) pairs, most similar first; ties keep catalog order
+        """
+        others = self.candidates(problem_id)
+        scores = self.similarities(problem_id, others)
+        keep = scores >= min_similarity
+        others, scores = others[keep], scores[keep]
+        # Stable sort by descending score; candidates are already in catalog order
+        top = np.argsort(-scores, kind="stable")[:k]
+        unique = self.catalog.unique_problems()
+        return [(unique[int(others[i])], float(scores[i])) for i in top]
+
+    def related_to(self, canonical_id: str, k: int = 5, min_similarity: float = 0.2) -> List[Tuple[Problem, float]]:
+        """Problems most similar to one problem given by canonical id (none if the catalog lacks it)"""
+        problem_id = self.catalog.problem_id(canonical_id)
+        return self.related(problem_id, k, min_similarity) if problem_id >= 0 else []
+
+    def bucket_sizes(self, problem_id: Optional[int] = None) -> List[int]:
+        """Bucket sizes of a problem per band, or the largest bucket per band"""
+        if problem_id is not None:
+            return [int(stops[problem_id] - starts[problem_id]) for starts, stops in self._bucket_bounds]
+        return [int((stops - starts).max(initial=0)) for starts, stops in self._bucket_bounds]
@@ -0,0 +1,84 @@
+"""
+Problem Cards
+Prerendered display fragments of the problems in a compiled catalog
+
+Problem content only changes when the catalog is rebuilt, yet listing a
+page used to classify each link's platform and format its markdown again
+on every Streamlit rerun. A ProblemCard holds a record's expander labels
+and its markdown body (description, rating and platform badge with the
+practice link); display code only prepends the list number and adds the
+learner's own widgets.
+
+Cards are rendered the first time a record is shown and kept, indexed by
+record position, for as long as the catalog lives, so every later rerun
+only looks them up. Rendering them all up front would add some 10 us per
+record to catalog startup for pages most learners never open. Cards are
+handed out only for the very records of the catalog they were made for;
+records from elsewhere (the shard store or the SQLite database before the
+full catalog is loaded, or plain problem dictionaries) are rendered on
+the spot, with the same result.
+"""
+
+from typing import Any, List, Mapping, NamedTuple, Optional
+
+from .catalog import ProblemCatalog, canonical_link, classify_platform
+
+# Badge shown before the practice link of well-known sites
+PLATFORM_MARKERS = {"LeetCode": "🟠", "GeeksforGeeks": "🟢"}
+
+class ProblemCard(NamedTuple):
+    """Display fragments of one problem listing"""
+    # "Title (Level)", for lists of one topic
+    label: str
+    # "Title (Topic, Level)", for lists across topics
+    placed_label: str
+    # Markdown with the description, rating and practice link
+    body: str
+
+def link_markdown(link: str, platform: str) -> str:
+    """Practice link line, with the platform's badge for well-known sites"""
+    if platform in PLATFORM_MARKERS:
+        return f"{PLATFORM_MARKERS[platform]} **Practice on {platform}:** [Open Problem]({link})"
+    return f"🔗 **Practice Link:** [Open Problem]({link})"
+
+def render_card(problem: Mapping[str, Any]) -> ProblemCard:
+    """Card of a problem record or dictionary"""
+    level = (problem.get("level") or "unknown").title()
+    title = problem["title"]
+    parts = [f"**Description:** {problem.get('description', '')}"]
+    if problem.get("rating") is not None:
+        parts.append(f"**Rating:** {problem['rating']:g}")
+    link = problem.get("link")
+    if link:
+        # Catalog records carry their platform, plain dictionaries are classified here
+        platform = problem.get("platform")
+        if platform is None:
+            platform = classify_platform(canonical_link(link))
+        parts.append(link_markdown(link, platform))
+    return ProblemCard(f"{title} ({level})", f"{title} ({problem.get('topic', 'unknown')}, {level})",
+                       "\n\n".join(parts))
+
+class ProblemCards:
+    """Cards of a catalog's records, each rendered once"""
+
+    def __init__(self, catalog: ProblemCatalog):
+        """
+        Args:
+            catalog: Compiled problem catalog
+        """
+        self.catalog = catalog
+        self._cards: List[Optional[ProblemCard]] = [None] * len(catalog)
+
+    def __len__(self) -> int:
+        """Cards rendered so far"""
+        return len(self._cards) - self._cards.count(None)
+
+    def card(self, problem: Mapping[str, Any]) -> ProblemCard:
+        """Kept card of one of the catalog's records, or a fresh one for any other problem"""
+        index = getattr(problem, "index", None)
+        if index is None or index >= len(self._cards) or self.catalog[index] is not problem:
+            return render_card(problem)
+        card = self._cards[index]
+        if card is None:
+            card = self._cards[index] = render_card(problem)
+        return card
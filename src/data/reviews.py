@@ -0,0 +1,466 @@
+"""
+Review Scheduling
+Spaced-repetition reviews of solved problems (SM-2), per learner and
+process-wide
+
+Every solved problem gets a card: SM-2 repetitions, interval in days,
+easiness factor and due time. A review graded 0-5 moves the card's due
+time out by a growing interval, or back to one day after a failed recall.
+
+Each learner's cards sit in an indexed binary heap keyed by due time, so
+adding, rescheduling or removing a card is O(log n) and the learner's due
+cards come out in O(due) by walking the heap only below due nodes, never
+scanning their history.
+
+For batch jobs across all learners (reminders, digests), learners sit in
+a bucketed timer queue keyed by the due time of their next review. pop_due
+visits only the buckets that have come due, so its cost follows the
+learners with something due, not the number of learners. A learner fires
+once and is queued again when their next review changes.
+
+One scheduler serves every session of the app, so its methods hold a
+lock: reads never see a heap halfway through a sift, and dump never sees
+the card tables change under it.
+
+Cards are keyed by canonical problem id, so review state survives catalog
+rebuilds. dump writes the state compactly: a table of the canonical ids,
+then per card the gap to its id's table position, due minute, interval,
+repetitions and easiness as varints, a few bytes per card.
+"""
+
+import heapq
+import math
+import struct
+import threading
+from typing import IO, Dict, Hashable, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from .solved import _read_varint, _write_varint
+
+DAY = 86400.0
+
+MAGIC = b"DSAR"
+FORMAT_VERSION = 1
+_HEADER = struct.Struct("<BIqII")
+
+# SM-2 easiness factor: starting value and floor
+INITIAL_EASINESS = 2.5
+MIN_EASINESS = 1.3
+
+# Review grades: 0-2 failed recall, 3 recalled with difficulty, 5 perfect recall
+QUALITY_LABELS = {1: "Again", 3: "Hard", 4: "Good", 5: "Easy"}
+
+# Width of one bucket of the process-wide timer queue
+DEFAULT_BUCKET_SECONDS = 3600
+
+class Card(NamedTuple):
+    """SM-2 state of one problem for one learner"""
+    repetitions: int
+    interval: int
+    easiness: float
+    due: float
+
+def new_card(solved_at: float) -> Card:
+    """Card of a problem just solved: first review one day later"""
+    return Card(0, 1, INITIAL_EASINESS, solved_at + DAY)
+
+def sm2_review(card: Card, quality: int, now: float) -> Card:
+    """
+    Card after a review
+
+    Args:
+        card: Card before the review
+        quality: Grade 0-5 (below 3 restarts the repetitions)
+        now: Review time (epoch seconds)
+    """
+    if not 0 <= quality <= 5:
+        raise ValueError(f"Review quality must be 0-5, got {quality}")
+    if quality < 3:
+        repetitions, interval = 0, 1
+    else:
+        if card.repetitions == 0:
+            interval = 1
+        elif card.repetitions == 1:
+            interval = 6
+        else:
+            interval = max(1, round(card.interval * card.easiness))
+        repetitions = card.repetitions + 1
+    miss = 5 - quality
+    easiness = max(MIN_EASINESS, round(card.easiness + 0.1 - miss * (0.08 + miss * 0.02), 2))
+    return Card(repetitions, interval, easiness, now + interval * DAY)
+
+class ReviewQueue:
+    """Indexed min-heap of one learner's cards by due time"""
+
+    __slots__ = ("_heap", "_due", "_position")
+
+    def __init__(self):
+        self._heap: List[str] = []
+        self._due: Dict[str, float] = {}
+        self._position: Dict[str, int] = {}
+
+    @classmethod
+    def from_items(cls, items: Dict[str, float]) -> "ReviewQueue":
+        """Queue of canonical id -> due time, built in one pass"""
+        queue = cls()
+        # A list sorted by due time is already a heap
+        queue._heap = sorted(items, key=items.__getitem__)
+        queue._due = dict(items)
+        queue._position = {key: i for i, key in enumerate(queue._heap)}
+        return queue
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._position
+
+    def peek(self) -> Optional[Tuple[str, float]]:
+        """Card due first and its due time (None if empty)"""
+        if not self._heap:
+            return None
+        key = self._heap[0]
+        return key, self._due[key]
+
+    def set(self, key: str, due: float):
+        """Add a card or move it to a new due time"""
+        position = self._position.get(key)
+        self._due[key] = due
+        if position is None:
+            self._heap.append(key)
+            self._position[key] = len(self._heap) - 1
+            self._sift_up(len(self._heap) - 1)
+        else:
+            self._sift_up(position)
+            self._sift_down(self._position[key])
+
+    def remove(self, key: str) -> bool:
+        """Drop a card; returns whether it was queued"""
+        position = self._position.pop(key, None)
+        if position is None:
+            return False
+        del self._due[key]
+        last = self._heap.pop()
+        if position < len(self._heap):
+            self._heap[position] = last
+            self._position[last] = position
+            self._sift_up(position)
+            self._sift_down(self._position[last])
+        return True
+
+    def due_items(self, now: float, limit: Optional[int] = None) -> List[Tuple[str, float]]:
+        """Cards due at or before now, earliest first, visiting only due nodes and their children"""
+        heap, due = self._heap, self._due
+        found = []
+        # Best-first walk down the heap: a node's children are never due before it
+        frontier = [(due[heap[0]], 0)] if heap and due[heap[0]] <= now else []
+        while frontier and (limit is None or len(found) < limit):
+            when, position = heapq.heappop(frontier)
+            found.append((heap[position], when))
+            for child in (2 * position + 1, 2 * position + 2):
+                if child < len(heap) and due[heap[child]] <= now:
+                    heapq.heappush(frontier, (due[heap[child]], child))
+        return found
+
+    def items(self) -> Iterator[Tuple[str, float]]:
+        """(canonical id, due time) pairs in no particular order"""
+        return iter(self._due.items())
+
+    def _sift_up(self, position: int):
+        heap, due, index = self._heap, self._due, self._position
+        key = heap[position]
+        while position > 0:
+            parent = (position - 1) >> 1
+            if due[heap[parent]] <= due[key]:
+                break
+            heap[position] = heap[parent]
+            index[heap[position]] = position
+            position = parent
+        heap[position] = key
+        index[key] = position
+
+    def _sift_down(self, position: int):
+        heap, due, index = self._heap, self._due, self._position
+        size = len(heap)
+        key = heap[position]
+        while True:
+            child = 2 * position + 1
+            if child >= size:
+                break
+            if child + 1 < size and due[heap[child + 1]] < due[heap[child]]:
+                child += 1
+            if due[key] <= due[heap[child]]:
+                break
+            heap[position] = heap[child]
+            index[heap[position]] = position
+            position = child
+        heap[position] = key
+        index[key] = position
+
+class ReviewScheduler:
+    """Cards and review queues of many learners, with a bucketed queue of learners by next due review"""
+
+    def __init__(self, bucket_seconds: int = DEFAULT_BUCKET_SECONDS):
+        """
+        Args:
+            bucket_seconds: Width of one timer bucket; pop_due checks the learners of the current
+                bucket one by one and takes earlier buckets whole
+        """
+        if bucket_seconds <= 0:
+            raise ValueError("Bucket width must be positive")
+        self.bucket_seconds = bucket_seconds
+        self._cards: Dict[Hashable, Dict[str, Card]] = {}
+        self._queues: Dict[Hashable, ReviewQueue] = {}
+        # bucket number -> learners whose next review falls in it, and a heap of the bucket numbers
+        self._buckets: Dict[int, Set[Hashable]] = {}
+        self._bucket_heap: List[int] = []
+        self._armed: Dict[Hashable, int] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._cards)
+
+    def __contains__(self, learner: Hashable) -> bool:
+        return learner in self._cards
+
+    def learners(self) -> List[Hashable]:
+        """Learners with cards, in insertion order"""
+        with self._lock:
+            return list(self._cards)
+
+    def card_count(self, learner: Optional[Hashable] = None) -> int:
+        """Cards of one learner, or of every learner"""
+        with self._lock:
+            if learner is not None:
+                return len(self._cards.get(learner, ()))
+            return sum(len(cards) for cards in self._cards.values())
+
+    def cards(self, learner: Hashable) -> Dict[str, Card]:
+        """A learner's cards by canonical id"""
+        with self._lock:
+            return dict(self._cards.get(learner, {}))
+
+    def card(self, learner: Hashable, canonical_id: str) -> Optional[Card]:
+        """A learner's card of a problem (None if not scheduled)"""
+        with self._lock:
+            return self._cards.get(learner, {}).get(canonical_id)
+
+    def add(self, learner: Hashable, canonical_id: str, solved_at: float) -> Card:
+        """Schedule a solved problem's first review; a problem already scheduled keeps its card"""
+        with self._lock:
+            cards = self._cards.setdefault(learner, {})
+            card = cards.get(canonical_id)
+            if card is None:
+                card = cards[canonical_id] = new_card(solved_at)
+                self._set(learner, canonical_id, card)
+            return card
+
+    def review(self, learner: Hashable, canonical_id: str, quality: int, now: float) -> Card:
+        """
+        Grade a review and reschedule the card
+
+        Args:
+            learner: Learner id
+            canonical_id: Canonical id of the reviewed problem
+            quality: Grade 0-5
+            now: Review time (epoch seconds)
+
+        Returns:
+            The rescheduled card
+        """
+        with self._lock:
+            cards = self._cards.setdefault(learner, {})
+            card = sm2_review(cards.get(canonical_id) or new_card(now), quality, now)
+            cards[canonical_id] = card
+            self._set(learner, canonical_id, card)
+            return card
+
+    def remove(self, learner: Hashable, canonical_id: str) -> bool:
+        """Stop reviewing a problem, e.g. when it is marked unsolved"""
+        with self._lock:
+            cards = self._cards.get(learner)
+            if not cards or cards.pop(canonical_id, None) is None:
+                return False
+            self._queues[learner].remove(canonical_id)
+            self._arm(learner)
+            return True
+
+    def next_due(self, learner: Hashable) -> Optional[float]:
+        """Due time of a learner's next review (None without cards)"""
+        with self._lock:
+            return self._next_due(learner)
+
+    def due(self, learner: Hashable, now: float, limit: Optional[int] = None) -> List[Tuple[str, Card]]:
+        """A learner's cards due at or before now, most overdue first"""
+        with self._lock:
+            return self._due(learner, now, limit)
+
+    def _next_due(self, learner: Hashable) -> Optional[float]:
+        queue = self._queues.get(learner)
+        head = queue.peek() if queue is not None else None
+        return head[1] if head else None
+
+    def _due(self, learner: Hashable, now: float, limit: Optional[int]) -> List[Tuple[str, Card]]:
+        queue = self._queues.get(learner)
+        if queue is None:
+            return []
+        cards = self._cards[learner]
+        return [(key, cards[key]) for key, _ in queue.due_items(now, limit)]
+
+    def pop_due(self, now: float, limit: Optional[int] = None) -> Dict[Hashable, List[Tuple[str, Card]]]:
+        """
+        Learners whose next review has come due since they last fired, with their due cards
+
+        A learner fires once; they are queued again when one of their cards
+        is added, reviewed or removed. Cards stay scheduled until reviewed.
+
+        Args:
+            now: Current time (epoch seconds)
+            limit: Most cards returned per learner
+
+        Returns:
+            Dictionary mapping learners to their due cards, most overdue first
+        """
+        current = math.floor(now / self.bucket_seconds)
+        fired: Dict[Hashable, List[Tuple[str, Card]]] = {}
+        with self._lock:
+            heap = self._bucket_heap
+            while heap and heap[0] <= current:
+                bucket = heap[0]
+                learners = self._buckets.get(bucket)
+                if learners and bucket == current:
+                    # The current bucket also holds learners due later in it
+                    for learner in [learner for learner in learners if self._next_due(learner) <= now]:
+                        learners.discard(learner)
+                        del self._armed[learner]
+                        fired[learner] = self._due(learner, now, limit)
+                    if learners:
+                        break
+                else:
+                    for learner in learners or ():
+                        del self._armed[learner]
+                        fired[learner] = self._due(learner, now, limit)
+                heapq.heappop(heap)
+                self._buckets.pop(bucket, None)
+        return fired
+
+    def _set(self, learner: Hashable, canonical_id: str, card: Card):
+        queue = self._queues.get(learner)
+        if queue is None:
+            queue = self._queues[learner] = ReviewQueue()
+        queue.set(canonical_id, card.due)
+        self._arm(learner)
+
+    def _arm(self, learner: Hashable):
+        """(Re)queue a learner in the bucket of their next review"""
+        due = self._next_due(learner)
+        bucket = None if due is None else math.floor(due / self.bucket_seconds)
+        old = self._armed.get(learner)
+        if old == bucket:
+            return
+        if old is not None:
+            learners = self._buckets[old]
+            learners.discard(learner)
+            if not learners:
+                # Its heap entry goes stale: pop_due skips it, or the next compaction drops it
+                del self._buckets[old]
+            del self._armed[learner]
+        if bucket is not None:
+            learners = self._buckets.get(bucket)
+            if learners is None:
+                learners = self._buckets[bucket] = set()
+                heapq.heappush(self._bucket_heap, bucket)
+                # A process that never calls pop_due would keep every stale entry, so once they
+                # outnumber the live buckets, rebuild the heap from the live ones (sorted is a heap)
+                if len(self._bucket_heap) > 2 * len(self._buckets) + 64:
+                    self._bucket_heap = sorted(self._buckets)
+            learners.add(learner)
+            self._armed[learner] = bucket
+
+    def dump(self, stream: IO[bytes]) -> int:
+        """
+        Write every learner's cards to a binary stream
+
+        Layout: magic, format version, bucket width, earliest due minute,
+        canonical id count and learner count, the sorted canonical ids
+        (UTF-8, varint length), then per learner its id and card count and
+        per card, sorted by canonical id: the gap to the previous id's
+        table position, minutes after the earliest due minute, interval,
+        repetitions and easiness x 100, all varints. Due times are kept to
+        the minute and learner ids are written as strings.
+
+        Returns:
+            Bytes written
+        """
+        with self._lock:
+            out = self._encode()
+        stream.write(out)
+        return len(out)
+
+    def _encode(self) -> bytearray:
+        ids = sorted({key for cards in self._cards.values() for key in cards})
+        table = {key: i for i, key in enumerate(ids)}
+        base = min((_minute(card.due) for cards in self._cards.values() for card in cards.values()), default=0)
+        out = bytearray(MAGIC)
+        out += _HEADER.pack(FORMAT_VERSION, self.bucket_seconds, base, len(ids), len(self._cards))
+        for key in ids:
+            encoded = key.encode("utf-8")
+            _write_varint(out, len(encoded))
+            out += encoded
+        for learner, cards in self._cards.items():
+            name = str(learner).encode("utf-8")
+            _write_varint(out, len(name))
+            out += name
+            _write_varint(out, len(cards))
+            previous = -1
+            for position, card in sorted((table[key], card) for key, card in cards.items()):
+                _write_varint(out, position - previous - 1)
+                previous = position
+                _write_varint(out, _minute(card.due) - base)
+                _write_varint(out, card.interval)
+                _write_varint(out, card.repetitions)
+                _write_varint(out, round(card.easiness * 100))
+        return out
+
+    @classmethod
+    def load(cls, stream: IO[bytes]) -> "ReviewScheduler":
+        """
+        Read a scheduler written by dump
+
+        Raises:
+            ValueError: If the data is not review state
+        """
+        data = stream.read()
+        header = len(MAGIC) + _HEADER.size
+        if data[:len(MAGIC)] != MAGIC or len(data) < header:
+            raise ValueError("Not review scheduling state")
+        version, bucket_seconds, base, id_count, learners = _HEADER.unpack_from(data, len(MAGIC))
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported review state format {version}")
+        scheduler = cls(bucket_seconds)
+        offset = header
+        ids = []
+        for _ in range(id_count):
+            length, offset = _read_varint(data, offset)
+            ids.append(data[offset:offset + length].decode("utf-8"))
+            offset += length
+        for _ in range(learners):
+            length, offset = _read_varint(data, offset)
+            name = data[offset:offset + length].decode("utf-8")
+            offset += length
+            count, offset = _read_varint(data, offset)
+            cards, position = {}, -1
+            for _ in range(count):
+                gap, offset = _read_varint(data, offset)
+                position += gap + 1
+                minute, offset = _read_varint(data, offset)
+                interval, offset = _read_varint(data, offset)
+                repetitions, offset = _read_varint(data, offset)
+                easiness, offset = _read_varint(data, offset)
+                cards[ids[position]] = Card(repetitions, interval, easiness / 100, (base + minute) * 60.0)
+            scheduler._cards[name] = cards
+            scheduler._queues[name] = ReviewQueue.from_items({key: card.due for key, card in cards.items()})
+            scheduler._arm(name)
+        return scheduler
+
+def _minute(timestamp: float) -> int:
+    return math.floor(timestamp / 60 + 0.5)
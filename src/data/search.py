@@ -0,0 +1,250 @@
+"""
+Problem Search Index
+In-memory inverted index over problem titles and descriptions with BM25
+ranking and prefix matching
+
+The index is built once per catalog. Postings for all terms live in three
+flat NumPy arrays (document ids, precomputed BM25 impacts and an
+impact-ordered permutation) with one offset range per term, and term ids
+are assigned in lexicographic order so every prefix maps to a contiguous
+term-id range.
+
+Because BM25 term weights only depend on the term and the document, each
+posting's contribution to the score is computed at build time. A query
+reads the highest-impact postings of each term first and stops as soon as
+no unseen document can beat the current k-th result (Fagin's threshold
+algorithm), so it touches a small prefix of each posting list even when
+a term occurs in most documents.
+"""
+
+import bisect
+import re
+from array import array
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from .catalog import Problem, ProblemCatalog
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+STOPWORDS = frozenset({"a", "an", "and", "at", "by", "for", "from", "in", "is", "of", "on", "or", "the", "to", "with"})
+
+# Prefixes expand to at most this many terms, keeping the most frequent ones
+MAX_PREFIX_TERMS = 32
+
+# Score densely once the threshold algorithm would read more than 1/16 of all documents
+DENSE_FRACTION = 16
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase alphanumeric tokens without stopwords"""
+    return [token for token in TOKEN_PATTERN.findall(text.lower()) if token not in STOPWORDS]
+
+class ProblemSearchIndex:
+    """BM25 full-text index over a problem catalog"""
+
+    def __init__(self, catalog: ProblemCatalog, title_weight: float = 2.0, k1: float = 1.2, b: float = 0.75):
+        """
+        Build the index
+
+        Args:
+            catalog: Compiled problem catalog
+            title_weight: How many description occurrences one title occurrence counts as
+            k1: BM25 term frequency saturation
+            b: BM25 document length normalization
+        """
+        self.catalog = catalog
+        term_ids: Dict[str, int] = {}
+        posting_terms = array("i")
+        posting_docs = array("i")
+        posting_tfs = array("f")
+        doc_lengths = array("f")
+
+        for doc, problem in enumerate(catalog):
+            frequencies: Dict[str, float] = {}
+            for token in tokenize(problem.title):
+                frequencies[token] = frequencies.get(token, 0.0) + title_weight
+            for token in tokenize(problem.description):
+                frequencies[token] = frequencies.get(token, 0.0) + 1.0
+            doc_lengths.append(sum(frequencies.values()))
+            for token, tf in frequencies.items():
+                term = term_ids.get(token)
+                if term is None:
+                    term = term_ids[token] = len(term_ids)
+                posting_terms.append(term)
+                posting_docs.append(doc)
+                posting_tfs.append(tf)
+
+        # Renumber terms lexicographically so prefixes are contiguous ranges
+        self._vocabulary = sorted(term_ids)
+        remap = np.empty(len(term_ids), dtype=np.int32)
+        remap[[term_ids[token] for token in self._vocabulary]] = np.arange(len(term_ids), dtype=np.int32)
+        terms = remap[np.asarray(posting_terms, dtype=np.int32)]
+
+        # Group postings by term; documents were added in increasing order and the sort is stable
+        order = np.argsort(terms, kind="stable")
+        terms = terms[order]
+        self._docs = np.asarray(posting_docs, dtype=np.int32)[order]
+        tfs = np.asarray(posting_tfs, dtype=np.float32)[order]
+        self._df = np.bincount(terms, minlength=len(self._vocabulary)).astype(np.int32)
+        self._offsets = np.zeros(len(self._vocabulary) + 1, dtype=np.int64)
+        np.cumsum(self._df, out=self._offsets[1:])
+
+        # BM25 contribution of every posting
+        lengths = np.asarray(doc_lengths, dtype=np.float32)
+        n = len(catalog)
+        average_length = float(lengths.mean()) if n else 1.0
+        idf = np.log1p((n - self._df + 0.5) / (self._df + 0.5)).astype(np.float32)
+        norms = k1 * (1 - b + b * lengths / max(average_length, 1e-9))
+        self._impacts = (idf[terms] * tfs * (k1 + 1) / (tfs + norms[self._docs])).astype(np.float32)
+
+        # Within each term, postings by decreasing impact
+        self._by_impact = np.lexsort((-self._impacts, terms)).astype(np.int32)
+
+    def __len__(self) -> int:
+        return len(self.catalog)
+
+    def vocabulary_size(self) -> int:
+        return len(self._vocabulary)
+
+    def _term_id(self, token: str) -> int:
+        i = bisect.bisect_left(self._vocabulary, token)
+        return i if i < len(self._vocabulary) and self._vocabulary[i] == token else -1
+
+    def _prefix_terms(self, prefix: str) -> List[int]:
+        lo = bisect.bisect_left(self._vocabulary, prefix)
+        hi = bisect.bisect_left(self._vocabulary, prefix + "\uffff", lo)
+        if hi - lo <= MAX_PREFIX_TERMS:
+            return list(range(lo, hi))
+        top = np.argpartition(-self._df[lo:hi], MAX_PREFIX_TERMS)[:MAX_PREFIX_TERMS]
+        # The prefix itself, when it is a whole term, always stays in
+        exact = [lo] if self._vocabulary[lo] == prefix else []
+        return sorted(set(exact) | {int(i) + lo for i in top})
+
+    def query_groups(self, query: str, prefix: bool = True) -> List[List[int]]:
+        """
+        Term ids a query searches for, one group per query token
+
+        A whole word is a group of one term; a prefix is a group of the
+        terms it expands to. A document scores the sum over groups of its
+        best term in each group.
+
+        Args:
+            query: Free text
+            prefix: Treat the last token as a prefix unless the query ends with whitespace
+
+        Returns:
+            Non-empty groups of term ids
+        """
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+        last_is_prefix = prefix and not query[-1:].isspace()
+        groups = []
+        seen = set()
+        for token in dict.fromkeys(tokens[:-1] if last_is_prefix else tokens):
+            term = self._term_id(token)
+            if term >= 0:
+                groups.append([term])
+                seen.add(term)
+        if last_is_prefix:
+            expansion = [term for term in self._prefix_terms(tokens[-1]) if term not in seen]
+            if expansion:
+                groups.append(expansion)
+        return groups
+
+    def search(self, query: str, k: int = 10, prefix: bool = True) -> List[Tuple[Problem, float]]:
+        """
+        Top-k problems for a free-text query
+
+        Args:
+            query: Free text, e.g. "median sorted" or "rect"
+            k: Number of results
+            prefix: Treat the last token as a prefix unless the query ends with whitespace
+
+        Returns:
+            (problem, score) pairs by decreasing score, ties in catalog order
+        """
+        groups = self.query_groups(query, prefix)
+        if not groups or k <= 0:
+            return []
+        docs, scores = self._top_k(groups, k)
+        return [(self.catalog[int(doc)], float(score)) for doc, score in zip(docs, scores)]
+
+    def _range(self, term: int) -> Tuple[int, int]:
+        return int(self._offsets[term]), int(self._offsets[term + 1])
+
+    def _impact_prefix(self, term: int, depth: int) -> np.ndarray:
+        """Positions of a term's depth highest-impact postings"""
+        start, stop = self._range(term)
+        return self._by_impact[start:min(start + depth, stop)]
+
+    def _next_impact(self, term: int, depth: int) -> float:
+        """Impact of a term's first posting beyond depth (0 when exhausted)"""
+        start, stop = self._range(term)
+        return float(self._impacts[self._by_impact[start + depth]]) if start + depth < stop else 0.0
+
+    def _group_scores(self, group: List[int], candidates: np.ndarray) -> np.ndarray:
+        """Best impact of any term in a group for each candidate document"""
+        scores = np.zeros(len(candidates), dtype=np.float32)
+        for term in group:
+            start, stop = self._range(term)
+            docs = self._docs[start:stop]
+            found = np.searchsorted(docs, candidates)
+            found[found == len(docs)] = 0
+            hit = docs[found] == candidates
+            np.maximum(scores, np.where(hit, self._impacts[start + found], 0), out=scores)
+        return scores
+
+    def _top_k(self, groups: List[List[int]], k: int) -> Tuple[np.ndarray, np.ndarray]:
+        if len(groups) == 1:
+            # Each term's impact order is its ranking; a document in the top k
+            # by best term is in the top k of that term
+            positions = np.concatenate([self._impact_prefix(term, k) for term in groups[0]])
+            docs = self._docs[positions]
+            impacts = self._impacts[positions]
+            order = np.lexsort((-impacts, docs))
+            docs, impacts = docs[order], impacts[order]
+            first = np.ones(len(docs), dtype=bool)
+            first[1:] = docs[1:] != docs[:-1]
+            return self._ranked(docs[first], impacts[first], k)
+
+        postings = sum(int(self._df[term]) for group in groups for term in group)
+        depth = 4 * k
+        while True:
+            if depth * len(groups) > len(self.catalog) // DENSE_FRACTION or depth > postings:
+                return self._top_k_dense(groups, k)
+            candidates = np.unique(np.concatenate([self._docs[self._impact_prefix(term, depth)]
+                                                   for group in groups for term in group]))
+            scores = sum(self._group_scores(group, candidates) for group in groups)
+
+            # Best score any unseen document could still reach
+            threshold = sum(max(self._next_impact(term, depth) for term in group) for group in groups)
+            if len(scores) >= k and np.partition(scores, len(scores) - k)[len(scores) - k] >= threshold:
+                return self._ranked(candidates, scores, k)
+            depth *= 4
+
+    def _top_k_dense(self, groups: List[List[int]], k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Exhaustive term-at-a-time scoring, for queries whose early stop would come too late"""
+        total = np.zeros(len(self.catalog), dtype=np.float32)
+        for group in groups:
+            best = total if len(group) == 1 else np.zeros(len(self.catalog), dtype=np.float32)
+            for term in group:
+                start, stop = self._range(term)
+                docs = self._docs[start:stop]
+                # Documents are unique within a term, so fancy-index updates are safe
+                if best is total:
+                    total[docs] += self._impacts[start:stop]
+                else:
+                    best[docs] = np.maximum(best[docs], self._impacts[start:stop])
+            if best is not total:
+                total += best
+        docs = np.flatnonzero(total)
+        if len(docs) > k:
+            kth = np.partition(total[docs], len(docs) - k)[len(docs) - k]
+            docs = docs[total[docs] >= kth]
+        return self._ranked(docs.astype(np.int32), total[docs], k)
+
+    @staticmethod
+    def _ranked(docs: np.ndarray, scores: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        order = np.lexsort((docs, -scores))[:k]
+        return docs[order], scores[order]
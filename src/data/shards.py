@@ -0,0 +1,203 @@
+"""
+Sharded Problem Catalog
+Per-topic shards of the problem catalog on disk, loaded lazily on first
+access and kept in memory under an LRU bound
+
+Layout of a shard directory:
+
+- ``manifest.json``: format version, catalog fingerprint and, per topic,
+  its shard file and problem counts per level (plain and de-duplicated),
+  so topic lists and counts never touch a shard
+- ``<n>.json.gz``: one gzip-compressed JSON shard per topic holding, per
+  level, parallel title / description / link columns (plus rating and tags
+  columns when any problem of the level has them)
+
+Build shards from the bundled data with:
+
+    cd src && python -m data.shards build ../problem_shards
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Sequence
+
+from .catalog import Problem, ProblemCatalog
+
+MANIFEST = "manifest.json"
+FORMAT_VERSION = 1
+
+def _shard_columns(levels: Dict[str, List[Dict[str, str]]]) -> Dict[str, Dict[str, List[str]]]:
+    columns = {}
+    for level, problems in levels.items():
+        column = {
+            "title": [p["title"] for p in problems],
+            "description": [p.get("description", "") for p in problems],
+            "link": [p.get("link") for p in problems],
+        }
+        if any(p.get("rating") is not None for p in problems):
+            column["rating"] = [p.get("rating") for p in problems]
+        if any(p.get("tags") for p in problems):
+            column["tags"] = [list(p["tags"]) if p.get("tags") else None for p in problems]
+        columns[level] = column
+    return columns
+
+def _shard_rows(columns: Dict[str, Dict[str, List[str]]]) -> Dict[str, List[Dict[str, str]]]:
+    levels = {}
+    for level, column in columns.items():
+        problems = []
+        missing = [None] * len(column["title"])
+        for title, description, link, rating, tags in zip(column["title"], column["description"], column["link"],
+                                                          column.get("rating") or missing, column.get("tags") or missing):
+            problem = {"title": title, "description": description}
+            if link is not None:
+                problem["link"] = link
+            if rating is not None:
+                problem["rating"] = rating
+            if tags:
+                problem["tags"] = tags
+            problems.append(problem)
+        levels[level] = problems
+    return levels
+
+def write_shards(problems_data: Dict[str, Dict[str, List[Dict[str, str]]]], directory: str) -> Dict[str, Any]:
+    """
+    Write one shard per topic plus the manifest
+
+    Args:
+        problems_data: Dictionary mapping topic -> level -> list of problem dictionaries
+        directory: Output directory (created if needed)
+
+    Returns:
+        The manifest
+    """
+    os.makedirs(directory, exist_ok=True)
+    catalog = ProblemCatalog(problems_data)
+    digest = hashlib.sha256()
+    topics = []
+    for number, (topic, levels) in enumerate(problems_data.items()):
+        file_name = f"{number:05d}.json.gz"
+        payload = json.dumps({"topic": topic, "levels": _shard_columns(levels)},
+                             separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        digest.update(payload)
+        # mtime=0 keeps shard bytes identical across rebuilds of the same data
+        with open(os.path.join(directory, file_name), "wb") as f:
+            f.write(gzip.compress(payload, compresslevel=6, mtime=0))
+        counts = {level: catalog.count(topic, level) for level in [*levels, "all"]}
+        unique = {level: catalog.count(topic, level, dedup=True) for level in [*levels, "all"]}
+        topics.append({"name": topic, "file": file_name, "counts": counts, "unique": unique})
+
+    manifest = {
+        "format": FORMAT_VERSION,
+        "fingerprint": digest.hexdigest(),
+        "problems": len(catalog),
+        "unique_problems": catalog.unique_count(),
+        "topics": topics,
+    }
+    # Written last, so a directory with a manifest always has all its shards
+    with open(os.path.join(directory, MANIFEST), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False)
+    return manifest
+
+class ShardedProblemStore:
+    """Read-only problem catalog backed by lazily loaded per-topic shards"""
+
+    def __init__(self, directory: str, max_resident_shards: int = 8):
+        """
+        Open a shard directory; only the manifest is read here
+
+        Args:
+            directory: Directory written by write_shards
+            max_resident_shards: Most topic shards kept in memory at once
+        """
+        with open(os.path.join(directory, MANIFEST), encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("format") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported shard format {manifest.get('format')} in '{directory}'")
+
+        self.directory = directory
+        self.fingerprint = manifest["fingerprint"]
+        self.max_resident_shards = max(1, max_resident_shards)
+        self._topics = {entry["name"]: entry for entry in manifest["topics"]}
+        self._unique_problems = manifest["unique_problems"]
+        self._resident: "OrderedDict[str, ProblemCatalog]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.loads = 0
+
+    def topics(self) -> List[str]:
+        """Topics that have problems, in catalog order"""
+        return list(self._topics)
+
+    def _shard(self, topic: str) -> ProblemCatalog:
+        with self._lock:
+            shard = self._resident.get(topic)
+            if shard is not None:
+                self._resident.move_to_end(topic)
+                return shard
+
+        # Read outside the lock; two threads may load the same shard once each
+        with open(os.path.join(self.directory, self._topics[topic]["file"]), "rb") as f:
+            payload = json.loads(gzip.decompress(f.read()))
+        shard = ProblemCatalog({topic: _shard_rows(payload["levels"])})
+
+        with self._lock:
+            self.loads += 1
+            self._resident[topic] = shard
+            self._resident.move_to_end(topic)
+            while len(self._resident) > self.max_resident_shards:
+                self._resident.popitem(last=False)
+        return shard
+
+    def problems(self, topic: str, level: str = "all", dedup: bool = False) -> Sequence[Problem]:
+        """
+        Problems of a topic at one level, or all levels, loading the topic's shard if needed
+
+        Problem ids in the returned records are local to the shard; compare
+        problems across topics by canonical_id.
+        """
+        if topic not in self._topics:
+            return ()
+        return self._shard(topic).problems(topic, level, dedup)
+
+    def count(self, topic: str, level: str = "all", dedup: bool = False) -> int:
+        """Number of problems of a topic at one level, or all levels, from the manifest"""
+        entry = self._topics.get(topic)
+        if entry is None:
+            return 0
+        return (entry["unique"] if dedup else entry["counts"]).get(level, 0)
+
+    def counts_by_topic(self, dedup: bool = False) -> Dict[str, int]:
+        """Number of problems per topic, from the manifest"""
+        return {topic: self.count(topic, "all", dedup) for topic in self._topics}
+
+    def unique_count(self) -> int:
+        """Number of distinct problems across all topics"""
+        return self._unique_problems
+
+    def resident_topics(self) -> List[str]:
+        """Topics whose shards are in memory, least recently used first"""
+        with self._lock:
+            return list(self._resident)
+
+    def load_all(self) -> Dict[str, Dict[str, List[Dict[str, str]]]]:
+        """Read every shard back into the nested PROBLEMS_DATA layout, bypassing the LRU"""
+        problems_data = {}
+        for topic, entry in self._topics.items():
+            with open(os.path.join(self.directory, entry["file"]), "rb") as f:
+                problems_data[topic] = _shard_rows(json.loads(gzip.decompress(f.read()))["levels"])
+        return problems_data
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build per-topic problem shards")
+    parser.add_argument("command", choices=["build"])
+    parser.add_argument("directory", help="output directory")
+    args = parser.parse_args()
+
+    from .problem_bank import PROBLEMS_DATA
+    built = write_shards(PROBLEMS_DATA, args.directory)
+    print(f"Wrote {len(built['topics'])} shards ({built['problems']} problems) to {args.directory}")
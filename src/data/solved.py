@@ -0,0 +1,306 @@
+"""
+Solved Problem Bitmaps
+Which problems each learner has solved, as one bit per distinct problem,
+with precomputed (topic, level) masks
+
+Bit i of a learner's bitmap stands for the catalog's problem id i (its
+dense number for a canonical id), so a problem listed under several topics
+is one bit. Bitmaps are plain Python ints: "unsolved intermediate Graphs
+problems of this learner" is the (Graphs, intermediate) mask AND NOT the
+learner's bitmap, and its size a popcount, both done word by word in C
+however many problems are involved.
+
+Bitmaps serialize to whichever is smaller: the raw bitmap bytes, or the
+gaps between solved problem ids as varints (sparse learners). Bit numbers
+are only meaningful for the catalog they were built on, so a saved index
+carries the catalog's fingerprint and refuses to load against another one.
+"""
+
+import hashlib
+import struct
+from itertools import accumulate
+from typing import IO, Collection, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
+
+from .bitmaps import bit_count, bit_positions
+from .catalog import LEVELS, Problem, ProblemCatalog
+
+MAGIC = b"DSAS"
+FORMAT_VERSION = 1
+
+# Encodings of one bitmap, the first byte of its serialized form
+RAW, GAPS = 0, 1
+
+def catalog_fingerprint(catalog: ProblemCatalog) -> bytes:
+    """Digest of the catalog's canonical ids in problem id order, i.e. of its bit numbering"""
+    digest = hashlib.sha1()
+    for problem in catalog.unique_problems():
+        digest.update(problem.canonical_id.encode("utf-8"))
+        digest.update(b"\n")
+    return digest.digest()
+
+def _write_varint(out: bytearray, value: int):
+    while value > 0x7F:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+def _read_varint(data: bytes, offset: int) -> Tuple[int, int]:
+    value = shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+def encode_bitmap(bits: int) -> bytes:
+    """Compact bytes of a bitmap: raw little-endian bits, or varint gaps between set bits if shorter"""
+    size = (bits.bit_length() + 7) // 8
+    # A gap takes at least one byte, so only bitmaps with fewer set bits than bytes can be smaller as gaps
+    if bit_count(bits) < size:
+        positions = bit_positions(bits)
+        gaps = [position - previous - 1 for previous, position in zip([-1, *positions], positions)]
+        if max(gaps) < 0x80:
+            # Every gap fits one varint byte, the usual case for learners working through topics
+            out = bytearray([GAPS]) + bytes(gaps)
+        else:
+            out = bytearray([GAPS])
+            for gap in gaps:
+                _write_varint(out, gap)
+        if len(out) <= size:
+            return bytes(out)
+    return bytes([RAW]) + bits.to_bytes(size, "little")
+
+def decode_bitmap(data: bytes) -> int:
+    """Bitmap from encode_bitmap's bytes"""
+    if not data:
+        raise ValueError("Empty bitmap encoding")
+    if data[0] == RAW:
+        return int.from_bytes(data[1:], "little")
+    if data[0] != GAPS:
+        raise ValueError(f"Unknown bitmap encoding {data[0]}")
+    if len(data) == 1:
+        return 0
+    if max(data[1:]) < 0x80:
+        gaps = data[1:]
+    else:
+        gaps, offset = [], 1
+        while offset < len(data):
+            gap, offset = _read_varint(data, offset)
+            gaps.append(gap)
+    positions = list(accumulate(gaps, lambda position, gap: position + gap + 1, initial=-1))[1:]
+    # Set bits in a byte buffer and convert once, instead of growing an int bit by bit
+    buffer = bytearray(positions[-1] // 8 + 1)
+    for position in positions:
+        buffer[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(buffer, "little")
+
+class ProblemMasks:
+    """Bitmap of the distinct problems under every (topic, level), every topic and every level"""
+
+    def __init__(self, catalog: ProblemCatalog):
+        """
+        Args:
+            catalog: Compiled problem catalog whose problem ids number the bits
+        """
+        self.catalog = catalog
+        self._masks: Dict[Tuple[Optional[str], str], int] = {}
+        self._counts: Dict[Tuple[Optional[str], str], int] = {}
+        for topic in catalog.topics():
+            for level in (*LEVELS, "all"):
+                self._set((topic, level), [problem.problem_id for problem in catalog.problems(topic, level, dedup=True)])
+        for level in LEVELS:
+            # A problem listed at one level under several topics counts once
+            self._set((None, level), {problem.problem_id for problem in catalog if problem.level == level})
+        self._masks[(None, "all")] = (1 << catalog.unique_count()) - 1
+        self._counts[(None, "all")] = catalog.unique_count()
+
+    def _set(self, key: Tuple[Optional[str], str], problem_ids: Collection[int]):
+        if not problem_ids:
+            return
+        # Set bits in a byte buffer and convert once; OR-ing bit by bit into an int is quadratic
+        buffer = bytearray(max(problem_ids) // 8 + 1)
+        for problem_id in problem_ids:
+            buffer[problem_id >> 3] |= 1 << (problem_id & 7)
+        self._masks[key] = int.from_bytes(buffer, "little")
+        self._counts[key] = len(problem_ids)
+
+    def mask(self, topic: Optional[str] = None, level: str = "all") -> int:
+        """Bitmap of the distinct problems of a topic (None for every topic) at one level or all"""
+        return self._masks.get((topic, level), 0)
+
+    def count(self, topic: Optional[str] = None, level: str = "all") -> int:
+        """Distinct problems of a topic (None for every topic) at one level or all"""
+        return self._counts.get((topic, level), 0)
+
+class SolvedIndex:
+    """Solved problem bitmaps of many learners over one catalog"""
+
+    def __init__(self, catalog: ProblemCatalog, masks: Optional[ProblemMasks] = None):
+        """
+        Args:
+            catalog: Compiled problem catalog whose problem ids number the bits
+            masks: Precomputed masks of the same catalog (built if omitted)
+        """
+        self.catalog = catalog
+        self.masks = masks or ProblemMasks(catalog)
+        self._bitmaps: Dict[Hashable, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._bitmaps)
+
+    def __contains__(self, learner: Hashable) -> bool:
+        return learner in self._bitmaps
+
+    def learners(self) -> List[Hashable]:
+        """Learners with a bitmap, in insertion order"""
+        return list(self._bitmaps)
+
+    def bitmap(self, learner: Hashable) -> int:
+        """A learner's solved bitmap (0 if unknown)"""
+        return self._bitmaps.get(learner, 0)
+
+    def set_bitmap(self, learner: Hashable, bits: int):
+        """Replace a learner's solved bitmap"""
+        if bits < 0 or bits.bit_length() > self.catalog.unique_count():
+            raise ValueError("Bitmap has bits outside the catalog's problem ids")
+        self._bitmaps[learner] = bits
+
+    def mark_solved(self, learner: Hashable, problem_id: int):
+        """Mark one problem (by problem id) solved"""
+        self._check(problem_id)
+        self._bitmaps[learner] = self._bitmaps.get(learner, 0) | 1 << problem_id
+
+    def mark_unsolved(self, learner: Hashable, problem_id: int):
+        """Clear one problem (by problem id)"""
+        self._check(problem_id)
+        bits = self._bitmaps.get(learner, 0)
+        if bits >> problem_id & 1:
+            self._bitmaps[learner] = bits ^ 1 << problem_id
+
+    def add_solved(self, learner: Hashable, problem_ids: Iterable[int]):
+        """Mark many problems solved at once"""
+        problem_ids = list(problem_ids)
+        if not problem_ids:
+            self._bitmaps.setdefault(learner, 0)
+            return
+        for problem_id in (min(problem_ids), max(problem_ids)):
+            self._check(problem_id)
+        buffer = bytearray(max(problem_ids) // 8 + 1)
+        for problem_id in problem_ids:
+            buffer[problem_id >> 3] |= 1 << (problem_id & 7)
+        self._bitmaps[learner] = self._bitmaps.get(learner, 0) | int.from_bytes(buffer, "little")
+
+    def add_solved_links(self, learner: Hashable, canonical_ids: Iterable[str]) -> int:
+        """Mark problems solved by canonical id; returns how many were unknown to the catalog and skipped"""
+        problem_ids = [self.catalog.problem_id(canonical_id) for canonical_id in canonical_ids]
+        known = [problem_id for problem_id in problem_ids if problem_id >= 0]
+        self.add_solved(learner, known)
+        return len(problem_ids) - len(known)
+
+    def _check(self, problem_id: int):
+        if not 0 <= problem_id < self.catalog.unique_count():
+            raise IndexError(f"Problem id {problem_id} is not in the catalog")
+
+    def is_solved(self, learner: Hashable, problem_id: int) -> bool:
+        """Whether a learner solved a problem"""
+        return bool(self._bitmaps.get(learner, 0) >> problem_id & 1)
+
+    def solved_count(self, learner: Hashable, topic: Optional[str] = None, level: str = "all") -> int:
+        """Distinct problems a learner solved in a topic (None for every topic) at one level or all"""
+        return bit_count(self._bitmaps.get(learner, 0) & self.masks.mask(topic, level))
+
+    def unsolved_count(self, learner: Hashable, topic: Optional[str] = None, level: str = "all") -> int:
+        """Distinct problems a learner has not solved in a topic at one level or all"""
+        return self.masks.count(topic, level) - self.solved_count(learner, topic, level)
+
+    def unsolved_counts(self, topic: Optional[str] = None, level: str = "all",
+                        learners: Optional[Iterable[Hashable]] = None) -> Dict[Hashable, int]:
+        """
+        Unsolved problem counts of many learners for one topic and level
+
+        Args:
+            topic: DSA topic name (None for every topic)
+            level: Difficulty level (beginner, intermediate, advanced, all)
+            learners: Learners to count (default every learner in the index)
+
+        Returns:
+            Dictionary mapping learners to their unsolved counts
+        """
+        mask = self.masks.mask(topic, level)
+        total = self.masks.count(topic, level)
+        bitmaps = self._bitmaps
+        if learners is None:
+            return {learner: total - bit_count(bits & mask) for learner, bits in bitmaps.items()}
+        return {learner: total - bit_count(bitmaps.get(learner, 0) & mask) for learner in learners}
+
+    def unsolved(self, learner: Hashable, topic: str, level: str = "all") -> List[Problem]:
+        """Problems of a topic a learner has not solved, each once, in catalog order"""
+        mask = self.masks.mask(topic, level)
+        remaining = mask & ~self._bitmaps.get(learner, 0)
+        if remaining == mask:
+            return list(self.catalog.problems(topic, level, dedup=True))
+        keep = set(bit_positions(remaining))
+        return [problem for problem in self.catalog.problems(topic, level, dedup=True) if problem.problem_id in keep]
+
+    def solved_ids(self, learner: Hashable) -> List[str]:
+        """Canonical ids of a learner's solved problems, e.g. to carry them over to a rebuilt catalog"""
+        problems = self.catalog.unique_problems()
+        return [problems[problem_id].canonical_id for problem_id in bit_positions(self._bitmaps.get(learner, 0))]
+
+    def dump(self, stream: IO[bytes]) -> int:
+        """
+        Write every learner's bitmap to a binary stream
+
+        Layout: magic, format version, catalog fingerprint, learner count,
+        then per learner its id (UTF-8, varint length) and encoded bitmap
+        (varint length). Learner ids are written as strings.
+
+        Returns:
+            Bytes written
+        """
+        out = bytearray(MAGIC)
+        out += struct.pack("<B20sI", FORMAT_VERSION, catalog_fingerprint(self.catalog), len(self._bitmaps))
+        for learner, bits in self._bitmaps.items():
+            name = str(learner).encode("utf-8")
+            encoded = encode_bitmap(bits)
+            _write_varint(out, len(name))
+            out += name
+            _write_varint(out, len(encoded))
+            out += encoded
+        stream.write(out)
+        return len(out)
+
+    @classmethod
+    def load(cls, catalog: ProblemCatalog, stream: IO[bytes], masks: Optional[ProblemMasks] = None) -> "SolvedIndex":
+        """
+        Read an index written by dump
+
+        Raises:
+            ValueError: If the data is not a solved index or was written for another catalog
+        """
+        data = stream.read()
+        header = len(MAGIC) + struct.calcsize("<B20sI")
+        if data[:len(MAGIC)] != MAGIC or len(data) < header:
+            raise ValueError("Not a solved problem index")
+        version, fingerprint, learners = struct.unpack_from("<B20sI", data, len(MAGIC))
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported solved index format {version}")
+        if fingerprint != catalog_fingerprint(catalog):
+            raise ValueError("Solved index was written for a different catalog; carry learners over with solved_ids")
+        index = cls(catalog, masks)
+        offset = header
+        for _ in range(learners):
+            length, offset = _read_varint(data, offset)
+            name = data[offset:offset + length].decode("utf-8")
+            offset += length
+            length, offset = _read_varint(data, offset)
+            index._bitmaps[name] = decode_bitmap(data[offset:offset + length])
+            offset += length
+        return index
+
+    def iter_encoded(self) -> Iterator[Tuple[Hashable, bytes]]:
+        """(learner, encoded bitmap) pairs, e.g. to store learners in separate rows"""
+        for learner, bits in self._bitmaps.items():
+            yield learner, encode_bitmap(bits)
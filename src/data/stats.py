@@ -0,0 +1,113 @@
+"""
+Problem Statistics
+Problem counts per topic, per level and per (topic, level), with and
+without de-duplication, kept up to date incrementally
+
+Counts are computed once from the catalog and then adjusted by ``add`` and
+``remove`` as problems come and go, so every lookup is a dictionary read.
+Dedup counts keep, for each canonical problem, how often it is listed
+under each (topic, level) pair. A problem has only a handful of listings,
+so checking whether it is already counted for a topic or level is cheap,
+and a dedup count only changes when that goes from no to yes or back.
+"""
+
+from types import MappingProxyType
+from typing import Dict, Hashable, Mapping, Optional, Tuple
+
+from .catalog import ProblemCatalog
+
+class ProblemStats:
+    """Incrementally maintained problem counts"""
+
+    def __init__(self):
+        # Listing counts and distinct problem counts: key -> count
+        self._listings: Dict[Hashable, int] = {}
+        self._unique: Dict[Hashable, int] = {}
+        # Listings of each canonical id: canonical_id -> {(topic, level): listings}
+        self._placements: Dict[str, Dict[Tuple[str, str], int]] = {}
+        # Per-topic counts, also exposed as live read-only mappings
+        self._by_topic: Dict[str, int] = {}
+        self._unique_by_topic: Dict[str, int] = {}
+        self._by_topic_view = MappingProxyType(self._by_topic)
+        self._unique_by_topic_view = MappingProxyType(self._unique_by_topic)
+
+    @classmethod
+    def from_catalog(cls, catalog: ProblemCatalog) -> "ProblemStats":
+        """Count every listing of a compiled catalog"""
+        stats = cls()
+        for topic in catalog.topics():
+            # Topics keep catalog order in the per-topic views, even with no problems
+            stats._by_topic[topic] = 0
+            stats._unique_by_topic[topic] = 0
+        for problem in catalog:
+            stats.add(problem.topic, problem.level, problem.canonical_id)
+        return stats
+
+    @staticmethod
+    def _keys(topic: str, level: str, placements: Dict[Tuple[str, str], int]):
+        """Each key with whether the problem is listed under it"""
+        # Keys are tagged, so a level can share a topic's name
+        return (
+            (None, bool(placements)),
+            (("topic", topic), any(t == topic for t, _ in placements)),
+            (("level", level), any(l == level for _, l in placements)),
+            (("pair", topic, level), (topic, level) in placements),
+        )
+
+    def _update(self, topic: str, level: str, canonical_id: str, delta: int):
+        placements = self._placements.setdefault(canonical_id, {})
+        before = self._keys(topic, level, placements)
+        pair = placements.get((topic, level), 0) + delta
+        if pair:
+            placements[(topic, level)] = pair
+        else:
+            placements.pop((topic, level), None)
+            if not placements:
+                del self._placements[canonical_id]
+        after = self._keys(topic, level, placements)
+
+        for (key, was_listed), (_, is_listed) in zip(before, after):
+            self._listings[key] = self._listings.get(key, 0) + delta
+            if was_listed != is_listed:
+                self._unique[key] = self._unique.get(key, 0) + (1 if is_listed else -1)
+        self._by_topic[topic] = self._listings[("topic", topic)]
+        self._unique_by_topic[topic] = self._unique.get(("topic", topic), 0)
+
+    def add(self, topic: str, level: str, canonical_id: str):
+        """Record one new listing of a problem under (topic, level)"""
+        self._update(topic, level, canonical_id, 1)
+
+    def remove(self, topic: str, level: str, canonical_id: str):
+        """
+        Forget one listing of a problem under (topic, level)
+
+        Raises:
+            KeyError: If the problem is not listed there
+        """
+        if (topic, level) not in self._placements.get(canonical_id, {}):
+            raise KeyError(f"'{canonical_id}' is not listed under {topic} / {level}")
+        self._update(topic, level, canonical_id, -1)
+
+    def count(self, topic: Optional[str] = None, level: Optional[str] = None, dedup: bool = False) -> int:
+        """
+        Number of problems of a topic, a level, a (topic, level) pair, or overall
+
+        Args:
+            topic: DSA topic name (None for all topics)
+            level: Difficulty level (None or "all" for all levels)
+            dedup: Count distinct problems instead of listings
+
+        Returns:
+            The count (0 for unknown topics or levels)
+        """
+        if level == "all":
+            level = None
+        if topic is None:
+            key = None if level is None else ("level", level)
+        else:
+            key = ("topic", topic) if level is None else ("pair", topic, level)
+        return (self._unique if dedup else self._listings).get(key, 0)
+
+    def counts_by_topic(self, dedup: bool = False) -> Mapping[str, int]:
+        """Live read-only mapping of topic -> count"""
+        return self._unique_by_topic_view if dedup else self._by_topic_view
@@ -0,0 +1,232 @@
+"""
+Synthetic Curriculum Generator
+Seeded generators for large topic dependency graphs and problem catalogs used by the benchmarks
+"""
+
+import itertools
+import random
+from typing import Callable, Dict, List
+
+def _names(num_topics: int) -> List[str]:
+    return [f"Topic {i}" for i in range(num_topics)]
+
+def layered_curriculum(num_topics: int, seed: int = 0, layers: int = 0, avg_prereqs: float = 3.0) -> Dict[str, List[str]]:
+    """
+    Random layered DAG: every topic depends on topics from the layer above
+
+    Args:
+        num_topics: Number of topics
+        seed: Random seed
+        layers: Number of layers (defaults to roughly the square root of num_topics)
+        avg_prereqs: Average number of prerequisites per non-root topic
+
+    Returns:
+        Dictionary mapping topics to their prerequisites
+    """
+    rng = random.Random(seed)
+    names = _names(num_topics)
+    layers = layers or max(1, int(num_topics ** 0.5))
+    width = max(1, -(-num_topics // layers))
+
+    dependencies = {}
+    for i, name in enumerate(names):
+        layer_start = (i // width) * width
+        if layer_start == 0:
+            dependencies[name] = []
+            continue
+        previous_start = layer_start - width
+        count = min(width, max(1, int(rng.expovariate(1 / avg_prereqs))))
+        picks = {rng.randrange(previous_start, layer_start) for _ in range(count)}
+        dependencies[name] = [names[j] for j in sorted(picks)]
+    return dependencies
+
+def chain_curriculum(num_topics: int, seed: int = 0) -> Dict[str, List[str]]:
+    """
+    Single long chain: every topic depends on the one before it
+
+    Args:
+        num_topics: Number of topics
+        seed: Unused, accepted so all generators share one signature
+
+    Returns:
+        Dictionary mapping topics to their prerequisites
+    """
+    names = _names(num_topics)
+    return {name: ([names[i - 1]] if i else []) for i, name in enumerate(names)}
+
+def fan_in_curriculum(num_topics: int, seed: int = 0, fan_in: int = 1000) -> Dict[str, List[str]]:
+    """
+    Wide fan-in: a few capstone topics each depend on many foundation topics
+
+    There is one capstone per fan_in topics, each depending on up to fan_in
+    random foundation topics, and a final topic depends on every capstone.
+
+    Args:
+        num_topics: Number of topics
+        seed: Random seed
+        fan_in: Maximum prerequisites per capstone topic
+
+    Returns:
+        Dictionary mapping topics to their prerequisites
+    """
+    rng = random.Random(seed)
+    names = _names(num_topics)
+    if num_topics < 3:
+        return chain_curriculum(num_topics)
+
+    capstones = max(1, num_topics // (fan_in + 1))
+    foundations = num_topics - capstones - 1
+    dependencies = {name: [] for name in names[:foundations]}
+    for name in names[foundations:-1]:
+        count = min(fan_in, foundations)
+        dependencies[name] = [names[j] for j in sorted(rng.sample(range(foundations), count))]
+    dependencies[names[-1]] = names[foundations:-1]
+    return dependencies
+
+def power_law_curriculum(num_topics: int, seed: int = 0, prereqs_per_topic: int = 2) -> Dict[str, List[str]]:
+    """
+    Power-law curriculum grown by preferential attachment
+
+    Topics that many others already build on are more likely to become
+    prerequisites of new topics, giving a few heavily shared foundations.
+
+    Args:
+        num_topics: Number of topics
+        seed: Random seed
+        prereqs_per_topic: Prerequisites drawn for each new topic
+
+    Returns:
+        Dictionary mapping topics to their prerequisites
+    """
+    rng = random.Random(seed)
+    names = _names(num_topics)
+    # Each topic appears once, plus once more per dependent it has gained
+    attachment = []
+    dependencies = {}
+    for i, name in enumerate(names):
+        picks = set()
+        if attachment:
+            for _ in range(min(i, prereqs_per_topic)):
+                picks.add(attachment[rng.randrange(len(attachment))])
+        dependencies[name] = [names[j] for j in sorted(picks)]
+        attachment.extend(picks)
+        attachment.append(i)
+    return dependencies
+
+# Generators selectable by name
+CURRICULUM_GENERATORS: Dict[str, Callable[..., Dict[str, List[str]]]] = {
+    "layered": layered_curriculum,
+    "chain": chain_curriculum,
+    "fan_in": fan_in_curriculum,
+    "power_law": power_law_curriculum,
+}
+
+def generate_curriculum(kind: str, num_topics: int, seed: int = 0, shuffle: bool = False) -> Dict[str, List[str]]:
+    """
+    Generate a synthetic curriculum by kind
+
+    Args:
+        kind: One of the names in CURRICULUM_GENERATORS
+        num_topics: Number of topics
+        seed: Random seed
+        shuffle: Shuffle the dictionary order so it no longer follows generation order
+
+    Returns:
+        Dictionary mapping topics to their prerequisites
+    """
+    if kind not in CURRICULUM_GENERATORS:
+        raise ValueError(f"Unknown curriculum kind '{kind}'. Choose from: {', '.join(CURRICULUM_GENERATORS)}")
+
+    dependencies = CURRICULUM_GENERATORS[kind](num_topics, seed=seed)
+    if shuffle:
+        items = list(dependencies.items())
+        random.Random(seed).shuffle(items)
+        dependencies = dict(items)
+    return dependencies
+
+_TITLE_WORDS = [
+    "Array", "String", "Tree", "Graph", "Path", "Sum", "Subarray", "Substring", "Matrix", "Interval",
+    "Median", "Rectangle", "Window", "Stack", "Queue", "Heap", "Node", "List", "Cycle", "Island",
+    "Palindrome", "Anagram", "Partition", "Range", "Query", "Order", "Sequence", "Bracket", "Coin", "Jump",
+    "Profit", "Distance", "Edit", "Merge", "Split", "Rotate", "Search", "Sort", "Count", "Kth",
+    "Largest", "Smallest", "Longest", "Shortest", "Minimum", "Maximum", "Valid", "Unique", "Balanced", "Binary",
+]
+
+_SYLLABLES = ["ka", "lo", "mi", "ne", "ro", "ta", "vu", "zi", "pe", "su", "dra", "gon", "tri", "ex", "ul"]
+
+def _vocabulary(size: int) -> List[str]:
+    """Domain words first, then pronounceable filler words, most frequent first"""
+    words = list(_TITLE_WORDS)
+    i = 0
+    while len(words) < size:
+        word, j = "", i
+        while True:
+            word += _SYLLABLES[j % len(_SYLLABLES)]
+            j //= len(_SYLLABLES)
+            if not j:
+                break
+        words.append(word.capitalize() + "ix")
+        i += 1
+    return words[:size]
+
+_LINK_PATTERNS = [
+    "https://leetcode.com/problems/{slug}/",
+    "https://www.geeksforgeeks.org/{slug}/",
+    "https://www.hackerrank.com/challenges/{slug}/problem",
+    "https://codeforces.com/problemset/problem/{number}/A",
+]
+
+def generate_problem_catalog(num_problems: int, num_topics: int = 100, seed: int = 0,
+                             duplicate_rate: float = 0.05, vocabulary_size: int = 20000
+                             ) -> Dict[str, Dict[str, List[Dict[str, str]]]]:
+    """
+    Random problem catalog in the PROBLEMS_DATA layout
+
+    Title and description words follow a Zipf distribution over a fixed
+    vocabulary, with common DSA words ("Array", "Sum", ...) at the head,
+    so term frequencies resemble real problem text. A fraction of entries repeat an earlier
+    problem under another topic or level, sometimes with a cosmetically
+    different link (http, missing trailing slash, query string), the way
+    curated lists overlap.
+
+    Args:
+        num_problems: Number of problem entries
+        num_topics: Number of topics ("Topic 0", "Topic 1", ...)
+        seed: Random seed
+        duplicate_rate: Fraction of entries that repeat an earlier problem
+        vocabulary_size: Distinct words in titles and descriptions
+
+    Returns:
+        Dictionary mapping topic -> level -> list of problem dictionaries
+    """
+    rng = random.Random(seed)
+    vocabulary = _vocabulary(vocabulary_size)
+    cum_weights = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(vocabulary))))
+    levels = ("beginner", "intermediate", "advanced")
+    catalog = {name: {level: [] for level in levels} for name in _names(num_topics)}
+    topics = list(catalog)
+    emitted = []
+    for i in range(num_problems):
+        if emitted and rng.random() < duplicate_rate:
+            original = emitted[rng.randrange(len(emitted))]
+            link = original["link"]
+            variant = rng.randrange(4)
+            if variant == 1:
+                link = link.replace("https://", "http://", 1)
+            elif variant == 2:
+                link = link.rstrip("/")
+            elif variant == 3:
+                link = f"{link}?ref=list{rng.randrange(10)}"
+            problem = {**original, "link": link}
+        else:
+            words = rng.choices(vocabulary, cum_weights=cum_weights, k=rng.randint(2, 5))
+            title = f"{' '.join(words)} {i}"
+            slug = "-".join(words).lower() + f"-{i}"
+            problem = {
+                "title": title,
+                "description": " ".join(rng.choices(vocabulary, cum_weights=cum_weights, k=rng.randint(6, 14))).lower(),
+                "link": rng.choice(_LINK_PATTERNS).format(slug=slug, number=i),
+            }
+            emitted.append(problem)
+        catalog[topics[rng.randrange(num_topics)]][levels[rng.randrange(3)]].append(problem)
+    return catalog
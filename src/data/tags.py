@@ -0,0 +1,312 @@
+"""
+Problem Tags
+Boolean problem queries over topics, levels, tags and solved state,
+evaluated as compressed bitmap algebra
+
+Every term a query can name has a RoaringBitmap of the catalog listings
+(by record index) it covers: each topic, each level, each practice
+platform and each tag. Tags come from the problems' optional ``tags``
+field, so a problem can belong to several techniques beyond the topic it
+is listed under ("Sliding Window Maximum" is deque, heap and sliding
+window). Names are matched case-insensitively, and a tag with a topic's
+name merges with it. A query such as
+
+    (Heaps OR Queues) AND advanced AND NOT solved
+
+is parsed once and evaluated without touching individual problems: NOT is
+carried as a flag and folded into AND NOT (set difference), so only a bare
+top-level NOT is taken against the set of all listings. ``solved`` is
+reserved for the listings of the learner's solved problems, passed in per
+query. Terms with spaces need no quotes; terms containing AND, OR or NOT,
+or parentheses, go in double quotes.
+
+Queries match listings, not problems, because a problem listed under
+several topics can have a different level under each: "Merge k Sorted
+Lists" is advanced under Linked Lists but intermediate under Heaps, so
+"Heaps AND advanced" must not match it. A problem matches when one of its
+listings does and is counted and returned once. NOT excludes problems,
+though: a negated topic, platform or tag covers every listing of its
+problems, so "Arrays AND NOT Dynamic Programming" drops Maximum Subarray
+from Arrays too. Levels stay per listing under NOT as well.
+"""
+
+import re
+from functools import reduce
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from .bitmaps import RoaringBitmap
+from .catalog import Problem, ProblemCatalog
+
+SOLVED_TERM = "solved"
+OPERATORS = ("AND", "OR", "NOT")
+
+_TOKEN = re.compile(r'\s*(?:(\()|(\))|"([^"]*)"|([^\s()"]+))')
+
+# Evaluated subexpression: a bitmap, and whether it stands for the complement of that bitmap
+_Value = Tuple[RoaringBitmap, bool]
+
+def tokenize_query(expression: str) -> List[Tuple[str, str]]:
+    """
+    Split a query into ("(", ""), (")", ""), ("op", AND/OR/NOT) and ("term", name) tokens
+
+    Raises:
+        ValueError: If the query has an unmatched quote
+    """
+    tokens: List[Tuple[str, str]] = []
+    words: List[str] = []
+
+    def flush():
+        if words:
+            tokens.append(("term", " ".join(words)))
+            words.clear()
+
+    position = 0
+    expression = expression.rstrip()
+    while position < len(expression):
+        match = _TOKEN.match(expression, position)
+        if match is None:
+            raise ValueError("Unmatched quote in query")
+        position = match.end()
+        open_paren, close_paren, quoted, word = match.groups()
+        if word is not None and word.upper() not in OPERATORS:
+            words.append(word)
+            continue
+        flush()
+        if open_paren:
+            tokens.append(("(", ""))
+        elif close_paren:
+            tokens.append((")", ""))
+        elif quoted is not None:
+            tokens.append(("term", " ".join(quoted.split())))
+        else:
+            tokens.append(("op", word.upper()))
+    flush()
+    return tokens
+
+class TagIndex:
+    """Compressed bitmap of catalog listings per topic, level, platform and tag"""
+
+    def __init__(self, catalog: ProblemCatalog, topics: Iterable[str] = (),
+                 aliases: Optional[Mapping[str, str]] = None):
+        """
+        Args:
+            catalog: Compiled problem catalog whose record indexes the bitmaps hold
+            topics: Further known names, e.g. curriculum topics without problems (empty sets)
+            aliases: Alternative names mapped to topics, levels or tags, e.g. "DP" or "hard"
+        """
+        self.catalog = catalog
+        members: Dict[str, Set[int]] = {}
+        self._names: Dict[str, str] = {}
+        # Level names (and their aliases): properties of a listing, not of a problem
+        self._listing_terms: Set[str] = {problem.level.lower() for problem in catalog}
+        for problem in catalog:
+            names = [problem.topic, problem.level]
+            if problem.platform:
+                names.append(problem.platform)
+            if problem.tags:
+                names.extend(problem.tags)
+            for name in names:
+                key = name.lower()
+                self._names.setdefault(key, name)
+                members.setdefault(key, set()).add(problem.index)
+        for name in topics:
+            self._names.setdefault(name.lower(), name)
+            members.setdefault(name.lower(), set())
+        self._bitmaps = {key: RoaringBitmap.from_ids(ids) for key, ids in members.items()}
+        # Aliases share their target's bitmap
+        for alias, name in (aliases or {}).items():
+            if name.lower() in self._bitmaps:
+                self._bitmaps.setdefault(alias.lower(), self._bitmaps[name.lower()])
+                if name.lower() in self._listing_terms:
+                    self._listing_terms.add(alias.lower())
+        self.universe = RoaringBitmap.from_range(len(catalog))
+        # Listings after a problem's first one; only these can repeat a problem in a result
+        unique = catalog.unique_problems()
+        repeats = [problem for problem in catalog if unique[problem.problem_id] is not problem]
+        self._repeats = RoaringBitmap.from_ids(problem.index for problem in repeats)
+        # Every listing of a problem listed more than once, and negated term bitmaps built on first use
+        self._shared = self._repeats | RoaringBitmap.from_ids(unique[problem.problem_id].index for problem in repeats)
+        self._negated: Dict[str, RoaringBitmap] = {}
+
+    def terms(self) -> List[str]:
+        """Every name a query can use (besides "solved"), in first-seen spelling"""
+        return list(self._names.values())
+
+    def bitmap(self, term: str) -> RoaringBitmap:
+        """
+        Listings of one topic, level, platform or tag
+
+        Raises:
+            ValueError: If no problem has that name
+        """
+        bitmap = self._bitmaps.get(term.lower())
+        if bitmap is None:
+            raise ValueError(f"Unknown topic, level or tag '{term}'")
+        return bitmap
+
+    def negated_bitmap(self, term: str) -> RoaringBitmap:
+        """
+        Listings a NOT on the term excludes: every listing of its problems,
+        or just its own listings for a level
+
+        Raises:
+            ValueError: If no problem has that name
+        """
+        key = term.lower()
+        bitmap = self._negated.get(key)
+        if bitmap is None:
+            bitmap = self.bitmap(term)
+            if key not in self._listing_terms:
+                bitmap = self.expand(bitmap)
+            self._negated[key] = bitmap
+        return bitmap
+
+    def expand(self, bitmap: RoaringBitmap) -> RoaringBitmap:
+        """Bitmap with every listing of the problems it has a listing of"""
+        problem_ids = {self.catalog[index].problem_id for index in bitmap & self._shared}
+        return bitmap | RoaringBitmap.from_ids(problem.index for problem_id in problem_ids
+                                               for problem in self.catalog.listings(problem_id))
+
+    def query(self, expression: str, solved: Optional[RoaringBitmap] = None) -> RoaringBitmap:
+        """
+        Listings matching a boolean query
+
+        Args:
+            expression: Terms combined with AND, OR, NOT and parentheses
+            solved: Listings of the learner's solved problems, for the "solved" term (see solved_bitmap)
+
+        Returns:
+            Bitmap of matching record indexes
+
+        Raises:
+            ValueError: If the query is malformed or names an unknown term
+        """
+        tokens = tokenize_query(expression)
+        if not tokens:
+            raise ValueError("Empty query")
+        parser = _Parser(tokens, self, solved or RoaringBitmap())
+        bitmap, negated = parser.parse()
+        return self.universe - bitmap if negated else bitmap
+
+    def count(self, expression: str, solved: Optional[RoaringBitmap] = None) -> int:
+        """Number of distinct problems matching a boolean query"""
+        result = self.query(expression, solved)
+        # Matching first listings count once each; a matching repeat only counts when
+        # its problem's first listing did not match
+        unique = self.catalog.unique_problems()
+        missed = {self.catalog[index].problem_id for index in result & self._repeats}
+        return len(result - self._repeats) + sum(unique[problem_id].index not in result for problem_id in missed)
+
+    def problems(self, expression: str, solved: Optional[RoaringBitmap] = None,
+                 limit: Optional[int] = None) -> List[Problem]:
+        """Problems matching a boolean query, each at its first matching listing, in catalog order"""
+        seen: Set[int] = set()
+        problems: List[Problem] = []
+        for index in self.query(expression, solved):
+            if limit is not None and len(problems) == limit:
+                break
+            problem = self.catalog[index]
+            if problem.problem_id not in seen:
+                seen.add(problem.problem_id)
+                problems.append(problem)
+        return problems
+
+    def solved_bitmap(self, canonical_ids: Iterable[str]) -> RoaringBitmap:
+        """Bitmap of every listing of the solved problems; canonical ids the catalog lacks are skipped"""
+        problem_ids = (self.catalog.problem_id(canonical_id) for canonical_id in canonical_ids)
+        return RoaringBitmap.from_ids(problem.index for problem_id in problem_ids if problem_id >= 0
+                                      for problem in self.catalog.listings(problem_id))
+
+class _Parser:
+    """Recursive descent over query tokens: OR binds loosest, then AND, then NOT"""
+
+    def __init__(self, tokens: List[Tuple[str, str]], index: TagIndex, solved: RoaringBitmap):
+        self.tokens = tokens
+        self.position = 0
+        self.index = index
+        self.solved = solved
+        # Whether the terms being parsed sit under an odd number of NOTs
+        self.negated = False
+
+    def _peek(self) -> Tuple[str, str]:
+        return self.tokens[self.position] if self.position < len(self.tokens) else ("end", "")
+
+    def _next(self) -> Tuple[str, str]:
+        token = self._peek()
+        self.position += 1
+        return token
+
+    def parse(self) -> _Value:
+        value = self._or()
+        kind, text = self._peek()
+        if kind != "end":
+            raise ValueError(f"Unexpected {text or kind!r} in query")
+        return value
+
+    def _or(self) -> _Value:
+        operands = [self._and()]
+        while self._peek() == ("op", "OR"):
+            self._next()
+            operands.append(self._and())
+        if len(operands) == 1:
+            return operands[0]
+        positive = [bitmap for bitmap, negated in operands if not negated]
+        negative = [bitmap for bitmap, negated in operands if negated]
+        union = reduce(RoaringBitmap.__or__, positive) if positive else RoaringBitmap()
+        if not negative:
+            return union, False
+        # NOT a OR NOT b OR c = NOT ((a AND b) AND NOT c)
+        return _intersect(negative) - union, True
+
+    def _and(self) -> _Value:
+        operands = [self._not()]
+        while self._peek() == ("op", "AND"):
+            self._next()
+            operands.append(self._not())
+        if len(operands) == 1:
+            return operands[0]
+        positive = [bitmap for bitmap, negated in operands if not negated]
+        negative = [bitmap for bitmap, negated in operands if negated]
+        if not positive:
+            # NOT a AND NOT b = NOT (a OR b)
+            return reduce(RoaringBitmap.__or__, negative), True
+        result = _intersect(positive)
+        for bitmap in negative:
+            if not result:
+                break
+            result = result - bitmap
+        return result, False
+
+    def _not(self) -> _Value:
+        if self._peek() == ("op", "NOT"):
+            self._next()
+            self.negated = not self.negated
+            bitmap, negated = self._not()
+            self.negated = not self.negated
+            return bitmap, not negated
+        return self._atom()
+
+    def _atom(self) -> _Value:
+        kind, text = self._next()
+        if kind == "(":
+            value = self._or()
+            if self._next()[0] != ")":
+                raise ValueError("Missing ')' in query")
+            return value
+        if kind == "term":
+            if text.lower() == SOLVED_TERM:
+                return self.solved, False
+            if self.negated:
+                return self.index.negated_bitmap(text), False
+            return self.index.bitmap(text), False
+        raise ValueError(f"Expected a topic, level or tag in query, got {text or kind!r}")
+
+def _intersect(bitmaps: List[RoaringBitmap]) -> RoaringBitmap:
+    # Smallest first, so every step works on the smallest possible set
+    ordered = sorted(bitmaps, key=len)
+    result = ordered[0]
+    for bitmap in ordered[1:]:
+        if not result:
+            break
+        result = result & bitmap
+    return result
@@ -3,6 +3,8 @@ DSA Topic Data and Dependencies
 Contains all DSA topics and their prerequisite relationships
 """
 
+from .autocomplete import build_index
+
 # DSA Topics with their dependencies
 TOPIC_DEPENDENCIES = {
     # Basic Data Structures
@@ -116,6 +118,38 @@ TOPIC_DESCRIPTIONS = {
     "Geometry": "Geometric algorithms and concepts"
 }
 
+# Common abbreviations and alternative names, used by type-ahead search
+TOPIC_ALIASES = {
+    "DP": "Dynamic Programming",
+    "Memoization": "Dynamic Programming",
+    "LL": "Linked Lists",
+    "BST": "Binary Search Trees",
+    "Heap": "Heaps",
+    "Prefix Tree": "Trie",
+    "Range Query": "Segment Trees",
+    "DSU": "Union Find",
+    "Disjoint Set": "Union Find",
+    "Topo Sort": "Topological Sort",
+    "Dijkstra": "Shortest Path",
+    "Bellman-Ford": "Shortest Path",
+    "MST": "Minimum Spanning Tree",
+    "Kruskal": "Minimum Spanning Tree",
+    "Prim": "Minimum Spanning Tree",
+    "Breadth First Search": "BFS",
+    "Depth First Search": "DFS",
+    "Hashing": "Hash Tables",
+    "Hash Map": "Maps",
+    "Dictionary": "Maps",
+    "KMP": "String Matching",
+    "Rabin-Karp": "String Matching",
+    "Regex": "Regular Expressions",
+    "Bitwise": "Bit Manipulation",
+    "Number Theory": "Math",
+    "Convex Hull": "Geometry",
+}
+
+_topic_prefix_index = None
+
 def get_all_topics():
     """Get all available topics"""
     return list(TOPIC_DEPENDENCIES.keys())
@@ -134,4 +168,15 @@ def get_topics_by_category(category):
 
 def get_all_categories():
     """Get all available categories"""
-    return list(TOPIC_CATEGORIES.keys()) 
\ No newline at end of file
+    return list(TOPIC_CATEGORIES.keys())
+
+def get_topic_aliases():
+    """Get alternative topic names mapped to their topics"""
+    return dict(TOPIC_ALIASES)
+
+def get_topic_prefix_index():
+    """Type-ahead index over topic names and aliases, built on first use"""
+    global _topic_prefix_index
+    if _topic_prefix_index is None:
+        _topic_prefix_index = build_index(TOPIC_DEPENDENCIES, TOPIC_ALIASES)
+    return _topic_prefix_index
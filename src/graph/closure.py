@@ -0,0 +1,212 @@
+"""
+Bit-packed Reachability Matrix
+Vectorized transitive closure over a topic graph using NumPy
+
+Row r of the ancestor matrix holds one bit per topic (indexed by canonical
+rank) for every topic that reaches rank r, including r itself. Rows are
+packed into little-endian uint64 words, so a closure query is a single row
+read and cohort questions become bitwise ORs/ANDs over a few rows.
+
+Rows are filled level by level: every topic in a level only depends on
+lower levels, so a whole level is computed with one gather and one
+``bitwise_or.reduceat``. Graphs with cycles repeat the pass until stable.
+
+Memory is n * n / 8 bytes per direction, which suits dense curricula of a
+few thousand topics; sparse or very large graphs are better served by BFS.
+"""
+
+from typing import Iterable
+
+import numpy as np
+
+WORD = np.dtype('<u8')
+
+# Gathered rows per reduceat call, in words, to bound temporary memory
+_GATHER_LIMIT = 1 << 22
+
+if hasattr(np, "bitwise_count"):
+    def popcount(words: np.ndarray) -> np.ndarray:
+        """Count set bits in each row of packed words"""
+        return np.bitwise_count(words).sum(axis=-1, dtype=np.int64)
+else:
+    _BYTE_COUNTS = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+    def popcount(words: np.ndarray) -> np.ndarray:
+        """Count set bits in each row of packed words"""
+        as_bytes = np.ascontiguousarray(words).view(np.uint8).reshape(*words.shape[:-1], -1)
+        return _BYTE_COUNTS[as_bytes].sum(axis=-1, dtype=np.int64)
+
+class ReachabilityMatrix:
+    """
+    Ancestor and descendant bitsets for every topic
+
+    All positions are canonical ranks (positions in the topological order).
+    """
+
+    def __init__(self, ranks: np.ndarray, pred_offsets: np.ndarray, pred_targets: np.ndarray,
+                 succ_offsets: np.ndarray, succ_targets: np.ndarray):
+        """
+        Build both closure matrices from CSR adjacency
+
+        Args:
+            ranks: Canonical rank of every node id
+            pred_offsets, pred_targets: CSR prerequisite lists by node id
+            succ_offsets, succ_targets: CSR dependent lists by node id
+        """
+        ranks = np.asarray(ranks, dtype=np.int64)
+        self.size = len(ranks)
+        self.words = max(1, (self.size + 63) // 64)
+
+        order = np.empty(self.size, dtype=np.int64)
+        order[ranks] = np.arange(self.size)
+        self.ancestors = self._propagate(*self._rank_csr(order, ranks, pred_offsets, pred_targets), descending=False)
+        self.descendants = self._propagate(*self._rank_csr(order, ranks, succ_offsets, succ_targets), descending=True)
+
+    @classmethod
+    def from_matrices(cls, ancestors: np.ndarray, descendants: np.ndarray) -> "ReachabilityMatrix":
+        """
+        Wrap closure matrices that were computed elsewhere
+
+        Args:
+            ancestors: Packed ancestor rows, one per rank
+            descendants: Packed descendant rows, one per rank
+
+        Returns:
+            ReachabilityMatrix using the given arrays without copying them
+        """
+        matrix = cls.__new__(cls)
+        matrix.size = len(ancestors)
+        matrix.words = ancestors.shape[1] if ancestors.ndim == 2 else 1
+        matrix.ancestors = ancestors
+        matrix.descendants = descendants
+        return matrix
+
+    @staticmethod
+    def _rank_csr(order, ranks, offsets, targets):
+        """Re-index a node-id CSR so rows and neighbors are canonical ranks"""
+        offsets = np.asarray(offsets, dtype=np.int64)
+        targets = np.asarray(targets, dtype=np.int64)
+        counts = (offsets[1:] - offsets[:-1])[order]
+        rank_offsets = np.zeros(len(order) + 1, dtype=np.int64)
+        np.cumsum(counts, out=rank_offsets[1:])
+        positions = _expand_ranges(offsets[order], counts)
+        return rank_offsets, ranks[targets[positions]] if len(positions) else positions
+
+    def _propagate(self, offsets: np.ndarray, neighbors: np.ndarray, descending: bool) -> np.ndarray:
+        """
+        OR every row's neighbor rows into it, one dependency level at a time
+
+        Prerequisites have lower ranks, so ancestors are filled from rank 0
+        upwards; dependents have higher ranks and are filled from the top down.
+        """
+        n = self.size
+        matrix = np.zeros((n, self.words), dtype=WORD)
+        own = np.arange(n)
+        matrix[own, own >> 6] = np.left_shift(np.uint64(1), (own & 63).astype(np.uint64))
+
+        counts = offsets[1:] - offsets[:-1]
+        rows = np.repeat(own, counts)
+        levels, acyclic = _longest_path_levels(n, rows, neighbors, descending)
+        groups = np.split(np.argsort(levels, kind="stable"), np.cumsum(np.bincount(levels))[:-1])
+
+        while True:
+            changed = False
+            for group in groups:
+                group = group[counts[group] > 0]
+                for chunk in _chunks(group, counts, self.words):
+                    chunk_counts = counts[chunk]
+                    gathered = matrix[neighbors[_expand_ranges(offsets[chunk], chunk_counts)]]
+                    starts = np.concatenate(([0], np.cumsum(chunk_counts)[:-1]))
+                    merged = np.bitwise_or.reduceat(gathered, starts, axis=0) | matrix[chunk]
+                    if not acyclic and not changed:
+                        changed = not np.array_equal(merged, matrix[chunk])
+                    matrix[chunk] = merged
+            if acyclic or not changed:
+                return matrix
+
+    def mask(self, ranks: Iterable[int]) -> np.ndarray:
+        """Packed row with the given rank bits set"""
+        row = np.zeros(self.words, dtype=WORD)
+        ranks = np.fromiter(ranks, dtype=np.int64)
+        np.bitwise_or.at(row, ranks >> 6, np.left_shift(np.uint64(1), (ranks & 63).astype(np.uint64)))
+        return row
+
+    def to_ranks(self, row: np.ndarray) -> np.ndarray:
+        """Ranks of the set bits in a packed row, in ascending order"""
+        bits = np.unpackbits(np.ascontiguousarray(row).view(np.uint8), bitorder="little")
+        return np.flatnonzero(bits[:self.size])
+
+    def strict(self, matrix: np.ndarray, rank: int) -> np.ndarray:
+        """Row of a closure matrix without the topic's own bit"""
+        row = matrix[rank].copy()
+        row[rank >> 6] &= ~np.uint64(1 << (rank & 63))
+        return row
+
+    def strict_rows(self, matrix: np.ndarray, ranks: Iterable[int]) -> np.ndarray:
+        """Rows of a closure matrix for several topics, each without its own bit"""
+        ranks = np.fromiter(ranks, dtype=np.int64)
+        rows = matrix[ranks]
+        rows[np.arange(len(ranks)), ranks >> 6] &= ~np.left_shift(np.uint64(1), (ranks & 63).astype(np.uint64))
+        return rows
+
+    def union(self, matrix: np.ndarray, ranks: Iterable[int]) -> np.ndarray:
+        """OR of the closure rows for several topics"""
+        ranks = np.fromiter(ranks, dtype=np.int64)
+        if not len(ranks):
+            return np.zeros(self.words, dtype=WORD)
+        return np.bitwise_or.reduce(matrix[ranks], axis=0)
+
+    def intersection(self, matrix: np.ndarray, ranks: Iterable[int]) -> np.ndarray:
+        """AND of the closure rows for several topics"""
+        ranks = np.fromiter(ranks, dtype=np.int64)
+        if not len(ranks):
+            return np.zeros(self.words, dtype=WORD)
+        return np.bitwise_and.reduce(matrix[ranks], axis=0)
+
+    def nbytes(self) -> int:
+        """Memory held by both matrices"""
+        return self.ancestors.nbytes + self.descendants.nbytes
+
+def _expand_ranges(starts: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """Concatenate the index ranges [start, start + count) without a Python loop"""
+    total = int(counts.sum())
+    if total == 0:
+        return np.zeros(0, dtype=np.int64)
+    run_starts = np.cumsum(counts) - counts
+    return np.arange(total, dtype=np.int64) - np.repeat(run_starts - starts, counts)
+
+def _chunks(group: np.ndarray, counts: np.ndarray, words: int):
+    """Split a level into pieces whose gathered rows stay under the memory limit"""
+    if not len(group):
+        return
+    budget = max(1, _GATHER_LIMIT // words)
+    cumulative = np.cumsum(counts[group])
+    start = 0
+    while start < len(group):
+        base = cumulative[start - 1] if start else 0
+        stop = max(start + 1, int(np.searchsorted(cumulative, base + budget, side="right")))
+        yield group[start:stop]
+        start = stop
+
+def _longest_path_levels(n: int, rows: np.ndarray, neighbors: np.ndarray, descending: bool):
+    """
+    Level of every rank along edges that point in the processing direction
+
+    Returns the levels and whether the graph is acyclic, i.e. whether every
+    edge points that way so a single level-ordered pass is exact.
+    """
+    forward = neighbors > rows if descending else neighbors < rows
+    acyclic = bool(forward.all())
+    rows, neighbors = rows[forward], neighbors[forward]
+
+    order = np.argsort(rows, kind="stable")
+    rows, neighbors = rows[order], neighbors[order]
+    starts = np.searchsorted(rows, np.arange(n))
+    ends = np.searchsorted(rows, np.arange(n), side="right")
+    neighbor_list = neighbors.tolist()
+    level_list = [0] * n
+    starts, ends = starts.tolist(), ends.tolist()
+    for rank in (range(n - 1, -1, -1) if descending else range(n)):
+        if starts[rank] < ends[rank]:
+            level_list[rank] = 1 + max(level_list[j] for j in neighbor_list[starts[rank]:ends[rank]])
+    return np.array(level_list, dtype=np.int64), acyclic
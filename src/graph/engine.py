@@ -0,0 +1,555 @@
+"""
+Graph Engine Interface
+Common protocol and interchangeable backends for DSA topic dependency graphs
+
+All backends share one set of semantics so they can be swapped freely:
+
+- Topics are the keys of the dependency dictionary, in insertion order.
+  Prerequisites that are not themselves topics are ignored.
+- The canonical order is Kahn's algorithm where ties are broken by the
+  topic's position in the dependency dictionary. Topics that sit on (or
+  behind) a cycle are appended afterwards in dictionary order.
+- Closure queries (prerequisites / dependents) return topics in canonical order.
+- A topic counts as known if it is listed as known or is a prerequisite
+  of a known topic; known topics never appear in a learning path, except
+  the target, which is only left out when it is listed as known itself
+  (as in TopicGraph: knowing a later topic still gives a path to the one
+  picked).
+- The level of a topic is the length of its longest prerequisite chain,
+  following only edges that point forward in the canonical order.
+"""
+
+import heapq
+from array import array
+from collections import defaultdict, deque
+from typing import Any, Dict, Iterable, List, Optional, Protocol, runtime_checkable
+
+import networkx as nx
+import numpy as np
+
+from .closure import ReachabilityMatrix, popcount
+
+@runtime_checkable
+class GraphEngine(Protocol):
+    """Operations every topic graph backend provides"""
+
+    def topics(self) -> List[str]:
+        ...
+
+    def topological_order(self) -> List[str]:
+        ...
+
+    def get_prerequisites(self, topic: str) -> List[str]:
+        ...
+
+    def get_dependent_topics(self, topic: str) -> List[str]:
+        ...
+
+    def sort_subgraph(self, topics: Iterable[str]) -> List[str]:
+        ...
+
+    def get_learning_path(self, target_topic: str, known_topics: Optional[List[str]] = None) -> List[str]:
+        ...
+
+    def get_topic_level(self, topic: str) -> int:
+        ...
+
+    def get_topics_by_level(self) -> Dict[int, List[str]]:
+        ...
+
+class BaseEngine:
+    """
+    Shared behaviour for engine backends
+
+    Subclasses implement the primitive graph queries; learning paths and
+    level grouping are composed from them here so every backend agrees.
+    """
+
+    def __init__(self, topic_dependencies: Dict[str, List[str]]):
+        """
+        Initialize the engine with dependencies
+
+        Args:
+            topic_dependencies: Dictionary mapping topics to their prerequisites
+        """
+        self.topic_dependencies = topic_dependencies
+        self._names = list(topic_dependencies)
+        self._index = {topic: i for i, topic in enumerate(self._names)}
+
+    def topics(self) -> List[str]:
+        """Get all topics in dictionary order"""
+        return list(self._names)
+
+    def get_learning_path(self, target_topic: str, known_topics: Optional[List[str]] = None) -> List[str]:
+        """
+        Get optimal learning path to a target topic
+
+        Args:
+            target_topic: The topic to learn
+            known_topics: List of topics already known (optional)
+
+        Returns:
+            List of topics in canonical learning order
+        """
+        if target_topic not in self._index:
+            return []
+
+        known = set()
+        for known_topic in known_topics or []:
+            if known_topic in self._index:
+                known.add(known_topic)
+                known.update(self.get_prerequisites(known_topic))
+
+        needed = [topic for topic in self.get_prerequisites(target_topic) if topic not in known]
+        if target_topic not in (known_topics or []):
+            needed.append(target_topic)
+
+        return self.sort_subgraph(needed)
+
+    def get_topics_by_level(self) -> Dict[int, List[str]]:
+        """
+        Group topics by their level in the dependency graph
+
+        Returns:
+            Dictionary mapping levels to topics in canonical order
+        """
+        levels = defaultdict(list)
+        for topic in self.topological_order():
+            levels[self.get_topic_level(topic)].append(topic)
+        return dict(levels)
+
+class NetworkXEngine(BaseEngine):
+    """Engine backed by a NetworkX directed graph"""
+
+    def __init__(self, topic_dependencies: Dict[str, List[str]]):
+        super().__init__(topic_dependencies)
+        self._graph = nx.DiGraph()
+        self._graph.add_nodes_from(self._index)
+        for topic, prereqs in topic_dependencies.items():
+            for prereq in prereqs:
+                if prereq in self._index:
+                    self._graph.add_edge(prereq, topic)
+
+        self._order = self._lexicographic_sort(self._graph)
+        self._rank = {topic: i for i, topic in enumerate(self._order)}
+        self._levels = {}
+        for topic in self._order:
+            rank = self._rank[topic]
+            self._levels[topic] = max(
+                (self._levels[pred] + 1 for pred in self._graph.predecessors(topic) if self._rank[pred] < rank),
+                default=0
+            )
+
+    def _lexicographic_sort(self, graph: nx.DiGraph) -> List[str]:
+        """Topologically sort a graph, appending cyclic leftovers in dictionary order"""
+        order = []
+        try:
+            for topic in nx.lexicographical_topological_sort(graph, key=self._index.__getitem__):
+                order.append(topic)
+        except nx.NetworkXUnfeasible:
+            placed = set(order)
+            order.extend(sorted((t for t in graph if t not in placed), key=self._index.__getitem__))
+        return order
+
+    def topological_order(self) -> List[str]:
+        return list(self._order)
+
+    def get_prerequisites(self, topic: str) -> List[str]:
+        if topic not in self._index:
+            return []
+        return sorted(nx.ancestors(self._graph, topic) - {topic}, key=self._rank.__getitem__)
+
+    def get_dependent_topics(self, topic: str) -> List[str]:
+        if topic not in self._index:
+            return []
+        return sorted(nx.descendants(self._graph, topic) - {topic}, key=self._rank.__getitem__)
+
+    def sort_subgraph(self, topics: Iterable[str]) -> List[str]:
+        subgraph = self._graph.subgraph([t for t in topics if t in self._index])
+        return self._lexicographic_sort(subgraph)
+
+    def get_topic_level(self, topic: str) -> int:
+        return self._levels.get(topic, 0)
+
+class DictEngine(BaseEngine):
+    """Engine backed by plain Python adjacency dictionaries"""
+
+    def __init__(self, topic_dependencies: Dict[str, List[str]]):
+        super().__init__(topic_dependencies)
+        self._prereqs = {
+            topic: [p for p in dict.fromkeys(prereqs) if p in self._index]
+            for topic, prereqs in topic_dependencies.items()
+        }
+        self._dependents = {topic: [] for topic in self._index}
+        for topic, prereqs in self._prereqs.items():
+            for prereq in prereqs:
+                self._dependents[prereq].append(topic)
+
+        self._order = self._kahn(list(self._index))
+        self._rank = {topic: i for i, topic in enumerate(self._order)}
+        self._levels = {}
+        for topic in self._order:
+            rank = self._rank[topic]
+            self._levels[topic] = max(
+                (self._levels[p] + 1 for p in self._prereqs[topic] if self._rank[p] < rank),
+                default=0
+            )
+
+    def _kahn(self, topics: List[str]) -> List[str]:
+        """Kahn's algorithm over the given topics with dictionary-order tie breaking"""
+        members = set(topics)
+        in_degree = {t: sum(1 for p in self._prereqs[t] if p in members) for t in topics}
+        heap = [self._index[t] for t, degree in in_degree.items() if degree == 0]
+        heapq.heapify(heap)
+
+        order = []
+        while heap:
+            current = self._names[heapq.heappop(heap)]
+            order.append(current)
+            for dependent in self._dependents[current]:
+                if dependent in members:
+                    in_degree[dependent] -= 1
+                    if in_degree[dependent] == 0:
+                        heapq.heappush(heap, self._index[dependent])
+
+        if len(order) < len(topics):
+            placed = set(order)
+            order.extend(sorted((t for t in topics if t not in placed), key=self._index.__getitem__))
+        return order
+
+    def topological_order(self) -> List[str]:
+        return list(self._order)
+
+    def _closure(self, topic: str, edges: Dict[str, List[str]]) -> List[str]:
+        if topic not in self._index:
+            return []
+        visited = {topic}
+        queue = deque([topic])
+        while queue:
+            for neighbor in edges[queue.popleft()]:
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    queue.append(neighbor)
+        visited.discard(topic)
+        return sorted(visited, key=self._rank.__getitem__)
+
+    def get_prerequisites(self, topic: str) -> List[str]:
+        return self._closure(topic, self._prereqs)
+
+    def get_dependent_topics(self, topic: str) -> List[str]:
+        return self._closure(topic, self._dependents)
+
+    def sort_subgraph(self, topics: Iterable[str]) -> List[str]:
+        return self._kahn([t for t in dict.fromkeys(topics) if t in self._index])
+
+    def get_topic_level(self, topic: str) -> int:
+        return self._levels.get(topic, 0)
+
+class CSREngine(BaseEngine):
+    """
+    Engine backed by compressed sparse row integer arrays
+
+    Topics are mapped to integer ids in dictionary order. Both edge
+    directions are stored as offset/neighbor arrays so closure queries
+    walk flat machine integers instead of dictionaries of lists.
+    """
+
+    def __init__(self, topic_dependencies: Dict[str, List[str]]):
+        super().__init__(topic_dependencies)
+        n = len(self._names)
+
+        prereq_lists = [
+            [self._index[p] for p in dict.fromkeys(prereqs) if p in self._index]
+            for prereqs in topic_dependencies.values()
+        ]
+        dependent_lists = [[] for _ in range(n)]
+        for node, prereqs in enumerate(prereq_lists):
+            for prereq in prereqs:
+                dependent_lists[prereq].append(node)
+
+        self._pred_offsets, self._pred_targets = self._to_csr(prereq_lists)
+        self._succ_offsets, self._succ_targets = self._to_csr(dependent_lists)
+
+        self._order = self._kahn(range(n))
+        self._ranks = array('i', [0]) * n
+        for rank, node in enumerate(self._order):
+            self._ranks[node] = rank
+
+        self._levels = array('i', [0]) * n
+        offsets, targets, ranks, levels = self._pred_offsets, self._pred_targets, self._ranks, self._levels
+        for node in self._order:
+            level = 0
+            for i in range(offsets[node], offsets[node + 1]):
+                pred = targets[i]
+                if ranks[pred] < ranks[node] and levels[pred] + 1 > level:
+                    level = levels[pred] + 1
+            levels[node] = level
+
+    # Integer arrays that fully describe a built CSR engine
+    INDEX_ARRAYS = ("pred_offsets", "pred_targets", "succ_offsets", "succ_targets", "ranks", "levels")
+
+    def export_indexes(self) -> Dict[str, Any]:
+        """
+        Get the immutable indexes this engine is built from
+
+        Returns:
+            Dictionary with the topic names and every array in INDEX_ARRAYS
+        """
+        indexes = {"names": list(self._names)}
+        for name in self.INDEX_ARRAYS:
+            indexes[name] = getattr(self, "_" + name)
+        return indexes
+
+    @classmethod
+    def from_indexes(cls, indexes: Dict[str, Any]) -> "CSREngine":
+        """
+        Create an engine over prebuilt indexes without recomputing them
+
+        The arrays are used as given, so they may be read-only views, for
+        example into shared memory published by another process.
+
+        Args:
+            indexes: Dictionary in the format returned by export_indexes
+
+        Returns:
+            Engine instance sharing the given arrays
+        """
+        engine = cls.__new__(cls)
+        engine.topic_dependencies = None
+        engine._names = list(indexes["names"])
+        engine._index = {topic: i for i, topic in enumerate(engine._names)}
+        for name in cls.INDEX_ARRAYS:
+            setattr(engine, "_" + name, indexes[name])
+        engine._order = [0] * len(engine._names)
+        for node, rank in enumerate(engine._ranks):
+            engine._order[rank] = node
+        return engine
+
+    @staticmethod
+    def _to_csr(adjacency: List[List[int]]):
+        offsets = array('i', [0])
+        targets = array('i')
+        for neighbors in adjacency:
+            targets.extend(neighbors)
+            offsets.append(len(targets))
+        return offsets, targets
+
+    def _kahn(self, nodes: Iterable[int]) -> List[int]:
+        """Kahn's algorithm over node ids with id-order tie breaking"""
+        nodes = list(nodes)
+        member = bytearray(len(self._names))
+        for node in nodes:
+            member[node] = 1
+
+        pred_offsets, pred_targets = self._pred_offsets, self._pred_targets
+        succ_offsets, succ_targets = self._succ_offsets, self._succ_targets
+        in_degree = {}
+        for node in nodes:
+            in_degree[node] = sum(member[pred_targets[i]] for i in range(pred_offsets[node], pred_offsets[node + 1]))
+
+        heap = [node for node in nodes if in_degree[node] == 0]
+        heapq.heapify(heap)
+        order = []
+        while heap:
+            node = heapq.heappop(heap)
+            order.append(node)
+            for i in range(succ_offsets[node], succ_offsets[node + 1]):
+                succ = succ_targets[i]
+                if member[succ]:
+                    in_degree[succ] -= 1
+                    if in_degree[succ] == 0:
+                        heapq.heappush(heap, succ)
+
+        if len(order) < len(nodes):
+            placed = set(order)
+            order.extend(sorted(node for node in nodes if node not in placed))
+        return order
+
+    def _closure(self, topic: str, offsets: array, targets: array) -> List[str]:
+        start = self._index.get(topic)
+        if start is None:
+            return []
+        seen = bytearray(len(self._names))
+        seen[start] = 1
+        stack = [start]
+        found = []
+        while stack:
+            node = stack.pop()
+            for i in range(offsets[node], offsets[node + 1]):
+                neighbor = targets[i]
+                if not seen[neighbor]:
+                    seen[neighbor] = 1
+                    found.append(neighbor)
+                    stack.append(neighbor)
+        ranks = self._ranks
+        found.sort(key=ranks.__getitem__)
+        return [self._names[node] for node in found]
+
+    def topological_order(self) -> List[str]:
+        return [self._names[node] for node in self._order]
+
+    def get_prerequisites(self, topic: str) -> List[str]:
+        return self._closure(topic, self._pred_offsets, self._pred_targets)
+
+    def get_dependent_topics(self, topic: str) -> List[str]:
+        return self._closure(topic, self._succ_offsets, self._succ_targets)
+
+    def sort_subgraph(self, topics: Iterable[str]) -> List[str]:
+        nodes = {self._index[t] for t in topics if t in self._index}
+        return [self._names[node] for node in self._kahn(nodes)]
+
+    def get_topic_level(self, topic: str) -> int:
+        node = self._index.get(topic)
+        return 0 if node is None else self._levels[node]
+
+class BitsetEngine(CSREngine):
+    """
+    CSR engine with a precomputed NumPy reachability matrix
+
+    Closure queries and cohort-level set operations are answered with
+    bitwise operations over packed rows instead of a graph walk per call.
+    Intended for dense curricula of up to a few thousand topics; see
+    graph/closure.py for the memory trade-off.
+    """
+
+    def __init__(self, topic_dependencies: Dict[str, List[str]]):
+        super().__init__(topic_dependencies)
+        self._rank_names = self.topological_order()
+        self.closure = ReachabilityMatrix(
+            np.frombuffer(self._ranks, dtype=np.intc),
+            np.frombuffer(self._pred_offsets, dtype=np.intc), np.frombuffer(self._pred_targets, dtype=np.intc),
+            np.frombuffer(self._succ_offsets, dtype=np.intc), np.frombuffer(self._succ_targets, dtype=np.intc)
+        )
+
+    def export_indexes(self) -> Dict[str, Any]:
+        indexes = super().export_indexes()
+        indexes["ancestors"] = self.closure.ancestors
+        indexes["descendants"] = self.closure.descendants
+        return indexes
+
+    @classmethod
+    def from_indexes(cls, indexes: Dict[str, Any]) -> "BitsetEngine":
+        engine = super().from_indexes(indexes)
+        engine._rank_names = engine.topological_order()
+        engine.closure = ReachabilityMatrix.from_matrices(indexes["ancestors"], indexes["descendants"])
+        return engine
+
+    def _ranks_of(self, topics: Iterable[str]) -> List[int]:
+        return [self._ranks[self._index[t]] for t in dict.fromkeys(topics) if t in self._index]
+
+    def _names_of(self, row: np.ndarray) -> List[str]:
+        return [self._rank_names[rank] for rank in self.closure.to_ranks(row).tolist()]
+
+    def get_prerequisites(self, topic: str) -> List[str]:
+        node = self._index.get(topic)
+        if node is None:
+            return []
+        return self._names_of(self.closure.strict(self.closure.ancestors, self._ranks[node]))
+
+    def get_dependent_topics(self, topic: str) -> List[str]:
+        node = self._index.get(topic)
+        if node is None:
+            return []
+        return self._names_of(self.closure.strict(self.closure.descendants, self._ranks[node]))
+
+    def get_learning_path(self, target_topic: str, known_topics: Optional[List[str]] = None) -> List[str]:
+        if target_topic not in self._index:
+            return []
+        covered = self.closure.union(self.closure.ancestors, self._ranks_of(known_topics or []))
+        target_rank = self._ranks[self._index[target_topic]]
+        needed = self._names_of(self.closure.strict(self.closure.ancestors, target_rank) & ~covered)
+        if target_topic not in (known_topics or []):
+            needed.append(target_topic)
+        return self.sort_subgraph(needed)
+
+    def covered_topics(self, known_topics: List[str]) -> List[str]:
+        """
+        Topics considered known: the known topics plus all their prerequisites
+
+        Args:
+            known_topics: Topics a learner already knows
+
+        Returns:
+            Covered topics in canonical order
+        """
+        return self._names_of(self.closure.union(self.closure.ancestors, self._ranks_of(known_topics)))
+
+    def common_prerequisites(self, topics: List[str]) -> List[str]:
+        """
+        Topics that are prerequisites of every one of the given topics
+
+        Args:
+            topics: Topics to intersect
+
+        Returns:
+            Shared prerequisites in canonical order
+        """
+        ranks = self._ranks_of(topics)
+        if not ranks:
+            return []
+        rows = self.closure.strict_rows(self.closure.ancestors, ranks)
+        return self._names_of(np.bitwise_and.reduce(rows, axis=0))
+
+    def combined_prerequisites(self, topics: List[str]) -> List[str]:
+        """
+        Topics that are prerequisites of at least one of the given topics
+
+        Args:
+            topics: Topics to combine
+
+        Returns:
+            Prerequisites in canonical order
+        """
+        ranks = self._ranks_of(topics)
+        if not ranks:
+            return []
+        rows = self.closure.strict_rows(self.closure.ancestors, ranks)
+        return self._names_of(np.bitwise_or.reduce(rows, axis=0))
+
+    def cohort_coverage(self, cohort_known_topics: List[List[str]]) -> Dict[str, int]:
+        """
+        Count how many learners in a cohort have each topic covered
+
+        Args:
+            cohort_known_topics: Known topics for each learner
+
+        Returns:
+            Dictionary mapping every topic to the number of learners covering it
+        """
+        counts = np.zeros(len(self._rank_names), dtype=np.int64)
+        if cohort_known_topics:
+            learner_rows = np.stack([
+                self.closure.union(self.closure.ancestors, self._ranks_of(known))
+                for known in cohort_known_topics
+            ])
+            bits = np.unpackbits(learner_rows.view(np.uint8), axis=1, bitorder="little")
+            counts = bits[:, :len(self._rank_names)].sum(axis=0, dtype=np.int64)
+        return dict(zip(self._rank_names, counts.tolist()))
+
+    def prerequisite_counts(self) -> Dict[str, int]:
+        """Number of transitive prerequisites of every topic"""
+        counts = popcount(self.closure.ancestors) - 1
+        return dict(zip(self._rank_names, counts.tolist()))
+
+# Registered backends, selectable by name
+ENGINE_BACKENDS = {
+    "networkx": NetworkXEngine,
+    "dict": DictEngine,
+    "csr": CSREngine,
+    "numpy": BitsetEngine,
+}
+
+def create_engine(topic_dependencies: Dict[str, List[str]], backend: str = "dict") -> GraphEngine:
+    """
+    Create a graph engine using the named backend
+
+    Args:
+        topic_dependencies: Dictionary mapping topics to their prerequisites
+        backend: One of the names in ENGINE_BACKENDS
+
+    Returns:
+        Engine instance implementing GraphEngine
+    """
+    if backend not in ENGINE_BACKENDS:
+        raise ValueError(f"Unknown graph backend '{backend}'. Choose from: {', '.join(ENGINE_BACKENDS)}")
+    return ENGINE_BACKENDS[backend](topic_dependencies)
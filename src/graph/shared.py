@@ -0,0 +1,305 @@
+"""
+Shared-Memory Graph Indexes
+Publish a built graph engine's immutable indexes once and attach to them
+read-only from every Streamlit server process
+
+Layout of a namespace (e.g. "dsa_graph"):
+
+- ``<namespace>_ctl``: 16-byte control block holding the current version
+- ``<namespace>_v<version>``: one data segment per published curriculum,
+  containing a JSON header followed by 64-byte aligned arrays (topic names,
+  CSR offsets/targets, ranks, levels and, for the numpy backend, the
+  closure bitsets)
+
+Publishing writes a complete new data segment first and only then bumps
+the version in the control block, so readers never see a half-written
+graph. Readers check the version on every ``engine()`` call (one 8-byte
+read) and switch to the new segment when it changes; engines handed out
+earlier keep their old mapping alive until they are dropped.
+
+Only the arrays live in shared memory. Each process still decodes its own
+copy of the topic names and the name-to-id dictionary.
+"""
+
+import hashlib
+import json
+import os
+import struct
+from array import array
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .engine import BitsetEngine, CSREngine, GraphEngine
+
+MAGIC = b"DSAGRAPH"
+ALIGNMENT = 64
+_CONTROL = struct.Struct("<QQ")  # version, reserved
+_PREAMBLE = struct.Struct("<8sI")  # magic, header length
+
+SHARED_BACKENDS = {"csr": CSREngine, "numpy": BitsetEngine}
+
+def curriculum_fingerprint(topic_dependencies: Dict[str, List[str]]) -> str:
+    """Stable content hash of a curriculum, used to detect changes"""
+    encoded = json.dumps(list(topic_dependencies.items()), separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+class _Segment(shared_memory.SharedMemory):
+    """SharedMemory that tolerates being collected while array views still use it"""
+
+    def __del__(self):
+        try:
+            self.close()
+        except (OSError, BufferError):
+            # Views are still alive; the mapping is released together with them
+            pass
+
+def _open_segment(name: str, create: bool = False, size: int = 0) -> _Segment:
+    """
+    Open a segment that outlives this process
+
+    The resource tracker would otherwise unlink it when the creating or
+    attaching process exits; segments are removed explicitly instead.
+    """
+    segment = _Segment(name=name, create=create, size=size)
+    if os.name == "posix":
+        from multiprocessing import resource_tracker
+        resource_tracker.unregister(segment._name, "shared_memory")
+    return segment
+
+def _unlink_segment(name: str):
+    """Remove a segment by name if it exists"""
+    try:
+        # Opened tracked, because unlink() unregisters it from the resource tracker
+        segment = _Segment(name=name)
+    except FileNotFoundError:
+        return
+    segment.close()
+    segment.unlink()
+
+def _data_name(namespace: str, version: int) -> str:
+    return f"{namespace}_v{version}"
+
+def _align(offset: int) -> int:
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+def _encode_indexes(indexes: Dict[str, Any]) -> Tuple[Dict[str, Any], List[Tuple[int, bytes]]]:
+    """Lay out index arrays, returning header entries and (offset, bytes) payloads"""
+    entries = {}
+    payloads = []
+    offset = 0
+
+    names_blob = "\x00".join(indexes["names"]).encode("utf-8")
+    items = [("names", names_blob, {"kind": "names", "count": len(indexes["names"])})]
+    for key, value in indexes.items():
+        if key == "names":
+            continue
+        if isinstance(value, array):
+            items.append((key, value.tobytes(), {"kind": "array", "typecode": value.typecode, "length": len(value)}))
+        else:
+            value = np.ascontiguousarray(value)
+            items.append((key, value.tobytes(), {"kind": "ndarray", "dtype": value.dtype.str, "shape": list(value.shape)}))
+
+    for key, payload, entry in items:
+        offset = _align(offset)
+        entries[key] = {**entry, "offset": offset, "nbytes": len(payload)}
+        payloads.append((offset, payload))
+        offset += len(payload)
+    return entries, payloads
+
+def _decode_indexes(buffer: memoryview, base: int, entries: Dict[str, Any]) -> Dict[str, Any]:
+    """Create read-only views over a data segment's arrays"""
+    indexes = {}
+    for key, entry in entries.items():
+        start = base + entry["offset"]
+        view = buffer[start:start + entry["nbytes"]]
+        if entry["kind"] == "names":
+            blob = bytes(view).decode("utf-8")
+            indexes[key] = blob.split("\x00") if entry["count"] else []
+        elif entry["kind"] == "array":
+            indexes[key] = view.cast(entry["typecode"]).toreadonly()
+        else:
+            matrix = np.frombuffer(view.toreadonly(), dtype=np.dtype(entry["dtype"]))
+            indexes[key] = matrix.reshape(entry["shape"])
+    return indexes
+
+class SharedGraphPublisher:
+    """Writes graph indexes into shared memory and announces new versions"""
+
+    def __init__(self, namespace: str = "dsa_graph", keep_versions: int = 2):
+        """
+        Open (or create) the namespace's control block
+
+        Args:
+            namespace: Prefix for all segment names
+            keep_versions: Published versions to keep before unlinking older ones
+        """
+        self.namespace = namespace
+        self.keep_versions = max(1, keep_versions)
+        try:
+            self._control = _open_segment(f"{namespace}_ctl", create=True, size=_CONTROL.size)
+            _CONTROL.pack_into(self._control.buf, 0, 0, 0)
+        except FileExistsError:
+            self._control = _open_segment(f"{namespace}_ctl")
+
+    def current_version(self) -> int:
+        """Version currently announced to readers (0 if nothing is published)"""
+        return _CONTROL.unpack_from(self._control.buf, 0)[0]
+
+    def publish(self, topic_dependencies: Dict[str, List[str]], backend: str = "numpy") -> int:
+        """
+        Build an engine and publish its indexes as a new version
+
+        Args:
+            topic_dependencies: Dictionary mapping topics to their prerequisites
+            backend: Engine backend whose indexes are shared ("csr" or "numpy")
+
+        Returns:
+            The newly published version number
+        """
+        if backend not in SHARED_BACKENDS:
+            raise ValueError(f"Backend '{backend}' cannot be shared. Choose from: {', '.join(SHARED_BACKENDS)}")
+
+        engine = SHARED_BACKENDS[backend](topic_dependencies)
+        entries, payloads = _encode_indexes(engine.export_indexes())
+        fingerprint = curriculum_fingerprint(topic_dependencies)
+        version = self.current_version() + 1
+        while True:
+            header = json.dumps({
+                "version": version,
+                "backend": backend,
+                "fingerprint": fingerprint,
+                "arrays": entries,
+            }).encode("utf-8")
+            base = _align(_PREAMBLE.size + len(header))
+            size = base + max((offset + len(payload) for offset, payload in payloads), default=0)
+            try:
+                segment = _open_segment(_data_name(self.namespace, version), create=True, size=max(size, 1))
+                break
+            except FileExistsError:
+                # Another process is publishing this version, or it was left behind
+                version += 1
+
+        try:
+            _PREAMBLE.pack_into(segment.buf, 0, MAGIC, len(header))
+            segment.buf[_PREAMBLE.size:_PREAMBLE.size + len(header)] = header
+            for offset, payload in payloads:
+                segment.buf[base + offset:base + offset + len(payload)] = payload
+        finally:
+            segment.close()
+
+        # Announce only once the segment is complete
+        _CONTROL.pack_into(self._control.buf, 0, version, 0)
+        self._retire(version)
+        return version
+
+    def _retire(self, version: int):
+        """Unlink data segments that are older than the kept versions"""
+        for old in range(max(1, version - self.keep_versions - 4), version - self.keep_versions + 1):
+            _unlink_segment(_data_name(self.namespace, old))
+
+    def close(self):
+        """Detach from the control block without removing anything"""
+        self._control.close()
+
+class SharedGraphReader:
+    """Attaches to published graph indexes and follows version changes"""
+
+    def __init__(self, namespace: str = "dsa_graph"):
+        """
+        Args:
+            namespace: Prefix used by the publisher
+        """
+        self.namespace = namespace
+        self._control = None
+        self._segment = None
+        self._engine = None
+        self.version = 0
+        self.fingerprint = None
+
+    def _announced_version(self) -> int:
+        if self._control is None:
+            try:
+                self._control = _open_segment(f"{self.namespace}_ctl")
+            except FileNotFoundError:
+                return 0
+        return _CONTROL.unpack_from(self._control.buf, 0)[0]
+
+    def engine(self) -> Optional[GraphEngine]:
+        """
+        Get an engine over the currently published indexes
+
+        Returns:
+            Engine for the latest version, or None if nothing is published
+        """
+        version = self._announced_version()
+        if version and version != self.version:
+            self._attach(version)
+        return self._engine
+
+    def _attach(self, version: int):
+        try:
+            segment = _open_segment(_data_name(self.namespace, version))
+        except FileNotFoundError:
+            # Retired between reading the version and attaching; keep the current engine
+            return
+
+        magic, header_length = _PREAMBLE.unpack_from(segment.buf, 0)
+        if magic != MAGIC:
+            segment.close()
+            raise ValueError(f"Shared memory segment '{segment.name}' does not hold graph indexes")
+        header = json.loads(bytes(segment.buf[_PREAMBLE.size:_PREAMBLE.size + header_length]))
+        base = _align(_PREAMBLE.size + header_length)
+
+        indexes = _decode_indexes(segment.buf, base, header["arrays"])
+        self._engine = SHARED_BACKENDS[header["backend"]].from_indexes(indexes)
+        # Engines handed out earlier keep the previous mapping alive through their views
+        self._segment = segment
+        self.version = header["version"]
+        self.fingerprint = header["fingerprint"]
+
+def attach_or_publish(topic_dependencies: Dict[str, List[str]], namespace: str = "dsa_graph",
+                      backend: str = "numpy") -> SharedGraphReader:
+    """
+    Attach to a namespace, publishing the curriculum first if it is missing or outdated
+
+    Safe to call from every worker: whichever process finds no matching
+    version publishes one, and the rest attach to it.
+
+    Args:
+        topic_dependencies: Dictionary mapping topics to their prerequisites
+        namespace: Prefix for all segment names
+        backend: Engine backend whose indexes are shared
+
+    Returns:
+        Reader attached to a version matching the given curriculum
+    """
+    reader = SharedGraphReader(namespace)
+    if reader.engine() is None or reader.fingerprint != curriculum_fingerprint(topic_dependencies):
+        publisher = SharedGraphPublisher(namespace)
+        try:
+            publisher.publish(topic_dependencies, backend)
+        finally:
+            publisher.close()
+        reader.engine()
+    return reader
+
+def unlink_namespace(namespace: str = "dsa_graph", max_version: Optional[int] = None):
+    """
+    Remove every segment of a namespace, e.g. when the servers shut down
+
+    Args:
+        namespace: Prefix for all segment names
+        max_version: Highest version to look for (defaults to the announced version)
+    """
+    try:
+        control = _open_segment(f"{namespace}_ctl")
+    except FileNotFoundError:
+        return
+    if max_version is None:
+        max_version = _CONTROL.unpack_from(control.buf, 0)[0]
+    control.close()
+    for version in range(1, max_version + 1):
+        _unlink_segment(_data_name(namespace, version))
+    _unlink_segment(f"{namespace}_ctl")
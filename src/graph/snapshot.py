@@ -0,0 +1,141 @@
+"""
+Graph Snapshots
+Immutable graph snapshots published by atomic reference swap, so many
+readers can query a shared graph while it is being reloaded
+
+Readers call ``registry.current()`` once per request (e.g. per Streamlit
+rerun) and run every query against that snapshot. ``current()`` is a single
+attribute read and never takes a lock. A reload builds the new engine off
+to the side, outside any reader's view, and then replaces the reference in
+one assignment; readers holding the old snapshot finish on it undisturbed.
+Only writers serialize with each other.
+"""
+
+import threading
+import time
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+from .engine import GraphEngine, create_engine
+from .shared import curriculum_fingerprint
+
+class GraphSnapshot:
+    """
+    Read-only view of one version of the topic graph
+
+    The engine is private and only reachable through query methods that
+    return fresh lists, so nothing a reader gets back can alter the graph.
+    """
+
+    __slots__ = ("_engine", "version", "fingerprint", "created_at", "curriculum")
+
+    def __init__(self, engine: GraphEngine, version: int, fingerprint: str,
+                 curriculum: Optional[Mapping[str, Tuple[str, ...]]] = None):
+        """
+        Args:
+            engine: Fully built engine; it must not be modified afterwards
+            version: Monotonic version number assigned by the registry
+            fingerprint: Content hash of the curriculum
+            curriculum: Frozen copy of the dependencies the engine was built from
+        """
+        object.__setattr__(self, "_engine", engine)
+        object.__setattr__(self, "version", version)
+        object.__setattr__(self, "fingerprint", fingerprint)
+        object.__setattr__(self, "created_at", time.time())
+        object.__setattr__(self, "curriculum", curriculum)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("GraphSnapshot is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("GraphSnapshot is immutable")
+
+    def topics(self) -> List[str]:
+        return self._engine.topics()
+
+    def topological_order(self) -> List[str]:
+        return self._engine.topological_order()
+
+    def get_prerequisites(self, topic: str) -> List[str]:
+        return self._engine.get_prerequisites(topic)
+
+    def get_dependent_topics(self, topic: str) -> List[str]:
+        return self._engine.get_dependent_topics(topic)
+
+    def sort_subgraph(self, topics: Iterable[str]) -> List[str]:
+        return self._engine.sort_subgraph(topics)
+
+    def get_learning_path(self, target_topic: str, known_topics: Optional[List[str]] = None) -> List[str]:
+        return self._engine.get_learning_path(target_topic, known_topics)
+
+    def get_topic_level(self, topic: str) -> int:
+        return self._engine.get_topic_level(topic)
+
+    def get_topics_by_level(self) -> Dict[int, List[str]]:
+        return self._engine.get_topics_by_level()
+
+def freeze_curriculum(topic_dependencies: Dict[str, List[str]]) -> Mapping[str, Tuple[str, ...]]:
+    """Deep, read-only copy of a dependency dictionary"""
+    return MappingProxyType({topic: tuple(prereqs) for topic, prereqs in topic_dependencies.items()})
+
+class GraphRegistry:
+    """Holds the current graph snapshot and swaps in new ones atomically"""
+
+    def __init__(self, topic_dependencies: Optional[Dict[str, List[str]]] = None, backend: str = "dict"):
+        """
+        Args:
+            topic_dependencies: Initial curriculum to publish (optional)
+            backend: Engine backend used to build snapshots
+        """
+        self.backend = backend
+        self._current: Optional[GraphSnapshot] = None
+        self._writer_lock = threading.Lock()
+        if topic_dependencies is not None:
+            self.reload(topic_dependencies)
+
+    def current(self) -> Optional[GraphSnapshot]:
+        """Latest published snapshot; never blocks"""
+        return self._current
+
+    def reload(self, topic_dependencies: Dict[str, List[str]]) -> GraphSnapshot:
+        """
+        Build a snapshot of a new curriculum and publish it
+
+        Args:
+            topic_dependencies: Dictionary mapping topics to their prerequisites
+
+        Returns:
+            The published snapshot
+        """
+        with self._writer_lock:
+            curriculum = freeze_curriculum(topic_dependencies)
+            engine = create_engine(dict(curriculum), self.backend)
+            return self._publish(engine, curriculum_fingerprint(curriculum), curriculum)
+
+    def reload_if_changed(self, topic_dependencies: Dict[str, List[str]]) -> GraphSnapshot:
+        """Reload only when the curriculum differs from the current snapshot"""
+        current = self._current
+        if current is not None and current.fingerprint == curriculum_fingerprint(topic_dependencies):
+            return current
+        return self.reload(topic_dependencies)
+
+    def publish_engine(self, engine: GraphEngine, fingerprint: str) -> GraphSnapshot:
+        """
+        Publish an engine that was built elsewhere, e.g. attached from shared memory
+
+        Args:
+            engine: Fully built engine
+            fingerprint: Content hash of the curriculum it was built from
+
+        Returns:
+            The published snapshot
+        """
+        with self._writer_lock:
+            return self._publish(engine, fingerprint, None)
+
+    def _publish(self, engine: GraphEngine, fingerprint: str, curriculum) -> GraphSnapshot:
+        version = self._current.version + 1 if self._current is not None else 1
+        snapshot = GraphSnapshot(engine, version, fingerprint, curriculum)
+        # The swap: a single reference assignment that readers see whole or not at all
+        self._current = snapshot
+        return snapshot
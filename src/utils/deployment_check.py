@@ -62,6 +62,7 @@ def check_file_paths() -> Dict[str, bool]:
         'app/main.py': False,
         'src/data/topic_data.py': False,
         'src/data/problem_data.py': False,
+        'src/data/problem_bank.py': False,
         'src/graph/topic_graph.py': False,
         'src/utils/helpers.py': False,
         'requirements.txt': False,
@@ -4,12 +4,17 @@ Common utility functions used throughout the application
 """
 
 import streamlit as st
-from typing import List, Dict, Any
+import time
+from typing import List, Dict, Any, Optional
 import plotly.graph_objects as go
 import plotly.express as px
 import networkx as nx
 import pandas as pd
 
+from data.catalog import canonical_problem_id
+from data.problem_data import get_problem_card, get_related_problems, record_review, remove_review
+from data.reviews import QUALITY_LABELS
+
 def format_learning_path(topics: List[str]) -> str:
     """
     Format a learning path into a readable string
@@ -29,7 +34,7 @@ def format_learning_path(topics: List[str]) -> str:
     
     return formatted
 
-def create_topic_selector(topics: List[str], key: str, label: str = "Select Topic") -> str:
+def create_topic_selector(topics: List[str], key: str, label: str = "Select Topic", prefix_index=None) -> str:
     """
     Create a Streamlit topic selector
     
@@ -37,18 +42,19 @@ def create_topic_selector(topics: List[str], key: str, label: str = "Select Topi
         topics: List of available topics
         key: Unique key for the selector
         label: Label for the selector
+        prefix_index: Optional PrefixIndex; long topic lists then get a type-ahead filter
         
     Returns:
         Selected topic
     """
     return st.selectbox(
         label,
-        options=topics,
+        options=_selector_options(topics, key, prefix_index),
         key=key,
         help="Choose a topic to get learning recommendations"
     )
 
-def create_multi_topic_selector(topics: List[str], key: str, label: str = "Select Topics") -> List[str]:
+def create_multi_topic_selector(topics: List[str], key: str, label: str = "Select Topics", prefix_index=None) -> List[str]:
     """
     Create a Streamlit multi-topic selector
     
@@ -56,17 +62,44 @@ def create_multi_topic_selector(topics: List[str], key: str, label: str = "Selec
         topics: List of available topics
         key: Unique key for the selector
         label: Label for the selector
+        prefix_index: Optional PrefixIndex; long topic lists then get a type-ahead filter
         
     Returns:
         List of selected topics
     """
     return st.multiselect(
         label,
-        options=topics,
+        options=_selector_options(topics, key, prefix_index, keep=st.session_state.get(key, [])),
         key=key,
         help="Select topics you already know"
     )
 
+# Topic lists longer than this are filtered by type-ahead instead of listed in full
+MAX_SELECTOR_OPTIONS = 200
+
+def _selector_options(topics: List[str], key: str, prefix_index=None, keep: List[str] = ()) -> List[str]:
+    """
+    Options for a topic selector, narrowed by a typed prefix for long lists
+    
+    Args:
+        topics: List of available topics
+        key: Key of the selector the options are for
+        prefix_index: PrefixIndex over the topics (and their aliases)
+        keep: Options that must stay available, e.g. current selections
+        
+    Returns:
+        Options to show
+    """
+    if prefix_index is None or len(topics) <= MAX_SELECTOR_OPTIONS:
+        return topics
+    
+    typed = st.text_input("Type to search topics", key=f"{key}_prefix", placeholder="e.g. dp, graph, bst")
+    if not typed.strip():
+        return list(dict.fromkeys([*keep, *topics[:MAX_SELECTOR_OPTIONS]]))
+    available = set(topics)
+    matches = [c.value for c in prefix_index.complete(typed, prefix_index.max_results) if c.value in available]
+    return list(dict.fromkeys([*keep, *matches]))
+
 def create_difficulty_selector(key: str, label: str = "Select Difficulty Level") -> str:
     """
     Create a difficulty level selector
@@ -186,12 +219,13 @@ def create_progress_tracker(topics: List[str], completed_topics: List[str] = Non
     
     return progress
 
-def display_progress(progress: Dict[str, bool]):
+def display_progress(progress: Dict[str, bool], page_size: int = 50):
     """
     Display learning progress
     
     Args:
         progress: Dictionary mapping topics to completion status
+        page_size: Topics listed per page
     """
     st.subheader("📈 Learning Progress")
     
@@ -202,10 +236,15 @@ def display_progress(progress: Dict[str, bool]):
     st.progress(percentage / 100)
     st.write(f"**Progress:** {completed}/{total} topics completed ({percentage:.1f}%)")
     
-    # Show individual topic status
-    for topic, is_completed in progress.items():
-        status = "✅" if is_completed else "⏳"
-        st.write(f"{status} {topic}")
+    # Show one window of topic statuses, as a single element
+    topics = list(progress.items())
+    start = 0
+    if total > page_size:
+        pages = -(-total // page_size)
+        page = st.number_input(f"Page (of {pages})", min_value=1, max_value=pages, value=1, key="progress_page")
+        start = (page - 1) * page_size
+    lines = [f"{'✅' if is_completed else '⏳'} {topic}" for topic, is_completed in topics[start:start + page_size]]
+    st.markdown("  \n".join(lines))
 
 def validate_topic_selection(selected_topic: str, available_topics: List[str]) -> bool:
     """
@@ -228,14 +267,16 @@ def validate_topic_selection(selected_topic: str, available_topics: List[str]) -
     
     return True
 
-def display_problems(problems: List[Dict], topic: str, level: str):
+def display_problems(problems: List[Dict], topic: str, level: str, solved: Dict[str, float] = None, start: int = 0):
     """
     Display problems in a nicely formatted way
     
     Args:
-        problems: List of problem dictionaries
+        problems: Problem dictionaries to show, e.g. one page of the topic
         topic: Selected topic
         level: Selected difficulty level
+        solved: Learner's solved problems (canonical id -> time), to show solved checkboxes
+        start: 0-based position of the first problem in the whole list, for numbering
     """
     if not problems:
         st.warning(f"No problems found for {topic} at {level} level!")
@@ -255,18 +296,215 @@ def display_problems(problems: List[Dict], topic: str, level: str):
         st.info("Showing **All** difficulty levels")
     
     # Display problems
+    for i, problem in enumerate(problems, start + 1):
+        card = get_problem_card(problem)
+        with st.expander(f"{i}. {card.label}"):
+            display_problem_details(problem, solved, f"{topic}_{level}", card)
+
+def page_cursor(key: str, listing: Any) -> Optional[str]:
+    """
+    Cursor of the page currently shown for a paginated listing
+    
+    Args:
+        key: Session state key of the listing's pager
+        listing: Anything identifying the listing, e.g. (topic, level); a new listing starts at page one
+    
+    Returns:
+        Opaque cursor, or None for the first page
+    """
+    pager = st.session_state.get(key)
+    if pager is None or pager["listing"] != listing:
+        pager = st.session_state[key] = {"listing": listing, "cursors": [None]}
+    return pager["cursors"][-1]
+
+def reset_pager(key: str):
+    """Go back to the first page of a paginated listing, e.g. after its cursor became invalid"""
+    st.session_state.pop(key, None)
+
+def display_page_controls(page: Dict[str, Any], key: str):
+    """
+    Display previous/next buttons for a cursor-paginated listing
+    
+    Args:
+        page: Current page, with start, total and next_cursor
+        key: Session state key of the listing's pager (see page_cursor)
+    """
+    cursors = st.session_state[key]["cursors"]
+    shown = len(page["problems"])
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col1:
+        st.button("◀ Previous", key=f"{key}_previous", disabled=len(cursors) == 1,
+                  on_click=cursors.pop)
+    with col2:
+        st.caption(f"Showing {page['start'] + 1}–{page['start'] + shown} of {page['total']}")
+    with col3:
+        st.button("Next ▶", key=f"{key}_next", disabled=page["next_cursor"] is None,
+                  on_click=cursors.append, args=(page["next_cursor"],))
+
+def display_problem_details(problem: Dict, solved: Dict[str, float] = None, key: str = "", card=None):
+    """
+    Display a problem's description and practice link
+    
+    Args:
+        problem: Problem dictionary or record
+        solved: Learner's solved problems (canonical id -> time), to show a solved checkbox
+        key: Widget key prefix, unique per list the problem is shown in
+        card: The problem's ProblemCard, if the caller already has it
+    """
+    # Description, rating and platform link come prerendered with the catalog
+    st.markdown((card or get_problem_card(problem)).body)
+    
+    if solved is not None:
+        canonical_id = problem.get('canonical_id') or canonical_problem_id(problem['title'], problem.get('link'))
+        widget_key = f"solved_{key}_{canonical_id}"
+        # Only user clicks change the solved set, so a checkbox created before a solve elsewhere never undoes it
+        st.checkbox("✅ Solved", value=canonical_id in solved, key=widget_key,
+                    on_change=_toggle_solved, args=(solved, canonical_id, widget_key))
+        if canonical_id in solved:
+            display_related_problems(problem)
+
+def display_related_problems(problem: Dict, k: int = 3):
+    """
+    Display the problems most similar to a problem, e.g. once it is solved
+    
+    Args:
+        problem: Problem dictionary or record
+        k: Number of similar problems
+    """
+    related = get_related_problems(problem.get('link'), problem['title'], k=k)
+    if not related:
+        return
+    links = [f"[{other['title']}]({other['link']})" if other.get('link') else other['title'] for other, _ in related]
+    st.markdown(f"🔁 **Similar problems:** {' · '.join(links)}")
+
+def _toggle_solved(solved: Dict[str, float], canonical_id: str, widget_key: str):
+    if st.session_state[widget_key]:
+        solved[canonical_id] = time.time()
+    else:
+        solved.pop(canonical_id, None)
+        if "learner_id" in st.session_state:
+            remove_review(st.session_state.learner_id, canonical_id, st.session_state.get("review_scheduler"))
+
+def display_practice_set(practice_page: Dict[str, Any]):
+    """
+    Display one page of a learning path's practice set
+    
+    Args:
+        practice_page: Result of get_practice_set
+    """
+    problems = practice_page["problems"]
+    if not problems:
+        st.warning("No problems available for this learning path!")
+        return
+    
+    first = (practice_page["page"] - 1) * practice_page["page_size"] + 1
+    st.info(f"Showing problems **{first}–{first + len(problems) - 1}** of **{practice_page['total']}** "
+            f"(page {practice_page['page']} of {practice_page['pages']})")
+    for i, problem in enumerate(problems, first):
+        card = get_problem_card(problem)
+        with st.expander(f"{i}. {card.placed_label}"):
+            display_problem_details(problem, card=card)
+
+def display_balanced_set(practice_set: Dict[str, Any]):
+    """
+    Display a practice set built under topic and level quotas
+    
+    Args:
+        practice_set: Result of get_balanced_practice_set
+    """
+    for message in practice_set["shortfalls"]:
+        st.warning(f"Not enough problems: {message}")
+    problems = practice_set["problems"]
+    if not problems:
+        return
+    
+    levels = ", ".join(f"{count} {level}" for level, count in practice_set["level_counts"].items() if count)
+    st.info(f"**{len(problems)}** problems: {levels}")
+    for i, problem in enumerate(problems, 1):
+        card = get_problem_card(problem)
+        with st.expander(f"{i}. {card.placed_label}"):
+            display_problem_details(problem, card=card)
+
+def display_search_results(problems: List[Dict], query: str):
+    """
+    Display problems found by a search
+    
+    Args:
+        problems: Matching problems, most relevant first
+        query: The search query
+    """
+    if not problems:
+        st.warning(f"No problems match \"{query}\"")
+        return
+    
+    st.info(f"Found **{len(problems)}** problems matching \"{query}\"")
+    for i, problem in enumerate(problems, 1):
+        card = get_problem_card(problem)
+        with st.expander(f"{i}. {card.placed_label}"):
+            display_problem_details(problem, card=card)
+
+def display_recommendations(problems: List[Dict], solved: Dict[str, float]):
+    """
+    Display a learner's recommended next problems
+    
+    Args:
+        problems: Recommended problems, best first
+        solved: Learner's solved problems (canonical id -> time)
+    """
+    if not problems:
+        st.info("No recommendations yet. Pick the topics you know on the Study Plan page.")
+        return
+    
+    st.caption(f"Based on the topics you know and the {len(solved)} problems you marked solved")
+    for i, problem in enumerate(problems, 1):
+        card = get_problem_card(problem)
+        with st.expander(f"{i}. {card.placed_label}"):
+            display_problem_details(problem, solved, "recommended", card=card)
+
+def display_due_reviews(due: List[Any], learner: str, scheduler: Any = None):
+    """
+    Display a learner's solved problems that are due for review, with grading buttons
+    
+    Args:
+        due: (problem, review card) tuples from get_due_reviews, most overdue first
+        learner: Learner id the reviews are recorded for
+        scheduler: The learner's own ReviewScheduler, if not the process-wide one
+    """
+    if not due:
+        st.info("Nothing to review right now. Problems you solve come back here a day later.")
+        return
+    
+    st.caption("Re-solve each problem, then grade how well you remembered it; harder ones come back sooner")
+    for i, (problem, review) in enumerate(due, 1):
+        overdue = max(0, int((time.time() - review.due) // 86400))
+        card = get_problem_card(problem)
+        label = f"{i}. {card.placed_label}"
+        with st.expander(f"{label} · {overdue} days overdue" if overdue else label):
+            display_problem_details(problem, card=card)
+            columns = st.columns(len(QUALITY_LABELS))
+            for column, (quality, name) in zip(columns, QUALITY_LABELS.items()):
+                with column:
+                    st.button(name, key=f"review_{problem['canonical_id']}_{quality}",
+                              on_click=record_review, args=(learner, problem['canonical_id'], quality),
+                              kwargs={"scheduler": scheduler})
+
+def display_daily_mix(problems: List[Dict], solved: Dict[str, float]):
+    """
+    Display a learner's randomized problem mix for today
+    
+    Args:
+        problems: Problems of the mix
+        solved: Learner's solved problems (canonical id -> time)
+    """
+    if not problems:
+        st.info("You have solved every problem in the collection!")
+        return
+    
+    st.caption("A new mix of unsolved problems every day, weighted towards core topics")
     for i, problem in enumerate(problems, 1):
-        with st.expander(f"{i}. {problem['title']} ({problem.get('level', 'unknown').title()})"):
-            st.write(f"**Description:** {problem['description']}")
-            
-            # Display single link
-            if 'link' in problem:
-                if 'leetcode.com' in problem['link']:
-                    st.markdown(f"🟠 **Practice on LeetCode:** [Open Problem]({problem['link']})")
-                elif 'geeksforgeeks.org' in problem['link']:
-                    st.markdown(f"🟢 **Practice on GeeksforGeeks:** [Open Problem]({problem['link']})")
-                else:
-                    st.markdown(f"🔗 **Practice Link:** [Open Problem]({problem['link']})")
+        card = get_problem_card(problem)
+        with st.expander(f"{i}. {card.placed_label}"):
+            display_problem_details(problem, solved, "daily_mix", card=card)
 
 def create_problem_stats_chart(problem_counts: Dict[str, int]) -> go.Figure:
     """
@@ -320,6 +558,82 @@ def create_problem_stats_chart(problem_counts: Dict[str, int]) -> go.Figure:
         st.error(f"Stats chart rendering error: {str(e)}")
         return None
 
+def create_funnel_chart(funnel: pd.DataFrame) -> go.Figure:
+    """
+    Create a funnel of learners through the curriculum's levels
+    
+    Args:
+        funnel: Frame from CohortAnalytics.funnel
+        
+    Returns:
+        Plotly figure object
+    """
+    fig = go.Figure(go.Funnel(
+        y=[f"Level {level} ({topics} topics)" for level, topics in zip(funnel["level"], funnel["topics"])],
+        x=funnel["learners"],
+        textinfo="value+percent initial"
+    ))
+    fig.update_layout(title="Learners Through Each Level", height=400, margin=dict(l=20, r=20, t=40, b=20),
+                      paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)')
+    return fig
+
+def create_completion_chart(distribution: pd.DataFrame) -> go.Figure:
+    """
+    Create a histogram of learners by number of completed topics
+    
+    Args:
+        distribution: Frame from CohortAnalytics.completion_distribution
+        
+    Returns:
+        Plotly figure object
+    """
+    fig = px.bar(distribution, x="topics_completed", y="learners", title="Topics Completed per Learner",
+                 labels={"topics_completed": "Topics completed", "learners": "Learners"})
+    fig.update_layout(height=350, margin=dict(l=20, r=20, t=40, b=20), showlegend=False,
+                      paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)')
+    return fig
+
+def display_cohort_analytics(analytics: Any):
+    """
+    Display a cohort's progress dashboard
+    
+    Args:
+        analytics: CohortAnalytics with the class's progress events
+    """
+    funnel = analytics.funnel()
+    quantiles = analytics.completion_quantiles((0.25, 0.5, 0.75))
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Learners", len(analytics))
+    with col2:
+        st.metric("Median topics completed", int(quantiles[0.5]),
+                  help=f"Middle half of the class: {quantiles[0.25]}–{quantiles[0.75]} topics")
+    with col3:
+        st.metric("Completed everything", f"{funnel['share'].iloc[-1]:.0%}")
+    
+    st.plotly_chart(create_funnel_chart(funnel), use_container_width=True)
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        topic = st.selectbox("Share of the class past", analytics.topics, key="cohort_past_topic",
+                             index=analytics.topics.index("Graphs") if "Graphs" in analytics.topics else 0)
+        st.metric(f"Past {topic}", f"{analytics.share_past(topic):.0%}")
+    with col2:
+        start_topic = st.selectbox("Time from", analytics.topics, key="cohort_start_topic",
+                                   index=analytics.topics.index("Recursion") if "Recursion" in analytics.topics else 0)
+        end_topic = st.selectbox("to", analytics.topics, key="cohort_end_topic",
+                                 index=analytics.topics.index("Dynamic Programming")
+                                 if "Dynamic Programming" in analytics.topics else len(analytics.topics) - 1)
+        days = analytics.time_between(start_topic, end_topic)
+        if len(days):
+            st.metric("Median days", f"{days.median():.1f}", help=f"Over the {len(days)} learners who completed both")
+        else:
+            st.info("No learner has completed both topics yet.")
+    
+    st.plotly_chart(create_completion_chart(analytics.completion_distribution()), use_container_width=True)
+    with st.expander("Completion by topic"):
+        st.dataframe(analytics.topic_completion(), use_container_width=True, hide_index=True)
+
 def display_problem_summary(total_problems: int, topic: str, level: str):
     """
     Display a summary of available problems